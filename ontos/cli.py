@@ -9,6 +9,7 @@ import argparse
 import contextlib
 import io
 import json
+import os
 import sys
 from pathlib import Path
 from typing import List, Optional, Sequence
@@ -22,6 +23,13 @@ from ontos.command_registry import (
     iter_command_specs,
 )
 from ontos.core.errors import OntosInternalError, OntosUserError
+from ontos.core.profiling import (
+    PROFILE_OUTPUT_ENV_VAR,
+    format_profile_report,
+    profiling_requested,
+    start_profiling,
+    stop_profiling,
+)
 from ontos.commands.map import CompactMode
 from ontos.ui.json_output import ExitCode, emit_command_error, emit_command_success
 
@@ -151,6 +159,10 @@ class _OntosArgumentParser(argparse.ArgumentParser):
             parsed.json = False
         if not hasattr(parsed, "quiet"):
             parsed.quiet = False
+        if not hasattr(parsed, "profile"):
+            parsed.profile = False
+        if not hasattr(parsed, "profile_output"):
+            parsed.profile_output = None
         return parsed
 
 
@@ -170,6 +182,19 @@ def create_parser(include_hidden: bool = True) -> argparse.ArgumentParser:
         default=argparse.SUPPRESS,
         help="Output in JSON format"
     )
+    global_parser.add_argument(
+        "--profile",
+        action="store_true",
+        default=argparse.SUPPRESS,
+        help="Report per-phase timings (also enabled by ONTOS_PROFILE=1)"
+    )
+    global_parser.add_argument(
+        "--profile-output",
+        type=Path,
+        default=argparse.SUPPRESS,
+        metavar="PATH",
+        help="Also write cProfile stats to PATH (implies --profile)"
+    )
 
     # Main parser
     parser = _OntosArgumentParser(
@@ -304,7 +329,10 @@ def _configure_map_arguments(p) -> None:
                    action=_StoreWithDeprecatedShortFlag,
                    help="Filter documents by expression (e.g., 'type:strategy'). Use -F; -f is deprecated.")
     p.add_argument("--no-cache", action="store_true",
-                   help="Bypass document cache (for debugging)")
+                   help="Bypass the persistent parse cache in .ontos/cache/ (for debugging)")
+    p.add_argument("--workers", type=int, default=None, metavar="N",
+                   help="Parse documents across N processes (0 = one per CPU; "
+                        "default: scanning.workers)")
     p.add_argument("--sync-agents", action="store_true",
                    help="Also sync AGENTS.md if it exists")
     p.add_argument("--verbose", "-v", action="store_true",
@@ -387,6 +415,15 @@ def _register_maintain(subparsers, parent):
             "check_links, sync_agents"
         )
     )
+    p.add_argument(
+        "--workers", "--jobs",
+        type=int,
+        default=None,
+        metavar="N",
+        dest="workers",
+        help="Run the check_links body scan across N processes "
+             "(0 = one per CPU; default: scanning.workers)",
+    )
     _add_scope_argument(p)
     p.set_defaults(func=_cmd_maintain)
 
@@ -431,6 +468,15 @@ def _register_link_check(subparsers, parent):
         help="Skip orphan detection; removes the exit-3 (orphans-only) outcome — "
              "not recommended for CI gates",
     )
+    p.add_argument(
+        "--workers", "--jobs",
+        type=int,
+        default=None,
+        metavar="N",
+        dest="workers",
+        help="Load and body-scan documents across N processes "
+             "(0 = one per CPU; default: scanning.workers)",
+    )
     p.set_defaults(func=_cmd_link_check)
 
 
@@ -705,6 +751,11 @@ def _register_export(subparsers, parent):
                              help="Filter by concept (comma-separated)")
     data_parser.add_argument("--no-content", action="store_true",
                              help="Exclude document content")
+    data_parser.add_argument("--content-hash-only", action="store_true",
+                             help="Emit content hashes without document bodies")
+    data_parser.add_argument("--format", choices=["json", "ndjson"], default="json",
+                             dest="output_format",
+                             help="Output format; ndjson streams one record per line (default: json)")
     data_parser.add_argument("--deterministic", action="store_true",
                              help="Stable output for testing")
     data_parser.add_argument("--force", "-f", action="store_true",
@@ -1045,6 +1096,7 @@ def _cmd_map(args) -> int:
         compact=CompactMode(args.compact) if args.compact != "off" else CompactMode.OFF,
         filter_expr=getattr(args, 'filter', None),
         no_cache=getattr(args, 'no_cache', False),
+        workers=getattr(args, 'workers', None),
         sync_agents=getattr(args, 'sync_agents', False),
         scope=getattr(args, "scope", None),
         verbose=getattr(args, "verbose", False),
@@ -1185,6 +1237,7 @@ def _cmd_maintain(args) -> int:
         quiet=args.quiet,
         json_output=args.json,
         scope=getattr(args, "scope", None),
+        workers=getattr(args, "workers", None),
     )
 
     return maintain_command(options)
@@ -1206,6 +1259,7 @@ def _cmd_link_check(args) -> int:
         limit=limit,
         frontmatter_only=getattr(args, "frontmatter_only", False),
         include_orphans=not getattr(args, "no_orphans", False),
+        workers=getattr(args, "workers", None),
     )
     return link_check_command(options)
 
@@ -1497,6 +1551,8 @@ def _cmd_export_data(args) -> int:
         status=args.status,
         concepts=args.concept,
         no_content=args.no_content,
+        content_hash_only=args.content_hash_only,
+        output_format=args.output_format,
         deterministic=args.deterministic,
         force=args.force,
         quiet=args.quiet or args.json,
@@ -2096,6 +2152,46 @@ def _cmd_hook(args) -> int:
 # Main entry point
 # ============================================================================
 
+@contextlib.contextmanager
+def _profiling_session(args: argparse.Namespace):
+    """Record named spans (and optionally cProfile) around one command.
+
+    JSON envelopes pick the spans up themselves; text mode prints the table
+    to stderr when the command finishes.
+    """
+    output = getattr(args, "profile_output", None) or os.environ.get(PROFILE_OUTPUT_ENV_VAR) or None
+    if not (getattr(args, "profile", False) or output or profiling_requested(os.environ)):
+        yield
+        return
+
+    profiler = None
+    if output:
+        import cProfile
+
+        profiler = cProfile.Profile()
+    recorder = start_profiling()
+    try:
+        if profiler is not None:
+            profiler.enable()
+        try:
+            yield
+        finally:
+            if profiler is not None:
+                profiler.disable()
+    finally:
+        stop_profiling()
+        if not args.json:
+            print(format_profile_report(recorder.report()), file=sys.stderr)
+        if profiler is not None:
+            try:
+                profiler.dump_stats(str(output))
+            except OSError as exc:
+                print(f"Warning: could not write profile to {output}: {exc}", file=sys.stderr)
+            else:
+                if not args.json:
+                    print(f"cProfile stats written to {output}", file=sys.stderr)
+
+
 def main() -> int:
     """Main entry point for CLI."""
     argv = sys.argv[1:]
@@ -2161,7 +2257,8 @@ def main() -> int:
                 f"Command {args.command!r} has no registered handler",
                 code="E_COMMAND_REGISTRY",
             )
-        return handler(args)
+        with _profiling_session(args):
+            return handler(args)
     except OntosUserError as e:
         if args.json:
             emit_command_error(
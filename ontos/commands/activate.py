@@ -30,6 +30,7 @@ from ontos.core.warning_groups import (
 from ontos.io.config import load_project_config
 from ontos.io.concepts import load_known_concepts
 from ontos.io.files import DocumentLoadIssue, find_project_root, load_documents
+from ontos.io.parse_cache import DocumentParseCache
 from ontos.io.scan_scope import collect_scoped_documents, resolve_scan_scope
 from ontos.io.yaml import parse_frontmatter_content
 from ontos.ui.json_output import ExitCode, emit_command_error, emit_command_success
@@ -145,7 +146,14 @@ def run_activation(
         effective_scope,
         base_skip_patterns=list(config.scanning.skip_patterns),
     )
-    load_result = load_documents(doc_paths, parse_frontmatter_content)
+    parse_cache = DocumentParseCache.for_workspace(project_root)
+    load_result = load_documents(
+        doc_paths,
+        parse_frontmatter_content,
+        parse_cache=parse_cache,
+        workers=config.scanning.workers,
+    )
+    parse_cache.save()
     docs = load_result.documents
 
     if not docs and not output_path.exists():
@@ -1,19 +1,20 @@
 """
-Export data command — bulk document export to JSON.
+Export data command — bulk document export to JSON or streamed NDJSON.
 """
 
 from __future__ import annotations
 import json
+import os
+import sys
 from dataclasses import dataclass
 from datetime import datetime
 from pathlib import Path
-from typing import Dict, List, Optional, Tuple, Any
+from typing import Dict, Iterator, List, Optional, Set, TextIO, Tuple, Any
 
-from ontos.core.content_hash import compute_content_hash
 from ontos.core.snapshot import SnapshotFilters
 from ontos.io.snapshot import create_snapshot, DocumentSnapshot
 from ontos.core.migration import classify_documents
-from ontos.io.files import find_project_root
+from ontos.io.files import document_content_hash, find_project_root, read_document_content
 
 
 @dataclass
@@ -24,6 +25,8 @@ class ExportDataOptions:
     status: Optional[str] = None  # Comma-separated
     concepts: Optional[str] = None  # Comma-separated
     no_content: bool = False
+    content_hash_only: bool = False
+    output_format: str = "json"  # json | ndjson
     deterministic: bool = False
     force: bool = False
     quiet: bool = False
@@ -38,40 +41,104 @@ def _parse_csv(value: Optional[str]) -> Optional[List[str]]:
     return [v.strip() for v in value.split(",") if v.strip()]
 
 
+EXPORT_SCHEMA_VERSION = "ontos-export-v1"
+NDJSON_SCHEMA_VERSION = "ontos-export-ndjson-v1"
+
+
 def _snapshot_to_json(
     snapshot: DocumentSnapshot,
     filters: Optional[SnapshotFilters],
     deterministic: bool = False,
+    *,
+    content_hash_only: bool = False,
 ) -> Dict[str, Any]:
     """Convert snapshot to JSON-serializable dict."""
-    import ontos
+    documents = list(
+        _iter_document_records(snapshot, filters, deterministic, content_hash_only)
+    )
+    included_ids = {doc["id"] for doc in documents}
+    edges = list(_iter_edge_records(snapshot, included_ids, deterministic))
+
+    return {
+        "schema_version": EXPORT_SCHEMA_VERSION,
+        "provenance": _export_provenance(snapshot, deterministic),
+        "filters": _export_filters(filters),
+        "summary": _export_summary(snapshot, included_ids, deterministic),
+        "documents": documents,
+        "graph": {
+            "nodes": sorted(list(included_ids)) if deterministic else list(included_ids),
+            "edges": edges,
+        },
+    }
+
+
+def write_snapshot_ndjson(
+    snapshot: DocumentSnapshot,
+    filters: Optional[SnapshotFilters],
+    stream: TextIO,
+    deterministic: bool = False,
+    *,
+    content_hash_only: bool = False,
+) -> int:
+    """Stream the export as newline-delimited JSON and return the document count.
 
+    One ``{"record": "document", ...}`` line per exported document, then one
+    ``{"record": "edge", ...}`` line per edge, then a single ``trailer``
+    line carrying schema version, provenance, filters and summary. Each
+    body is read, written and released before the next, so memory does not
+    grow with the size of the corpus when the snapshot was built with
+    ``lazy_content=True``. Deterministic mode sorts records and keys.
+    """
+    included_ids = set()
+    for record in _iter_document_records(snapshot, filters, deterministic, content_hash_only):
+        included_ids.add(record["id"])
+        _write_ndjson_line(stream, {"record": "document", **record}, deterministic)
+    for record in _iter_edge_records(snapshot, included_ids, deterministic):
+        _write_ndjson_line(stream, {"record": "edge", **record}, deterministic)
+    _write_ndjson_line(
+        stream,
+        {
+            "record": "trailer",
+            "schema_version": NDJSON_SCHEMA_VERSION,
+            "provenance": _export_provenance(snapshot, deterministic),
+            "filters": _export_filters(filters),
+            "summary": _export_summary(snapshot, included_ids, deterministic),
+        },
+        deterministic,
+    )
+    return len(included_ids)
+
+
+def _write_ndjson_line(stream: TextIO, record: Dict[str, Any], deterministic: bool) -> None:
+    stream.write(json.dumps(record, sort_keys=deterministic, separators=(",", ":")))
+    stream.write("\n")
+
+
+def _iter_document_records(
+    snapshot: DocumentSnapshot,
+    filters: Optional[SnapshotFilters],
+    deterministic: bool,
+    content_hash_only: bool,
+) -> Iterator[Dict[str, Any]]:
     from ontos.core.snapshot import matches_filter
-    from ontos.core.migration import classify_documents
 
     # Get migration classifications
     report = classify_documents(snapshot)
- 
-    # Build documents list
-    documents = []
-    included_ids = set()
+
     for doc_id in sorted(snapshot.documents.keys()) if deterministic else snapshot.documents.keys():
         doc = snapshot.documents[doc_id]
-        
+
         # Apply filters during serialization (B2)
         if not matches_filter(doc, filters):
             continue
 
-        included_ids.add(doc_id)
         classification = report.classifications.get(doc_id)
+        content = None if content_hash_only else read_document_content(doc)
 
-        doc_type = doc.type.value
-        doc_status = doc.status.value
-
-        doc_dict = {
+        yield {
             "id": doc.id,
-            "type": doc_type,
-            "status": doc_status,
+            "type": doc.type.value,
+            "status": doc.status.value,
             "path": str(doc.filepath),
             "depends_on": sorted(doc.depends_on) if deterministic else doc.depends_on,
             "concepts": sorted(doc.tags) if deterministic else doc.tags,
@@ -82,13 +149,16 @@ def _snapshot_to_json(
             "migration_status_reason": doc.frontmatter.get("migration_status_reason"),
             "inferred_migration_status": classification.inferred_status if classification else None,
             "effective_migration_status": classification.effective_status if classification else None,
-            "content": doc.content if doc.content else None,
-            "content_hash": compute_content_hash(doc.content) if doc.content else None,
+            "content": content if content else None,
+            "content_hash": document_content_hash(doc),
         }
-        documents.append(doc_dict)
 
-    # Build graph edges
-    edges = []
+
+def _iter_edge_records(
+    snapshot: DocumentSnapshot,
+    included_ids: Set[str],
+    deterministic: bool,
+) -> Iterator[Dict[str, str]]:
     for doc_id in sorted(snapshot.graph.edges.keys()) if deterministic else snapshot.graph.edges.keys():
         if doc_id not in included_ids:
             continue
@@ -97,20 +167,37 @@ def _snapshot_to_json(
             # Re-Architecture spec says: classification reflects position in COMPLETE graph.
             # But the export should probably only show edges between exported docs for clarity.
             if dep_id in included_ids:
-                edges.append({
+                yield {
                     "from": doc_id,
                     "to": dep_id,
                     "type": "depends_on"
-                })
+                }
+
+
+def _export_provenance(snapshot: DocumentSnapshot, deterministic: bool) -> Dict[str, Any]:
+    import ontos
 
-    # Build provenance
-    provenance = {
+    return {
         "exported_at": "deterministic" if deterministic else datetime.now().isoformat(),
         "ontos_version": ontos.__version__,
         "git_commit": "deterministic" if deterministic else snapshot.git_commit,
         "project_root": str(snapshot.project_root),
     }
 
+
+def _export_filters(filters: Optional[SnapshotFilters]) -> Dict[str, Any]:
+    return {
+        "types": filters.types if filters else None,
+        "status": filters.status if filters else None,
+        "concepts": filters.concepts if filters else None,
+    }
+
+
+def _export_summary(
+    snapshot: DocumentSnapshot,
+    included_ids: Set[str],
+    deterministic: bool,
+) -> Dict[str, Any]:
     # Build summary (only for included documents)
     by_type: Dict[str, int] = {}
     by_status: Dict[str, int] = {}
@@ -121,31 +208,16 @@ def _snapshot_to_json(
         by_type[doc_type] = by_type.get(doc_type, 0) + 1
         by_status[doc_status] = by_status.get(doc_status, 0) + 1
 
-    result = {
-        "schema_version": "ontos-export-v1",
-        "provenance": provenance,
-        "filters": {
-            "types": filters.types if filters else None,
-            "status": filters.status if filters else None,
-            "concepts": filters.concepts if filters else None,
-        },
-        "summary": {
-            "total_documents": len(documents),
-            "by_type": dict(sorted(by_type.items())) if deterministic else by_type,
-            "by_status": dict(sorted(by_status.items())) if deterministic else by_status,
-        },
-        "documents": documents,
-        "graph": {
-            "nodes": sorted(list(included_ids)) if deterministic else list(included_ids),
-            "edges": edges,
-        },
+    summary: Dict[str, Any] = {
+        "total_documents": len(included_ids),
+        "by_type": dict(sorted(by_type.items())) if deterministic else by_type,
+        "by_status": dict(sorted(by_status.items())) if deterministic else by_status,
     }
 
     # S2: Include parse warnings if any
     if snapshot.warnings:
-        result["summary"]["warnings"] = snapshot.warnings
-
-    return result
+        summary["warnings"] = snapshot.warnings
+    return summary
 
 
 def _run_export_data_command(options: ExportDataOptions) -> Tuple[int, str]:
@@ -167,6 +239,10 @@ def _run_export_data_command(options: ExportDataOptions) -> Tuple[int, str]:
         if options.output_path.exists() and not options.force:
             return 2, f"Error: Output file exists: {options.output_path}. Use --force to overwrite."
 
+    streaming = options.output_format == "ndjson"
+    if streaming and options.json_output and not options.output_path:
+        return 2, "Error: --format ndjson with --json requires --output."
+
     # Create FULL snapshot first for accurate migration classification (B2)
     try:
         full_snapshot = create_snapshot(
@@ -174,6 +250,9 @@ def _run_export_data_command(options: ExportDataOptions) -> Tuple[int, str]:
             include_content=not options.no_content,
             filters=None,  # Get everything
             scope=options.scope,
+            # Bodies stay on disk when they are streamed one at a time or
+            # not emitted at all.
+            lazy_content=streaming or options.content_hash_only,
         )
 
         # Convert to JSON with filters applied during serialization
@@ -182,7 +261,14 @@ def _run_export_data_command(options: ExportDataOptions) -> Tuple[int, str]:
             status=_parse_csv(options.status),
             concepts=_parse_csv(options.concepts),
         )
-        data = _snapshot_to_json(full_snapshot, filters, options.deterministic)
+        if streaming:
+            return _stream_export(full_snapshot, filters, options)
+        data = _snapshot_to_json(
+            full_snapshot,
+            filters,
+            options.deterministic,
+            content_hash_only=options.content_hash_only,
+        )
 
         # Serialize
         if options.deterministic:
@@ -206,6 +292,52 @@ def _run_export_data_command(options: ExportDataOptions) -> Tuple[int, str]:
         return 0, json_str
 
 
+def _stream_export(
+    snapshot: DocumentSnapshot,
+    filters: SnapshotFilters,
+    options: ExportDataOptions,
+) -> Tuple[int, str]:
+    """Write the NDJSON export to ``options.output_path`` or stdout."""
+    if not options.output_path:
+        try:
+            write_snapshot_ndjson(
+                snapshot,
+                filters,
+                sys.stdout,
+                options.deterministic,
+                content_hash_only=options.content_hash_only,
+            )
+            sys.stdout.flush()
+        except BrokenPipeError:
+            # The consumer stopped reading (``| head``), which is a normal end
+            # for a stream. Point stdout at devnull so the interpreter's final
+            # flush does not raise again.
+            _silence_stdout()
+        return 0, ""
+    try:
+        options.output_path.parent.mkdir(parents=True, exist_ok=True)
+        with open(options.output_path, "w", encoding="utf-8", newline="\n") as handle:
+            count = write_snapshot_ndjson(
+                snapshot,
+                filters,
+                handle,
+                options.deterministic,
+                content_hash_only=options.content_hash_only,
+            )
+    except (IOError, OSError) as e:
+        return 5, f"Error writing to {options.output_path}: {e}"
+    return 0, f"Exported {count} documents to {options.output_path}"
+
+
+def _silence_stdout() -> None:
+    try:
+        devnull = os.open(os.devnull, os.O_WRONLY)
+        os.dup2(devnull, sys.stdout.fileno())
+    except (OSError, ValueError):
+        # No real descriptor behind stdout (e.g. captured in tests).
+        pass
+
+
 def export_data_command(options: ExportDataOptions) -> int:
     """Export structured data and return exit code only."""
     exit_code, _ = _run_export_data_command(options)
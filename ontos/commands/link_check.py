@@ -9,8 +9,10 @@ import sys
 from typing import Dict, List, Optional
 
 from ontos.core.link_diagnostics import LinkDiagnosticsResult, run_link_diagnostics
+from ontos.io.body_scan_cache import BodyScanCache
 from ontos.io.config import load_project_config
 from ontos.io.files import find_project_root
+from ontos.io.parse_cache import DocumentParseCache
 from ontos.io.scan_scope import build_scope_roots, collect_scoped_documents, resolve_scan_scope
 from ontos.ui.json_output import emit_command_error, emit_command_success
 from ontos.ui.output import OutputHandler
@@ -29,6 +31,8 @@ class LinkCheckOptions:
     limit: Optional[int] = None
     frontmatter_only: bool = False
     include_orphans: bool = True
+    # Process count for loading and the body scan (None = scanning.workers).
+    workers: Optional[int] = None
 
 
 def link_check_command(options: LinkCheckOptions) -> int:
@@ -73,6 +77,9 @@ def link_check_command(options: LinkCheckOptions) -> int:
         include_suggestions=include_suggestions,
         include_orphans=options.include_orphans,
         progress=progress,
+        parse_cache=DocumentParseCache.for_workspace(repo_root),
+        workers=options.workers,
+        body_scan_cache=BodyScanCache.for_workspace(repo_root),
     )
 
     if options.json_output:
@@ -12,16 +12,19 @@ import time
 import warnings
 from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Callable, Dict, List, Literal, Optional, Sequence, Tuple, cast
+from typing import Callable, Dict, Iterable, List, Literal, Optional, Sequence, Set, Tuple, cast
 
 import ontos
 from ontos.core.config import ConfigError, OntosConfig
 from ontos.core.curation import CurationLevel, detect_curation_level
 from ontos.core.errors import OntosUserError
 from ontos.core.link_diagnostics import run_link_diagnostics
+from ontos.io.body_scan_cache import BodyScanCache
 from ontos.io.config import load_project_config
-from ontos.io.files import find_project_root
+from ontos.io.files import DocumentLoadResult, find_project_root, load_documents
+from ontos.io.parse_cache import MemoryParseCache
 from ontos.io.scan_scope import build_scope_roots, collect_scoped_documents, resolve_scan_scope
+from ontos.io.yaml import parse_frontmatter_content
 from ontos.ui.json_output import ExitCode, emit_command_error, emit_command_success
 from ontos.ui.output import OutputHandler
 
@@ -44,6 +47,8 @@ class MaintainOptions:
     quiet: bool = False
     json_output: bool = False
     scope: Optional[str] = None
+    # Process count for the check_links body scan (None = scanning.workers).
+    workers: Optional[int] = None
 
 
 @dataclass
@@ -81,6 +86,62 @@ class TaskExecution:
     exit_code: int = 0
 
 
+class MaintainCorpus:
+    """Scoped document corpus shared by the tasks of one maintain run.
+
+    The scoped path list and its ``DocumentLoadResult`` are built on first
+    use and reused by every read-only task. Loads go through one in-memory
+    parse cache, so a later load of the same or another path set only
+    re-reads files whose fingerprint changed. Tasks that write documents
+    report the paths they touched through :meth:`invalidate`; the next load
+    re-reads just those paths (and rescans the tree only when the path set
+    itself may have changed).
+    """
+
+    def __init__(self, scan: Callable[[], List[Path]]) -> None:
+        self._scan = scan
+        self._parse_cache = MemoryParseCache()
+        self._paths: Optional[List[Path]] = None
+        self._load_result: Optional[DocumentLoadResult] = None
+        self._dirty: Set[Path] = set()
+
+    def paths(self) -> List[Path]:
+        """Return the scoped document paths, scanning at most once."""
+        if self._paths is None:
+            self._paths = self._scan()
+        return self._paths
+
+    def load_result(self) -> DocumentLoadResult:
+        """Return the loaded scoped corpus, re-reading only dirty paths."""
+        if self._load_result is None:
+            self._load_result = self.load(self.paths())
+        return self._load_result
+
+    def load(self, paths: Sequence[Path]) -> DocumentLoadResult:
+        """Load ``paths`` through the shared parse cache."""
+        if self._dirty:
+            self._parse_cache.discard(self._dirty)
+            self._dirty.clear()
+        return load_documents(
+            list(paths),
+            parse_frontmatter_content,
+            parse_cache=self._parse_cache,
+        )
+
+    def invalidate(self, paths: Optional[Iterable[Path]] = None) -> None:
+        """Mark ``paths`` as written; ``None`` means unknown, so rescan."""
+        self._load_result = None
+        if paths is None:
+            self._paths = None
+            return
+        dirty = {Path(path) for path in paths}
+        self._dirty.update(dirty)
+        if self._paths is not None:
+            known = set(self._paths)
+            if any(path not in known or not path.exists() for path in dirty):
+                self._paths = None
+
+
 @dataclass
 class MaintainContext:
     """Shared execution context for all maintenance tasks."""
@@ -89,6 +150,10 @@ class MaintainContext:
     config: OntosConfig
     options: MaintainOptions
     output: OutputHandler
+    corpus: MaintainCorpus = field(init=False, repr=False)
+
+    def __post_init__(self) -> None:
+        self.corpus = MaintainCorpus(lambda: _scan_docs(self))
 
 
 class MaintainTaskRegistry:
@@ -358,6 +423,7 @@ def _task_migrate_untagged(ctx: MaintainContext) -> TaskResult:
             json_output=False,
         )
     )
+    ctx.corpus.invalidate(untagged)
     if exit_code == 0:
         return _ok(
             f"Scaffolded {count} untagged file(s).",
@@ -451,12 +517,7 @@ def _task_curation_stats(ctx: MaintainContext) -> TaskResult:
         CurationLevel.FULL: 0,
     }
 
-    from ontos.io.files import load_documents
-    from ontos.io.yaml import parse_frontmatter_content
-    
-    load_result = load_documents(_scan_docs(ctx), parse_frontmatter_content)
-
-    for doc in load_result.documents.values():
+    for doc in ctx.corpus.load_result().documents.values():
         level = detect_curation_level(doc.frontmatter)
         counts[level] += 1
 
@@ -539,6 +600,8 @@ def _task_consolidate_logs(ctx: MaintainContext) -> TaskResult:
             json_output=False,
         )
     )
+    # Consolidation moves and rewrites logs it does not report back.
+    ctx.corpus.invalidate()
     if exit_code == 0:
         return _ok(message or "Consolidation complete.", metrics={"retention_count": retention_count})
     return _fail(
@@ -560,9 +623,6 @@ class DraftProposal:
 
 
 def _find_draft_proposals(ctx: MaintainContext) -> List[DraftProposal]:
-    from ontos.io.files import load_documents
-    from ontos.io.yaml import parse_frontmatter_content
-
     proposal_dirs: List[Path] = []
     
     # ... Same directory detection logic ...
@@ -582,7 +642,7 @@ def _find_draft_proposals(ctx: MaintainContext) -> List[DraftProposal]:
     for d in proposal_dirs:
         all_files.extend(d.rglob("*.md"))
     
-    load_result = load_documents(all_files, parse_frontmatter_content)
+    load_result = ctx.corpus.load(all_files)
     
     proposals: List[DraftProposal] = []
     version_pattern = re.compile(r"v?(\d+)[._-](\d+)")
@@ -661,11 +721,8 @@ def _task_check_links(ctx: MaintainContext) -> TaskResult:
         return _ok("Would validate dependency links.")
 
     scope = resolve_scan_scope(ctx.options.scope, ctx.config.scanning.default_scope)
-    doc_paths = _scan_docs(ctx)
-    from ontos.io.files import load_documents
-    from ontos.io.yaml import parse_frontmatter_content
-
-    load_result = load_documents(doc_paths, parse_frontmatter_content)
+    doc_paths = ctx.corpus.paths()
+    load_result = ctx.corpus.load_result()
 
     diagnostics = run_link_diagnostics(
         repo_root=ctx.repo_root,
@@ -678,6 +735,8 @@ def _task_check_links(ctx: MaintainContext) -> TaskResult:
         # skipping suggestion generation is a free speedup with identical results.
         include_suggestions=False,
         load_result=load_result,
+        workers=ctx.options.workers,
+        body_scan_cache=BodyScanCache.for_workspace(ctx.repo_root),
     )
 
     details: List[str] = []
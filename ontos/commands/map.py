@@ -18,10 +18,12 @@ from pathlib import Path
 from typing import Dict, List, Optional, Any, Tuple
 
 from ontos import __version__ as ONTOS_VERSION
+from ontos.core.profiling import profiled
 from ontos.core.validation import ValidationOrchestrator
 from ontos.core.tokens import estimate_tokens, format_token_count
 from ontos.core.types import DocumentData, DocumentStatus, ValidationResult
 from ontos.io.concepts import load_known_concepts as _load_known_concepts
+from ontos.io.files import DocumentChangedError, read_document_content
 from ontos.ui.json_output import ExitCode, emit_command_error, emit_command_success
 
 
@@ -93,6 +95,7 @@ def _without_generated_timestamps(content: str) -> str:
     return "".join(normalized)
 
 
+@profiled("write")
 def _write_context_map_if_changed(output_path: Path, content: str) -> bool:
     """Write a generated map only when non-timestamp content changed."""
     if output_path.exists():
@@ -137,6 +140,12 @@ def _extract_recent_activity_summary(doc: Any) -> str:
         return _normalize_recent_activity_summary(frontmatter["summary"])
 
     body = str(getattr(doc, "content", "") or "")
+    if not body and getattr(doc, "content_ref", None) is not None:
+        # Lazy snapshots leave the body on disk.
+        try:
+            body = read_document_content(doc)
+        except DocumentChangedError:
+            body = ""
     body = _HTML_COMMENT_RE.sub("", body)
     paragraph_lines: List[str] = []
     body_lines = body.splitlines()
@@ -192,6 +201,7 @@ def _log_date_sort_key(doc: Any) -> tuple:
     )
 
 
+@profiled("render")
 def generate_context_map(
     docs: Dict[str, DocumentData],
     config: Dict[str, Any],
@@ -909,6 +919,7 @@ class MapOptions:
     compact: CompactMode = CompactMode.OFF
     filter_expr: Optional[str] = None
     no_cache: bool = False
+    workers: Optional[int] = None
     sync_agents: bool = False
     scope: Optional[str] = None
     verbose: bool = False
@@ -929,7 +940,7 @@ def map_command(options: MapOptions) -> int:
     from ontos.io.config import load_project_config
     from ontos.io.scan_scope import collect_scoped_documents, resolve_scan_scope
     from ontos.io.yaml import parse_frontmatter_content
-    from ontos.core.cache import DocumentCache
+    from ontos.io.parse_cache import DocumentParseCache
 
     # Find project root
     try:
@@ -980,13 +991,21 @@ def map_command(options: MapOptions) -> int:
         base_skip_patterns=skip,
     )
 
-    # Load documents using canonical loader (#40, #10)
-    cache = DocumentCache() if not options.no_cache else None
+    # Load documents using canonical loader (#40, #10). The persistent parse
+    # cache under .ontos/cache/ lets unchanged files skip read + YAML parse.
+    parse_cache = (
+        DocumentParseCache.for_workspace(project_root) if not options.no_cache else None
+    )
     load_result: DocumentLoadResult = load_documents(
-        doc_paths, 
-        parse_frontmatter_content, 
-        cache=cache
+        doc_paths,
+        parse_frontmatter_content,
+        parse_cache=parse_cache,
+        workers=(
+            options.workers if options.workers is not None else config.scanning.workers
+        ),
     )
+    if parse_cache is not None:
+        parse_cache.save()
     
     # Process load issues. Default output is grouped so activation is not
     # buried under hundreds of repeated legacy warnings; --verbose preserves
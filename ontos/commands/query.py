@@ -5,7 +5,7 @@ from collections import defaultdict
 from dataclasses import dataclass, field
 from datetime import datetime, date
 from pathlib import Path
-from typing import Dict, List, Optional, Tuple, Any
+from typing import Any, Callable, Dict, List, Optional, Tuple
 
 from ontos.core.types import DocumentData, DocumentType
 from ontos.core.graph import build_graph as core_build_graph, detect_cycles
@@ -15,7 +15,8 @@ from ontos.core.health import (
     connectivity_summary,
     orphan_summary,
 )
-from ontos.io.git import get_file_mtime as git_mtime_provider
+from ontos.io.git import get_file_mtime
+from ontos.io.git_dates import git_date_provider
 from ontos.io.config import load_project_config
 from ontos.io.files import find_project_root, load_documents, DocumentLoadResult
 from ontos.io.scan_scope import collect_scoped_documents, resolve_scan_scope
@@ -58,8 +59,18 @@ def scan_docs_for_query(root: Path, scope: Optional[str], explicit_dirs: Optiona
 # Local build_graph removed in favor of ontos.core.graph.build_graph
 
 
-def query_stale(files_data: Dict[str, DocumentData], days: int) -> List[Tuple[str, int]]:
-    """Find documents not updated in N days."""
+def query_stale(
+    files_data: Dict[str, DocumentData],
+    days: int,
+    git_mtime_provider: Optional[Callable[[Path], Optional[datetime]]] = None,
+) -> List[Tuple[str, int]]:
+    """Find documents not updated in N days.
+
+    ``git_mtime_provider`` defaults to one ``git log`` call per document;
+    the command passes the bulk :func:`git_date_provider` instead.
+    """
+    if git_mtime_provider is None:
+        git_mtime_provider = get_file_mtime
     stale = []
     today = datetime.now()
     
@@ -267,7 +278,7 @@ def _run_query_command(options: QueryOptions) -> Tuple[int, str]:
             output.warning(f"No documents tagged with '{options.concept}'")
             
     elif options.stale is not None:
-        results = query_stale(files_data, options.stale)
+        results = query_stale(files_data, options.stale, git_date_provider(root))
         options.runtime_data = {
             "stale_days": options.stale,
             "results": [{"id": doc_id, "age_days": age} for doc_id, age in results],
@@ -26,6 +26,8 @@ from ontos.core.rename_transaction import RenameTransaction, recover_rename_tran
 from ontos.core.types import DocumentData
 from ontos.io.config import load_project_config
 from ontos.io.files import DocumentLoadIssue, find_project_root, load_documents, scan_documents
+from ontos.io.parse_cache import DocumentParseCache
+from ontos.io.reference_index import load_reference_index
 from ontos.io.scan_scope import ScanScope, collect_scoped_documents, resolve_scan_scope
 from ontos.io.yaml import parse_frontmatter_content
 from ontos.mcp.locking import workspace_lock
@@ -392,7 +394,8 @@ def build_rename_plan(
     6. ``new_id`` must not already exist in scope.
     7. Cross-scope collision check when ``scope == ScanScope.DOCS``.
     8. ``load_issues`` parse-failed-sighting check (skipped when ``None``).
-    9. Per-document ``_build_file_plan`` loop (sorted by filepath).
+    9. Per-document ``_build_file_plan`` loop (sorted by filepath) over the
+       documents that may reference ``old_id`` (see ``_reference_candidates``).
     10. Summary + ``RenamePlan`` assembly.
 
     ``check_git=False`` exists because MCP validates git-clean ex-ante —
@@ -495,9 +498,12 @@ def build_rename_plan(
                 ),
             )
 
+    candidates = _reference_candidates(repo_root, docs, old_id)
     file_plans: List[FilePlan] = []
     all_warnings: List[RenameWarning] = []
     for doc in sorted(docs.values(), key=lambda item: str(item.filepath)):
+        if doc.filepath not in candidates:
+            continue
         try:
             file_plan = _build_file_plan(
                 path=doc.filepath,
@@ -616,7 +622,9 @@ def _prepare_plan(options: RenameOptions, *, mode: str) -> Tuple[Optional[_Prepa
         scope,
         base_skip_patterns=list(config.scanning.skip_patterns),
     )
-    load_result = load_documents(doc_paths, parse_frontmatter_content)
+    parse_cache = DocumentParseCache.for_workspace(repo_root)
+    load_result = load_documents(doc_paths, parse_frontmatter_content, parse_cache=parse_cache)
+    parse_cache.save()
     docs = load_result.documents
 
     # Duplicate-ID detection is a CLI-only error path (MCP operates on the
@@ -693,10 +701,30 @@ def _load_external_ids(repo_root: Path, config) -> set[str]:
     if not external_root.exists():
         return set()
     paths = scan_documents([external_root], skip_patterns=list(config.scanning.skip_patterns))
-    result = load_documents(paths, parse_frontmatter_content)
+    parse_cache = DocumentParseCache.for_workspace(repo_root)
+    result = load_documents(paths, parse_frontmatter_content, parse_cache=parse_cache)
+    parse_cache.save()
     return set(result.documents.keys())
 
 
+def _reference_candidates(
+    repo_root: Path,
+    docs: Dict[str, DocumentData],
+    old_id: str,
+) -> set[Path]:
+    """Return the document paths that can yield a file plan for ``old_id``."""
+    index = load_reference_index(repo_root, [doc.filepath for doc in docs.values()])
+    candidates = index.candidates(old_id)
+    # Parsed frontmatter catches values a token scan cannot see (YAML escapes).
+    for doc in docs.values():
+        if any(
+            _needs_patch(field_name, doc.frontmatter.get(field_name), old_id)
+            for field_name in ("id", "depends_on", "impacts", "describes")
+        ):
+            candidates.add(doc.filepath)
+    return candidates
+
+
 def _scan_parse_failed_files_for_target(
     *,
     issues: Sequence[DocumentLoadIssue],
@@ -103,6 +103,7 @@ from ontos.core.types import (
     DocumentStatus,
     ValidationErrorType,
     DocumentData,
+    ContentRef,
     ValidationError,
     ValidationResult,
     TEMPLATES,
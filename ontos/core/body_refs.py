@@ -2,11 +2,12 @@
 
 from __future__ import annotations
 
+import functools
 import re
 from dataclasses import dataclass
 from enum import Enum
 from pathlib import Path
-from typing import Iterable, List, Optional, Sequence, Tuple
+from typing import AbstractSet, Dict, Iterable, List, Optional, Sequence, Tuple
 
 
 class ZoneType(str, Enum):
@@ -138,10 +139,10 @@ def scan_body_references(
     if not lines:
         lines = [""]
 
-    # (#135) Sorting the known-id set used to happen per text segment —
-    # O(lines * ids log ids) across a corpus. Hoist it to once per scan.
-    ordered_known_ids = (
-        _order_known_ids(known_ids)
+    # (#135) The known-id matcher is built once per distinct id set and
+    # shared by every segment of every document scanned against it.
+    id_matcher = (
+        known_id_matcher(known_ids)
         if known_ids is not None and rename_target is None
         else None
     )
@@ -241,7 +242,7 @@ def scan_body_references(
                     known_ids=known_ids,
                     line_is_reference_definition=line_is_reference_definition,
                     include_generic_bare_id_token=include_generic_bare_id_token,
-                    ordered_known_ids=ordered_known_ids,
+                    id_matcher=id_matcher,
                 )
             )
 
@@ -416,7 +417,7 @@ def _scan_normal_text_segment(
     known_ids: Optional[set[str]],
     line_is_reference_definition: bool,
     include_generic_bare_id_token: bool = True,
-    ordered_known_ids: Optional[List[str]] = None,
+    id_matcher: Optional["KnownIdMatcher"] = None,
 ) -> List[BodyReferenceMatch]:
     if line_is_reference_definition:
         return []
@@ -463,7 +464,7 @@ def _scan_normal_text_segment(
         bare_candidates = _iter_target_id_candidates(segment_text, rename_target)
     elif known_ids is not None:
         bare_candidates = _iter_known_reference_candidates(
-            segment_text, ordered_known_ids or _order_known_ids(known_ids)
+            segment_text, id_matcher or known_id_matcher(known_ids)
         )
     elif include_generic_bare_id_token:
         bare_candidates = _iter_generic_id_candidates(segment_text)
@@ -715,6 +716,93 @@ def _iter_known_id_candidates(text: str, ids: Sequence[str]) -> Iterable[Tuple[i
             yield start, end, doc_id
 
 
+_TRIE_TERMINAL = ""
+_HARD_BOUNDARY_RE = re.compile(r"[ \t\n\[\]()`,]")
+
+
+class KnownIdMatcher:
+    """Multi-ID matcher over a fixed known-id set, built once per corpus.
+
+    Every known-id match must start at the beginning of the text or right
+    after a hard boundary character, so instead of one substring search per
+    id the matcher walks a character trie of all ids from each such start
+    position. Output is identical to :func:`_iter_known_id_candidates` over
+    the ids in longest-first order: grouped by id in that order, ascending
+    by position within each id.
+
+    Ids that themselves contain a hard boundary character (or are empty)
+    can overlap their own earlier occurrences at a valid start position,
+    where the per-id ``re.finditer`` scan would not report them; those rare
+    ids keep the per-id scan.
+    """
+
+    __slots__ = ("ids", "_rank", "_trie", "_fallback")
+
+    def __init__(self, known_ids: Iterable[str]):
+        self.ids = frozenset(known_ids)
+        ordered = _order_known_ids(self.ids)
+        self._rank: Dict[str, int] = {doc_id: rank for rank, doc_id in enumerate(ordered)}
+        self._trie: Dict[str, object] = {}
+        self._fallback: List[str] = []
+        for doc_id in ordered:
+            if not doc_id or any(ch in _HARD_BOUNDARY for ch in doc_id):
+                self._fallback.append(doc_id)
+                continue
+            node = self._trie
+            for ch in doc_id:
+                node = node.setdefault(ch, {})  # type: ignore[assignment]
+            node[_TRIE_TERMINAL] = doc_id
+
+    def iter_candidates(self, text: str) -> List[Tuple[int, int, str]]:
+        """Return ``(start, end, id)`` for every bounded known-id match."""
+
+        hits: List[Tuple[int, int, int, str]] = []
+        rank = self._rank
+        trie = self._trie
+        length = len(text)
+        starts = [0]
+        starts.extend(found.end() for found in _HARD_BOUNDARY_RE.finditer(text))
+        for start in starts:
+            if start >= length:
+                continue
+            node = trie.get(text[start])
+            index = start + 1
+            while node is not None:
+                doc_id = node.get(_TRIE_TERMINAL)  # type: ignore[union-attr]
+                if doc_id is not None:
+                    curr_ch = text[index] if index < length else None
+                    next_ch = text[index + 1] if index + 1 < length else None
+                    if is_trailing_boundary(curr_ch, next_ch):
+                        hits.append((rank[doc_id], start, index, doc_id))
+                if index >= length:
+                    break
+                node = node.get(text[index])  # type: ignore[union-attr]
+                index += 1
+        for doc_id in self._fallback:
+            if doc_id not in text:
+                continue
+            for start, end in _iter_exact_id_matches(text, doc_id):
+                hits.append((rank[doc_id], start, end, doc_id))
+        hits.sort()
+        return [(start, end, doc_id) for _, start, end, doc_id in hits]
+
+
+def known_id_matcher(known_ids: AbstractSet[str]) -> KnownIdMatcher:
+    """Return the shared matcher for ``known_ids``.
+
+    Matchers are memoized per distinct id set, so a link-check run that
+    scans every document against the same ids compiles the trie once.
+    Passing a ``frozenset`` makes the lookup O(1).
+    """
+
+    return _cached_matcher(frozenset(known_ids))
+
+
+@functools.lru_cache(maxsize=8)
+def _cached_matcher(known_ids: frozenset) -> KnownIdMatcher:
+    return KnownIdMatcher(known_ids)
+
+
 def _iter_target_id_candidates(
     text: str,
     target: str,
@@ -733,13 +821,13 @@ def _iter_target_id_candidates(
 
 def _iter_known_reference_candidates(
     text: str,
-    ids: Sequence[str],
+    matcher: "KnownIdMatcher",
 ) -> Iterable[Tuple[int, int, str]]:
     """Yield known IDs, including aliased and heading-qualified wikilinks."""
 
-    known = set(ids)
+    known = matcher.ids
     seen: set[Tuple[int, int]] = set()
-    for start, end, normalized_id in _iter_known_id_candidates(text, ids):
+    for start, end, normalized_id in matcher.iter_candidates(text):
         seen.add((start, end))
         yield start, end, normalized_id
     for start, end, normalized_id in _iter_wikilink_id_candidates(text):
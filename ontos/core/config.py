@@ -79,6 +79,9 @@ class ScanningConfig:
     ])
     scan_paths: List[str] = field(default_factory=list)
     default_scope: str = "docs"
+    # Process count for document read/parse (0 = one per CPU). The serial
+    # loader stays the default; results are identical either way.
+    workers: int = 1
 
 
 @dataclass
@@ -115,6 +118,11 @@ class McpConfig:
     """[mcp] section."""
     usage_logging: bool = False
     usage_log_path: Optional[str] = None
+    # How `ontos serve` notices workspace edits: "fingerprint" re-stats
+    # tracked files on every tool call; "watch" uses filesystem events
+    # (falling back to polling); "poll" checks on a background timer.
+    freshness_mode: str = "fingerprint"
+    poll_interval_ms: int = 1000
 
 
 @dataclass
@@ -164,6 +172,7 @@ def _validate_types(data: dict) -> None:
         ("paths", "logs_dir"): str,
         ("paths", "context_map"): str,
         ("scanning", "default_scope"): str,
+        ("scanning", "workers"): int,
         ("validation", "max_dependency_depth"): int,
         ("workflow", "log_retention_count"): int,
         ("hooks", "pre_push"): bool,
@@ -171,6 +180,8 @@ def _validate_types(data: dict) -> None:
         ("hooks", "strict"): bool,
         ("mcp", "usage_logging"): bool,
         ("mcp", "usage_log_path"): str,
+        ("mcp", "freshness_mode"): str,
+        ("mcp", "poll_interval_ms"): int,
     }
 
     for (section, key), expected_type in type_requirements.items():
@@ -225,6 +236,17 @@ def _validate_types(data: dict) -> None:
     default_scope = scanning.get("default_scope")
     if default_scope is not None and default_scope not in {"docs", "library"}:
         raise ConfigError("scanning.default_scope must be 'docs' or 'library'")
+    workers = scanning.get("workers")
+    if workers is not None and workers < 0:
+        raise ConfigError("scanning.workers must be >= 0 (0 = one per CPU)")
+
+    mcp = data.get("mcp", {})
+    freshness_mode = mcp.get("freshness_mode")
+    if freshness_mode is not None and freshness_mode not in {"fingerprint", "watch", "poll"}:
+        raise ConfigError("mcp.freshness_mode must be 'fingerprint', 'watch', or 'poll'")
+    poll_interval_ms = mcp.get("poll_interval_ms")
+    if poll_interval_ms is not None and poll_interval_ms < 50:
+        raise ConfigError("mcp.poll_interval_ms must be >= 50")
 
 
 
@@ -20,6 +20,7 @@ import secrets
 import stat
 import time
 
+from ontos.core.profiling import profiled
 from ontos.core.locking import (
     WorkspaceBinding,
     WorkspaceLockGuard,
@@ -289,6 +290,7 @@ class SessionContext:
         finally:
             self._close_anchor(anchor)
 
+    @profiled("write")
     def commit(self) -> List[Path]:
         """Execute all buffered operations from the current session.
 
@@ -17,6 +17,7 @@ The caller (commands layer) provides the IO callback.
 
 import os
 import re
+import sys
 from typing import Optional, List, Dict, Any, Callable
 
 from ontos.io.yaml import parse_yaml, split_frontmatter_text
@@ -64,6 +65,32 @@ def parse_frontmatter(
         return None
 
 
+# Longer strings (summaries, prose) are effectively unique per document.
+_INTERN_MAX_LENGTH = 128
+
+
+def intern_frontmatter(frontmatter: Dict[str, Any]) -> Dict[str, Any]:
+    """Return ``frontmatter`` with its keys and short string values interned.
+
+    Every document repeats the same keys and mostly the same short values
+    (types, statuses, tags, referenced IDs); interning stores each once per
+    process. Nested mappings are left as parsed.
+    """
+    def _intern(value: Any) -> Any:
+        if type(value) is str and len(value) <= _INTERN_MAX_LENGTH:
+            return sys.intern(value)
+        return value
+
+    interned: Dict[Any, Any] = {}
+    for key, value in frontmatter.items():
+        if type(value) is list:
+            value = [_intern(item) for item in value]
+        else:
+            value = _intern(value)
+        interned[_intern(key)] = value
+    return interned
+
+
 def normalize_reference_list(value: Any, field_name: str, on_warning: Optional[Callable[[str], None]] = None) -> List[str]:
     """Normalize reference lists (depends_on, impacts) to List[str].
     
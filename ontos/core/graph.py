@@ -15,6 +15,7 @@ from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Dict, List, Sequence, Set, Optional, Tuple, Union
 
+from ontos.core.profiling import profiled
 from ontos.core.types import DocumentData, ValidationError, ValidationErrorType
 from ontos.core.suggestions import SuggestionIndex, suggest_candidates
 
@@ -191,6 +192,7 @@ class DependencyGraph:
             self.reverse_edges[dep].append(doc_id)
 
 
+@profiled("graph")
 def build_graph(
     docs: Dict[str, DocumentData],
     severity_map: Optional[Dict[str, str]] = None,
@@ -216,118 +218,118 @@ def build_graph(
     Returns:
         Tuple of (DependencyGraph, list of broken/out-of-scope link errors)
     """
-    severity_map = severity_map or {}
     graph = DependencyGraph()
     errors: List[ValidationError] = []
-    existing_ids = set(docs.keys())
-    depends_on_severity = severity_map.get(
-        "depends_on",
-        severity_map.get("broken_link", DEPENDS_ON_SEVERITY_DEFAULT),
+    resolver = DependencyResolver(
+        docs,
+        severity_map=severity_map,
+        workspace_root=workspace_root,
+        allowed_external_dependency_paths=allowed_external_dependency_paths,
     )
-    out_of_scope_severity = severity_map.get(
-        "out_of_scope_dependency", OUT_OF_SCOPE_DEPENDENCY_SEVERITY
-    )
-    external_file_severity = severity_map.get(
-        "external_file_dependency", EXTERNAL_FILE_DEPENDENCY_SEVERITY
-    )
-    external_allowlist = list(allowed_external_dependency_paths or [])
 
-    # (#135) One suggestion index per build, with results memoized per unique
-    # dep value — the same broken target declared from many docs used to
-    # recompute fuzzy matches against the whole corpus each time.
-    suggestion_index: Optional[SuggestionIndex] = None
-    suggestion_memo: Dict[str, List[Tuple[str, float, str]]] = {}
+    for doc_id, doc in docs.items():
+        resolved_depends_on, doc_errors = resolver.resolve(doc_id, doc)
+        errors.extend(doc_errors)
+        graph.add_node(doc_id, doc.type.value, str(doc.filepath), resolved_depends_on)
 
-    loaded_paths = _LoadedPathIndex.from_documents(docs)
-    workspace_root_resolved: Optional[Path] = None
-    if workspace_root is not None:
-        try:
-            workspace_root_resolved = workspace_root.resolve()
-        except (OSError, RuntimeError, ValueError):
-            workspace_root_resolved = None
+    return graph, errors
 
-    for doc_id, doc in docs.items():
-        depends_on = doc.depends_on
-        doc_type = doc.type.value
+
+class DependencyResolver:
+    """Resolve one document's ``depends_on`` entries against a loaded corpus.
+
+    Shared by :func:`build_graph` and incremental validation so a single
+    document can be re-resolved with exactly the full-build semantics.
+    """
+
+    def __init__(
+        self,
+        docs: Dict[str, DocumentData],
+        severity_map: Optional[Dict[str, str]] = None,
+        workspace_root: Optional[Path] = None,
+        allowed_external_dependency_paths: Optional[Sequence[str]] = None,
+    ) -> None:
+        severity_map = severity_map or {}
+        self.docs = docs
+        self.existing_ids = set(docs.keys())
+        self.workspace_root = workspace_root
+        self.depends_on_severity = severity_map.get(
+            "depends_on",
+            severity_map.get("broken_link", DEPENDS_ON_SEVERITY_DEFAULT),
+        )
+        self.out_of_scope_severity = severity_map.get(
+            "out_of_scope_dependency", OUT_OF_SCOPE_DEPENDENCY_SEVERITY
+        )
+        self.external_file_severity = severity_map.get(
+            "external_file_dependency", EXTERNAL_FILE_DEPENDENCY_SEVERITY
+        )
+        self.external_allowlist = list(allowed_external_dependency_paths or [])
+
+        # (#135) One suggestion index per build, with results memoized per unique
+        # dep value — the same broken target declared from many docs used to
+        # recompute fuzzy matches against the whole corpus each time.
+        self._suggestion_index: Optional[SuggestionIndex] = None
+        self._suggestion_memo: Dict[str, List[Tuple[str, float, str]]] = {}
+        # The loaded-path index stats every document, so it is only built
+        # once a dependency actually needs path resolution.
+        self._loaded_paths: Optional[_LoadedPathIndex] = None
+
+        self.workspace_root_resolved: Optional[Path] = None
+        if workspace_root is not None:
+            try:
+                self.workspace_root_resolved = workspace_root.resolve()
+            except (OSError, RuntimeError, ValueError):
+                self.workspace_root_resolved = None
+
+    @property
+    def loaded_paths(self) -> _LoadedPathIndex:
+        if self._loaded_paths is None:
+            self._loaded_paths = _LoadedPathIndex.from_documents(self.docs)
+        return self._loaded_paths
+
+    def resolve(
+        self, doc_id: str, doc: DocumentData
+    ) -> Tuple[List[str], List[ValidationError]]:
+        """Return ``(resolved_depends_on, errors)`` for one document."""
+        errors: List[ValidationError] = []
         # (#117) Resolve each declared dep BEFORE building the graph node so
         # the edges + reverse_edges record doc-id targets, not raw path
         # strings. Doc-id matches and path-resolved-to-loaded-doc both
         # become regular edges; out-of-scope or broken entries are dropped
         # from the edge list and reported as ValidationErrors.
         resolved_depends_on: List[str] = []
-        for dep_id in depends_on:
-            if dep_id in existing_ids:
+        for dep_id in doc.depends_on:
+            if dep_id in self.existing_ids:
                 resolved_depends_on.append(dep_id)
                 continue
 
-            resolved_id, external_path, external_resolved = _resolve_depends_on_path(
-                dep_id, doc, loaded_paths, workspace_root, workspace_root_resolved
-            )
+            resolved_id, external_path, external_resolved = (None, None, None)
+            if self.workspace_root is not None and _looks_like_path(dep_id):
+                resolved_id, external_path, external_resolved = _resolve_depends_on_path(
+                    dep_id,
+                    doc,
+                    self.loaded_paths,
+                    self.workspace_root,
+                    self.workspace_root_resolved,
+                )
             if resolved_id is not None:
                 resolved_depends_on.append(resolved_id)
                 continue
             if external_path is not None:
-                rel_posix: Optional[str] = None
-                if external_resolved is not None and workspace_root_resolved is not None:
-                    try:
-                        rel_posix = external_resolved.relative_to(
-                            workspace_root_resolved
-                        ).as_posix()
-                    except ValueError:
-                        rel_posix = None
-                allowlisted = bool(
-                    external_allowlist
-                    and rel_posix is not None
-                    and _path_matches_allowlist(rel_posix, external_allowlist)
+                errors.append(
+                    self._external_dependency_error(
+                        doc_id, doc, dep_id, external_path, external_resolved
+                    )
                 )
-                if allowlisted:
-                    errors.append(ValidationError(
-                        error_type=ValidationErrorType.EXTERNAL_FILE_DEPENDENCY,
-                        doc_id=doc_id,
-                        filepath=str(doc.filepath),
-                        message=(
-                            f"External file dependency (allowlisted): '{dep_id}' "
-                            f"(declared in {doc_id}) resolved to '{rel_posix}'."
-                        ),
-                        fix_suggestion="",
-                        severity=external_file_severity,
-                        context={
-                            "dep_value": dep_id,
-                            "resolved_path": rel_posix,
-                            "allowlisted": True,
-                        },
-                    ))
-                else:
-                    errors.append(ValidationError(
-                        error_type=ValidationErrorType.OUT_OF_SCOPE_DEPENDENCY,
-                        doc_id=doc_id,
-                        filepath=str(doc.filepath),
-                        message=(
-                            f"External dependency resolved from disk: '{dep_id}' "
-                            f"(declared in {doc_id}) exists at "
-                            f"'{external_path}' but is not a loaded document."
-                        ),
-                        fix_suggestion=(
-                            "If the target should be tracked as a doc, add an "
-                            "Ontos frontmatter id; otherwise this can be left as a "
-                            "soft external reference."
-                        ),
-                        severity=out_of_scope_severity,
-                        context={
-                            "dep_value": dep_id,
-                            "resolved_path": (
-                                rel_posix if rel_posix is not None else str(external_path)
-                            ),
-                            "allowlisted": False,
-                        },
-                    ))
                 continue
 
-            if dep_id not in suggestion_memo:
-                if suggestion_index is None:
-                    suggestion_index = SuggestionIndex(docs)
-                suggestion_memo[dep_id] = suggest_candidates(dep_id, suggestion_index)
-            candidates = suggestion_memo[dep_id]
+            if dep_id not in self._suggestion_memo:
+                if self._suggestion_index is None:
+                    self._suggestion_index = SuggestionIndex(self.docs)
+                self._suggestion_memo[dep_id] = suggest_candidates(
+                    dep_id, self._suggestion_index
+                )
+            candidates = self._suggestion_memo[dep_id]
             fix_suggestion = f"Remove '{dep_id}' from depends_on or create the missing document"
             if candidates:
                 suggestion_text = ", ".join(c[0] for c in candidates)
@@ -339,13 +341,73 @@ def build_graph(
                 filepath=str(doc.filepath),
                 message=f"Broken dependency: '{dep_id}' (declared in {doc_id}) does not exist",
                 fix_suggestion=fix_suggestion,
-                severity=depends_on_severity,
+                severity=self.depends_on_severity,
                 context={"dep_value": dep_id},
             ))
 
-        graph.add_node(doc_id, doc_type, str(doc.filepath), resolved_depends_on)
-
-    return graph, errors
+        return resolved_depends_on, errors
+
+    def _external_dependency_error(
+        self,
+        doc_id: str,
+        doc: DocumentData,
+        dep_id: str,
+        external_path: Path,
+        external_resolved: Optional[Path],
+    ) -> ValidationError:
+        rel_posix: Optional[str] = None
+        if external_resolved is not None and self.workspace_root_resolved is not None:
+            try:
+                rel_posix = external_resolved.relative_to(
+                    self.workspace_root_resolved
+                ).as_posix()
+            except ValueError:
+                rel_posix = None
+        allowlisted = bool(
+            self.external_allowlist
+            and rel_posix is not None
+            and _path_matches_allowlist(rel_posix, self.external_allowlist)
+        )
+        if allowlisted:
+            return ValidationError(
+                error_type=ValidationErrorType.EXTERNAL_FILE_DEPENDENCY,
+                doc_id=doc_id,
+                filepath=str(doc.filepath),
+                message=(
+                    f"External file dependency (allowlisted): '{dep_id}' "
+                    f"(declared in {doc_id}) resolved to '{rel_posix}'."
+                ),
+                fix_suggestion="",
+                severity=self.external_file_severity,
+                context={
+                    "dep_value": dep_id,
+                    "resolved_path": rel_posix,
+                    "allowlisted": True,
+                },
+            )
+        return ValidationError(
+            error_type=ValidationErrorType.OUT_OF_SCOPE_DEPENDENCY,
+            doc_id=doc_id,
+            filepath=str(doc.filepath),
+            message=(
+                f"External dependency resolved from disk: '{dep_id}' "
+                f"(declared in {doc_id}) exists at "
+                f"'{external_path}' but is not a loaded document."
+            ),
+            fix_suggestion=(
+                "If the target should be tracked as a doc, add an "
+                "Ontos frontmatter id; otherwise this can be left as a "
+                "soft external reference."
+            ),
+            severity=self.out_of_scope_severity,
+            context={
+                "dep_value": dep_id,
+                "resolved_path": (
+                    rel_posix if rel_posix is not None else str(external_path)
+                ),
+                "allowlisted": False,
+            },
+        )
 
 
 def detect_cycles(graph: DependencyGraph) -> List[List[str]]:
@@ -460,6 +522,7 @@ def detect_orphans(
     allowed_orphan_types: Set[str],
     allowed_orphan_paths: Optional[Sequence[str]] = None,
     workspace_root: Optional[Path] = None,
+    doc_ids: Optional[Set[str]] = None,
 ) -> List[str]:
     """Find documents with no incoming edges (not depended on by anyone).
 
@@ -472,6 +535,7 @@ def detect_orphans(
         workspace_root: Repository root used to compute relative paths for
             ``allowed_orphan_paths`` matching. Required when
             ``allowed_orphan_paths`` is non-empty.
+        doc_ids: Optional subset of nodes to check; defaults to all of them.
 
     Returns:
         List of orphan doc_ids
@@ -481,6 +545,8 @@ def detect_orphans(
     ws_root = workspace_root.resolve() if workspace_root is not None else None
 
     for doc_id, node in graph.nodes.items():
+        if doc_ids is not None and doc_id not in doc_ids:
+            continue
         if node.doc_type in allowed_orphan_types:
             continue
         if patterns and ws_root is not None:
@@ -509,8 +575,79 @@ def calculate_depths(graph: DependencyGraph) -> Dict[str, int]:
     if not graph.nodes:
         return {}
 
+    return _component_depths(_ordered_adjacency(graph), {})
+
+
+def calculate_depths_incremental(
+    graph: DependencyGraph,
+    previous_depths: Dict[str, int],
+    changed_ids: Set[str],
+) -> Dict[str, int]:
+    """Recompute depths only where a change can have moved them.
+
+    ``changed_ids`` names every node that is new or whose outgoing edges
+    differ from the graph ``previous_depths`` was computed on. A node's depth
+    depends only on what it can reach, so only the changed nodes and their
+    ancestors are recomputed; everything else keeps its previous depth. The
+    result equals ``calculate_depths(graph)``.
+
+    Args:
+        graph: DependencyGraph after the change
+        previous_depths: Depths of the graph before the change
+        changed_ids: New nodes and nodes whose edges changed
+
+    Returns:
+        Dictionary mapping doc_id to depth
+    """
+    if not graph.nodes:
+        return {}
+
     adjacency = _ordered_adjacency(graph)
-    components = _strongly_connected_components(adjacency)
+    affected: Set[str] = set()
+    stack = [node for node in changed_ids if node in graph.nodes]
+    while stack:
+        node = stack.pop()
+        if node in affected:
+            continue
+        affected.add(node)
+        for dependent in graph.reverse_edges.get(node, ()):
+            if dependent in graph.nodes and dependent not in affected:
+                stack.append(dependent)
+
+    if any(
+        node not in affected and node not in previous_depths
+        for node in graph.nodes
+    ):
+        # The caller under-reported changes; fall back to a full pass.
+        return calculate_depths(graph)
+
+    # Edges leaving the affected region point at nodes whose depth is
+    # already final, so they act as fixed leaves of the sub-problem.
+    fixed = {
+        node: previous_depths[node]
+        for node in graph.nodes
+        if node not in affected
+    }
+    sub_adjacency = {node: adjacency[node] for node in sorted(affected)}
+    depths = dict(fixed)
+    depths.update(_component_depths(sub_adjacency, fixed))
+    return {node: depths[node] for node in graph.nodes}
+
+
+def _component_depths(
+    adjacency: Dict[str, List[str]],
+    fixed_depths: Dict[str, int],
+) -> Dict[str, int]:
+    """Longest-path depths over the condensation of ``adjacency``.
+
+    Neighbors missing from ``adjacency`` must appear in ``fixed_depths`` and
+    contribute ``fixed_depth + 1`` to the nodes that depend on them.
+    """
+    internal = {
+        node: [neighbor for neighbor in neighbors if neighbor in adjacency]
+        for node, neighbors in adjacency.items()
+    }
+    components = _strongly_connected_components(internal)
     component_for = {
         node: component_index
         for component_index, component in enumerate(components)
@@ -519,9 +656,16 @@ def calculate_depths(graph: DependencyGraph) -> Dict[str, int]:
 
     outgoing: List[Set[int]] = [set() for _ in components]
     dependents: List[Set[int]] = [set() for _ in components]
+    component_depths = [0 for _ in components]
     for node, neighbors in adjacency.items():
         source_component = component_for[node]
         for neighbor in neighbors:
+            if neighbor not in component_for:
+                component_depths[source_component] = max(
+                    component_depths[source_component],
+                    fixed_depths[neighbor] + 1,
+                )
+                continue
             target_component = component_for[neighbor]
             if source_component == target_component:
                 continue
@@ -529,7 +673,6 @@ def calculate_depths(graph: DependencyGraph) -> Dict[str, int]:
             dependents[target_component].add(source_component)
 
     remaining_outgoing = [len(items) for items in outgoing]
-    component_depths = [0 for _ in components]
     ready: List[Tuple[str, int]] = [
         (component[0], index)
         for index, component in enumerate(components)
@@ -556,7 +699,7 @@ def calculate_depths(graph: DependencyGraph) -> Dict[str, int]:
 
     return {
         node: component_depths[component_for[node]]
-        for node in graph.nodes
+        for node in adjacency
     }
 
 
@@ -7,7 +7,7 @@ import re
 import time
 from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Callable, Dict, Iterable, List, Optional, Sequence, Set, Tuple
+from typing import Callable, Dict, FrozenSet, Iterable, List, Optional, Sequence, Set, Tuple
 from urllib.parse import unquote
 
 from ontos.core.body_refs import MatchType, scan_body_references
@@ -16,7 +16,15 @@ from ontos.core.graph import _LoadedPathIndex, build_graph, detect_orphans
 from ontos.core.suggestions import SuggestionIndex, suggest_candidates
 from ontos.core.types import DocumentData, ValidationErrorType
 from ontos.core.validation import ValidationOrchestrator
-from ontos.io.files import DocumentLoadIssue, DocumentLoadResult, load_documents, scan_documents
+from ontos.io.files import (
+    DocumentLoadIssue,
+    DocumentLoadResult,
+    load_documents,
+    resolve_worker_count,
+    scan_documents,
+)
+from ontos.io.body_scan_cache import BodyMatchRecord, BodyScanCache
+from ontos.io.parse_cache import DocumentParseCache
 from ontos.io.scan_scope import ScanScope
 from ontos.io.yaml import parse_frontmatter_content, split_frontmatter_text
 
@@ -27,6 +35,11 @@ _LINK_CHECK_SEVERITY = {
     "impacts": "error",
     "describes": "error",
 }
+# Below this many documents a process pool costs more than it saves.
+_PARALLEL_MIN_DOCS = 64
+# Scan-option signature for BodyScanCache entries; it must change whenever the
+# flags passed to scan_body_references by _scan_document_body change.
+_BODY_SCAN_SIGNATURE = "link_check:skipped=0:generic=0"
 
 
 @dataclass(frozen=True)
@@ -332,6 +345,26 @@ class _ResolvedMarkdownTarget:
     ambiguous: bool = False
 
 
+@dataclass(frozen=True)
+class _BodyScanContext:
+    """Read-only scope data the per-document body scan resolves against."""
+
+    repo_root: Path
+    known_ids: FrozenSet[str]
+    active_paths: _LoadedPathIndex
+    external_paths: _LoadedPathIndex
+
+
+@dataclass(frozen=True)
+class _BodyReference:
+    """One body match before dedupe; ``resolved_path`` marks a file link."""
+
+    field: str
+    value: str
+    location: ReferenceLocation
+    resolved_path: Optional[str] = None
+
+
 def run_link_diagnostics(
     *,
     repo_root: Path,
@@ -344,6 +377,9 @@ def run_link_diagnostics(
     include_orphans: bool = True,
     progress: Optional[Callable[[str], None]] = None,
     load_result: Optional[DocumentLoadResult] = None,
+    parse_cache: Optional[DocumentParseCache] = None,
+    workers: Optional[int] = None,
+    body_scan_cache: Optional[BodyScanCache] = None,
 ) -> LinkDiagnosticsResult:
     """Run shared link diagnostics for a loaded scope.
 
@@ -351,6 +387,11 @@ def run_link_diagnostics(
     phase (#135); pass None for silent runs. ``include_orphans=False`` skips
     orphan detection entirely, which also removes the exit-2 possibility.
     Per-phase wall-clock timings land in ``LinkDiagnosticsResult.timings_ms``.
+    ``parse_cache`` is consulted (and saved) when this function loads the
+    scope itself. ``workers`` is the process count for loading and the body
+    scan (``0`` = one per CPU, default ``scanning.workers``).
+    ``body_scan_cache`` serves body matches for unchanged bodies and is saved
+    after the body phase; classification always runs against the live scope.
     """
 
     timings_ms: Dict[str, int] = {}
@@ -363,7 +404,14 @@ def run_link_diagnostics(
     phase_start = time.perf_counter()
     if load_result is None:
         _notify(f"Loading {len(doc_paths)} documents...")
-        load_result = load_documents(list(doc_paths), parse_frontmatter_content)
+        load_result = load_documents(
+            list(doc_paths),
+            parse_frontmatter_content,
+            parse_cache=parse_cache,
+            workers=config.scanning.workers if workers is None else workers,
+        )
+        if parse_cache is not None:
+            parse_cache.save()
         timings_ms["load"] = _elapsed_ms(phase_start)
     else:
         timings_ms["load"] = 0
@@ -485,77 +533,48 @@ def run_link_diagnostics(
     phase_start = time.perf_counter()
     if include_body:
         _notify(f"Scanning body references in {len(docs)} documents...")
-        for doc in docs.values():
-            # Generic unknown scan — finds broken references to
-            # IDs that don't exist. (#117) The prose-token heuristic
-            # (`_looks_like_doc_id`) produced ~11k false positives per
-            # 163-doc corpus; it is now disabled by passing
-            # include_generic_bare_id_token=False. Broken markdown link
-            # targets still surface because link_target detection is
-            # independent of the bare-token heuristic. Broken bare
-            # references inside explicit `[[id]]` wikilink sigils still
-            # surface via _iter_wikilink_id_candidates.
-            body_scan = scan_body_references(
-                path=doc.filepath,
-                body=doc.content,
-                include_skipped=False,
-                include_generic_bare_id_token=False,
-            )
-            body_line_offset = _body_line_offset(doc)
-
-            for body_match in body_scan.matches:
-                field = (
-                    "body.markdown_link_target"
-                    if body_match.match_type == MatchType.MARKDOWN_LINK_TARGET
-                    else "body.bare_id_token"
-                )
-                location = ReferenceLocation(
-                    line=body_line_offset + body_match.line,
-                    col_start=body_match.col_start,
-                    col_end=body_match.col_end,
-                    zone=body_match.zone.value,
-                    match_type=body_match.match_type.value,
-                )
-
-                value = body_match.normalized_id
-                if (
-                    body_match.match_type == MatchType.MARKDOWN_LINK_TARGET
-                    and value not in active_ids
-                    and value not in external_ids
-                ):
-                    resolution = _resolve_markdown_target(
-                        raw_target=body_match.raw_match,
-                        source_path=doc.filepath,
-                        repo_root=repo_root,
-                        active_paths=active_path_index,
-                        external_paths=external_path_index,
-                    )
-                    if resolution.document_id is not None:
-                        value = resolution.document_id
-                    elif resolution.resolved_path is not None:
-                        key = (doc.id, field, resolution.resolved_path)
-                        if key not in file_dep_seen:
-                            file_dep_seen.add(key)
-                            file_dependencies.append(
-                                FileDependencyReference(
-                                    source_doc_id=doc.id,
-                                    source_path=doc.filepath,
-                                    field=field,
-                                    value=body_match.raw_match,
-                                    resolved_path=resolution.resolved_path,
-                                    allowlisted=True,
-                                    severity="info",
-                                )
+        body_context = _BodyScanContext(
+            repo_root=repo_root,
+            known_ids=frozenset(active_ids | external_ids),
+            active_paths=active_path_index,
+            external_paths=external_path_index,
+        )
+        body_workers = resolve_worker_count(
+            config.scanning.workers if workers is None else workers
+        )
+        doc_list = list(docs.values())
+        # Scanning and target resolution run per document (optionally in a
+        # process pool); dedupe and classification happen here in document
+        # order, so output does not depend on the worker count.
+        per_doc = _scan_bodies(doc_list, body_context, body_workers, body_scan_cache)
+        if body_scan_cache is not None:
+            body_scan_cache.save()
+        for doc, body_refs in zip(doc_list, per_doc):
+            for body_ref in body_refs:
+                if body_ref.resolved_path is not None:
+                    key = (doc.id, body_ref.field, body_ref.resolved_path)
+                    if key not in file_dep_seen:
+                        file_dep_seen.add(key)
+                        file_dependencies.append(
+                            FileDependencyReference(
+                                source_doc_id=doc.id,
+                                source_path=doc.filepath,
+                                field=body_ref.field,
+                                value=body_ref.value,
+                                resolved_path=body_ref.resolved_path,
+                                allowlisted=True,
+                                severity="info",
                             )
-                        continue
+                        )
+                    continue
 
                 _classify_reference(
                     source_doc_id=doc.id,
                     source_path=doc.filepath,
-                    field=field,
-                    value=value,
+                    field=body_ref.field,
+                    value=body_ref.value,
                     severity="error",
-                    location=location,
+                    location=body_ref.location,
                     active_ids=active_ids,
                     external_ids=external_ids,
                     broken_references=broken_references,
@@ -581,7 +600,7 @@ def run_link_diagnostics(
         _notify("Scanning parse-failed files...")
     parse_failed_candidates = _collect_parse_failed_candidates(
         issues=load_result.issues,
-        known_ids=active_ids | external_ids,
+        known_ids=frozenset(active_ids | external_ids),
     )
     timings_ms["parse_failed_scan"] = _elapsed_ms(phase_start)
 
@@ -751,6 +770,153 @@ def _attach_suggestions(
         finding.suggestions = list(memo[finding.value])
 
 
+def _scan_bodies(
+    docs: List[DocumentData],
+    context: _BodyScanContext,
+    worker_count: int,
+    body_scan_cache: Optional[BodyScanCache] = None,
+) -> List[List[_BodyReference]]:
+    """Scan every body, across a process pool when worthwhile.
+
+    Bodies found in ``body_scan_cache`` skip the scan; only their Markdown
+    targets are resolved again. Results come back in ``docs`` order. Any
+    pool failure degrades to the serial scan instead of failing the run.
+    """
+
+    jobs: List[Tuple[DocumentData, Optional[List[BodyMatchRecord]]]] = [
+        (
+            doc,
+            body_scan_cache.lookup(_BODY_SCAN_SIGNATURE, doc.content)
+            if body_scan_cache is not None
+            else None,
+        )
+        for doc in docs
+    ]
+    misses = sum(1 for _, records in jobs if records is None)
+
+    outcomes: Optional[List[Tuple[List[BodyMatchRecord], List[_BodyReference]]]] = None
+    if worker_count > 1 and misses >= _PARALLEL_MIN_DOCS:
+        from concurrent.futures import ProcessPoolExecutor
+
+        chunk_size = max(1, len(jobs) // (worker_count * 4))
+        chunks = [jobs[index:index + chunk_size] for index in range(0, len(jobs), chunk_size)]
+        try:
+            with ProcessPoolExecutor(
+                max_workers=worker_count,
+                initializer=_install_body_scan_context,
+                initargs=(context,),
+            ) as pool:
+                outcomes = []
+                for chunk_result in pool.map(_scan_body_chunk, chunks):
+                    outcomes.extend(chunk_result)
+        except Exception:
+            outcomes = None
+    if outcomes is None:
+        outcomes = [_scan_document_body(doc, context, records) for doc, records in jobs]
+
+    if body_scan_cache is not None:
+        for (doc, cached), (records, _) in zip(jobs, outcomes):
+            if cached is None:
+                body_scan_cache.store(_BODY_SCAN_SIGNATURE, doc.content, records)
+    return [refs for _, refs in outcomes]
+
+
+_worker_body_context: Optional[_BodyScanContext] = None
+
+
+def _install_body_scan_context(context: _BodyScanContext) -> None:
+    """Process-pool initializer: ship the scope data once per worker."""
+
+    global _worker_body_context
+    _worker_body_context = context
+
+
+def _scan_body_chunk(
+    jobs: List[Tuple[DocumentData, Optional[List[BodyMatchRecord]]]],
+) -> List[Tuple[List[BodyMatchRecord], List[_BodyReference]]]:
+    assert _worker_body_context is not None
+    return [_scan_document_body(doc, _worker_body_context, records) for doc, records in jobs]
+
+
+def _scan_document_body(
+    doc: DocumentData,
+    context: _BodyScanContext,
+    records: Optional[List[BodyMatchRecord]] = None,
+) -> Tuple[List[BodyMatchRecord], List[_BodyReference]]:
+    """Scan one body and resolve its Markdown targets; no shared state.
+
+    ``records`` are memoized matches for this body; without them the body
+    is scanned. Returns the match records alongside the resolved references.
+    """
+
+    if records is None:
+        # Generic unknown scan — finds broken references to IDs that don't
+        # exist. (#117) The prose-token heuristic (`_looks_like_doc_id`)
+        # produced ~11k false positives per 163-doc corpus; it is now
+        # disabled by passing include_generic_bare_id_token=False. Broken
+        # markdown link targets still surface because link_target detection
+        # is independent of the bare-token heuristic. Broken bare references
+        # inside explicit `[[id]]` wikilink sigils still surface via
+        # _iter_wikilink_id_candidates.
+        body_scan = scan_body_references(
+            path=doc.filepath,
+            body=doc.content,
+            include_skipped=False,
+            include_generic_bare_id_token=False,
+        )
+        records = [
+            [
+                match.line,
+                match.col_start,
+                match.col_end,
+                match.zone.value,
+                match.match_type.value,
+                match.raw_match,
+                match.normalized_id,
+            ]
+            for match in body_scan.matches
+        ]
+    if not records:
+        return records, []
+    body_line_offset = _body_line_offset(doc)
+
+    refs: List[_BodyReference] = []
+    for line, col_start, col_end, zone, match_type, raw_match, normalized_id in records:
+        is_link_target = match_type == MatchType.MARKDOWN_LINK_TARGET.value
+        field = "body.markdown_link_target" if is_link_target else "body.bare_id_token"
+        location = ReferenceLocation(
+            line=body_line_offset + line,
+            col_start=col_start,
+            col_end=col_end,
+            zone=zone,
+            match_type=match_type,
+        )
+
+        value = normalized_id
+        if is_link_target and value not in context.known_ids:
+            resolution = _resolve_markdown_target(
+                raw_target=raw_match,
+                source_path=doc.filepath,
+                repo_root=context.repo_root,
+                active_paths=context.active_paths,
+                external_paths=context.external_paths,
+            )
+            if resolution.document_id is not None:
+                value = resolution.document_id
+            elif resolution.resolved_path is not None:
+                refs.append(
+                    _BodyReference(
+                        field=field,
+                        value=raw_match,
+                        location=location,
+                        resolved_path=resolution.resolved_path,
+                    )
+                )
+                continue
+        refs.append(_BodyReference(field=field, value=value, location=location))
+    return records, refs
+
+
 def _body_line_offset(doc: DocumentData) -> int:
     """Return the number of physical file lines preceding ``doc.content``.
 
@@ -1033,7 +1199,7 @@ def _load_external_scope_info(
 def _collect_parse_failed_candidates(
     *,
     issues: Sequence[DocumentLoadIssue],
-    known_ids: Set[str],
+    known_ids: FrozenSet[str],
 ) -> List[ParseFailedCandidate]:
     candidate_paths = sorted(
         {
@@ -0,0 +1,191 @@
+"""Named timing spans for ``ontos --profile`` and ``ONTOS_PROFILE``.
+
+Hot paths wrap their phases in :func:`span` (or decorate them with
+:func:`profiled`) using a small fixed vocabulary: ``config``, ``scan``,
+``read``, ``parse``, ``graph``, ``validate``, ``render`` and ``write``.
+While no recorder is active a span is a shared no-op context manager, so the
+instrumentation costs one global lookup per call.
+
+Spans nest. Each name reports its call count, inclusive ``total_ms`` (a name
+re-entered inside itself is only timed at the outermost level) and
+``self_ms``, the time not spent inside other spans. Work done in pool
+processes is timed by the span that wraps the pool in the parent.
+"""
+
+from __future__ import annotations
+
+import functools
+import threading
+import time
+from typing import Any, Callable, Dict, List, Mapping, Optional, TypeVar
+
+
+PROFILE_ENV_VAR = "ONTOS_PROFILE"
+PROFILE_OUTPUT_ENV_VAR = "ONTOS_PROFILE_OUTPUT"
+
+_FALSE_VALUES = frozenset({"", "0", "false", "no", "off"})
+
+F = TypeVar("F", bound=Callable[..., Any])
+
+
+class _Stat:
+    __slots__ = ("calls", "total", "children")
+
+    def __init__(self) -> None:
+        self.calls = 0
+        self.total = 0.0
+        self.children = 0.0
+
+
+class SpanRecorder:
+    """Accumulates span timings for one command invocation."""
+
+    def __init__(self) -> None:
+        self._started = time.perf_counter()
+        self._stats: Dict[str, _Stat] = {}
+        self._lock = threading.Lock()
+        self._local = threading.local()
+
+    def _frames(self) -> List[list]:
+        frames = getattr(self._local, "frames", None)
+        if frames is None:
+            frames = self._local.frames = []
+        return frames
+
+    def enter(self, name: str) -> None:
+        # frame = [name, start, time spent in child spans]
+        self._frames().append([name, time.perf_counter(), 0.0])
+
+    def exit(self) -> None:
+        frames = self._frames()
+        name, start, children = frames.pop()
+        elapsed = time.perf_counter() - start
+        reentrant = any(frame[0] == name for frame in frames)
+        if frames:
+            frames[-1][2] += elapsed
+        with self._lock:
+            stat = self._stats.get(name)
+            if stat is None:
+                stat = self._stats[name] = _Stat()
+            stat.calls += 1
+            stat.children += children
+            if not reentrant:
+                stat.total += elapsed
+            else:
+                # Keep the outer frame's self time free of its own re-entry.
+                stat.children -= elapsed
+
+    def report(self) -> Dict[str, Any]:
+        """Return a JSON-serializable summary in first-seen span order."""
+        with self._lock:
+            spans = [
+                {
+                    "name": name,
+                    "calls": stat.calls,
+                    "total_ms": _ms(stat.total),
+                    "self_ms": _ms(max(0.0, stat.total - stat.children)),
+                }
+                for name, stat in self._stats.items()
+            ]
+        return {
+            "wall_ms": _ms(time.perf_counter() - self._started),
+            "spans": spans,
+        }
+
+
+class _NullSpan:
+    __slots__ = ()
+
+    def __enter__(self) -> None:
+        return None
+
+    def __exit__(self, *exc_info: Any) -> None:
+        return None
+
+
+class _Span:
+    __slots__ = ("_name", "_recorder")
+
+    def __init__(self, name: str, recorder: SpanRecorder) -> None:
+        self._name = name
+        self._recorder = recorder
+
+    def __enter__(self) -> None:
+        self._recorder.enter(self._name)
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self._recorder.exit()
+
+
+_NULL_SPAN = _NullSpan()
+_recorder: Optional[SpanRecorder] = None
+
+
+def span(name: str):
+    """Context manager timing ``name`` when profiling is active."""
+    recorder = _recorder
+    if recorder is None:
+        return _NULL_SPAN
+    return _Span(name, recorder)
+
+
+def profiled(name: str) -> Callable[[F], F]:
+    """Decorator form of :func:`span`."""
+
+    def decorate(func: F) -> F:
+        @functools.wraps(func)
+        def wrapper(*args: Any, **kwargs: Any) -> Any:
+            recorder = _recorder
+            if recorder is None:
+                return func(*args, **kwargs)
+            recorder.enter(name)
+            try:
+                return func(*args, **kwargs)
+            finally:
+                recorder.exit()
+
+        return wrapper  # type: ignore[return-value]
+
+    return decorate
+
+
+def start_profiling() -> SpanRecorder:
+    """Install a fresh recorder and return it."""
+    global _recorder
+    _recorder = SpanRecorder()
+    return _recorder
+
+
+def stop_profiling() -> Optional[SpanRecorder]:
+    """Uninstall and return the active recorder, if any."""
+    global _recorder
+    recorder, _recorder = _recorder, None
+    return recorder
+
+
+def profile_report() -> Optional[Dict[str, Any]]:
+    """Summary of the active recorder, or None when profiling is off."""
+    recorder = _recorder
+    if recorder is None:
+        return None
+    return recorder.report()
+
+
+def profiling_requested(environ: Mapping[str, str]) -> bool:
+    """True when ``ONTOS_PROFILE`` is set to anything but a false value."""
+    return environ.get(PROFILE_ENV_VAR, "").strip().lower() not in _FALSE_VALUES
+
+
+def format_profile_report(report: Mapping[str, Any]) -> str:
+    """Render a report as the plain-text table printed on stderr."""
+    lines = [f"Profile (wall {report['wall_ms']} ms)"]
+    for entry in report["spans"]:
+        lines.append(
+            f"  {entry['name']:<10} calls={entry['calls']:<6} "
+            f"total={entry['total_ms']} ms  self={entry['self_ms']} ms"
+        )
+    return "\n".join(lines)
+
+
+def _ms(seconds: float) -> float:
+    return round(seconds * 1000.0, 3)
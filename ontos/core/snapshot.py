@@ -13,7 +13,7 @@ from typing import Dict, List, Optional, Any
 
 from ontos.core.types import DocumentData, ValidationResult
 from ontos.core.graph import DependencyGraph, build_graph
-from ontos.core.validation import ValidationOrchestrator
+from ontos.core.validation import ValidationAnalysis, ValidationOrchestrator
 
 
 @dataclass
@@ -35,6 +35,9 @@ class DocumentSnapshot:
     git_commit: Optional[str] = None
     ontos_version: str = ""
     warnings: List[str] = field(default_factory=list)
+    # Per-document validation state; lets the next snapshot of the same
+    # workspace re-validate only what changed.
+    analysis: Optional[ValidationAnalysis] = field(default=None, repr=False, compare=False)
 
     @property
     def by_type(self) -> Dict[str, List[DocumentData]]:
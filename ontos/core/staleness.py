@@ -15,7 +15,9 @@ For testing, mock these functions directly:
 For production use:
     result = get_file_modification_date(path, git_mtime_provider=my_git_provider)
 
-The caller (commands layer) provides the IO callback.
+The caller (commands layer) provides the IO callback.  Prefer
+``ontos.io.git_dates.git_date_provider(root)`` over the per-file
+``ontos.io.git.get_file_mtime`` when dating many files.
 """
 
 import os
@@ -18,7 +18,22 @@ def estimate_tokens(content: str) -> int:
     """
     if not content:
         return 0
-    return len(content) // 4
+    return estimate_tokens_for_length(len(content))
+
+
+def estimate_tokens_for_length(char_count: int) -> int:
+    """Estimate token count from a character count alone.
+
+    Same heuristic as :func:`estimate_tokens`, for callers that know the
+    length of a text without holding it.
+
+    Args:
+        char_count: Number of characters in the text
+
+    Returns:
+        Estimated token count
+    """
+    return char_count // 4
 
 
 def format_token_count(tokens: int) -> str:
@@ -8,11 +8,15 @@ Phase 2 Decomposition - Created from Phase2-Implementation-Spec.md Section 4.1
 """
 
 from __future__ import annotations
+import sys
 from dataclasses import dataclass, field
 from enum import Enum, IntEnum
 from pathlib import Path
 from typing import Any, Dict, List, Optional, Set
 
+# ``dataclass(slots=True)`` needs Python 3.10; on 3.9 records keep a __dict__.
+DATACLASS_SLOTS: Dict[str, bool] = {"slots": True} if sys.version_info >= (3, 10) else {}
+
 # =============================================================================
 # RE-EXPORTS (consolidate existing types here)
 # =============================================================================
@@ -109,9 +113,29 @@ class ValidationErrorType(Enum):
 # DATACLASSES
 # =============================================================================
 
-@dataclass
+@dataclass(frozen=True)
+class ContentRef:
+    """Location of a document body inside its file.
+
+    ``offset`` and ``length`` are in bytes; ``content_hash`` is
+    ``compute_content_hash`` of the body, used to detect an edit between
+    loading the document and reading the body back. ``chars`` is the body's
+    length in characters, so size estimates need no read.
+    """
+    offset: int
+    length: int
+    content_hash: str
+    chars: int
+
+
+@dataclass(**DATACLASS_SLOTS)
 class DocumentData:
-    """Parsed document with frontmatter and content."""
+    """Parsed document with frontmatter and content.
+
+    Slotted, and the ID and reference values are interned: a large snapshot
+    repeats the same IDs across every ``depends_on``/``impacts`` list, graph
+    edge and index, and interning makes those one string each.
+    """
     id: str
     type: DocumentType
     status: DocumentStatus
@@ -123,6 +147,16 @@ class DocumentData:
     tags: List[str] = field(default_factory=list)
     aliases: List[str] = field(default_factory=list)
     describes: List[str] = field(default_factory=list)
+    # Set by the file loader; lets lazy snapshots drop ``content`` and read
+    # it back on demand (see ``ontos.io.files.read_document_content``).
+    content_ref: Optional[ContentRef] = None
+
+    def __post_init__(self) -> None:
+        if type(self.id) is str:
+            self.id = sys.intern(self.id)
+        for values in (self.depends_on, self.impacts, self.tags, self.aliases, self.describes):
+            if type(values) is list:
+                values[:] = [sys.intern(value) if type(value) is str else value for value in values]
 
 
 @dataclass
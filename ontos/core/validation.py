@@ -8,8 +8,10 @@ Phase 2 Decomposition - Created from Phase2-Implementation-Spec.md Section 4.5
 """
 
 from __future__ import annotations
+from dataclasses import dataclass
 from typing import Dict, List, Set, Tuple, Optional, Any
 
+from ontos.core.profiling import profiled, span
 from ontos.core.types import (
     DocumentData,
     ValidationError,
@@ -17,10 +19,13 @@ from ontos.core.types import (
     ValidationErrorType,
 )
 from ontos.core.graph import (
-    build_graph,
+    DependencyGraph,
+    DependencyResolver,
+    _looks_like_path,
     detect_cycles,
     detect_orphans,
     calculate_depths,
+    calculate_depths_incremental,
     DEPENDS_ON_SEVERITY_DEFAULT,
     IMPACTS_SEVERITY_DEFAULT,
     DESCRIBES_SEVERITY_DEFAULT,
@@ -72,6 +77,40 @@ def validate_describes_field(
     return errors
 
 
+def _corpus_key(docs: Dict[str, DocumentData]) -> Tuple[Any, ...]:
+    """Ordered ids, aliases and paths that broken-link findings depend on."""
+    return tuple(
+        (doc_id, tuple(doc.aliases or ()), str(doc.filepath))
+        for doc_id, doc in docs.items()
+    )
+
+
+@dataclass
+class ValidationAnalysis:
+    """Everything one validation pass derived from a corpus.
+
+    Findings are kept per document so a later pass over an edited corpus can
+    reuse the entries of documents that did not change (see
+    :meth:`ValidationOrchestrator.analyze`). ``result`` is the assembled
+    :class:`ValidationResult`, identical to what ``validate_all`` returns.
+    """
+
+    docs: Dict[str, DocumentData]
+    signature: Tuple[Any, ...]
+    corpus_key: Tuple[Any, ...]
+    graph: DependencyGraph
+    link_findings: Dict[str, List[ValidationError]]
+    log_schema_findings: Dict[str, List[ValidationError]]
+    impacts_findings: Dict[str, List[ValidationError]]
+    describes_findings: Dict[str, List[ValidationError]]
+    concept_findings: Dict[str, List[ValidationError]]
+    cycles: List[List[str]]
+    orphans: List[str]
+    depths: Dict[str, int]
+    result: ValidationResult
+    incremental: bool = False
+
+
 class ValidationOrchestrator:
     """Orchestrates all validation checks and collects errors."""
 
@@ -119,21 +158,157 @@ class ValidationOrchestrator:
         Returns:
             ValidationResult with all errors, warnings, and infos
         """
-        self.validate_graph()
-        self.validate_log_schema()
-        self.validate_impacts()
-        self.validate_describes()
-        self.validate_concepts()
-
-        return ValidationResult(
-            errors=self.errors,
-            warnings=self.warnings,
-            infos=self.infos,
+        return self.analyze().result
+
+    @profiled("validate")
+    def analyze(
+        self,
+        previous: Optional[ValidationAnalysis] = None,
+        *,
+        prebuilt_graph: Optional[Tuple[DependencyGraph, List[ValidationError]]] = None,
+    ) -> ValidationAnalysis:
+        """Run all validations, reusing ``previous`` where it is still valid.
+
+        ``previous`` is the analysis of an earlier version of the same
+        workspace. Per-document findings of unchanged documents are carried
+        over and only the changed documents (plus whatever their edits can
+        reach through the ID set and the graph) are re-checked. The
+        assembled result is identical to a full ``validate_all`` pass; a
+        ``previous`` built under different settings is ignored.
+
+        The returned analysis carries the resolved graph together with its
+        cycles, orphans and depths, so callers should read those from it
+        rather than rebuilding the graph.
+
+        Args:
+            previous: Optional analysis of the prior corpus
+            prebuilt_graph: Optional ``build_graph`` result for ``self.docs``,
+                built with this orchestrator's severity map, workspace root
+                and external-path allowlist. Its edges and link errors are
+                used instead of resolving ``depends_on`` again. Ignored when
+                ``previous`` is given.
+
+        Returns:
+            ValidationAnalysis whose ``result`` holds the collected findings
+        """
+        signature = self._signature()
+        corpus_key = _corpus_key(self.docs)
+        if previous is not None and previous.signature != signature:
+            previous = None
+
+        if previous is None:
+            changed: Set[str] = set(self.docs)
+            ids_changed = True
+        else:
+            changed = {
+                doc_id
+                for doc_id, doc in self.docs.items()
+                if doc is not previous.docs.get(doc_id)
+                and doc != previous.docs.get(doc_id)
+            }
+            ids_changed = self.docs.keys() != previous.docs.keys()
+
+        with span("graph"):
+            if prebuilt_graph is not None and previous is None:
+                graph, link_findings = self._adopt_graph(*prebuilt_graph)
+            else:
+                graph, link_findings = self._resolve_links(previous, changed, corpus_key)
+            cycles, orphans, depths = self._analyze_graph(graph, previous, changed)
+
+        valid_ids = set(self.docs.keys())
+        impacts_severity = self.severity_map.get("impacts", IMPACTS_SEVERITY_DEFAULT)
+        describes_severity = self.severity_map.get("describes", DESCRIBES_SEVERITY_DEFAULT)
+
+        def per_doc(previous_findings, check, recheck_all):
+            findings: Dict[str, List[ValidationError]] = {}
+            for doc_id, doc in self.docs.items():
+                if recheck_all or doc_id in changed:
+                    findings[doc_id] = check(doc_id, doc)
+                else:
+                    findings[doc_id] = previous_findings[doc_id]
+            return findings
+
+        log_schema_findings = per_doc(
+            previous.log_schema_findings if previous else None,
+            self._log_schema_errors,
+            previous is None,
+        )
+        # impacts/describes resolve against the ID set, so any add/remove
+        # re-checks every document.
+        impacts_findings = per_doc(
+            previous.impacts_findings if previous else None,
+            lambda doc_id, doc: self._impact_errors(
+                doc_id, doc, valid_ids, impacts_severity
+            ),
+            ids_changed,
+        )
+        describes_findings = per_doc(
+            previous.describes_findings if previous else None,
+            lambda doc_id, doc: validate_describes_field(
+                doc, valid_ids, severity=describes_severity
+            ),
+            ids_changed,
+        )
+        concept_findings = per_doc(
+            previous.concept_findings if previous else None,
+            self._concept_errors,
+            previous is None,
         )
 
-    def validate_graph(self) -> None:
-        """Validate dependency graph: broken links, cycles, orphans, depth."""
-        graph, broken_link_errors = build_graph(
+        # Replay in the same phase order validate_all has always used so the
+        # result lists are ordered exactly as before.
+        for doc_id in self.docs:
+            for error in link_findings[doc_id]:
+                self._report(error)
+        self._report_graph_findings(cycles, orphans, depths)
+        for doc_id in self.docs:
+            self.warnings.extend(log_schema_findings[doc_id])
+        for findings in (impacts_findings, describes_findings, concept_findings):
+            for doc_id in self.docs:
+                for error in findings[doc_id]:
+                    self._report(error)
+
+        return ValidationAnalysis(
+            docs=dict(self.docs),
+            signature=signature,
+            corpus_key=corpus_key,
+            graph=graph,
+            link_findings=link_findings,
+            log_schema_findings=log_schema_findings,
+            impacts_findings=impacts_findings,
+            describes_findings=describes_findings,
+            concept_findings=concept_findings,
+            cycles=cycles,
+            orphans=orphans,
+            depths=depths,
+            result=ValidationResult(
+                errors=self.errors,
+                warnings=self.warnings,
+                infos=self.infos,
+            ),
+            incremental=previous is not None,
+        )
+
+    def _signature(self) -> Tuple[Any, ...]:
+        """Settings that, when changed, invalidate every cached finding."""
+        config = self.config
+        return (
+            tuple(sorted(self.severity_map.items())),
+            config.get("max_dependency_depth", 5),
+            tuple(sorted(config.get("allowed_orphan_types", ["atom", "log"]) or ())),
+            tuple(config.get("allowed_orphan_paths", []) or ()),
+            tuple(config.get("allowed_external_dependency_paths", []) or ()),
+            tuple(sorted(config.get("known_concepts", set()) or ())),
+            str(self.workspace_root) if self.workspace_root is not None else None,
+        )
+
+    def _resolve_links(
+        self,
+        previous: Optional[ValidationAnalysis],
+        changed: Set[str],
+        corpus_key: Tuple[Any, ...],
+    ) -> Tuple[DependencyGraph, Dict[str, List[ValidationError]]]:
+        resolver = DependencyResolver(
             self.docs,
             severity_map=self.severity_map,
             workspace_root=self.workspace_root,
@@ -141,11 +316,113 @@ class ValidationOrchestrator:
                 "allowed_external_dependency_paths", []
             ),
         )
-        for link_error in broken_link_errors:
-            self._report(link_error)
+        # Broken-link suggestions rank against every id and alias in the
+        # corpus, so reuse is only safe while that key is unchanged. Path-like
+        # dependencies consult the filesystem and are always re-resolved.
+        reusable = previous is not None and previous.corpus_key == corpus_key
+        graph = DependencyGraph()
+        link_findings: Dict[str, List[ValidationError]] = {}
+        for doc_id, doc in self.docs.items():
+            if (
+                reusable
+                and doc_id not in changed
+                and not any(
+                    dep not in resolver.existing_ids and _looks_like_path(dep)
+                    for dep in doc.depends_on
+                )
+            ):
+                resolved = list(previous.graph.edges[doc_id])
+                link_findings[doc_id] = previous.link_findings[doc_id]
+            else:
+                resolved, link_findings[doc_id] = resolver.resolve(doc_id, doc)
+            graph.add_node(doc_id, doc.type.value, str(doc.filepath), resolved)
+        return graph, link_findings
+
+    def _adopt_graph(
+        self,
+        graph: DependencyGraph,
+        errors: List[ValidationError],
+    ) -> Tuple[DependencyGraph, Dict[str, List[ValidationError]]]:
+        link_findings: Dict[str, List[ValidationError]] = {
+            doc_id: [] for doc_id in self.docs
+        }
+        for error in errors:
+            link_findings[error.doc_id].append(error)
+        return graph, link_findings
 
-        # Detect cycles
-        cycles = detect_cycles(graph)
+    def _analyze_graph(
+        self,
+        graph: DependencyGraph,
+        previous: Optional[ValidationAnalysis],
+        changed: Set[str],
+    ) -> Tuple[List[List[str]], List[str], Dict[str, int]]:
+        allowed_orphans = set(self.config.get("allowed_orphan_types", ["atom", "log"]))
+        allowed_paths = list(self.config.get("allowed_orphan_paths", []))
+        if previous is None:
+            return (
+                detect_cycles(graph),
+                detect_orphans(
+                    graph,
+                    allowed_orphans,
+                    allowed_orphan_paths=allowed_paths,
+                    workspace_root=self.workspace_root,
+                ),
+                calculate_depths(graph),
+            )
+
+        old_graph = previous.graph
+        edges_changed = {
+            doc_id
+            for doc_id, deps in graph.edges.items()
+            if old_graph.edges.get(doc_id) != deps
+        }
+
+        # A new cycle needs a new edge; with none, the old answer stands.
+        if edges_changed or previous.cycles:
+            cycles = detect_cycles(graph)
+        else:
+            cycles = []
+
+        # Orphan status only moves for edited documents and for documents
+        # that gained or lost their last incoming edge.
+        recheck = {
+            doc_id
+            for doc_id in graph.nodes
+            if doc_id in changed
+            or bool(graph.reverse_edges.get(doc_id))
+            != bool(old_graph.reverse_edges.get(doc_id))
+        }
+        rechecked = set(detect_orphans(
+            graph,
+            allowed_orphans,
+            allowed_orphan_paths=allowed_paths,
+            workspace_root=self.workspace_root,
+            doc_ids=recheck,
+        ))
+        previous_orphans = set(previous.orphans)
+        orphans = [
+            doc_id
+            for doc_id in graph.nodes
+            if (doc_id in rechecked if doc_id in recheck else doc_id in previous_orphans)
+        ]
+
+        depths = calculate_depths_incremental(
+            graph,
+            {
+                doc_id: depth
+                for doc_id, depth in previous.depths.items()
+                if doc_id in graph.nodes
+            },
+            edges_changed,
+        )
+        return cycles, orphans, depths
+
+    def _report_graph_findings(
+        self,
+        cycles: List[List[str]],
+        orphans: List[str],
+        depths: Dict[str, int],
+    ) -> None:
         for cycle in cycles:
             cycle_str = " -> ".join(cycle)
             self.errors.append(ValidationError(
@@ -157,15 +434,6 @@ class ValidationOrchestrator:
                 severity="error"
             ))
 
-        # Detect orphans
-        allowed_orphans = set(self.config.get("allowed_orphan_types", ["atom", "log"]))
-        allowed_paths = list(self.config.get("allowed_orphan_paths", []))
-        orphans = detect_orphans(
-            graph,
-            allowed_orphans,
-            allowed_orphan_paths=allowed_paths,
-            workspace_root=self.workspace_root,
-        )
         for orphan_id in orphans:
             if orphan_id in self.docs:
                 self.warnings.append(ValidationError(
@@ -177,9 +445,7 @@ class ValidationOrchestrator:
                     severity="warning"
                 ))
 
-        # Check depth
         max_depth = self.config.get("max_dependency_depth", 5)
-        depths = calculate_depths(graph)
         for doc_id, depth in depths.items():
             if depth > max_depth:
                 self.warnings.append(ValidationError(
@@ -191,26 +457,38 @@ class ValidationOrchestrator:
                     severity="warning"
                 ))
 
+    def validate_graph(self) -> None:
+        """Validate dependency graph: broken links, cycles, orphans, depth."""
+        graph, link_findings = self._resolve_links(None, set(self.docs), ())
+        for doc_id in self.docs:
+            for link_error in link_findings[doc_id]:
+                self._report(link_error)
+        self._report_graph_findings(*self._analyze_graph(graph, None, set(self.docs)))
+
     def validate_log_schema(self) -> None:
         """Validate log documents have required v2.0 fields."""
-        required_fields = {"branch", "event_type", "source"}
-
         for doc_id, doc in self.docs.items():
-            # Handle both enum and string types
-            doc_type = doc.type.value
-            if doc_type != "log":
-                continue
+            self.warnings.extend(self._log_schema_errors(doc_id, doc))
 
-            missing = required_fields - set(doc.frontmatter.keys())
-            if missing:
-                self.warnings.append(ValidationError(
-                    error_type=ValidationErrorType.SCHEMA,
-                    doc_id=doc_id,
-                    filepath=str(doc.filepath),
-                    message=f"Log missing fields: {', '.join(sorted(missing))}",
-                    fix_suggestion="Add missing fields to frontmatter",
-                    severity="warning"
-                ))
+    def _log_schema_errors(self, doc_id: str, doc: DocumentData) -> List[ValidationError]:
+        required_fields = {"branch", "event_type", "source"}
+
+        # Handle both enum and string types
+        doc_type = doc.type.value
+        if doc_type != "log":
+            return []
+
+        missing = required_fields - set(doc.frontmatter.keys())
+        if not missing:
+            return []
+        return [ValidationError(
+            error_type=ValidationErrorType.SCHEMA,
+            doc_id=doc_id,
+            filepath=str(doc.filepath),
+            message=f"Log missing fields: {', '.join(sorted(missing))}",
+            fix_suggestion="Add missing fields to frontmatter",
+            severity="warning"
+        )]
 
     def validate_impacts(self, severity: Optional[str] = None) -> None:
         """Validate impacts[] references exist.
@@ -226,16 +504,28 @@ class ValidationOrchestrator:
         )
 
         for doc_id, doc in self.docs.items():
-            for impact in doc.impacts:
-                if impact not in valid_ids:
-                    self._report(ValidationError(
-                        error_type=ValidationErrorType.IMPACTS,
-                        doc_id=doc_id,
-                        filepath=str(doc.filepath),
-                        message=f"Impact reference '{impact}' not found",
-                        fix_suggestion=f"Remove '{impact}' or create the document",
-                        severity=effective_severity
-                    ))
+            for error in self._impact_errors(doc_id, doc, valid_ids, effective_severity):
+                self._report(error)
+
+    @staticmethod
+    def _impact_errors(
+        doc_id: str,
+        doc: DocumentData,
+        valid_ids: Set[str],
+        severity: str,
+    ) -> List[ValidationError]:
+        errors = []
+        for impact in doc.impacts:
+            if impact not in valid_ids:
+                errors.append(ValidationError(
+                    error_type=ValidationErrorType.IMPACTS,
+                    doc_id=doc_id,
+                    filepath=str(doc.filepath),
+                    message=f"Impact reference '{impact}' not found",
+                    fix_suggestion=f"Remove '{impact}' or create the document",
+                    severity=severity
+                ))
+        return errors
 
     def validate_describes(self, severity: Optional[str] = None) -> None:
         """Validate describes field references.
@@ -261,79 +551,84 @@ class ValidationOrchestrator:
 
     def validate_concepts(self) -> None:
         """Validate concept field usage and structure (#42)."""
-        known_concepts = self.config.get("known_concepts", set())
-        
         for doc_id, doc in self.docs.items():
-            concepts = doc.frontmatter.get("concepts")
-            
-            # Structural check: empty list
-            if isinstance(concepts, list) and not concepts:
-                self._report(ValidationError(
+            for error in self._concept_errors(doc_id, doc):
+                self._report(error)
+
+    def _concept_errors(self, doc_id: str, doc: DocumentData) -> List[ValidationError]:
+        known_concepts = self.config.get("known_concepts", set())
+        errors: List[ValidationError] = []
+        concepts = doc.frontmatter.get("concepts")
+
+        # Structural check: empty list
+        if isinstance(concepts, list) and not concepts:
+            errors.append(ValidationError(
+                error_type=ValidationErrorType.CURATION,
+                doc_id=doc_id,
+                filepath=str(doc.filepath),
+                message="Empty 'concepts' list",
+                fix_suggestion="Add concepts or remove the field",
+                severity=self.severity_map.get("concepts", "warning")
+            ))
+
+        if concepts:
+            if not isinstance(concepts, list):
+                errors.append(ValidationError(
                     error_type=ValidationErrorType.CURATION,
                     doc_id=doc_id,
                     filepath=str(doc.filepath),
-                    message="Empty 'concepts' list",
-                    fix_suggestion="Add concepts or remove the field",
+                    message=f"Invalid 'concepts' type: {type(concepts).__name__} (expected list)",
+                    fix_suggestion="Convert concepts to a YAML list",
                     severity=self.severity_map.get("concepts", "warning")
                 ))
+            else:
+                # Structural check: non-string elements
+                non_strings = [str(c) for c in concepts if not isinstance(c, str)]
+                if non_strings:
+                    errors.append(ValidationError(
+                        error_type=ValidationErrorType.CURATION,
+                        doc_id=doc_id,
+                        filepath=str(doc.filepath),
+                        message=f"Non-string items in concepts: {', '.join(non_strings)}",
+                        fix_suggestion="Ensure all concepts are strings",
+                        severity=self.severity_map.get("concepts", "warning")
+                    ))
 
-            if concepts:
-                if not isinstance(concepts, list):
-                    self._report(ValidationError(
+                # Structural check: duplicates
+                # Guard against unhashable members (dicts, lists) during set conversion (VUL-01)
+                hashable_concepts = [c for c in concepts if isinstance(c, (str, int, float, bool))]
+                if len(hashable_concepts) != len(set(hashable_concepts)):
+                    dupes = [c for c in set(hashable_concepts) if hashable_concepts.count(c) > 1]
+                    errors.append(ValidationError(
                         error_type=ValidationErrorType.CURATION,
                         doc_id=doc_id,
                         filepath=str(doc.filepath),
-                        message=f"Invalid 'concepts' type: {type(concepts).__name__} (expected list)",
-                        fix_suggestion="Convert concepts to a YAML list",
+                        message=f"Duplicate concepts: {', '.join(map(str, dupes))}",
+                        fix_suggestion="Remove duplicate concepts",
                         severity=self.severity_map.get("concepts", "warning")
                     ))
-                else:
-                    # Structural check: non-string elements
-                    non_strings = [str(c) for c in concepts if not isinstance(c, str)]
-                    if non_strings:
-                        self._report(ValidationError(
-                            error_type=ValidationErrorType.CURATION,
-                            doc_id=doc_id,
-                            filepath=str(doc.filepath),
-                            message=f"Non-string items in concepts: {', '.join(non_strings)}",
-                            fix_suggestion="Ensure all concepts are strings",
-                            severity=self.severity_map.get("concepts", "warning")
-                        ))
 
-                    # Structural check: duplicates
-                    # Guard against unhashable members (dicts, lists) during set conversion (VUL-01)
-                    hashable_concepts = [c for c in concepts if isinstance(c, (str, int, float, bool))]
-                    if len(hashable_concepts) != len(set(hashable_concepts)):
-                        dupes = [c for c in set(hashable_concepts) if hashable_concepts.count(c) > 1]
-                        self._report(ValidationError(
+                # Vocabulary check (#42)
+                if known_concepts:
+                    unknown = [c for c in concepts if isinstance(c, str) and c not in known_concepts]
+                    for u in unknown:
+                        errors.append(ValidationError(
                             error_type=ValidationErrorType.CURATION,
                             doc_id=doc_id,
                             filepath=str(doc.filepath),
-                            message=f"Duplicate concepts: {', '.join(map(str, dupes))}",
-                            fix_suggestion="Remove duplicate concepts",
+                            message=f"Unknown concept: '{u}'",
+                            fix_suggestion=f"Add '{u}' to vocabulary or use an existing concept",
                             severity=self.severity_map.get("concepts", "warning")
                         ))
 
-                    # Vocabulary check (#42)
-                    if known_concepts:
-                        unknown = [c for c in concepts if isinstance(c, str) and c not in known_concepts]
-                        for u in unknown:
-                            self._report(ValidationError(
-                                error_type=ValidationErrorType.CURATION,
-                                doc_id=doc_id,
-                                filepath=str(doc.filepath),
-                                message=f"Unknown concept: '{u}'",
-                                fix_suggestion=f"Add '{u}' to vocabulary or use an existing concept",
-                                severity=self.severity_map.get("concepts", "warning")
-                            ))
-
-            # Role-based check: log requirement
-            if doc.type.value == "log" and concepts is None:
-                self._report(ValidationError(
-                    error_type=ValidationErrorType.CURATION,
-                    doc_id=doc_id,
-                    filepath=str(doc.filepath),
-                    message="Log document missing 'concepts' field (required at L2)",
-                    fix_suggestion="Add a concepts: list to the frontmatter",
-                    severity=self.severity_map.get("concepts", "warning")
-                ))
+        # Role-based check: log requirement
+        if doc.type.value == "log" and concepts is None:
+            errors.append(ValidationError(
+                error_type=ValidationErrorType.CURATION,
+                doc_id=doc_id,
+                filepath=str(doc.filepath),
+                message="Log document missing 'concepts' field (required at L2)",
+                fix_suggestion="Add a concepts: list to the frontmatter",
+                severity=self.severity_map.get("concepts", "warning")
+            ))
+        return errors
@@ -0,0 +1,147 @@
+"""Persistent memo of body-reference scan results for ``ontos link-check``.
+
+The link-check body scan depends only on the body text and the scan flags,
+not on which IDs currently exist: classifying a match as broken, external or
+a file link happens afterwards against the live scope. :class:`BodyScanCache`
+therefore stores the raw matches of each body under
+``compute_content_hash(body)`` plus a scan-option signature, so a run over an
+unchanged tree skips zone splitting and token matching for every document and
+only redoes classification.
+
+Entries are content-addressed, never path-addressed: a renamed or copied file
+with the same body is a hit. The payload is stamped with ``ontos.__version__``
+and a schema version; any mismatch discards it wholesale, so a scanner change
+in a new release never serves stale matches. ``save()`` keeps only the entries
+used by the current run, which bounds the file to one scope's bodies.
+"""
+
+from __future__ import annotations
+
+import json
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+import ontos
+from ontos.core.content_hash import compute_content_hash
+from ontos.io.parse_cache import CACHE_RELATIVE_DIR, write_cache_file
+
+
+BODY_SCAN_CACHE_FILENAME = "body_refs.json"
+BODY_SCAN_CACHE_SCHEMA_VERSION = 1
+
+# (line, col_start, col_end, zone, match_type, raw_match, normalized_id)
+BodyMatchRecord = List[Any]
+
+
+class BodyScanCache:
+    """Persistent ``(signature, body hash) -> body matches`` memo.
+
+    Usage:
+        cache = BodyScanCache.for_workspace(repo_root)
+        records = cache.lookup(signature, body)
+        ...
+        cache.store(signature, body, records)
+        cache.save()
+
+    Like :class:`~ontos.io.parse_cache.DocumentParseCache`, a corrupt or
+    foreign-version file simply starts empty and ``save()`` is best-effort.
+    """
+
+    def __init__(self, cache_file: Path, *, workspace_root: Optional[Path] = None):
+        self.cache_file = Path(cache_file)
+        self.workspace_root = workspace_root
+        self._entries: Dict[str, Dict[str, Any]] = {}
+        self._touched: set = set()
+        self._loaded = False
+        self._dirty = False
+        self._hits = 0
+        self._misses = 0
+
+    @classmethod
+    def for_workspace(cls, repo_root: Path) -> "BodyScanCache":
+        """Return the memo stored under ``<repo_root>/.ontos/cache/``."""
+        root = Path(repo_root)
+        return cls(root / CACHE_RELATIVE_DIR / BODY_SCAN_CACHE_FILENAME, workspace_root=root)
+
+    def lookup(self, signature: str, body: str) -> Optional[List[BodyMatchRecord]]:
+        """Return the stored matches for ``body`` or ``None`` on a miss."""
+        self._ensure_loaded()
+        key = _entry_key(signature, body)
+        entry = self._entries.get(key)
+        # The hash is truncated; the length check makes a collision between
+        # two bodies that are both scanned in one workspace vanishingly rare.
+        if entry is None or entry.get("length") != len(body):
+            self._misses += 1
+            return None
+        matches = entry.get("matches")
+        if not isinstance(matches, list):
+            self._misses += 1
+            return None
+        self._hits += 1
+        self._touched.add(key)
+        return matches
+
+    def store(self, signature: str, body: str, matches: List[BodyMatchRecord]) -> None:
+        """Record the matches found in ``body`` under ``signature``."""
+        self._ensure_loaded()
+        key = _entry_key(signature, body)
+        self._entries[key] = {"length": len(body), "matches": [list(item) for item in matches]}
+        self._touched.add(key)
+        self._dirty = True
+
+    def save(self) -> bool:
+        """Persist the entries used by this run if anything changed.
+
+        Returns:
+            True when a new cache file was written.
+        """
+        if not self._dirty and len(self._touched) == len(self._entries):
+            return False
+        payload = {
+            "schema_version": BODY_SCAN_CACHE_SCHEMA_VERSION,
+            "ontos_version": ontos.__version__,
+            "entries": {key: self._entries[key] for key in sorted(self._touched)},
+        }
+        if not write_cache_file(self.cache_file, payload, self.workspace_root):
+            return False
+        self._entries = dict(payload["entries"])
+        self._dirty = False
+        return True
+
+    @property
+    def stats(self) -> dict:
+        """Return memo statistics."""
+        total = self._hits + self._misses
+        return {
+            "entries": len(self._entries),
+            "hits": self._hits,
+            "misses": self._misses,
+            "hit_rate": self._hits / total if total > 0 else 0.0,
+        }
+
+    def _ensure_loaded(self) -> None:
+        if self._loaded:
+            return
+        self._loaded = True
+        try:
+            with open(self.cache_file, "r", encoding="utf-8") as handle:
+                payload = json.load(handle)
+        except (OSError, ValueError):
+            return
+        if not isinstance(payload, dict):
+            return
+        if (
+            payload.get("schema_version") != BODY_SCAN_CACHE_SCHEMA_VERSION
+            or payload.get("ontos_version") != ontos.__version__
+        ):
+            self._dirty = True
+            return
+        entries = payload.get("entries")
+        if isinstance(entries, dict):
+            self._entries = {
+                key: entry for key, entry in entries.items() if isinstance(entry, dict)
+            }
+
+
+def _entry_key(signature: str, body: str) -> str:
+    return f"{signature}|{compute_content_hash(body)}"
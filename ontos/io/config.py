@@ -9,6 +9,7 @@ from ontos.core.config import (
     dict_to_config,
     config_to_dict,
 )
+from ontos.core.profiling import profiled
 from ontos.io.toml import load_config, write_config
 
 CONFIG_FILENAME = ".ontos.toml"
@@ -24,6 +25,7 @@ def find_config(start_path: Optional[Path] = None) -> Optional[Path]:
     return None
 
 
+@profiled("config")
 def load_project_config(
     config_path: Optional[Path] = None,
     repo_root: Optional[Path] = None,
@@ -0,0 +1,114 @@
+"""Single-pass markdown discovery for :func:`ontos.io.files.scan_documents`.
+
+The historical scanner ran ``rglob("*.md")`` and then tested every hit with
+``fnmatch`` and ``Path.match`` per skip pattern. This walker keeps those exact
+semantics but:
+
+- walks with ``os.scandir`` and never descends into a directory whose every
+  possible markdown descendant a skip pattern is guaranteed to reject;
+- folds all ``fnmatch`` patterns into one compiled regex and only falls back
+  to ``PurePath.match`` when a pattern's last component already matches the
+  file name;
+- works on plain strings and builds a ``Path`` only for files it keeps.
+
+Like ``rglob`` it does not descend into symlinked directories, and every
+entry named ``*.md`` is reported regardless of its type.
+"""
+
+from __future__ import annotations
+
+import os
+import re
+from fnmatch import translate
+from pathlib import PurePath
+from typing import Iterator, List, Optional, Pattern, Sequence, Tuple
+
+_MARKDOWN_SUFFIX = os.path.normcase(".md")
+_WILDCARD_CHARS = frozenset("*?[")
+
+
+class SkipMatcher:
+    """Precompiled form of a ``scan_documents`` skip-pattern list.
+
+    A file path is skipped when ``fnmatch(path, pattern)`` or
+    ``Path(path).match(pattern)`` holds for any pattern, exactly as before.
+    """
+
+    def __init__(self, patterns: Sequence[str]) -> None:
+        self.patterns = list(patterns)
+        self._full: Optional[Pattern[str]] = None
+        if self.patterns:
+            self._full = re.compile(
+                "|".join(
+                    f"(?:{translate(os.path.normcase(pattern))})"
+                    for pattern in self.patterns
+                )
+            )
+        # Path.match compares the last component first; only patterns whose
+        # last component matches the name need the full pathlib check.
+        self._component: List[Tuple[Pattern[str], str]] = []
+        for pattern in self.patterns:
+            last = re.split(r"[\\/]+", pattern.rstrip("/\\") or pattern)[-1]
+            self._component.append(
+                (re.compile(translate(os.path.normcase(last))), pattern)
+            )
+        # fnmatch's ``*`` spans separators, so ``A*B`` rejects a whole subtree
+        # once the directory prefix matches ``A`` and every candidate name
+        # ends with the literal ``B``.
+        self._subtree: List[Pattern[str]] = []
+        for pattern in self.patterns:
+            normalized = os.path.normcase(pattern)
+            head, star, tail = normalized.rpartition("*")
+            if (
+                star
+                and not _WILDCARD_CHARS.intersection(tail)
+                and _MARKDOWN_SUFFIX.endswith(tail)
+            ):
+                self._subtree.append(re.compile(translate(head)))
+
+    def skips_file(self, path_str: str, name: str) -> bool:
+        if self._full is not None and self._full.match(os.path.normcase(path_str)):
+            return True
+        normalized_name = os.path.normcase(name)
+        for last_component, pattern in self._component:
+            if last_component.match(normalized_name) and PurePath(path_str).match(pattern):
+                return True
+        return False
+
+    def skips_subtree(self, dir_str: str) -> bool:
+        """True when every markdown file under ``dir_str`` would be skipped."""
+        if not self._subtree:
+            return False
+        if dir_str == ".":
+            prefix = ""
+        else:
+            prefix = os.path.normcase(dir_str.rstrip(os.sep) + os.sep)
+        return any(head.match(prefix) for head in self._subtree)
+
+
+def walk_markdown(root: str, matcher: SkipMatcher) -> Iterator[Tuple[str, str]]:
+    """Yield ``(path_str, name)`` for unskipped ``*.md`` entries under ``root``."""
+    if matcher.skips_subtree(root):
+        return
+    stack = [root]
+    while stack:
+        directory = stack.pop()
+        try:
+            with os.scandir(directory) as entries:
+                entries = list(entries)
+        except OSError:
+            continue
+        for entry in entries:
+            name = entry.name
+            # Path(".") / name renders without the "./" prefix.
+            path_str = name if directory == "." else os.path.join(directory, name)
+            try:
+                descend = entry.is_dir() and not entry.is_symlink()
+            except OSError:
+                descend = False
+            if descend and not matcher.skips_subtree(path_str):
+                stack.append(path_str)
+            if os.path.normcase(name).endswith(_MARKDOWN_SUFFIX) and not matcher.skips_file(
+                path_str, name
+            ):
+                yield path_str, name
@@ -8,15 +8,21 @@ Phase 2 Decomposition - Created from Phase2-Implementation-Spec.md Section 4.7
 """
 
 import os
+import re
 import warnings
-from fnmatch import fnmatch
 from datetime import datetime
 from pathlib import Path
-from typing import Callable, Dict, List, Optional, Tuple, Any
+from typing import TYPE_CHECKING, Callable, Dict, List, Optional, Tuple, Any
 from dataclasses import dataclass
 
-from ontos.core.types import DocumentType, DocumentStatus, DocumentData
+from ontos.core.content_hash import compute_content_hash
+from ontos.core.types import ContentRef, DocumentType, DocumentStatus, DocumentData
 from ontos.core.cache import DocumentCache
+from ontos.core.profiling import profiled, span
+from ontos.io.doc_walker import SkipMatcher, walk_markdown
+
+if TYPE_CHECKING:
+    from ontos.io.parse_cache import DocumentParseCache
 
 
 @dataclass
@@ -120,6 +126,7 @@ def find_project_root(start_path: Path = None) -> Path:
     )
 
 
+@profiled("scan")
 def scan_documents(
     dirs: List[Path],
     skip_patterns: List[str] = None,
@@ -129,6 +136,9 @@ def scan_documents(
 ) -> List[Path]:
     """Recursively find markdown files.
 
+    Subtrees that a skip pattern rejects wholesale (for example
+    ``*/node_modules/*``) are never entered; see :mod:`ontos.io.doc_walker`.
+
     Args:
         dirs: Directories to scan
         skip_patterns: Glob patterns to skip
@@ -136,34 +146,29 @@ def scan_documents(
     Returns:
         List of markdown file paths
     """
-    skip_patterns = skip_patterns or []
+    matcher = SkipMatcher(skip_patterns or [])
     results = set()
     workspace_resolved = workspace_root.resolve() if workspace_root is not None else None
 
     for dir_path in dirs:
         if not dir_path.exists():
             continue
-        for md_file in dir_path.rglob("*.md"):
-            if exclude_transient and _is_transient_markdown_candidate(md_file):
+        for path_str, name in walk_markdown(str(dir_path), matcher):
+            if exclude_transient and _is_transient_markdown_name(name):
                 continue
-            # Check skip patterns against full path for robust matching
-            skip = False
-            path_str = str(md_file)
-            for pattern in skip_patterns:
-                if fnmatch(path_str, pattern) or md_file.match(pattern):
-                    skip = True
-                    break
-            if not skip:
-                resolved = md_file.resolve()
-                if workspace_resolved is not None and not resolved.is_relative_to(workspace_resolved):
-                    continue
-                results.add(resolved)
+            resolved = Path(path_str).resolve()
+            if workspace_resolved is not None and not resolved.is_relative_to(workspace_resolved):
+                continue
+            results.add(resolved)
 
     return sorted(list(results))
 
 
 def _is_transient_markdown_candidate(path: Path) -> bool:
-    name = path.name
+    return _is_transient_markdown_name(path.name)
+
+
+def _is_transient_markdown_name(name: str) -> bool:
     return name.startswith(".") or name.startswith("#") or name.endswith("~")
 
 
@@ -179,6 +184,61 @@ def read_document(path: Path) -> str:
     return path.read_text(encoding="utf-8")
 
 
+class DocumentChangedError(Exception):
+    """A lazily loaded body no longer matches the snapshot it came from."""
+
+    def __init__(self, path: Path):
+        super().__init__(f"Document changed on disk since it was loaded: {path}")
+        self.path = path
+
+
+def read_document_content(doc: DocumentData) -> str:
+    """Return the body of ``doc``, reading it back if a snapshot dropped it.
+
+    Documents in a lazy snapshot (``create_snapshot(lazy_content=True)``)
+    carry an empty ``content`` and a :class:`ContentRef`. The body is read
+    from the recorded byte range and checked against the recorded hash.
+
+    Raises:
+        DocumentChangedError: The file was edited, truncated or removed
+            after the snapshot was built.
+    """
+    ref = doc.content_ref
+    if doc.content or ref is None or ref.length == 0:
+        return doc.content
+    try:
+        with open(doc.filepath, "rb") as handle:
+            handle.seek(ref.offset)
+            raw = handle.read(ref.length)
+    except OSError as exc:
+        raise DocumentChangedError(doc.filepath) from exc
+    body = raw.decode("utf-8", errors="replace")
+    if len(raw) != ref.length or compute_content_hash(body) != ref.content_hash:
+        raise DocumentChangedError(doc.filepath)
+    return body
+
+
+def document_content_hash(doc: DocumentData) -> Optional[str]:
+    """Return ``compute_content_hash`` of the body without reading or hashing it.
+
+    Documents from the file loader answer from the hash recorded at load
+    time; others (built from in-memory content) are hashed on demand.
+    ``None`` for an empty body.
+    """
+    ref = doc.content_ref
+    if ref is not None:
+        return ref.content_hash if ref.length else None
+    return compute_content_hash(doc.content) if doc.content else None
+
+
+def document_content_length(doc: DocumentData) -> int:
+    """Return ``len`` of the body without reading it back from disk."""
+    ref = doc.content_ref
+    if doc.content or ref is None:
+        return len(doc.content)
+    return ref.chars
+
+
 def load_frontmatter(
     path: Path,
     frontmatter_parser: Callable[[str], Tuple[Dict[str, Any], str]],
@@ -247,10 +307,45 @@ def _content_has_explicit_id(
     return isinstance(frontmatter, dict) and "id" in frontmatter
 
 
+# Bytes read from a README/template to look for an explicit ``id:`` opt-in.
+_COUNT_HEAD_BYTES = 8192
+_FRONTMATTER_ID_LINE = re.compile(r"^id\s*:", re.MULTILINE)
+
+
+def count_documents(paths: List[Path]) -> int:
+    """Cheaply count the documents :func:`load_documents` would keep.
+
+    Every markdown path loads as a document (a missing ``id`` falls back to
+    the file stem) except README/``*_template.md`` files without an explicit
+    ``id:``, so only those files are opened, and only their first few KiB.
+    Duplicate IDs and unreadable files are not detected; the result is an
+    upper bound that is exact for well-formed workspaces.
+    """
+    count = 0
+    for path in paths:
+        if not _is_validation_excluded_by_name(path):
+            count += 1
+            continue
+        try:
+            with open(path, "rb") as handle:
+                head = _decode_document_bytes(handle.read(_COUNT_HEAD_BYTES))
+        except OSError:
+            continue
+        if not head.startswith("---"):
+            continue
+        block = head[3:].split("\n---", 1)[0]
+        if _FRONTMATTER_ID_LINE.search(block):
+            count += 1
+    return count
+
+
 def load_documents(
     paths: List[Path],
     frontmatter_parser: Callable[[str], Tuple[Dict[str, Any], str]],
-    cache: Optional[DocumentCache] = None
+    cache: Optional[DocumentCache] = None,
+    *,
+    parse_cache: Optional["DocumentParseCache"] = None,
+    workers: int = 1,
 ) -> DocumentLoadResult:
     """Load multiple documents with duplicate detection and error tracking.
 
@@ -258,6 +353,12 @@ def load_documents(
         paths: List of file paths to load
         frontmatter_parser: Parser function (S4 contract)
         cache: Optional DocumentCache for mtime-based optimization
+        parse_cache: Optional DocumentParseCache (or in-process
+            MemoryParseCache); unchanged files skip both the read and the
+            frontmatter parse. The caller owns ``parse_cache.save()``.
+        workers: Process count for reading and parsing (``0`` = one per CPU).
+            Results are merged in sorted-path order, so documents, issues and
+            duplicate resolution are identical to the serial path.
 
     Returns:
         DocumentLoadResult containing docs, issues, and collision details
@@ -265,9 +366,19 @@ def load_documents(
     documents: Dict[str, DocumentData] = {}
     issues: List[DocumentLoadIssue] = []
     duplicate_ids: Dict[str, List[Path]] = {}
+
+    if parse_cache is not None:
+        parse_cache.bind_parser(frontmatter_parser)
     
     # Determinism: paths processed in sorted order
     sorted_paths = sorted(paths)
+
+    prefetched: Dict[Path, tuple] = {}
+    worker_count = resolve_worker_count(workers)
+    if worker_count > 1:
+        prefetched = _prefetch_parallel(
+            sorted_paths, frontmatter_parser, parse_cache, worker_count
+        )
     
     for path in sorted_paths:
         try:
@@ -282,32 +393,19 @@ def load_documents(
                     pass # Handled below by catch-all
             
             if doc is None:
-                # Lenient read (BOM stripping and leading lstrip for frontmatter detection)
-                raw_bytes = path.read_bytes()
-                if raw_bytes.startswith(b'\xef\xbb\xbf'):
-                    raw_bytes = raw_bytes[3:]
-                # .lstrip() intentionally strips leading whitespace/BOM before frontmatter detection.
-                # This is more lenient than the legacy parser (core/frontmatter.py) which required
-                # content.startswith('---') with no leading whitespace. The leniency handles BOM
-                # artifacts and minor formatting issues in imported/external files.
-                content = raw_bytes.decode('utf-8', errors='replace').lstrip()
-
-                # Apply the existing README/template exclusion before the
-                # canonical validator sees fallback stems such as `_template`.
-                if (
-                    _is_validation_excluded_by_name(path)
-                    and not _content_has_explicit_id(content, frontmatter_parser)
-                ):
-                    continue
-
-                doc, doc_issues = load_document_from_content(path, content, frontmatter_parser)
+                if path in prefetched:
+                    doc, doc_issues = _take_prefetched(
+                        path, prefetched.pop(path), parse_cache
+                    )
+                else:
+                    doc, doc_issues = _load_path(path, frontmatter_parser, parse_cache)
 
                 # (#117) README.md and *_template.md files are typically not
                 # data docs. Skip them unless they declare an explicit `id:`
                 # frontmatter field (escape hatch for repos that intentionally
                 # track these). Silently drop both the doc and any parser
                 # warnings the file produced so the loader stays quiet.
-                if _is_validation_excluded_by_name(path) and not _has_explicit_id(doc):
+                if doc is None:
                     continue
 
                 issues.extend(doc_issues)
@@ -356,6 +454,202 @@ def load_documents(
     )
 
 
+def _load_path(
+    path: Path,
+    frontmatter_parser: Callable[[str], Tuple[Dict[str, Any], str]],
+    parse_cache: Optional["DocumentParseCache"],
+) -> Tuple[Optional[DocumentData], List[DocumentLoadIssue]]:
+    """Read and parse one path, consulting the persistent cache when given.
+
+    Parse/IO exceptions propagate to the caller and are never cached.
+    """
+    if parse_cache is None:
+        with span("read"):
+            raw_bytes = path.read_bytes()
+        with span("parse"):
+            return _parse_document_bytes(path, raw_bytes, frontmatter_parser)
+
+    from ontos.io.parse_cache import content_digest
+
+    stat_result = path.stat()
+    cached = parse_cache.lookup(path, stat_result)
+    if cached is not None:
+        return cached
+    with span("read"):
+        raw_bytes = path.read_bytes()
+    digest = content_digest(raw_bytes)
+    cached = parse_cache.lookup(path, stat_result, digest)
+    if cached is not None:
+        return cached
+    with span("parse"):
+        outcome = _parse_document_bytes(path, raw_bytes, frontmatter_parser)
+    parse_cache.store(path, stat_result, digest, outcome)
+    return outcome
+
+
+# Below this many uncached paths the process-pool start-up costs more than
+# the parse work it would spread out.
+_PARALLEL_MIN_PATHS = 64
+
+
+def resolve_worker_count(workers: Optional[int]) -> int:
+    """Normalize a configured worker count (``0`` = one per CPU, min 1)."""
+    if workers is None:
+        return 1
+    if workers == 0:
+        return os.cpu_count() or 1
+    return max(1, workers)
+
+
+def _prefetch_parallel(
+    sorted_paths: List[Path],
+    frontmatter_parser: Callable[[str], Tuple[Dict[str, Any], str]],
+    parse_cache: Optional["DocumentParseCache"],
+    worker_count: int,
+) -> Dict[Path, tuple]:
+    """Read and parse cache misses across a process pool.
+
+    Returns per-path results for :func:`_take_prefetched`; paths missing from
+    the mapping are loaded serially by the caller. Any pool failure (no
+    process support, unpicklable parser, broken worker) degrades to the
+    serial path instead of failing the load.
+    """
+    from concurrent.futures import ProcessPoolExecutor
+    from functools import partial
+
+    prefetched: Dict[Path, tuple] = {}
+    pending: List[Path] = []
+    for path in sorted_paths:
+        if parse_cache is not None:
+            try:
+                cached = parse_cache.lookup(path, path.stat())
+            except OSError:
+                cached = None
+            if cached is not None:
+                prefetched[path] = ("cached", cached)
+                continue
+        pending.append(path)
+
+    if len(pending) < _PARALLEL_MIN_PATHS:
+        return prefetched
+
+    worker = partial(
+        _load_path_in_worker,
+        frontmatter_parser=frontmatter_parser,
+        with_fingerprint=parse_cache is not None,
+    )
+    chunksize = max(1, len(pending) // (worker_count * 4))
+    try:
+        # Workers both read and parse; the parent can only time the pool.
+        with span("parse"), ProcessPoolExecutor(max_workers=worker_count) as pool:
+            results = list(pool.map(worker, pending, chunksize=chunksize))
+    except Exception:
+        return prefetched
+    prefetched.update(zip(pending, results))
+    return prefetched
+
+
+def _load_path_in_worker(
+    path: Path,
+    frontmatter_parser: Callable[[str], Tuple[Dict[str, Any], str]],
+    with_fingerprint: bool,
+) -> tuple:
+    """Process-pool entry point: read and parse one path.
+
+    Exceptions are returned as ``(code, text)`` so the parent can report them
+    exactly where and how the serial loop would.
+    """
+    stat_result = None
+    digest = None
+    try:
+        if with_fingerprint:
+            stat_result = path.stat()
+        raw_bytes = path.read_bytes()
+        outcome = _parse_document_bytes(path, raw_bytes, frontmatter_parser)
+    except (ValueError, UnicodeDecodeError) as exc:
+        return ("parse_error", str(exc))
+    except OSError as exc:
+        return ("io_error", str(exc))
+    if with_fingerprint:
+        from ontos.io.parse_cache import content_digest
+
+        digest = content_digest(raw_bytes)
+    return ("parsed", outcome, stat_result, digest)
+
+
+def _take_prefetched(
+    path: Path,
+    result: tuple,
+    parse_cache: Optional["DocumentParseCache"],
+) -> Tuple[Optional[DocumentData], List[DocumentLoadIssue]]:
+    """Turn a prefetched result back into the serial loop's outcome/exception."""
+    kind = result[0]
+    if kind == "cached":
+        return result[1]
+    if kind == "parse_error":
+        raise ValueError(result[1])
+    if kind == "io_error":
+        raise OSError(result[1])
+    _, outcome, stat_result, digest = result
+    if parse_cache is not None:
+        cached = parse_cache.lookup(path, stat_result, digest)
+        if cached is not None:
+            return cached
+        parse_cache.store(path, stat_result, digest, outcome)
+    return outcome
+
+
+def _decode_document_bytes(raw_bytes: bytes) -> str:
+    """Leniently decode document bytes (BOM stripping and leading lstrip)."""
+    if raw_bytes.startswith(b'\xef\xbb\xbf'):
+        raw_bytes = raw_bytes[3:]
+    # .lstrip() intentionally strips leading whitespace/BOM before frontmatter detection.
+    # This is more lenient than the legacy parser (core/frontmatter.py) which required
+    # content.startswith('---') with no leading whitespace. The leniency handles BOM
+    # artifacts and minor formatting issues in imported/external files.
+    return raw_bytes.decode('utf-8', errors='replace').lstrip()
+
+
+def _parse_document_bytes(
+    path: Path,
+    raw_bytes: bytes,
+    frontmatter_parser: Callable[[str], Tuple[Dict[str, Any], str]],
+) -> Tuple[Optional[DocumentData], List[DocumentLoadIssue]]:
+    """Parse raw document bytes; ``(None, [])`` marks an excluded file."""
+    content = _decode_document_bytes(raw_bytes)
+
+    # Apply the existing README/template exclusion before the
+    # canonical validator sees fallback stems such as `_template`.
+    if (
+        _is_validation_excluded_by_name(path)
+        and not _content_has_explicit_id(content, frontmatter_parser)
+    ):
+        return None, []
+
+    doc, doc_issues = load_document_from_content(path, content, frontmatter_parser)
+    if _is_validation_excluded_by_name(path) and not _has_explicit_id(doc):
+        return None, []
+    doc.content_ref = _content_ref(raw_bytes, doc.content)
+    return doc, doc_issues
+
+
+def _content_ref(raw_bytes: bytes, body: str) -> Optional[ContentRef]:
+    """Locate ``body`` in ``raw_bytes``; ``None`` when it is not a byte suffix.
+
+    Bodies that were altered by decoding (invalid UTF-8) or by the
+    frontmatter parser have no ref and are always kept in memory.
+    """
+    body_bytes = body.encode("utf-8")
+    if not raw_bytes.endswith(body_bytes):
+        return None
+    return ContentRef(
+        offset=len(raw_bytes) - len(body_bytes),
+        length=len(body_bytes),
+        content_hash=compute_content_hash(body),
+        chars=len(body),
+    )
+
+
 def load_document(
     path: Path,
     frontmatter_parser: Callable[[str], Tuple[Dict[str, Any], str]]
@@ -371,14 +665,7 @@ def load_document(
     Returns:
         DocumentData with normalized types
     """
-    raw_bytes = path.read_bytes()
-    if raw_bytes.startswith(b'\xef\xbb\xbf'):
-        raw_bytes = raw_bytes[3:]
-    # .lstrip() intentionally strips leading whitespace/BOM before frontmatter detection.
-    # This is more lenient than the legacy parser (core/frontmatter.py) which required
-    # content.startswith('---') with no leading whitespace. The leniency handles BOM
-    # artifacts and minor formatting issues in imported/external files.
-    content = raw_bytes.decode('utf-8', errors='replace').lstrip()
+    content = _decode_document_bytes(path.read_bytes())
     doc, _ = load_document_from_content(path, content, frontmatter_parser)
     return doc
 
@@ -399,6 +686,7 @@ def load_document_from_content(
         Tuple of (DocumentData, List[DocumentLoadIssue])
     """
     from ontos.core.frontmatter import (
+    intern_frontmatter,
     normalize_depends_on, 
     normalize_type, 
     normalize_status, 
@@ -410,6 +698,8 @@ def load_document_from_content(
     from ontos.core.cache import DocumentCache # This import is not used in this function, but kept as per instruction.
     
     fm, body = frontmatter_parser(content)
+    if isinstance(fm, dict):
+        fm = intern_frontmatter(fm)
     issues: List[DocumentLoadIssue] = []
 
     def report_warning(msg: str, field_name: str):
@@ -535,5 +825,6 @@ def write_text_file(
         content: Content to write
         encoding: File encoding
     """
-    path.parent.mkdir(parents=True, exist_ok=True)
-    path.write_text(content, encoding=encoding)
+    with span("write"):
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(content, encoding=encoding)
@@ -0,0 +1,287 @@
+"""Bulk last-commit dates for staleness checks.
+
+:func:`ontos.io.git.get_file_mtime` runs ``git log -1 -- <path>`` once per
+file, so a staleness pass over a large workspace forks one git process per
+document.  :class:`GitDateIndex` answers the same question for every file in
+``HEAD`` from a single ``git log --name-only`` stream: commits arrive newest
+first, so the first commit that names a path is its last modification.  The
+walk stops as soon as every path in ``HEAD`` has been seen.
+
+The index is persisted as JSON under ``.ontos/cache/`` keyed by the ``HEAD``
+commit, so repeated runs on an unchanged ``HEAD`` never start git at all
+beyond the one ``rev-parse`` that identifies ``HEAD``.
+
+Differences from the per-file lookup, both rare in practice:
+
+- paths that are not in ``HEAD`` (untracked, or deleted and re-created
+  without committing) report ``None`` instead of a historical date;
+- a path whose newest change sits on a side branch that a merge discarded
+  reports that side-branch commit rather than the commit ``git log -1``
+  reaches through history simplification.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import subprocess
+from datetime import datetime
+from pathlib import Path
+from typing import Callable, Dict, Iterator, Optional, Set, Tuple
+
+from ontos.io.git import get_file_mtime
+from ontos.io.parse_cache import CACHE_RELATIVE_DIR, write_cache_file
+
+
+GIT_DATES_CACHE_FILENAME = "git-dates.json"
+GIT_DATES_SCHEMA_VERSION = 1
+
+_READ_CHUNK = 1 << 16
+
+
+class GitDateIndex:
+    """``path -> last commit author date`` for every file in ``HEAD``.
+
+    Instances are callables compatible with the ``git_mtime_provider``
+    callbacks in :mod:`ontos.core.staleness` and :mod:`ontos.core.config`.
+    """
+
+    def __init__(self, git_root: Path, head: str, dates: Dict[str, str]):
+        self.git_root = Path(git_root)
+        self.head = head
+        self._dates = dates
+        self._parsed: Dict[str, Optional[datetime]] = {}
+        self._root_str = str(self.git_root)
+
+    def __len__(self) -> int:
+        return len(self._dates)
+
+    def __call__(self, filepath: Path) -> Optional[datetime]:
+        key = self._relative_key(filepath)
+        if key is None:
+            return None
+        if key in self._parsed:
+            return self._parsed[key]
+        value = self._dates.get(key)
+        parsed: Optional[datetime] = None
+        if value is not None:
+            try:
+                parsed = datetime.fromisoformat(value)
+            except ValueError:
+                parsed = None
+        self._parsed[key] = parsed
+        return parsed
+
+    @classmethod
+    def build(cls, git_root: Path, head: str) -> Optional["GitDateIndex"]:
+        """Walk history once for every path in ``head``; None if git fails."""
+        targets = _tree_paths(git_root, head)
+        if targets is None:
+            return None
+        dates = _last_commit_dates(git_root, head, targets)
+        if dates is None:
+            return None
+        return cls(git_root, head, dates)
+
+    def _relative_key(self, filepath: Path) -> Optional[str]:
+        absolute = os.path.abspath(filepath)
+        # git reports the real toplevel; resolve directories (not the file,
+        # which may itself be a tracked symlink) before comparing.
+        candidates = (
+            absolute,
+            os.path.join(
+                os.path.realpath(os.path.dirname(absolute)),
+                os.path.basename(absolute),
+            ),
+        )
+        for candidate in candidates:
+            try:
+                relative = os.path.relpath(candidate, self._root_str)
+            except ValueError:  # different drive on Windows
+                continue
+            if relative != os.pardir and not relative.startswith(os.pardir + os.sep):
+                return Path(relative).as_posix()
+        return None
+
+
+def load_git_date_index(
+    repo_root: Path,
+    *,
+    use_cache: bool = True,
+) -> Optional[GitDateIndex]:
+    """Return the date index for the repository containing ``repo_root``.
+
+    Reuses ``.ontos/cache/git-dates.json`` when it was built for the current
+    ``HEAD``; otherwise walks history once and rewrites it.
+
+    Returns:
+        None when ``repo_root`` is not inside a git repository with commits.
+    """
+    root = Path(repo_root)
+    identity = _repository_identity(root)
+    if identity is None:
+        return None
+    git_root, head = identity
+    cache_file = root / CACHE_RELATIVE_DIR / GIT_DATES_CACHE_FILENAME
+
+    if use_cache:
+        cached = _read_cached_dates(cache_file, git_root, head)
+        if cached is not None:
+            return GitDateIndex(git_root, head, cached)
+
+    index = GitDateIndex.build(git_root, head)
+    if index is not None and use_cache:
+        write_cache_file(
+            cache_file,
+            {
+                "schema_version": GIT_DATES_SCHEMA_VERSION,
+                "git_root": str(git_root),
+                "head": head,
+                "dates": index._dates,
+            },
+            root,
+        )
+    return index
+
+
+def git_date_provider(
+    repo_root: Path,
+    *,
+    use_cache: bool = True,
+) -> Callable[[Path], Optional[datetime]]:
+    """Return a ``git_mtime_provider`` for ``repo_root``.
+
+    Falls back to the per-file :func:`ontos.io.git.get_file_mtime` when the
+    bulk index cannot be built (no repository, no commits, git missing).
+    """
+    index = load_git_date_index(repo_root, use_cache=use_cache)
+    if index is None:
+        return get_file_mtime
+    return index
+
+
+def _repository_identity(root: Path) -> Optional[Tuple[Path, str]]:
+    try:
+        result = subprocess.run(
+            ["git", "-C", str(root), "rev-parse", "--show-toplevel", "HEAD"],
+            capture_output=True,
+            text=True,
+            timeout=5,
+        )
+    except (subprocess.TimeoutExpired, FileNotFoundError, OSError):
+        return None
+    lines = result.stdout.splitlines()
+    if result.returncode != 0 or len(lines) != 2:
+        return None
+    return Path(lines[0]), lines[1].strip()
+
+
+def _read_cached_dates(cache_file: Path, git_root: Path, head: str) -> Optional[Dict[str, str]]:
+    try:
+        with open(cache_file, "r", encoding="utf-8") as handle:
+            payload = json.load(handle)
+    except (OSError, ValueError):
+        return None
+    if (
+        not isinstance(payload, dict)
+        or payload.get("schema_version") != GIT_DATES_SCHEMA_VERSION
+        or payload.get("head") != head
+        or payload.get("git_root") != str(git_root)
+    ):
+        return None
+    dates = payload.get("dates")
+    if not isinstance(dates, dict):
+        return None
+    return dates
+
+
+def _tree_paths(git_root: Path, head: str) -> Optional[Set[str]]:
+    try:
+        result = subprocess.run(
+            ["git", "-C", str(git_root), "ls-tree", "-r", "-z", "--name-only", head],
+            capture_output=True,
+            timeout=60,
+        )
+    except (subprocess.TimeoutExpired, FileNotFoundError, OSError):
+        return None
+    if result.returncode != 0:
+        return None
+    return {
+        os.fsdecode(path)
+        for path in result.stdout.split(b"\0")
+        if path
+    }
+
+
+def _last_commit_dates(
+    git_root: Path,
+    head: str,
+    targets: Set[str],
+) -> Optional[Dict[str, str]]:
+    """Stream ``git log`` until every target path has a date."""
+    dates: Dict[str, str] = {}
+    if not targets:
+        return dates
+    remaining = set(targets)
+    command = [
+        "git", "-C", str(git_root), "log",
+        "-z", "--no-renames", "--name-only", "-c",
+        "--format=%x00%aI", head, "--",
+    ]
+    try:
+        process = subprocess.Popen(
+            command,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL,
+        )
+    except (FileNotFoundError, OSError):
+        return None
+    try:
+        for date_str, path in _iter_log_records(process.stdout):
+            if path in remaining:
+                remaining.discard(path)
+                dates[path] = date_str
+                if not remaining:
+                    break
+    finally:
+        if process.poll() is None:
+            process.kill()
+        process.stdout.close()
+        returncode = process.wait()
+    # A killed walk is expected once every path is found.
+    if remaining and returncode != 0:
+        return None
+    return dates
+
+
+def _iter_log_records(stream) -> Iterator[Tuple[str, str]]:
+    """Yield ``(author_date, path)`` from ``git log -z --format=%x00%aI``.
+
+    Each commit is an empty field, the date field, then NUL-separated paths
+    (the first prefixed with a newline) until the next empty field.
+    """
+    current_date: Optional[str] = None
+    expect_header = False
+    pending = b""
+    while True:
+        chunk = stream.read(_READ_CHUNK)
+        if not chunk:
+            break
+        fields = (pending + chunk).split(b"\0")
+        pending = fields.pop()
+        for field in fields:
+            if not field:
+                expect_header = True
+                continue
+            if expect_header:
+                current_date = field.decode("ascii", "replace").strip()
+                expect_header = False
+                continue
+            if current_date is None:
+                continue
+            if field.startswith(b"\n"):
+                field = field[1:]
+            if field:
+                yield current_date, os.fsdecode(field)
+    if pending.strip(b"\n") and current_date is not None and not expect_header:
+        yield current_date, os.fsdecode(pending.lstrip(b"\n"))
@@ -0,0 +1,567 @@
+"""Persistent on-disk parse cache for the canonical document loader.
+
+Every CLI invocation historically re-read and re-parsed every Markdown file in
+scope.  :class:`DocumentParseCache` stores the normalized ``DocumentData`` and
+the loader issues produced for each path under ``.ontos/cache/`` so a file whose
+stat fingerprint ``(mtime_ns, size)`` is unchanged skips both ``read_bytes`` and
+frontmatter parsing.  A changed fingerprint with identical bytes (``touch``,
+checkout of the same blob) is recognized through the SHA-256 of the raw bytes
+and only costs the read.
+
+The cache file is plain JSON with tagged values for the YAML scalars JSON
+cannot represent, never pickle: the cache lives inside the workspace and must
+not become a code-execution vector for a cloned repository.  The payload is
+stamped with ``ontos.__version__``, a schema version and the parser identity;
+any mismatch discards it wholesale.
+
+Concurrency: the file is replaced atomically (temp file + ``os.replace``), so
+readers always observe a complete payload.  Concurrent writers are last-writer
+wins; a lost update only costs a re-parse on the next run.
+
+Trade-off: the cache is a single JSON file holding every entry, bodies
+included.  Each run ``json.load``s the whole corpus even when it only needs a
+few documents, and any change, even to one file, rewrites the whole file.  For
+the workspace sizes Ontos targets one sequential read beats thousands of small
+ones; sharding the cache into one file per entry is the alternative if load or
+save time starts to dominate on very large corpora.
+"""
+
+from __future__ import annotations
+
+import base64
+import hashlib
+import json
+import os
+import time
+from datetime import date, datetime
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+from uuid import uuid4
+
+import ontos
+from ontos.core.frontmatter import intern_frontmatter
+from ontos.core.profiling import profiled
+from ontos.core.types import ContentRef, DocumentData, DocumentStatus, DocumentType
+from ontos.io.files import DocumentLoadIssue
+
+
+CACHE_RELATIVE_DIR = Path(".ontos") / "cache"
+DOCUMENT_CACHE_FILENAME = "documents.json"
+CACHE_SCHEMA_VERSION = 3
+
+# Files modified this close to the moment they were cached may be rewritten
+# again within the filesystem timestamp granularity (2s on FAT) without a
+# visible stat change.  Such "racily clean" entries are always re-verified by
+# content hash, mirroring git's racy-index handling.
+_RACY_WINDOW_NS = 2_000_000_000
+
+LoadOutcome = Tuple[Optional[DocumentData], List[DocumentLoadIssue]]
+
+
+class _UnencodableValue(Exception):
+    """Raised when a parsed value has no stable JSON encoding."""
+
+
+def _encode_value(value: Any) -> Any:
+    """Encode a YAML ``safe_load`` value into tagged JSON."""
+    if value is None or isinstance(value, (bool, int, float, str)):
+        return value
+    if isinstance(value, list):
+        return {"l": [_encode_value(item) for item in value]}
+    if isinstance(value, dict):
+        return {"m": [[_encode_value(k), _encode_value(v)] for k, v in value.items()]}
+    if isinstance(value, datetime):
+        return {"dt": value.isoformat()}
+    if isinstance(value, date):
+        return {"d": value.isoformat()}
+    if isinstance(value, bytes):
+        return {"b": base64.b64encode(value).decode("ascii")}
+    if isinstance(value, (set, frozenset)):
+        try:
+            members = sorted(value)
+        except TypeError as exc:
+            raise _UnencodableValue(repr(value)) from exc
+        return {"s": [_encode_value(item) for item in members]}
+    raise _UnencodableValue(type(value).__name__)
+
+
+def _decode_value(value: Any) -> Any:
+    """Inverse of :func:`_encode_value`."""
+    if not isinstance(value, dict):
+        return value
+    (tag, payload), = value.items()
+    if tag == "l":
+        return [_decode_value(item) for item in payload]
+    if tag == "m":
+        return {_decode_value(k): _decode_value(v) for k, v in payload}
+    if tag == "dt":
+        return datetime.fromisoformat(payload)
+    if tag == "d":
+        return date.fromisoformat(payload)
+    if tag == "b":
+        return base64.b64decode(payload)
+    if tag == "s":
+        return {_decode_value(item) for item in payload}
+    raise ValueError(f"Unknown cache value tag {tag!r}")
+
+
+def _encode_document(doc: DocumentData) -> Dict[str, Any]:
+    return {
+        "id": doc.id,
+        "type": doc.type.value,
+        "status": doc.status.value,
+        "frontmatter": _encode_value(doc.frontmatter),
+        "content": doc.content,
+        "depends_on": list(doc.depends_on),
+        "impacts": list(doc.impacts),
+        "tags": list(doc.tags),
+        "aliases": list(doc.aliases),
+        "describes": list(doc.describes),
+        "content_ref": (
+            [
+                doc.content_ref.offset,
+                doc.content_ref.length,
+                doc.content_ref.content_hash,
+                doc.content_ref.chars,
+            ]
+            if doc.content_ref is not None
+            else None
+        ),
+    }
+
+
+def _decode_document(path: Path, record: Dict[str, Any]) -> DocumentData:
+    return DocumentData(
+        id=record["id"],
+        type=DocumentType(record["type"]),
+        status=DocumentStatus(record["status"]),
+        filepath=path,
+        frontmatter=intern_frontmatter(_decode_value(record["frontmatter"])),
+        content=record["content"],
+        depends_on=list(record["depends_on"]),
+        impacts=list(record["impacts"]),
+        tags=list(record["tags"]),
+        aliases=list(record["aliases"]),
+        describes=list(record["describes"]),
+        content_ref=ContentRef(*record["content_ref"]) if record.get("content_ref") else None,
+    )
+
+
+def _encode_issue(issue: DocumentLoadIssue) -> Dict[str, Any]:
+    return {
+        "code": issue.code,
+        "message": issue.message,
+        "doc_id": issue.doc_id,
+        "field": issue.field,
+        "value": _encode_value(issue.value),
+        "line": issue.line,
+        "allowed_values": issue.allowed_values,
+        "suggested_fix": issue.suggested_fix,
+        "severity": issue.severity,
+        "blocking": issue.blocking,
+    }
+
+
+def _decode_issue(path: Path, record: Dict[str, Any]) -> DocumentLoadIssue:
+    return DocumentLoadIssue(
+        code=record["code"],
+        path=path,
+        message=record["message"],
+        doc_id=record["doc_id"],
+        field=record["field"],
+        value=_decode_value(record["value"]),
+        line=record["line"],
+        allowed_values=record["allowed_values"],
+        suggested_fix=record["suggested_fix"],
+        severity=record["severity"],
+        blocking=record["blocking"],
+    )
+
+
+def _parser_identity(frontmatter_parser: Callable[..., Any]) -> str:
+    module = getattr(frontmatter_parser, "__module__", None) or "?"
+    name = getattr(frontmatter_parser, "__qualname__", None) or repr(frontmatter_parser)
+    return f"{module}.{name}"
+
+
+class DocumentParseCache:
+    """Persistent ``path -> (DocumentData | excluded, issues)`` cache.
+
+    Usage:
+        cache = DocumentParseCache.for_workspace(repo_root)
+        result = load_documents(paths, parse_frontmatter_content, parse_cache=cache)
+        cache.save()
+
+    Lookups never raise for a corrupt, foreign-version or unreadable cache;
+    the cache simply starts empty.  ``save()`` is best-effort and silent on
+    I/O failure so a read-only checkout still loads documents normally.
+    """
+
+    def __init__(self, cache_file: Path, *, workspace_root: Optional[Path] = None):
+        self.cache_file = Path(cache_file)
+        self.workspace_root = workspace_root
+        self._entries: Dict[str, Dict[str, Any]] = {}
+        self._touched: set = set()
+        self._loaded = False
+        self._dirty = False
+        self._parser: Optional[str] = None
+        self._hits = 0
+        self._hash_hits = 0
+        self._misses = 0
+
+    @classmethod
+    def for_workspace(cls, repo_root: Path) -> "DocumentParseCache":
+        """Return the cache stored under ``<repo_root>/.ontos/cache/``."""
+        root = Path(repo_root)
+        return cls(
+            root / CACHE_RELATIVE_DIR / DOCUMENT_CACHE_FILENAME,
+            workspace_root=root,
+        )
+
+    # ------------------------------------------------------------------
+    # Loader protocol
+    # ------------------------------------------------------------------
+
+    def bind_parser(self, frontmatter_parser: Callable[..., Any]) -> None:
+        """Scope entries to one parser; switching parsers discards entries."""
+        identity = _parser_identity(frontmatter_parser)
+        self._ensure_loaded()
+        if self._parser is not None and self._parser != identity:
+            self._entries.clear()
+            self._dirty = True
+        self._parser = identity
+
+    def lookup(
+        self,
+        path: Path,
+        stat_result: os.stat_result,
+        digest: Optional[str] = None,
+    ) -> Optional[LoadOutcome]:
+        """Return a cached outcome for ``path`` or ``None`` on a miss.
+
+        Without ``digest`` only a trusted stat-fingerprint hit is served.
+        With ``digest`` (see :func:`content_digest`) the content hash decides,
+        and a matching entry has its fingerprint refreshed so the next run is
+        a pure stat hit.
+        """
+        self._ensure_loaded()
+        key = str(path)
+        entry = self._entries.get(key)
+        if entry is None:
+            if digest is not None:
+                self._misses += 1
+            return None
+
+        fingerprint_matches = (
+            entry.get("mtime_ns") == stat_result.st_mtime_ns
+            and entry.get("size") == stat_result.st_size
+        )
+        if digest is None:
+            if not fingerprint_matches or entry.get("racy", True):
+                return None
+            outcome = self._decode_entry(path, entry)
+            if outcome is not None:
+                self._hits += 1
+                self._touched.add(key)
+            return outcome
+
+        if entry.get("sha256") != digest:
+            self._misses += 1
+            return None
+        outcome = self._decode_entry(path, entry)
+        if outcome is None:
+            self._misses += 1
+            return None
+        self._hash_hits += 1
+        self._touched.add(key)
+        racy = _is_racy(stat_result)
+        if not fingerprint_matches or entry.get("racy") != racy:
+            entry["mtime_ns"] = stat_result.st_mtime_ns
+            entry["size"] = stat_result.st_size
+            entry["racy"] = racy
+            self._dirty = True
+        return outcome
+
+    def store(
+        self,
+        path: Path,
+        stat_result: os.stat_result,
+        digest: str,
+        outcome: LoadOutcome,
+    ) -> None:
+        """Record the parse outcome for ``path`` (``doc=None`` means excluded)."""
+        self._ensure_loaded()
+        doc, issues = outcome
+        try:
+            entry = {
+                "mtime_ns": stat_result.st_mtime_ns,
+                "size": stat_result.st_size,
+                "sha256": digest,
+                "racy": _is_racy(stat_result),
+                "document": _encode_document(doc) if doc is not None else None,
+                "issues": [_encode_issue(issue) for issue in issues],
+            }
+        except _UnencodableValue:
+            self._entries.pop(str(path), None)
+            return
+        self._entries[str(path)] = entry
+        self._touched.add(str(path))
+        self._dirty = True
+
+    # ------------------------------------------------------------------
+    # Persistence
+    # ------------------------------------------------------------------
+
+    def save(self) -> bool:
+        """Atomically persist the cache if anything changed.
+
+        Entries not touched by this process are kept only while their path
+        still exists, so deleted documents do not accumulate forever.
+
+        Returns:
+            True when a new cache file was written.
+        """
+        if not self._dirty:
+            return False
+        entries = {
+            key: entry
+            for key, entry in self._entries.items()
+            if key in self._touched or os.path.exists(key)
+        }
+        payload = {
+            "schema_version": CACHE_SCHEMA_VERSION,
+            "ontos_version": ontos.__version__,
+            "parser": self._parser,
+            "entries": entries,
+        }
+        if not write_cache_file(self.cache_file, payload, self.workspace_root):
+            return False
+        self._dirty = False
+        return True
+
+    def clear(self) -> None:
+        """Drop all entries; the next ``save()`` writes an empty cache."""
+        self._ensure_loaded()
+        self._entries.clear()
+        self._touched.clear()
+        self._dirty = True
+        self._hits = self._hash_hits = self._misses = 0
+
+    @property
+    def stats(self) -> dict:
+        """Return cache statistics."""
+        total = self._hits + self._hash_hits + self._misses
+        return {
+            "entries": len(self._entries),
+            "hits": self._hits,
+            "hash_hits": self._hash_hits,
+            "misses": self._misses,
+            "hit_rate": (self._hits + self._hash_hits) / total if total > 0 else 0.0,
+        }
+
+    # ------------------------------------------------------------------
+    # Internals
+    # ------------------------------------------------------------------
+
+    def _ensure_loaded(self) -> None:
+        if self._loaded:
+            return
+        self._loaded = True
+        try:
+            with open(self.cache_file, "r", encoding="utf-8") as handle:
+                payload = json.load(handle)
+        except (OSError, ValueError):
+            return
+        if not isinstance(payload, dict):
+            return
+        if (
+            payload.get("schema_version") != CACHE_SCHEMA_VERSION
+            or payload.get("ontos_version") != ontos.__version__
+        ):
+            # Stale stamp: start empty and overwrite on the next save.
+            self._dirty = True
+            return
+        entries = payload.get("entries")
+        if isinstance(entries, dict):
+            self._entries = entries
+            self._parser = payload.get("parser")
+
+    def _decode_entry(self, path: Path, entry: Dict[str, Any]) -> Optional[LoadOutcome]:
+        try:
+            record = entry["document"]
+            doc = _decode_document(path, record) if record is not None else None
+            issues = [_decode_issue(path, item) for item in entry["issues"]]
+        except (KeyError, TypeError, ValueError):
+            self._entries.pop(str(path), None)
+            self._dirty = True
+            return None
+        return doc, issues
+
+
+class MemoryParseCache:
+    """In-process ``path -> (DocumentData | excluded, issues)`` cache.
+
+    Same loader protocol and freshness rules as :class:`DocumentParseCache`,
+    but outcomes are held as live objects: an unchanged file yields the very
+    ``DocumentData`` instance it produced last time, which lets long-lived
+    callers (the MCP snapshot cache) detect unchanged documents by identity.
+    Nothing is written to disk.
+    """
+
+    def __init__(self) -> None:
+        self._entries: Dict[str, Dict[str, Any]] = {}
+        self._touched: set = set()
+        self._parser: Optional[str] = None
+        self._hits = 0
+        self._hash_hits = 0
+        self._misses = 0
+
+    def bind_parser(self, frontmatter_parser: Callable[..., Any]) -> None:
+        """Start a load pass; switching parsers discards entries."""
+        identity = _parser_identity(frontmatter_parser)
+        if self._parser is not None and self._parser != identity:
+            self._entries.clear()
+        self._parser = identity
+        self._touched = set()
+
+    def lookup(
+        self,
+        path: Path,
+        stat_result: os.stat_result,
+        digest: Optional[str] = None,
+    ) -> Optional[LoadOutcome]:
+        """Return the cached outcome for ``path`` or ``None`` on a miss."""
+        key = str(path)
+        entry = self._entries.get(key)
+        if entry is None:
+            if digest is not None:
+                self._misses += 1
+            return None
+
+        fingerprint_matches = (
+            entry["mtime_ns"] == stat_result.st_mtime_ns
+            and entry["size"] == stat_result.st_size
+        )
+        if digest is None:
+            if not fingerprint_matches or entry["racy"]:
+                return None
+            self._hits += 1
+        elif entry["sha256"] != digest:
+            self._misses += 1
+            return None
+        else:
+            self._hash_hits += 1
+            entry["mtime_ns"] = stat_result.st_mtime_ns
+            entry["size"] = stat_result.st_size
+            entry["racy"] = _is_racy(stat_result)
+        self._touched.add(key)
+        doc, issues = entry["outcome"]
+        return doc, list(issues)
+
+    def store(
+        self,
+        path: Path,
+        stat_result: os.stat_result,
+        digest: str,
+        outcome: LoadOutcome,
+    ) -> None:
+        """Record the parse outcome for ``path`` (``doc=None`` means excluded)."""
+        doc, issues = outcome
+        self._entries[str(path)] = {
+            "mtime_ns": stat_result.st_mtime_ns,
+            "size": stat_result.st_size,
+            "sha256": digest,
+            "racy": _is_racy(stat_result),
+            "outcome": (doc, list(issues)),
+        }
+        self._touched.add(str(path))
+
+    def discard(self, paths: Iterable[Path]) -> None:
+        """Forget ``paths`` so the next load re-reads them unconditionally."""
+        for path in paths:
+            self._entries.pop(str(path), None)
+
+    def prune(self) -> int:
+        """Drop entries not seen since the last ``bind_parser``; return count."""
+        stale = [key for key in self._entries if key not in self._touched]
+        for key in stale:
+            del self._entries[key]
+        return len(stale)
+
+    def clear(self) -> None:
+        """Drop all entries."""
+        self._entries.clear()
+        self._touched.clear()
+        self._hits = self._hash_hits = self._misses = 0
+
+    @property
+    def stats(self) -> dict:
+        """Return cache statistics."""
+        total = self._hits + self._hash_hits + self._misses
+        return {
+            "entries": len(self._entries),
+            "hits": self._hits,
+            "hash_hits": self._hash_hits,
+            "misses": self._misses,
+            "hit_rate": (self._hits + self._hash_hits) / total if total > 0 else 0.0,
+        }
+
+
+@profiled("write")
+def write_cache_file(
+    cache_file: Path,
+    payload: Dict[str, Any],
+    workspace_root: Optional[Path] = None,
+) -> bool:
+    """Atomically write ``payload`` as JSON to a file under ``.ontos/cache/``.
+
+    The directory is created with a catch-all ``.gitignore``.  When
+    ``workspace_root`` is given, a cache directory that is a symlink or
+    resolves outside the workspace is refused.  I/O failures are swallowed.
+
+    Returns:
+        True when the file was written.
+    """
+    cache_file = Path(cache_file)
+    try:
+        cache_dir = cache_file.parent
+        root = None if workspace_root is None else Path(workspace_root).resolve()
+        if root is not None:
+            # Vet the deepest existing ancestor before mkdir so a symlinked
+            # ``.ontos`` never gets a ``cache/`` created at its target.
+            existing = cache_dir
+            while not existing.exists() and not existing.is_symlink() and existing != existing.parent:
+                existing = existing.parent
+            resolved = existing.resolve()
+            if existing.is_symlink() or (resolved != root and root not in resolved.parents):
+                return False
+        cache_dir.mkdir(parents=True, exist_ok=True)
+        if root is not None:
+            if cache_dir.is_symlink() or root not in cache_dir.resolve().parents:
+                return False
+        ignore_file = cache_dir / ".gitignore"
+        if not ignore_file.exists():
+            ignore_file.write_text("# Created by ontos; safe to delete.\n*\n", encoding="utf-8")
+        temp = cache_dir / f".{cache_file.name}.{uuid4().hex}.tmp"
+        try:
+            with open(temp, "w", encoding="utf-8") as handle:
+                json.dump(payload, handle, ensure_ascii=False, separators=(",", ":"))
+            os.replace(temp, cache_file)
+        except BaseException:
+            try:
+                temp.unlink()
+            except FileNotFoundError:
+                pass
+            raise
+    except OSError:
+        return False
+    return True
+
+
+def content_digest(raw_bytes: bytes) -> str:
+    """Return the full SHA-256 hex digest used to key cache entries."""
+    return hashlib.sha256(raw_bytes).hexdigest()
+
+
+def _is_racy(stat_result: os.stat_result) -> bool:
+    return time.time_ns() - stat_result.st_mtime_ns < _RACY_WINDOW_NS
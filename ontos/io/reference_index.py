@@ -0,0 +1,163 @@
+"""Persisted token index that narrows ``ontos rename`` to referencing files.
+
+A rename plan used to open, split and body-scan every document in scope to
+find the handful that mention ``old_id``.  Every match the planner can make
+(frontmatter value, Markdown link target, wikilink, bare token, code-zone
+sighting) contains the ID literally, and document IDs only use the characters
+``[A-Za-z0-9_.-]``.  So each file is reduced to the set of maximal runs of
+those characters, and a file can reference an ID only if one of its runs
+contains it.  :meth:`ReferenceIndex.candidates` answers that from the index
+alone; the planner then opens just the candidates and makes the exact
+decision there.
+
+The index is stored as JSON under ``.ontos/cache/``. Each entry is keyed by
+path and carries the file's ``(mtime_ns, size)`` fingerprint and a SHA-256 of
+its bytes. A file with an unchanged fingerprint is not opened. A changed
+fingerprint with identical bytes costs one read. Only files whose content
+changed are tokenized again.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import re
+from pathlib import Path
+from typing import Dict, Iterable, List, Set
+
+from ontos.io.parse_cache import (
+    CACHE_RELATIVE_DIR,
+    _is_racy,
+    content_digest,
+    write_cache_file,
+)
+
+
+REFERENCE_INDEX_FILENAME = "references.json"
+REFERENCE_INDEX_SCHEMA_VERSION = 1
+
+_TOKEN_RE = re.compile(r"[A-Za-z0-9_.-]+")
+
+
+def reference_tokens(text: str) -> List[str]:
+    """Return the sorted distinct ID-alphabet runs in ``text``."""
+    return sorted(set(_TOKEN_RE.findall(text)))
+
+
+class ReferenceIndex:
+    """``token -> paths`` postings for a set of documents."""
+
+    def __init__(self, tokens_by_path: Dict[str, List[str]]):
+        self._postings: Dict[str, Set[str]] = {}
+        for path, tokens in tokens_by_path.items():
+            for token in tokens:
+                self._postings.setdefault(token, set()).add(path)
+        self.reused = 0
+        self.rescanned = 0
+
+    def __len__(self) -> int:
+        return len(self._postings)
+
+    def candidates(self, target: str) -> Set[Path]:
+        """Paths whose text may reference ``target`` (a superset)."""
+        hits: Set[str] = set()
+        for token, paths in self._postings.items():
+            if target in token:
+                hits.update(paths)
+        return {Path(path) for path in hits}
+
+
+def load_reference_index(
+    repo_root: Path,
+    paths: Iterable[Path],
+    *,
+    use_cache: bool = True,
+) -> ReferenceIndex:
+    """Return the index for ``paths``, refreshing entries that changed.
+
+    Entries for files outside ``paths`` are kept while the file exists, so
+    docs-scope and library-scope runs share one index file.
+    """
+    root = Path(repo_root)
+    cache_file = root / CACHE_RELATIVE_DIR / REFERENCE_INDEX_FILENAME
+    entries = _read_entries(cache_file) if use_cache else {}
+
+    tokens_by_path: Dict[str, List[str]] = {}
+    reused = rescanned = 0
+    changed = False
+    for path in paths:
+        key = str(path)
+        try:
+            stat_result = os.stat(path)
+        except OSError:
+            continue
+        entry = entries.get(key)
+        if (
+            entry is not None
+            and entry.get("mtime_ns") == stat_result.st_mtime_ns
+            and entry.get("size") == stat_result.st_size
+            and not entry.get("racy", True)
+        ):
+            tokens_by_path[key] = entry["tokens"]
+            reused += 1
+            continue
+        try:
+            raw = Path(path).read_bytes()
+        except OSError:
+            continue
+        digest = content_digest(raw)
+        if entry is not None and entry.get("sha256") == digest:
+            tokens = entry["tokens"]
+            reused += 1
+        else:
+            tokens = reference_tokens(raw.decode("utf-8", errors="replace"))
+            rescanned += 1
+        entries[key] = {
+            "mtime_ns": stat_result.st_mtime_ns,
+            "size": stat_result.st_size,
+            "sha256": digest,
+            "racy": _is_racy(stat_result),
+            "tokens": tokens,
+        }
+        tokens_by_path[key] = tokens
+        changed = True
+
+    if changed and use_cache:
+        write_cache_file(
+            cache_file,
+            {
+                "schema_version": REFERENCE_INDEX_SCHEMA_VERSION,
+                "entries": {
+                    key: entry
+                    for key, entry in entries.items()
+                    if key in tokens_by_path or os.path.exists(key)
+                },
+            },
+            root,
+        )
+
+    index = ReferenceIndex(tokens_by_path)
+    index.reused = reused
+    index.rescanned = rescanned
+    return index
+
+
+def _read_entries(cache_file: Path) -> Dict[str, Dict[str, object]]:
+    try:
+        with open(cache_file, "r", encoding="utf-8") as handle:
+            payload = json.load(handle)
+    except (OSError, ValueError):
+        return {}
+    if (
+        not isinstance(payload, dict)
+        or payload.get("schema_version") != REFERENCE_INDEX_SCHEMA_VERSION
+    ):
+        return {}
+    entries = payload.get("entries")
+    if not isinstance(entries, dict):
+        return {}
+    return {
+        key: entry
+        for key, entry in entries.items()
+        if isinstance(entry, dict) and isinstance(entry.get("tokens"), list)
+    }
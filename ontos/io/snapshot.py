@@ -4,12 +4,11 @@ IO-layer wrapper for runtime snapshot assembly.
 
 from datetime import datetime
 from pathlib import Path
-from typing import Dict, List, Optional, Any, Callable
+from typing import TYPE_CHECKING, Dict, List, Optional, Any, Callable
 
 import ontos
 from ontos.core.types import DocumentData
 from ontos.core.snapshot import DocumentSnapshot, SnapshotFilters, matches_filter
-from ontos.core.graph import build_graph
 from ontos.core.validation import ValidationOrchestrator
 from ontos.io.config import load_project_config
 from ontos.io.concepts import load_known_concepts
@@ -17,12 +16,19 @@ from ontos.io.files import load_documents
 from ontos.io.scan_scope import collect_scoped_documents, resolve_scan_scope
 from ontos.io.yaml import parse_frontmatter_content
 
+if TYPE_CHECKING:
+    from ontos.io.parse_cache import DocumentParseCache
+
 def create_snapshot(
     root: Path,
     include_content: bool = True,
     filters: Optional[SnapshotFilters] = None,
     git_commit_provider: Optional[Callable[[], Optional[str]]] = None,
     scope: Optional[str] = None,
+    *,
+    parse_cache: Optional["DocumentParseCache"] = None,
+    previous: Optional[DocumentSnapshot] = None,
+    lazy_content: bool = False,
 ) -> DocumentSnapshot:
     """
     Create a snapshot of all documents using the canonical loader.
@@ -32,6 +38,15 @@ def create_snapshot(
         include_content: Whether to include document content
         filters: Optional filters (type, status, concept)
         git_commit_provider: Optional callback to get git commit hash
+        parse_cache: Optional parse cache passed through to the loader
+        previous: Optional earlier snapshot of the same workspace. Its
+            validation analysis is reused for documents that did not change;
+            the result is identical to a snapshot built without it.
+        lazy_content: Drop bodies that can be read back from disk. Such
+            documents keep an empty ``content`` and their ``content_ref``;
+            callers fetch the body with ``read_document_content``. The
+            loaded records are stripped in place so a parse cache keeps
+            handing out the same instances.
 
     Returns:
         Immutable DocumentSnapshot
@@ -50,7 +65,12 @@ def create_snapshot(
     )
 
     # Load documents using unified loader
-    load_result = load_documents(doc_paths, parse_frontmatter_content)
+    load_result = load_documents(
+        doc_paths,
+        parse_frontmatter_content,
+        parse_cache=parse_cache,
+        workers=config.scanning.workers,
+    )
     documents = load_result.documents
     warnings = [issue.message for issue in load_result.issues]
 
@@ -73,11 +93,10 @@ def create_snapshot(
                     aliases=doc.aliases,
                     describes=doc.describes
                 )
+            elif lazy_content and doc.content_ref is not None and doc.content_ref.length:
+                doc.content = ""
             filtered_docs[doc_id] = doc
 
-    # Build graph (workspace_root threaded for #117 path-fallback resolution).
-    graph, _ = build_graph(filtered_docs, workspace_root=root)
-
     # Run the same project validation settings used by map and activation so
     # cached/MCP counts cannot drift from command counts.
     orchestrator = ValidationOrchestrator(
@@ -93,8 +112,14 @@ def create_snapshot(
         },
         workspace_root=root,
     )
-    validation_result = orchestrator.validate_all()
-    
+    analysis = orchestrator.analyze(
+        previous.analysis if previous is not None else None
+    )
+    validation_result = analysis.result
+    # The analysis resolved every edge with #117 path fallback against the
+    # same workspace root; its graph is the one build_graph would produce.
+    graph = analysis.graph
+
     # Get git commit
     git_commit = None
     if git_commit_provider:
@@ -111,5 +136,6 @@ def create_snapshot(
         validation_result=validation_result,
         git_commit=git_commit,
         ontos_version=ontos.__version__,
-        warnings=warnings
+        warnings=warnings,
+        analysis=analysis,
     )
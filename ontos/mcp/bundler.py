@@ -8,10 +8,12 @@ from pathlib import Path
 import re
 from typing import Any
 
+from ontos.core.profiling import profiled
 from ontos.core.snapshot import DocumentSnapshot
 from ontos.core.staleness import check_staleness, parse_describes_verified
-from ontos.core.tokens import estimate_tokens
+from ontos.core.tokens import estimate_tokens_for_length
 from ontos.core.types import DocumentData
+from ontos.io.files import document_content_length, read_document_content
 from ontos.mcp.portfolio_config import (
     DEFAULT_BUNDLE_LOG_WINDOW_DAYS,
     DEFAULT_BUNDLE_MAX_LOGS,
@@ -35,6 +37,7 @@ class BundleDocument:
     token_estimate: int
 
 
+@profiled("render")
 def build_context_bundle(
     snapshot: DocumentSnapshot,
     workspace_root: Path,
@@ -84,6 +87,9 @@ def build_context_bundle(
         log_window_days=log_window_days,
     )
     included, excluded_count, total_tokens = _greedy_pack(priority_docs, token_budget)
+    # Only packed bodies are read, so an edit to a dropped document cannot
+    # fail the bundle.
+    included = [_with_content(doc, docs_by_id[doc.id]) for doc in included]
     reordered = _lost_in_middle_order(included)
     stale_documents = _detect_stale_documents(reordered, docs_by_id)
 
@@ -124,16 +130,22 @@ def _to_bundle_doc(
     else:
         score = 0.5
 
+    # The recorded length avoids reading bodies the budget may drop; content
+    # is filled in by _with_content once the bundle is packed.
     return BundleDocument(
         id=doc.id,
         type=doc.type.value,
         status=doc.status.value,
-        content=doc.content or "",
+        content="",
         score=score,
-        token_estimate=estimate_tokens(doc.content),
+        token_estimate=estimate_tokens_for_length(document_content_length(doc)),
     )
 
 
+def _with_content(bundle_doc: BundleDocument, doc: DocumentData) -> BundleDocument:
+    return replace(bundle_doc, content=read_document_content(doc))
+
+
 def _build_priority_order(
     docs: list[BundleDocument],
     docs_by_id: dict[str, DocumentData],
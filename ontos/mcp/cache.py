@@ -2,23 +2,69 @@
 
 from __future__ import annotations
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from datetime import datetime, timezone
+import logging
+import os
 from pathlib import Path
 import threading
 import time
-from typing import Any, Callable, Dict, Optional, Set, Tuple
+from typing import Any, Callable, Dict, List, Optional, Set, Tuple
 
 from ontos.core.graph import calculate_depths
 from ontos.core.snapshot import DocumentSnapshot
 from ontos.io.concepts import concept_vocabulary_paths
+from ontos.io.parse_cache import MemoryParseCache
 from ontos.io.scan_scope import collect_scoped_documents, resolve_scan_scope
 from ontos.io.snapshot import create_snapshot
 from ontos.mcp.tools import CanonicalSnapshotView, build_canonical_snapshot_view
+from ontos.mcp.watcher import (
+    FRESHNESS_FINGERPRINT,
+    ChangeTracker,
+    start_watcher,
+)
 
 
 Fingerprint = Optional[Tuple[int, int]]
 TEMP_FILE_SUFFIXES = (".swp", ".swo")
+# Set to a truthy value to cross-check every incremental rebuild against a
+# from-scratch snapshot (debugging aid; doubles rebuild cost).
+VERIFY_INCREMENTAL_ENV = "ONTOS_MCP_VERIFY_INCREMENTAL"
+
+logger = logging.getLogger(__name__)
+
+
+class DerivedPayloadCache:
+    """Memo of tool payloads derived from one published snapshot.
+
+    Each :class:`SnapshotCacheState` owns one, so entries are keyed by tool
+    and arguments only and disappear with the revision that produced them.
+    Cached payloads are shared between calls and must not be mutated.
+    """
+
+    def __init__(self) -> None:
+        self._values: Dict[Tuple[Any, ...], Any] = {}
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key: Tuple[Any, ...], compute: Callable[[], Any]) -> Any:
+        """Return the payload stored under ``key``, computing it on a miss.
+
+        The lock is not held while computing; two concurrent misses both
+        compute and the first result wins.
+        """
+        with self._lock:
+            if key in self._values:
+                self.hits += 1
+                return self._values[key]
+        value = compute()
+        with self._lock:
+            self.misses += 1
+            return self._values.setdefault(key, value)
+
+    def __len__(self) -> int:
+        return len(self._values)
 
 
 @dataclass(frozen=True)
@@ -31,6 +77,7 @@ class SnapshotCacheState:
     tracked_doc_path_keys: frozenset[str]
     last_indexed: datetime
     snapshot_revision: int
+    derived: DerivedPayloadCache = field(default_factory=DerivedPayloadCache)
 
 
 @dataclass(frozen=True)
@@ -45,12 +92,13 @@ class SnapshotCacheView:
     canonical_view: CanonicalSnapshotView
     snapshot_revision: int
     last_indexed: datetime
+    derived: DerivedPayloadCache
 
 
 class SnapshotCache:
     """Keep one canonical Ontos snapshot warm for MCP tool calls."""
 
-    freshness_mode = "file-mtime-fingerprint"
+    freshness_mode = FRESHNESS_FINGERPRINT
 
     def __init__(
         self,
@@ -60,15 +108,48 @@ class SnapshotCache:
         *,
         git_commit_provider: Optional[Callable[[], Optional[str]]] = None,
         started_at: Optional[datetime] = None,
+        parse_cache: Optional[MemoryParseCache] = None,
+        verify_incremental: Optional[bool] = None,
+        watch: Optional[str] = None,
+        poll_interval: float = 1.0,
+        lazy_content: bool = False,
     ) -> None:
         self.workspace_root = workspace_root.resolve()
         self.config = config
         self.started_at = started_at or datetime.now(timezone.utc)
         self.rebuild_lock = threading.Lock()
         self._git_commit_provider = git_commit_provider
+        # Rebuilds re-parse only files whose fingerprint moved and re-validate
+        # only what those edits can reach. Pass the cache the initial
+        # snapshot was loaded with so the first rebuild is already warm.
+        self._parse_cache = parse_cache if parse_cache is not None else MemoryParseCache()
+        # Rebuilds keep bodies on disk (see ``create_snapshot``); pass the
+        # same flag the initial snapshot was built with.
+        self.lazy_content = lazy_content
+        if verify_incremental is None:
+            verify_incremental = os.environ.get(VERIFY_INCREMENTAL_ENV, "").strip().lower() in {
+                "1", "true", "yes", "on",
+            }
+        self.verify_incremental = verify_incremental
+        self.incremental_mismatches = 0
         self._state: SnapshotCacheState
         self._replace_state_from_snapshot(snapshot, revision=1)
 
+        # watch="watch"/"poll" moves change detection to a background watcher;
+        # fresh-view checks then only look at what it recorded.
+        self._changes: Optional[ChangeTracker] = None
+        self._watcher = None
+        if watch in {"watch", "poll"}:
+            self._changes = ChangeTracker()
+            self._watcher = start_watcher(
+                self.workspace_root,
+                watch,
+                self._changes,
+                lambda: self._is_stale(self._state),
+                poll_interval,
+            )
+            self.freshness_mode = self._watcher.mode
+
     @property
     def snapshot(self) -> DocumentSnapshot:
         return self._state.snapshot
@@ -97,12 +178,19 @@ class SnapshotCache:
     def last_indexed(self) -> datetime:
         return self._state.last_indexed
 
+    @property
+    def derived(self) -> DerivedPayloadCache:
+        return self._state.derived
+
     def current_view(self) -> SnapshotCacheView:
         """Return a stable read view of the current published cache state."""
         return self._view_for_state(self._state)
 
     def get_fresh_view(self) -> SnapshotCacheView:
         """Return a stable read view, rebuilding only when tracked inputs changed."""
+        if self._changes is not None:
+            return self._get_watched_view(self._changes)
+
         state = self._state
         if not self._is_stale(state):
             return self._view_for_state(state)
@@ -117,16 +205,55 @@ class SnapshotCache:
             self._publish_state(replacement)
             return self._view_for_state(replacement)
 
+    def _get_watched_view(self, changes: ChangeTracker) -> SnapshotCacheView:
+        if not changes.pending:
+            return self._view_for_state(self._state)
+
+        with self.rebuild_lock:
+            state = self._state
+            full, paths = changes.drain()
+            try:
+                if full:
+                    stale = self._is_stale(state)
+                else:
+                    stale = self._changed_paths_stale(state, paths)
+                if not stale:
+                    return self._view_for_state(state)
+
+                replacement = self._build_replacement_state(state.snapshot_revision + 1)
+            except BaseException:
+                changes.mark_all()
+                raise
+            self._publish_state(replacement)
+            return self._view_for_state(replacement)
+
+    def mark_dirty(self) -> None:
+        """Force the next fresh-view check to consult the whole workspace.
+
+        Write tools call this around their own edits so a watcher that has not
+        delivered the events yet cannot hide them. A no-op in fingerprint mode,
+        which checks everything anyway.
+        """
+        if self._changes is not None:
+            self._changes.mark_all()
+
+    def close(self) -> None:
+        """Stop the background watcher, if any."""
+        if self._watcher is not None:
+            self._watcher.stop()
+            self._watcher = None
+
     def get_fresh_snapshot(self) -> DocumentSnapshot:
         """Return the latest snapshot, rebuilding only when inputs changed."""
         return self.get_fresh_view().snapshot
 
     def force_refresh(self) -> tuple[DocumentSnapshot, int]:
-        """Rebuild the snapshot unconditionally and return duration in milliseconds."""
+        """Rebuild the snapshot from scratch and return duration in milliseconds."""
         started = time.perf_counter()
         with self.rebuild_lock:
             next_revision = self._state.snapshot_revision + 1
-            replacement = self._build_replacement_state(next_revision)
+            self._parse_cache.clear()
+            replacement = self._build_replacement_state(next_revision, incremental=False)
             self._publish_state(replacement)
 
         duration_ms = int((time.perf_counter() - started) * 1000)
@@ -135,14 +262,45 @@ class SnapshotCache:
     def _replace_state_from_snapshot(self, snapshot: DocumentSnapshot, revision: int) -> None:
         self._publish_state(self._materialize_state(snapshot, revision))
 
-    def _build_replacement_state(self, revision: int) -> SnapshotCacheState:
+    def _build_replacement_state(
+        self,
+        revision: int,
+        *,
+        incremental: bool = True,
+    ) -> SnapshotCacheState:
+        previous = self._state.snapshot if incremental else None
+        if previous is not None and previous.analysis is None:
+            previous = None
         snapshot = create_snapshot(
             root=self.workspace_root,
             include_content=True,
             filters=None,
             git_commit_provider=self._git_commit_provider,
             scope=None,
+            parse_cache=self._parse_cache,
+            previous=previous,
+            lazy_content=self.lazy_content,
         )
+        self._parse_cache.prune()
+
+        if previous is not None and self.verify_incremental:
+            full = create_snapshot(
+                root=self.workspace_root,
+                include_content=True,
+                filters=None,
+                git_commit_provider=self._git_commit_provider,
+                scope=None,
+                lazy_content=self.lazy_content,
+            )
+            mismatches = _snapshot_differences(snapshot, full)
+            if mismatches:
+                self.incremental_mismatches += 1
+                logger.warning(
+                    "Incremental snapshot rebuild diverged from a full rebuild "
+                    "(%s); publishing the full result.",
+                    ", ".join(mismatches),
+                )
+                snapshot = full
         return self._materialize_state(snapshot, revision)
 
     def _materialize_state(self, snapshot: DocumentSnapshot, revision: int) -> SnapshotCacheState:
@@ -167,7 +325,11 @@ class SnapshotCache:
             snapshot=snapshot,
             fingerprints=fingerprints,
             documents_by_path=documents_by_path,
-            depths=calculate_depths(snapshot.graph),
+            depths=(
+                snapshot.analysis.depths
+                if snapshot.analysis is not None
+                else calculate_depths(snapshot.graph)
+            ),
             canonical_view=build_canonical_snapshot_view(snapshot, self.workspace_root),
             tracked_doc_path_keys=tracked_doc_path_keys,
             last_indexed=datetime.now(timezone.utc),
@@ -189,6 +351,7 @@ class SnapshotCache:
             canonical_view=state.canonical_view,
             snapshot_revision=state.snapshot_revision,
             last_indexed=state.last_indexed,
+            derived=state.derived,
         )
 
     def _is_stale(self, state: SnapshotCacheState) -> bool:
@@ -217,6 +380,34 @@ class SnapshotCache:
 
         return False
 
+    def _changed_paths_stale(self, state: SnapshotCacheState, paths: Set[str]) -> bool:
+        """Recheck only watcher-reported paths against the published state."""
+        has_missing_targets = any(key.startswith("missing::") for key in state.fingerprints)
+        for raw_path in paths:
+            path = Path(raw_path)
+            name = path.name
+            if name.endswith(TEMP_FILE_SUFFIXES) or name.endswith("~") or name.startswith("#"):
+                continue
+            try:
+                rel_path = path.resolve(strict=False).relative_to(self.workspace_root).as_posix()
+            except (OSError, RuntimeError, ValueError):
+                continue
+
+            tracked = False
+            for key in (f"path::{rel_path}", f"validation-input::{rel_path}"):
+                if key in state.fingerprints:
+                    tracked = True
+                    if self._stat_fingerprint(path) != state.fingerprints[key]:
+                        return True
+            if tracked:
+                continue
+            # An untracked Markdown file may be a new document (or a deleted
+            # out-of-scope one); an untracked file of any kind may satisfy a
+            # describes target that was missing. Only the full check knows.
+            if path.suffix.lower() == ".md" or has_missing_targets:
+                return self._is_stale(state)
+        return False
+
     def _scan_canonical_document_keys(self) -> frozenset[str]:
         effective_scope = resolve_scan_scope(None, self.config.scanning.default_scope)
         paths = collect_scoped_documents(
@@ -296,3 +487,28 @@ class SnapshotCache:
         except OSError:
             return None
         return stat.st_mtime_ns, stat.st_size
+
+
+def _snapshot_differences(incremental: DocumentSnapshot, full: DocumentSnapshot) -> List[str]:
+    """Name the parts of two snapshots of the same workspace that disagree."""
+    differences: List[str] = []
+    if incremental.documents != full.documents:
+        differences.append("documents")
+    if list(incremental.documents) != list(full.documents):
+        differences.append("document order")
+    if incremental.graph.edges != full.graph.edges:
+        differences.append("edges")
+    if incremental.graph.reverse_edges != full.graph.reverse_edges:
+        differences.append("reverse_edges")
+    for bucket in ("errors", "warnings", "infos"):
+        if getattr(incremental.validation_result, bucket) != getattr(
+            full.validation_result, bucket
+        ):
+            differences.append(f"validation {bucket}")
+    if incremental.warnings != full.warnings:
+        differences.append("load warnings")
+    incremental_depths = incremental.analysis.depths if incremental.analysis else None
+    full_depths = full.analysis.depths if full.analysis else None
+    if incremental_depths != full_depths:
+        differences.append("depths")
+    return differences
@@ -2,23 +2,34 @@
 
 from __future__ import annotations
 
-from contextlib import contextmanager
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from concurrent.futures.process import BrokenProcessPool
+from contextlib import closing, contextmanager
+from dataclasses import dataclass
 from datetime import datetime, timezone
 import json
 from pathlib import Path
 import re
 import sqlite3
 import threading
-from typing import Any, Iterator, Optional
+from typing import Any, Callable, FrozenSet, Iterable, Iterator, NamedTuple, Optional
 
-from ontos.core.content_hash import compute_content_hash
 from ontos.core.errors import OntosUserError
+from ontos.core.types import DocumentData
 from ontos.io.config import load_project_config
+from ontos.io.files import (
+    document_content_hash,
+    load_documents,
+    read_document_content,
+    resolve_worker_count,
+)
 from ontos.io.scan_scope import collect_scoped_documents, resolve_scan_scope
 from ontos.io.snapshot import create_snapshot
+from ontos.io.yaml import parse_frontmatter_content
+from ontos.mcp.portfolio_writer import PortfolioWriteQueue
 from ontos.mcp.scanner import ProjectEntry, discover_projects
 
-__all__ = ["PortfolioIndex"]
+__all__ = ["PortfolioIndex", "RebuildProgress"]
 
 # Keep keyword detection case-sensitive and word-boundary-aware.
 # Naive substring matching would misclassify plain words like FORD, ANDROID,
@@ -36,6 +47,52 @@ _INVALID_FTS_QUERY_FRAGMENTS = (
 )
 _MAX_FTS_QUERY_LENGTH = 10_000
 
+# ``documents`` columns compared when deciding whether a row must be rewritten;
+# ``body`` is covered by ``content_hash``.
+_DOCUMENT_ROW_COLUMNS = (
+    "id",
+    "workspace",
+    "type",
+    "status",
+    "path",
+    "title",
+    "curation",
+    "content_hash",
+    "word_count",
+    "concepts",
+    "last_modified",
+)
+# scan_state fingerprint key for the workspace config, next to document paths.
+_CONFIG_FINGERPRINT_KEY = ".ontos.toml"
+
+
+@dataclass(frozen=True)
+class RebuildProgress:
+    """One finished workspace during :meth:`PortfolioIndex.rebuild_all`."""
+
+    completed: int
+    total: int
+    slug: str
+    outcome: str  # "rebuilt" or "skipped"
+
+
+class _PreparedDocument(NamedTuple):
+    row: tuple  # values for _DOCUMENT_ROW_COLUMNS
+    body: Optional[str]
+    edges: tuple
+
+
+@dataclass(frozen=True)
+class _PreparedWorkspace:
+    """Everything the writer needs for one workspace; cheap to pickle."""
+
+    root: Path
+    fingerprint: dict
+    has_ontos: bool
+    has_readme: bool
+    root_mtime: Optional[str]
+    documents: tuple
+
 
 class PortfolioIndex:
     """SQLite-backed portfolio index for cross-project queries."""
@@ -56,6 +113,8 @@ class PortfolioIndex:
         self.read_only = read_only
         self._write_lock = threading.Lock()
         self._opened = False
+        self._writer: PortfolioWriteQueue | None = None
+        self._writer_lock = threading.Lock()
 
     def open(self) -> None:
         """Prepare the backing DB and ensure schema compatibility."""
@@ -89,7 +148,14 @@ class PortfolioIndex:
             self._opened = True
 
     def close(self) -> None:
-        """Mark the index closed; operation-scoped connections close eagerly."""
+        """Drain queued upserts and mark the index closed.
+
+        Operation-scoped connections close eagerly.
+        """
+        with self._writer_lock:
+            writer, self._writer = self._writer, None
+        if writer is not None:
+            writer.close()
         self._opened = False
 
     def rebuild_all(
@@ -97,8 +163,23 @@ class PortfolioIndex:
         scan_roots: list[Path],
         exclude: list[str],
         registry_path: Path | None = None,
-    ) -> None:
-        """Rebuild all discovered workspaces from scratch."""
+        *,
+        workers: int = 1,
+        progress: Callable[[RebuildProgress], None] | None = None,
+    ) -> dict[str, list[str]]:
+        """Bring every discovered workspace up to date.
+
+        Workspaces whose stored fingerprint still matches the filesystem are
+        skipped; stale ones are re-synced document by document. Workspaces no
+        longer discovered (or whose slug now names another path) are dropped.
+
+        With ``workers > 1`` (``0`` = one per CPU) the fingerprint and snapshot
+        phase runs across a process pool while this thread, the only SQLite
+        writer, applies each workspace as soon as it is ready.
+
+        Returns:
+            Sorted slugs grouped as ``rebuilt``, ``skipped`` and ``removed``.
+        """
         self._require_writable()
         self.open()
         projects = discover_projects(
@@ -106,31 +187,168 @@ class PortfolioIndex:
             exclude=exclude,
             registry_path=registry_path,
         )
+        roots = {
+            project.slug: project.path.expanduser().resolve(strict=False)
+            for project in projects
+        }
 
-        with self._write_lock:
-            with self._managed_connection() as conn:
+        rebuilt: list[str] = []
+        skipped: list[ProjectEntry] = []
+        with self._managed_connection() as conn:
+            with self._write_lock:
                 conn.execute("BEGIN IMMEDIATE;")
-                conn.execute("DELETE FROM edges;")
-                conn.execute("DELETE FROM documents;")
-                conn.execute("DELETE FROM projects;")
-                conn.execute("DELETE FROM scan_state;")
-                conn.execute("DELETE FROM fts_content;")
+                removed = [
+                    row["slug"]
+                    for row in conn.execute("SELECT slug, path FROM projects ORDER BY slug")
+                    if str(roots.get(row["slug"], "")) != row["path"]
+                ]
+                for slug in removed:
+                    self._delete_workspace_rows(conn, slug)
+                    conn.execute("DELETE FROM scan_state WHERE workspace = ?", (slug,))
+                    conn.execute("DELETE FROM projects WHERE slug = ?", (slug,))
                 conn.commit()
 
-        for project in projects:
-            self._rebuild_workspace(project.slug, project.path, project=project)
+            jobs = [
+                (project, roots[project.slug], self._previous_fingerprint(conn, project.slug, roots[project.slug]))
+                for project in projects
+            ]
+            # closing() shuts the worker pool down if a write below raises.
+            prepared_stream = self._prepare_workspaces(jobs, resolve_worker_count(workers))
+            with closing(prepared_stream):
+                for completed, (project, prepared) in enumerate(prepared_stream, start=1):
+                    if prepared is None:
+                        skipped.append(project)
+                        outcome = "skipped"
+                    else:
+                        with self._write_lock:
+                            self._write_workspace(conn, project.slug, prepared, project=project)
+                        rebuilt.append(project.slug)
+                        outcome = "rebuilt"
+                    if progress is not None:
+                        progress(RebuildProgress(completed, len(jobs), project.slug, outcome))
+
+            with self._write_lock:
+                if skipped:
+                    # Registry status/tags/metadata can change without any
+                    # document changing.
+                    conn.execute("BEGIN IMMEDIATE;")
+                    conn.executemany(
+                        """
+                        UPDATE projects
+                        SET status = ?, has_ontos = ?, has_readme = ?, tags = ?, metadata = ?
+                        WHERE slug = ?
+                        """,
+                        [
+                            (
+                                project.status,
+                                int(project.has_ontos),
+                                int(project.has_readme),
+                                json.dumps(project.tags),
+                                json.dumps(project.metadata),
+                                project.slug,
+                            )
+                            for project in skipped
+                        ],
+                    )
+                    conn.commit()
+                if rebuilt or removed:
+                    conn.execute("INSERT INTO fts_content(fts_content) VALUES('optimize');")
+                    conn.commit()
+                self._publish_read_only_snapshot(conn)
 
-        with self._managed_connection() as conn:
-            conn.execute("INSERT INTO fts_content(fts_content) VALUES('optimize');")
-            conn.commit()
-            self._publish_read_only_snapshot(conn)
+        return {
+            "rebuilt": sorted(rebuilt),
+            "skipped": sorted(project.slug for project in skipped),
+            "removed": removed,
+        }
 
     def rebuild_workspace(self, slug: str, workspace_root: Path) -> None:
-        """Rebuild one workspace in a serialized write transaction."""
+        """Re-sync one workspace in a serialized write transaction."""
         self._require_writable()
         self.open()
         self._rebuild_workspace(slug, workspace_root, project=None)
 
+    def upsert_documents(
+        self,
+        slug: str,
+        workspace_root: Path,
+        paths: Iterable[Path],
+    ) -> str:
+        """Re-index only ``paths`` of one workspace.
+
+        Each touched path gets its document, FTS and edge rows rewritten (or
+        dropped when the file is gone or out of scope) and its ``scan_state``
+        entry refreshed; no other document is read. Paths the stored
+        fingerprint already lists are known to be in scope, so only a new
+        path costs a stat walk of the workspace. Other ``scan_state``
+        entries are kept as they were, so drift elsewhere still shows in
+        :meth:`is_workspace_stale`. A workspace with no usable previous
+        state, a config edit, a duplicate ID, or a released ID that an
+        unindexed file might claim falls back to :meth:`rebuild_workspace`.
+
+        Returns:
+            ``"upserted"`` or ``"rebuilt"``.
+        """
+        self._require_writable()
+        self.open()
+        root = workspace_root.expanduser().resolve(strict=False)
+        touched: set[str] = set()
+        for path in paths:
+            candidate = Path(path)
+            if not candidate.is_absolute():
+                candidate = root / candidate
+            try:
+                touched.add(candidate.resolve(strict=False).relative_to(root).as_posix())
+            except ValueError:
+                continue
+        touched.discard(_CONFIG_FINGERPRINT_KEY)
+
+        with self._write_lock:
+            with self._managed_connection() as conn:
+                previous = self._previous_fingerprint(conn, slug, root)
+                if previous is not None:
+                    # Fingerprint before parsing, as _prepare_workspace does.
+                    entries = _touched_fingerprint(root, previous, touched)
+                    load_result = load_documents(
+                        sorted(root / rel_path for rel_path, stat in entries.items() if stat),
+                        parse_frontmatter_content,
+                    )
+                    documents = [
+                        _prepare_document(doc, slug, root)
+                        for doc in sorted(load_result.documents.values(), key=lambda item: item.id)
+                    ]
+                    if self._upsert_workspace_paths(
+                        conn, slug, root, previous, touched, entries, documents
+                    ):
+                        return "upserted"
+        self._rebuild_workspace(slug, root, project=None)
+        return "rebuilt"
+
+    def schedule_upsert(
+        self,
+        slug: str,
+        workspace_root: Path,
+        paths: Iterable[Path] | None = None,
+    ) -> None:
+        """Queue :meth:`upsert_documents` on the background writer.
+
+        Returns immediately. Requests for one workspace that are still
+        queued merge into a single batch; ``paths=None`` queues a full
+        re-sync. Use :meth:`wait_for_writes` to await convergence.
+        """
+        self._require_writable()
+        with self._writer_lock:
+            if self._writer is None:
+                self._writer = PortfolioWriteQueue(self._apply_queued_write)
+            writer = self._writer
+        writer.submit(slug, workspace_root, None if paths is None else [Path(path) for path in paths])
+
+    def wait_for_writes(self, timeout: float | None = None) -> bool:
+        """Block until queued upserts are applied; False on timeout."""
+        with self._writer_lock:
+            writer = self._writer
+        return True if writer is None else writer.wait_idle(timeout)
+
     def is_workspace_stale(self, slug: str) -> bool:
         """Return True when tracked file fingerprints drift from scan_state."""
         self.open()
@@ -161,7 +379,7 @@ class PortfolioIndex:
         except ValueError:
             return True
 
-        current = self._workspace_fingerprint(workspace_path)
+        current = _workspace_fingerprint(workspace_path)
         return stored != current
 
     def get_projects(self) -> list[dict[str, Any]]:
@@ -308,160 +526,404 @@ class PortfolioIndex:
         project: ProjectEntry | None,
     ) -> None:
         root = workspace_root.expanduser().resolve(strict=False)
-        has_ontos = (root / ".ontos.toml").exists()
-        has_readme = (root / "README.md").exists() or (root / "readme.md").exists()
-        snapshot = create_snapshot(
-            root=root,
-            include_content=True,
-            filters=None,
-            git_commit_provider=None,
-            scope=None,
-        )
-
+        prepared = _prepare_workspace(slug, root, None)
         with self._write_lock:
             with self._managed_connection() as conn:
-                conn.execute("BEGIN IMMEDIATE;")
-                rowids = [
-                    row[0]
-                    for row in conn.execute(
-                        "SELECT rowid FROM documents WHERE workspace = ?",
-                        (slug,),
-                    ).fetchall()
-                ]
-                if rowids:
-                    conn.executemany(
-                        "DELETE FROM fts_content WHERE rowid = ?",
-                        [(rowid,) for rowid in rowids],
-                    )
-                conn.execute(
-                    "DELETE FROM edges WHERE from_workspace = ? OR to_workspace = ?",
-                    (slug, slug),
-                )
-                conn.execute("DELETE FROM documents WHERE workspace = ?", (slug,))
-
-                doc_count = len(snapshot.documents)
-                status = project.status if project else self._classify_workspace(has_ontos, has_readme, doc_count)
-                tags = project.tags if project else []
-                metadata = project.metadata if project else {}
-
-                conn.execute(
-                    """
-                    INSERT INTO projects(
-                        slug, path, status, doc_count, has_ontos, has_readme,
-                        last_scanned, last_modified, tags, metadata
-                    ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-                    ON CONFLICT(slug) DO UPDATE SET
-                        path = excluded.path,
-                        status = excluded.status,
-                        doc_count = excluded.doc_count,
-                        has_ontos = excluded.has_ontos,
-                        has_readme = excluded.has_readme,
-                        last_scanned = excluded.last_scanned,
-                        last_modified = excluded.last_modified,
-                        tags = excluded.tags,
-                        metadata = excluded.metadata
+                self._write_workspace(conn, slug, prepared, project=project)
+
+    def _apply_queued_write(
+        self,
+        slug: str,
+        workspace_root: Path,
+        paths: Optional[FrozenSet[Path]],
+    ) -> None:
+        if paths is None:
+            self.rebuild_workspace(slug, workspace_root)
+        else:
+            self.upsert_documents(slug, workspace_root, paths)
+
+    @staticmethod
+    def _prepare_workspaces(
+        jobs: list[tuple[ProjectEntry, Path, dict[str, Any] | None]],
+        worker_count: int,
+    ) -> Iterator[tuple[ProjectEntry, _PreparedWorkspace | None]]:
+        """Yield ``(project, prepared)`` as each workspace's snapshot is ready.
+
+        A pool that cannot start or breaks degrades to preparing the
+        remaining workspaces in this process. An error raised while preparing
+        one workspace propagates; it would fail the same way serially.
+        """
+        remaining = list(jobs)
+        worker_count = min(worker_count, len(jobs))
+        pool: ProcessPoolExecutor | None = None
+        futures: dict[Any, tuple[ProjectEntry, Path, dict[str, Any] | None]] = {}
+        if worker_count > 1:
+            try:
+                pool = ProcessPoolExecutor(max_workers=worker_count)
+                for job in jobs:
+                    futures[pool.submit(_prepare_workspace, job[0].slug, job[1], job[2])] = job
+            except (BrokenProcessPool, OSError, NotImplementedError):
+                if pool is not None:
+                    pool.shutdown(wait=True, cancel_futures=True)
+                pool = None
+        if pool is not None:
+            try:
+                for future in as_completed(futures):
+                    job = futures[future]
+                    try:
+                        prepared = future.result()
+                    except BrokenProcessPool:
+                        break
+                    remaining.remove(job)
+                    yield job[0], prepared
+            finally:
+                # Also reached when the consumer closes this generator early;
+                # queued workspaces are not worth finishing then.
+                pool.shutdown(wait=True, cancel_futures=True)
+        for project, root, previous in remaining:
+            yield project, _prepare_workspace(project.slug, root, previous)
+
+    def _write_workspace(
+        self,
+        conn: sqlite3.Connection,
+        slug: str,
+        prepared: _PreparedWorkspace,
+        *,
+        project: ProjectEntry | None,
+    ) -> None:
+        """Re-sync one workspace, touching only rows whose document changed.
+
+        The stored ``scan_state`` fingerprint identifies documents whose file
+        stat is unchanged; those rows are left alone. Every other document is
+        compared against its stored row (``content_hash`` included) and only
+        rewritten when it differs. A workspace with no usable previous state
+        (new slug, moved path, FTS drift) is rewritten in full, which keeps
+        the method idempotent. Callers hold ``_write_lock``.
+        """
+        root = prepared.root
+        fingerprint = prepared.fingerprint
+        conn.execute("BEGIN IMMEDIATE;")
+        previous = self._previous_fingerprint(conn, slug, root)
+        if previous is None:
+            self._delete_workspace_rows(conn, slug)
+            stored_rows: dict[str, sqlite3.Row] = {}
+        else:
+            stored_rows = {
+                row["id"]: row
+                for row in conn.execute(
+                    f"""
+                    SELECT rowid, {", ".join(_DOCUMENT_ROW_COLUMNS)}
+                    FROM documents
+                    WHERE workspace = ?
                     """,
-                    (
-                        slug,
-                        str(root),
-                        status,
-                        doc_count,
-                        int(has_ontos),
-                        int(has_readme),
-                        self._iso_now(),
-                        self._path_mtime_iso(root),
-                        json.dumps(tags),
-                        json.dumps(metadata),
-                    ),
+                    (slug,),
                 )
+            }
+        # Config edits can change how every document normalizes.
+        trust_stat = previous is not None and previous.get(
+            _CONFIG_FINGERPRINT_KEY
+        ) == fingerprint.get(_CONFIG_FINGERPRINT_KEY)
+
+        doc_count = len(prepared.documents)
+        status = (
+            project.status
+            if project
+            else self._classify_workspace(prepared.has_ontos, prepared.has_readme, doc_count)
+        )
+        tags = project.tags if project else []
+        metadata = project.metadata if project else {}
 
-                for doc in sorted(snapshot.documents.values(), key=lambda item: item.id):
-                    doc_path = doc.filepath.resolve(strict=False)
-                    try:
-                        rel_path = doc_path.relative_to(root).as_posix()
-                    except ValueError:
-                        rel_path = doc_path.name
-                    concepts = " ".join(term for term in doc.tags if term)
-                    cursor = conn.execute(
-                        """
-                        INSERT INTO documents(
-                            id, workspace, type, status, path, title, curation,
-                            content_hash, word_count, concepts, body, last_modified
-                        ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-                        """,
-                        (
-                            doc.id,
-                            slug,
-                            doc.type.value,
-                            doc.status.value,
-                            rel_path,
-                            self._extract_title(doc.frontmatter),
-                            self._extract_curation(doc.frontmatter),
-                            compute_content_hash(doc.content) if doc.content else None,
-                            len(doc.content.split()) if doc.content else 0,
-                            concepts,
-                            doc.content,
-                            self._path_mtime_iso(doc_path),
-                        ),
-                    )
-                    conn.execute(
-                        """
-                        INSERT INTO fts_content(rowid, title, concepts, body)
-                        VALUES (?, ?, ?, ?)
-                        """,
-                        (
-                            cursor.lastrowid,
-                            self._extract_title(doc.frontmatter) or "",
-                            concepts,
-                            doc.content or "",
-                        ),
-                    )
+        conn.execute(
+            """
+            INSERT INTO projects(
+                slug, path, status, doc_count, has_ontos, has_readme,
+                last_scanned, last_modified, tags, metadata
+            ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+            ON CONFLICT(slug) DO UPDATE SET
+                path = excluded.path,
+                status = excluded.status,
+                doc_count = excluded.doc_count,
+                has_ontos = excluded.has_ontos,
+                has_readme = excluded.has_readme,
+                last_scanned = excluded.last_scanned,
+                last_modified = excluded.last_modified,
+                tags = excluded.tags,
+                metadata = excluded.metadata
+            """,
+            (
+                slug,
+                str(root),
+                status,
+                doc_count,
+                int(prepared.has_ontos),
+                int(prepared.has_readme),
+                self._iso_now(),
+                prepared.root_mtime,
+                json.dumps(tags),
+                json.dumps(metadata),
+            ),
+        )
 
-                    for depends_id in sorted(set(doc.depends_on)):
-                        conn.execute(
-                            """
-                            INSERT OR IGNORE INTO edges(
-                                from_workspace, from_id, to_workspace, to_id, type
-                            ) VALUES (?, ?, ?, ?, 'depends_on')
-                            """,
-                            (slug, doc.id, slug, depends_id),
-                        )
+        path_index = _DOCUMENT_ROW_COLUMNS.index("path")
+        for document in prepared.documents:
+            row = document.row
+            doc_id = row[0]
+            rel_path = row[path_index]
+            stored = stored_rows.pop(doc_id, None)
+            if (
+                stored is not None
+                and trust_stat
+                and stored["path"] == rel_path
+                and fingerprint.get(rel_path) is not None
+                and previous.get(rel_path) == fingerprint[rel_path]
+            ):
+                continue
+            if stored is not None:
+                if tuple(stored[column] for column in _DOCUMENT_ROW_COLUMNS) == row and (
+                    self._stored_edges(conn, slug, doc_id) == list(document.edges)
+                ):
+                    continue
+                self._delete_document_rows(conn, slug, doc_id, stored["rowid"])
+            self._insert_document_rows(conn, slug, document)
+
+        for doc_id, stored in stored_rows.items():
+            self._delete_document_rows(conn, slug, doc_id, stored["rowid"])
+
+        conn.execute(
+            """
+            INSERT INTO scan_state(workspace, fingerprint, scanned_at)
+            VALUES (?, ?, ?)
+            ON CONFLICT(workspace) DO UPDATE SET
+                fingerprint = excluded.fingerprint,
+                scanned_at = excluded.scanned_at
+            """,
+            (
+                slug,
+                json.dumps(fingerprint, sort_keys=True),
+                self._iso_now(),
+            ),
+        )
+        conn.commit()
 
-                conn.execute(
-                    """
-                    INSERT INTO scan_state(workspace, fingerprint, scanned_at)
-                    VALUES (?, ?, ?)
-                    ON CONFLICT(workspace) DO UPDATE SET
-                        fingerprint = excluded.fingerprint,
-                        scanned_at = excluded.scanned_at
-                    """,
-                    (
-                        slug,
-                        json.dumps(self._workspace_fingerprint(root), sort_keys=True),
-                        self._iso_now(),
-                    ),
-                )
-                conn.commit()
+        docs_count, fts_count = self._fts_parity_counts(conn, slug)
+        if docs_count != fts_count:
+            raise RuntimeError(
+                f"FTS parity mismatch for {slug}: documents={docs_count}, fts={fts_count}"
+            )
 
-                docs_count = conn.execute(
-                    "SELECT COUNT(*) FROM documents WHERE workspace = ?",
-                    (slug,),
-                ).fetchone()[0]
-                fts_count = conn.execute(
-                    """
-                    SELECT COUNT(*)
-                    FROM fts_content
-                    JOIN documents ON documents.rowid = fts_content.rowid
-                    WHERE documents.workspace = ?
-                    """,
-                    (slug,),
-                ).fetchone()[0]
-                if docs_count != fts_count:
-                    raise RuntimeError(
-                        f"FTS parity mismatch for {slug}: documents={docs_count}, fts={fts_count}"
-                    )
+        self._publish_read_only_snapshot(conn)
 
-                self._publish_read_only_snapshot(conn)
+    def _upsert_workspace_paths(
+        self,
+        conn: sqlite3.Connection,
+        slug: str,
+        root: Path,
+        previous: dict[str, Any],
+        touched: set[str],
+        entries: dict[str, Any],
+        documents: list[_PreparedDocument],
+    ) -> bool:
+        """Apply one targeted upsert; False when a full re-sync is required.
+
+        Callers hold ``_write_lock``.
+        """
+        conn.execute("BEGIN IMMEDIATE;")
+        config_stat = _stat_fingerprint(root / _CONFIG_FINGERPRINT_KEY)
+        if (
+            self._previous_fingerprint(conn, slug, root) != previous
+            # Config edits can change how every document normalizes.
+            or previous.get(_CONFIG_FINGERPRINT_KEY)
+            != (list(config_stat) if config_stat is not None else None)
+        ):
+            conn.rollback()
+            return False
+
+        stored_by_path = {
+            row["path"]: row
+            for row in conn.execute(
+                "SELECT rowid, id, path FROM documents WHERE workspace = ?",
+                (slug,),
+            )
+        }
+        owner_by_id = {row["id"]: path for path, row in stored_by_path.items()}
+        new_ids = {document.row[0] for document in documents}
+        for doc_id in new_ids:
+            owner = owner_by_id.get(doc_id)
+            if owner is not None and owner not in touched:
+                # The ID is also held by an untouched file.
+                conn.rollback()
+                return False
+        released = {
+            row["id"] for path, row in stored_by_path.items() if path in touched
+        } - new_ids
+        if released and set(previous) - set(stored_by_path) - touched - {_CONFIG_FINGERPRINT_KEY}:
+            # An unindexed file may be a shadowed duplicate of a released ID.
+            conn.rollback()
+            return False
+
+        for rel_path in touched:
+            stored = stored_by_path.get(rel_path)
+            if stored is not None:
+                self._delete_document_rows(conn, slug, stored["id"], stored["rowid"])
+        for document in documents:
+            self._insert_document_rows(conn, slug, document)
+
+        fingerprint = {key: value for key, value in previous.items() if key not in touched}
+        fingerprint.update(entries)
+        scanned_at = self._iso_now()
+        conn.execute(
+            """
+            UPDATE projects
+            SET doc_count = (SELECT COUNT(*) FROM documents WHERE workspace = ?),
+                last_scanned = ?
+            WHERE slug = ?
+            """,
+            (slug, scanned_at, slug),
+        )
+        conn.execute(
+            "UPDATE scan_state SET fingerprint = ?, scanned_at = ? WHERE workspace = ?",
+            (json.dumps(fingerprint, sort_keys=True), scanned_at, slug),
+        )
+        conn.commit()
+
+        docs_count, fts_count = self._fts_parity_counts(conn, slug)
+        if docs_count != fts_count:
+            raise RuntimeError(
+                f"FTS parity mismatch for {slug}: documents={docs_count}, fts={fts_count}"
+            )
+
+        self._publish_read_only_snapshot(conn)
+        return True
+
+    def _previous_fingerprint(
+        self,
+        conn: sqlite3.Connection,
+        slug: str,
+        root: Path,
+    ) -> dict[str, Any] | None:
+        """Return the stored fingerprint when incremental sync is safe."""
+        row = conn.execute(
+            """
+            SELECT p.path AS path, s.fingerprint AS fingerprint
+            FROM projects p
+            LEFT JOIN scan_state s ON s.workspace = p.slug
+            WHERE p.slug = ?
+            """,
+            (slug,),
+        ).fetchone()
+        if row is None or row["path"] != str(root) or not isinstance(row["fingerprint"], str):
+            return None
+        try:
+            stored = json.loads(row["fingerprint"])
+        except ValueError:
+            return None
+        if not isinstance(stored, dict):
+            return None
+        docs_count, fts_count = self._fts_parity_counts(conn, slug)
+        if docs_count != fts_count:
+            return None
+        return stored
+
+    @staticmethod
+    def _fts_parity_counts(conn: sqlite3.Connection, slug: str) -> tuple[int, int]:
+        docs_count = conn.execute(
+            "SELECT COUNT(*) FROM documents WHERE workspace = ?",
+            (slug,),
+        ).fetchone()[0]
+        fts_count = conn.execute(
+            """
+            SELECT COUNT(*)
+            FROM fts_content
+            JOIN documents ON documents.rowid = fts_content.rowid
+            WHERE documents.workspace = ?
+            """,
+            (slug,),
+        ).fetchone()[0]
+        return int(docs_count), int(fts_count)
+
+    @staticmethod
+    def _stored_edges(conn: sqlite3.Connection, slug: str, doc_id: str) -> list[str]:
+        return [
+            row[0]
+            for row in conn.execute(
+                """
+                SELECT to_id FROM edges
+                WHERE from_workspace = ? AND from_id = ? AND type = 'depends_on'
+                ORDER BY to_id
+                """,
+                (slug, doc_id),
+            )
+        ]
+
+    @staticmethod
+    def _insert_document_rows(
+        conn: sqlite3.Connection,
+        slug: str,
+        document: _PreparedDocument,
+    ) -> None:
+        row = document.row
+        cursor = conn.execute(
+            f"""
+            INSERT INTO documents({", ".join(_DOCUMENT_ROW_COLUMNS)}, body)
+            VALUES ({", ".join("?" * (len(_DOCUMENT_ROW_COLUMNS) + 1))})
+            """,
+            row + (document.body,),
+        )
+        conn.execute(
+            """
+            INSERT INTO fts_content(rowid, title, concepts, body)
+            VALUES (?, ?, ?, ?)
+            """,
+            (
+                cursor.lastrowid,
+                row[_DOCUMENT_ROW_COLUMNS.index("title")] or "",
+                row[_DOCUMENT_ROW_COLUMNS.index("concepts")],
+                document.body or "",
+            ),
+        )
+        for depends_id in document.edges:
+            conn.execute(
+                """
+                INSERT OR IGNORE INTO edges(
+                    from_workspace, from_id, to_workspace, to_id, type
+                ) VALUES (?, ?, ?, ?, 'depends_on')
+                """,
+                (slug, row[0], slug, depends_id),
+            )
+
+    @staticmethod
+    def _delete_document_rows(
+        conn: sqlite3.Connection,
+        slug: str,
+        doc_id: str,
+        rowid: int,
+    ) -> None:
+        conn.execute("DELETE FROM fts_content WHERE rowid = ?", (rowid,))
+        conn.execute(
+            "DELETE FROM edges WHERE from_workspace = ? AND from_id = ?",
+            (slug, doc_id),
+        )
+        conn.execute("DELETE FROM documents WHERE rowid = ?", (rowid,))
+
+    @staticmethod
+    def _delete_workspace_rows(conn: sqlite3.Connection, slug: str) -> None:
+        rowids = [
+            row[0]
+            for row in conn.execute(
+                "SELECT rowid FROM documents WHERE workspace = ?",
+                (slug,),
+            ).fetchall()
+        ]
+        if rowids:
+            conn.executemany(
+                "DELETE FROM fts_content WHERE rowid = ?",
+                [(rowid,) for rowid in rowids],
+            )
+        conn.execute(
+            "DELETE FROM edges WHERE from_workspace = ? OR to_workspace = ?",
+            (slug, slug),
+        )
+        conn.execute("DELETE FROM documents WHERE workspace = ?", (slug,))
 
     @staticmethod
     def _publish_read_only_snapshot(conn: sqlite3.Connection) -> None:
@@ -680,37 +1142,120 @@ class PortfolioIndex:
         message = str(exc).lower()
         return "database is locked" in message or "database table is locked" in message
 
-    @staticmethod
-    def _stat_fingerprint(path: Path) -> tuple[int, int] | None:
-        try:
-            stat = path.stat()
-        except OSError:
-            return None
-        return stat.st_mtime_ns, stat.st_size
 
-    def _workspace_fingerprint(self, workspace_root: Path) -> dict[str, list[int] | None]:
-        root = workspace_root.resolve(strict=False)
-        try:
-            config = load_project_config(config_path=root / ".ontos.toml", repo_root=root)
-            effective_scope = resolve_scan_scope(None, config.scanning.default_scope)
-            paths = collect_scoped_documents(
-                root,
-                config,
-                effective_scope,
-                base_skip_patterns=config.scanning.skip_patterns,
-            )
-        except Exception:
-            docs_dir = root / "docs"
-            if not docs_dir.is_dir():
-                return {}
-            paths = sorted(path for path in docs_dir.rglob("*.md") if path.is_file())
-
-        fingerprint: dict[str, list[int] | None] = {}
-        for path in sorted(paths):
-            rel_path = path.resolve(strict=False).relative_to(root).as_posix()
-            stat = self._stat_fingerprint(path)
-            fingerprint[rel_path] = [stat[0], stat[1]] if stat is not None else None
-        return fingerprint
+def _stat_fingerprint(path: Path) -> tuple[int, int] | None:
+    try:
+        stat = path.stat()
+    except OSError:
+        return None
+    return stat.st_mtime_ns, stat.st_size
+
+
+def _workspace_fingerprint(workspace_root: Path) -> dict[str, list[int] | None]:
+    root = workspace_root.resolve(strict=False)
+    try:
+        config = load_project_config(config_path=root / ".ontos.toml", repo_root=root)
+        effective_scope = resolve_scan_scope(None, config.scanning.default_scope)
+        paths = collect_scoped_documents(
+            root,
+            config,
+            effective_scope,
+            base_skip_patterns=config.scanning.skip_patterns,
+        )
+    except Exception:
+        docs_dir = root / "docs"
+        if not docs_dir.is_dir():
+            return {}
+        paths = sorted(path for path in docs_dir.rglob("*.md") if path.is_file())
+
+    fingerprint: dict[str, list[int] | None] = {}
+    config_stat = _stat_fingerprint(root / _CONFIG_FINGERPRINT_KEY)
+    if config_stat is not None:
+        fingerprint[_CONFIG_FINGERPRINT_KEY] = [config_stat[0], config_stat[1]]
+    for path in sorted(paths):
+        rel_path = path.resolve(strict=False).relative_to(root).as_posix()
+        stat = _stat_fingerprint(path)
+        fingerprint[rel_path] = [stat[0], stat[1]] if stat is not None else None
+    return fingerprint
+
+
+def _touched_fingerprint(
+    root: Path,
+    previous: dict[str, Any],
+    touched: set[str],
+) -> dict[str, list[int] | None]:
+    """Fingerprint entries for the in-scope paths among ``touched``."""
+    if touched - previous.keys():
+        current = _workspace_fingerprint(root)
+        return {rel_path: current[rel_path] for rel_path in touched if rel_path in current}
+    entries: dict[str, list[int] | None] = {}
+    for rel_path in touched:
+        stat = _stat_fingerprint(root / rel_path)
+        if stat is not None:
+            entries[rel_path] = [stat[0], stat[1]]
+    return entries
+
+
+def _prepare_workspace(
+    slug: str,
+    root: Path,
+    previous_fingerprint: dict[str, Any] | None,
+) -> _PreparedWorkspace | None:
+    """Fingerprint and snapshot one workspace into writer-ready rows.
+
+    Process-pool entry point, so it touches no SQLite state. Returns None
+    when ``previous_fingerprint`` shows nothing changed.
+    """
+    # Fingerprint before parsing so an edit racing the snapshot leaves the
+    # workspace stale rather than silently indexed with old content.
+    fingerprint = _workspace_fingerprint(root)
+    if previous_fingerprint is not None and previous_fingerprint == fingerprint:
+        return None
+    snapshot = create_snapshot(
+        root=root,
+        include_content=True,
+        filters=None,
+        git_commit_provider=None,
+        scope=None,
+    )
+    return _PreparedWorkspace(
+        root=root,
+        fingerprint=fingerprint,
+        has_ontos=(root / ".ontos.toml").exists(),
+        has_readme=(root / "README.md").exists() or (root / "readme.md").exists(),
+        root_mtime=PortfolioIndex._path_mtime_iso(root),
+        documents=tuple(
+            _prepare_document(doc, slug, root)
+            for doc in sorted(snapshot.documents.values(), key=lambda item: item.id)
+        ),
+    )
+
+
+def _prepare_document(doc: DocumentData, slug: str, root: Path) -> _PreparedDocument:
+    """Build the ``documents`` row, FTS body and edges for one document."""
+    doc_path = doc.filepath.resolve(strict=False)
+    body = read_document_content(doc)
+    try:
+        rel_path = doc_path.relative_to(root).as_posix()
+    except ValueError:
+        rel_path = doc_path.name
+    return _PreparedDocument(
+        row=(
+            doc.id,
+            slug,
+            doc.type.value,
+            doc.status.value,
+            rel_path,
+            PortfolioIndex._extract_title(doc.frontmatter),
+            PortfolioIndex._extract_curation(doc.frontmatter),
+            document_content_hash(doc),
+            len(body.split()) if body else 0,
+            " ".join(term for term in doc.tags if term),
+            PortfolioIndex._path_mtime_iso(doc_path),
+        ),
+        body=body,
+        edges=tuple(sorted(set(doc.depends_on))),
+    )
 
 
 def _sanitize_fts_query(query: str) -> str:
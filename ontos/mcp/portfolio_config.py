@@ -17,6 +17,9 @@ __all__ = [
     "DEFAULT_BUNDLE_LOG_WINDOW_DAYS",
     "DEFAULT_BUNDLE_MAX_LOGS",
     "DEFAULT_BUNDLE_TOKEN_BUDGET",
+    "DEFAULT_PORTFOLIO_WORKERS",
+    "DEFAULT_WORKSPACE_CACHE_MAX_MB",
+    "DEFAULT_WORKSPACE_CACHE_SIZE",
     "PortfolioConfig",
     "PORTFOLIO_CONFIG_PATH",
     "ensure_portfolio_config",
@@ -28,6 +31,11 @@ logger = logging.getLogger(__name__)
 DEFAULT_BUNDLE_TOKEN_BUDGET = 8_000
 DEFAULT_BUNDLE_MAX_LOGS = 20
 DEFAULT_BUNDLE_LOG_WINDOW_DAYS = 30
+# Snapshot workers for the startup rebuild; 0 = one per CPU.
+DEFAULT_PORTFOLIO_WORKERS = 1
+# Warm snapshot caches kept for cross-workspace reads, and their memory budget.
+DEFAULT_WORKSPACE_CACHE_SIZE = 4
+DEFAULT_WORKSPACE_CACHE_MAX_MB = 512
 
 _DEFAULT_REGISTRY_PATH: Optional[str] = None
 _REGISTRY_PATH_EDGE_CHARS = "\u200b\u200c\u200d\ufeff"
@@ -42,6 +50,9 @@ class PortfolioConfig:
     bundle_token_budget: int = DEFAULT_BUNDLE_TOKEN_BUDGET
     bundle_max_logs: int = DEFAULT_BUNDLE_MAX_LOGS
     bundle_log_window_days: int = DEFAULT_BUNDLE_LOG_WINDOW_DAYS
+    workers: int = DEFAULT_PORTFOLIO_WORKERS
+    workspace_cache_size: int = DEFAULT_WORKSPACE_CACHE_SIZE
+    workspace_cache_max_mb: int = DEFAULT_WORKSPACE_CACHE_MAX_MB
 
 
 PORTFOLIO_CONFIG_PATH = Path.home() / ".config" / "ontos" / "portfolio.toml"
@@ -112,6 +123,17 @@ def load_portfolio_config() -> PortfolioConfig:
             bundle.get("log_window_days"),
             DEFAULT_BUNDLE_LOG_WINDOW_DAYS,
         ),
+        workers=_coerce_workers(portfolio.get("workers")),
+        workspace_cache_size=_coerce_positive(
+            portfolio.get("workspace_cache_size"),
+            DEFAULT_WORKSPACE_CACHE_SIZE,
+            "workspace_cache_size",
+        ),
+        workspace_cache_max_mb=_coerce_positive(
+            portfolio.get("workspace_cache_max_mb"),
+            DEFAULT_WORKSPACE_CACHE_MAX_MB,
+            "workspace_cache_max_mb",
+        ),
     )
 
 
@@ -157,3 +179,28 @@ def _coerce_int(value: object, default: int) -> int:
     if isinstance(value, int):
         return value
     return default
+
+
+def _coerce_workers(value: object) -> int:
+    workers = _coerce_int(value, DEFAULT_PORTFOLIO_WORKERS)
+    if workers < 0:
+        logger.warning(
+            "Ignoring negative portfolio.workers value %r; using %d.",
+            value,
+            DEFAULT_PORTFOLIO_WORKERS,
+        )
+        return DEFAULT_PORTFOLIO_WORKERS
+    return workers
+
+
+def _coerce_positive(value: object, default: int, key: str) -> int:
+    number = _coerce_int(value, default)
+    if number < 1:
+        logger.warning(
+            "Ignoring non-positive portfolio.%s value %r; using %d.",
+            key,
+            value,
+            default,
+        )
+        return default
+    return number
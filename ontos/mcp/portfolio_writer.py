@@ -0,0 +1,142 @@
+"""Background writer that applies coalesced portfolio index updates.
+
+MCP write tools change one file or a handful of files and then return.
+They do not re-sync the whole workspace before answering. Instead they hand
+the touched paths to a :class:`PortfolioWriteQueue`, and a single daemon
+thread applies those paths through
+:meth:`~ontos.mcp.portfolio.PortfolioIndex.upsert_documents`. Requests for a
+workspace that arrive while an earlier batch is still pending merge into that
+batch, so a burst of writes costs one index transaction. A request without
+paths asks for a full re-sync and absorbs any pending paths.
+
+The queue is best-effort, like the synchronous rebuild it replaces. A failed
+batch is logged to stderr and retried once as a full re-sync. If an update
+is lost (for example, the process exits before the thread drains),
+``scan_state`` stays stale, and the next staleness check or ``rebuild_all``
+repairs it. :meth:`PortfolioWriteQueue.wait_idle` lets tests and shutdown
+wait for search to converge.
+"""
+
+from __future__ import annotations
+
+from collections import OrderedDict
+from dataclasses import dataclass
+from pathlib import Path
+import sys
+import threading
+import traceback
+from typing import Any, Callable, FrozenSet, Iterable, Optional, Set
+
+__all__ = ["PortfolioWriteQueue"]
+
+# ``apply(slug, workspace_root, paths)``; ``paths`` of None means full re-sync.
+ApplyFn = Callable[[str, Path, Optional[FrozenSet[Path]]], Any]
+
+
+@dataclass
+class _Batch:
+    root: Path
+    paths: Optional[Set[Path]]  # None = full re-sync
+
+
+class PortfolioWriteQueue:
+    """Per-workspace coalescing queue drained by one writer thread."""
+
+    def __init__(self, apply: ApplyFn, *, name: str = "ontos-portfolio-writer") -> None:
+        self._apply = apply
+        self._name = name
+        self._pending: "OrderedDict[str, _Batch]" = OrderedDict()
+        self._condition = threading.Condition()
+        self._active = 0
+        self._thread: Optional[threading.Thread] = None
+        self._closed = False
+        self.submitted = 0
+        self.batches = 0
+        self.failures = 0
+
+    def submit(
+        self,
+        slug: str,
+        workspace_root: Path,
+        paths: Optional[Iterable[Path]] = None,
+    ) -> None:
+        """Queue ``paths`` of ``slug`` (or a full re-sync) and return at once."""
+        root = Path(workspace_root).expanduser().resolve(strict=False)
+        with self._condition:
+            if self._closed:
+                raise RuntimeError("Portfolio write queue is closed")
+            self.submitted += 1
+            batch = self._pending.get(slug)
+            if batch is None:
+                self._pending[slug] = _Batch(root, None if paths is None else set(paths))
+            elif batch.root != root or paths is None or batch.paths is None:
+                # The slug moved or a full re-sync was asked for; either way
+                # the merged batch re-syncs the whole workspace.
+                batch.root = root
+                batch.paths = None
+            else:
+                batch.paths.update(paths)
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._run, name=self._name, daemon=True)
+                self._thread.start()
+            self._condition.notify_all()
+
+    def pending(self) -> int:
+        """Number of workspaces with a queued or running batch."""
+        with self._condition:
+            return len(self._pending) + self._active
+
+    def wait_idle(self, timeout: Optional[float] = None) -> bool:
+        """Block until every submitted batch was applied.
+
+        Returns:
+            False when ``timeout`` elapsed first.
+        """
+        with self._condition:
+            return self._condition.wait_for(
+                lambda: not self._pending and not self._active,
+                timeout,
+            )
+
+    def close(self, timeout: Optional[float] = None) -> None:
+        """Drain queued batches, then stop the writer thread."""
+        with self._condition:
+            self._closed = True
+            thread = self._thread
+            self._condition.notify_all()
+        if thread is not None:
+            thread.join(timeout)
+
+    def _run(self) -> None:
+        while True:
+            with self._condition:
+                while not self._pending and not self._closed:
+                    self._condition.wait()
+                if not self._pending:
+                    self._thread = None
+                    return
+                slug, batch = self._pending.popitem(last=False)
+                self._active += 1
+            try:
+                self._apply_batch(slug, batch)
+            finally:
+                with self._condition:
+                    self._active -= 1
+                    self.batches += 1
+                    self._condition.notify_all()
+
+    def _apply_batch(self, slug: str, batch: _Batch) -> None:
+        paths = None if batch.paths is None else frozenset(batch.paths)
+        try:
+            self._apply(slug, batch.root, paths)
+            return
+        except Exception:
+            self.failures += 1
+            traceback.print_exc(file=sys.stderr)
+        if paths is None:
+            return
+        try:
+            self._apply(slug, batch.root, None)
+        except Exception:
+            self.failures += 1
+            traceback.print_exc(file=sys.stderr)
@@ -22,8 +22,8 @@ A3 durable rollback:
 
 m-13 — FTS5 parity recoverable rebuild:
     The parity check in ``portfolio.py:410-422`` raises after
-    ``conn.commit()`` has already mutated the DB. Because
-    ``rebuild_workspace`` starts with a ``DELETE FROM documents`` it is
+    ``conn.commit()`` has already mutated the DB. ``rebuild_workspace``
+    rewrites a workspace in full when its FTS rows drifted, so it is
     idempotent; a single retry re-converges on success. This module
     retries once on parity-mismatch ``RuntimeError`` before surfacing
     failure. See PR description for rationale.
@@ -35,7 +35,7 @@ from dataclasses import dataclass
 from pathlib import Path
 import sys
 import traceback
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, Iterable, List, Optional
 
 from mcp.types import CallToolResult, TextContent
 
@@ -220,8 +220,8 @@ def _rebuild_with_m13_retry(
 ) -> None:
     """Best-effort rebuild that retries once on FTS5 parity mismatch.
 
-    Because ``rebuild_workspace`` begins with a ``DELETE FROM documents``,
-    it is fully idempotent: a second invocation re-converges. The retry
+    ``rebuild_workspace`` falls back to a full rewrite when the workspace's
+    FTS rows drifted, so it is idempotent: a second invocation re-converges. The retry
     only runs for parity-mismatch ``RuntimeError``s raised by the
     post-commit check at ``portfolio.py:410-422``. Other exceptions are
     re-raised so they don't get silently swallowed.
@@ -249,16 +249,26 @@ def _rebuild_safely(
     portfolio_index: Any,
     slug: str,
     workspace_root: Path,
+    paths: Iterable[Path],
     *,
     ctx: Optional[SessionContext] = None,
 ) -> None:
-    """Same contract as Dev 2's ``_rebuild_safely``: swallow + log."""
+    """Same contract as Dev 2's ``_rebuild_safely``: swallow + log.
+
+    An index with ``schedule_upsert`` re-indexes just ``paths`` in the
+    background; its writer already falls back to a full re-sync when a
+    targeted upsert fails, which covers the m-13 retry.
+    """
     if portfolio_index is None:
         return
     try:
-        _rebuild_with_m13_retry(
-            portfolio_index, slug, workspace_root, ctx=ctx
-        )
+        schedule_upsert = getattr(portfolio_index, "schedule_upsert", None)
+        if schedule_upsert is not None:
+            schedule_upsert(slug, workspace_root, list(paths))
+        else:
+            _rebuild_with_m13_retry(
+                portfolio_index, slug, workspace_root, ctx=ctx
+            )
     except Exception:
         traceback.print_exc(file=sys.stderr)
 
@@ -275,7 +285,9 @@ def _commit_with_a3_rollback_and_rebuild(
         return ctx.commit()
     except Exception:
         transaction.rollback()
-        _rebuild_safely(portfolio_index, slug, workspace_root, ctx=ctx)
+        _rebuild_safely(
+            portfolio_index, slug, workspace_root, transaction.destinations, ctx=ctx
+        )
         raise
 
 
@@ -508,7 +520,7 @@ def _rename_document_impl(
     if planned != committed:
         transaction.rollback()
         _rebuild_safely(
-            portfolio_index, plan.slug, plan.workspace_root, ctx=ctx
+            portfolio_index, plan.slug, plan.workspace_root, planned | committed, ctx=ctx
         )
         raise OntosInternalError(
             "Commit result does not match planned file set. "
@@ -518,9 +530,9 @@ def _rename_document_impl(
 
     transaction.complete()
 
-    # Happy-path post-commit rebuild with m-13 retry.
+    # Happy-path post-commit refresh (m-13 retry on the synchronous path).
     _rebuild_safely(
-        portfolio_index, plan.slug, plan.workspace_root, ctx=ctx
+        portfolio_index, plan.slug, plan.workspace_root, committed, ctx=ctx
     )
 
     updated_files = sorted(
@@ -10,7 +10,9 @@ import re
 import sys
 from typing import Any
 
-from ontos.io.snapshot import create_snapshot
+from ontos.io.config import load_project_config
+from ontos.io.files import count_documents
+from ontos.io.scan_scope import collect_scoped_documents, resolve_scan_scope
 
 __all__ = [
     "ProjectEntry",
@@ -311,18 +313,30 @@ def _first_string(item: dict[str, Any], *keys: str) -> str | None:
 
 
 def _count_documents(workspace_root: Path, has_ontos: bool) -> int:
+    """Count documents without parsing or validating them.
+
+    Uses the same config, scope and skip patterns as ``create_snapshot`` but
+    stops after the directory scan, so discovery never builds a snapshot;
+    ``PortfolioIndex`` builds the one snapshot per workspace it needs.
+    """
     if not has_ontos:
         return 0
 
     try:
-        snapshot = create_snapshot(
-            root=workspace_root,
-            include_content=False,
-            filters=None,
-            git_commit_provider=None,
-            scope=None,
+        config = load_project_config(
+            config_path=workspace_root / ".ontos.toml",
+            repo_root=workspace_root,
+        )
+        skip_patterns = (
+            config.scanning.skip_patterns if config.scanning else ["_template.md", "archive/*"]
+        )
+        doc_paths = collect_scoped_documents(
+            workspace_root,
+            config,
+            resolve_scan_scope(None, config.scanning.default_scope),
+            base_skip_patterns=skip_patterns,
         )
-        return len(snapshot.documents)
+        return count_documents(doc_paths)
     except Exception:
         docs_dir = workspace_root / "docs"
         if not docs_dir.is_dir():
@@ -219,6 +219,16 @@ class QueryResponse(StrictModel):
     content_hash: Optional[str]
 
 
+class WorkspaceCacheStats(StrictModel):
+    capacity: int
+    max_bytes: int
+    resident: List[str]
+    estimated_bytes: int
+    hits: int
+    misses: int
+    evictions: int
+
+
 class HealthResponse(StrictModel):
     server_uptime: int
     workspace: str
@@ -228,6 +238,7 @@ class HealthResponse(StrictModel):
     ontos_version: str
     snapshot_revision: int
     freshness_mode: str
+    workspace_cache: Optional[WorkspaceCacheStats] = None
 
 
 class RefreshResponse(StrictModel):
@@ -396,6 +407,8 @@ def validate_success_payload(tool_name: str, payload: Dict[str, Any]) -> Dict[st
         normalized.pop("content", None)
     if tool_name == "activate" and "reason" not in payload:
         normalized.pop("reason", None)
+    if tool_name == "health" and "workspace_cache" not in payload:
+        normalized.pop("workspace_cache", None)
     return normalized
 
 
@@ -19,6 +19,7 @@ from mcp.types import CallToolResult, TextContent, Tool as MCPTool, ToolAnnotati
 
 from ontos.core.errors import OntosInternalError, OntosUserError
 from ontos.io.config import load_project_config
+from ontos.io.parse_cache import MemoryParseCache
 from ontos.io.snapshot import create_snapshot
 from ontos.mcp._types import PortfolioIndexLike
 from ontos.mcp.cache import SnapshotCache
@@ -34,6 +35,7 @@ from ontos.mcp.schemas import (
     validate_success_payload,
 )
 from ontos.mcp import tools as tool_impl
+from ontos.mcp.workspace_cache import WorkspaceCachePool
 
 _PRE_ACTIVATE_WARNING = (
     "Ontos activation not performed this MCP session; call activate first."
@@ -84,6 +86,15 @@ CORE_TOOL_NAMES = {
     "refresh",
 }
 PORTFOLIO_MODE_TOOL_NAMES = {"project_registry", "search"}
+# Pure view readers a portfolio server answers for any indexed workspace from
+# its WorkspaceCachePool; the rest of CORE_TOOL_NAMES act on the primary one.
+CROSS_WORKSPACE_READ_TOOL_NAMES = {
+    "workspace_overview",
+    "context_map",
+    "get_document",
+    "list_documents",
+    "query",
+}
 
 
 class OntosFastMCP(FastMCP):
@@ -153,6 +164,10 @@ def serve(
         server.run(transport="stdio")
         return 0
     finally:
+        pool = getattr(cache, "workspace_pool", None)
+        if pool is not None:
+            pool.close()
+        cache.close()
         if portfolio_index is not None:
             close = getattr(portfolio_index, "close", None)
             if callable(close):
@@ -165,14 +180,18 @@ def create_server(
     portfolio_index: Optional[PortfolioIndexLike] = None,
     read_only: bool = False,
     include_bundle_tool: bool = False,
+    workspace_pool: Optional[WorkspaceCachePool] = None,
 ) -> FastMCP:
     """Create and register the Ontos MCP server."""
     workspace_name = cache.workspace_root.name
     portfolio_mode = portfolio_index is not None
+    if portfolio_mode and workspace_pool is None:
+        workspace_pool = _build_workspace_pool(cache)
 
     # Tool implementations infer scope behavior from these cache attributes.
     setattr(cache, "portfolio_mode", portfolio_mode)
     setattr(cache, "portfolio_index", portfolio_index)
+    setattr(cache, "workspace_pool", workspace_pool)
     setattr(cache, "primary_workspace_slug", _workspace_slug(cache.workspace_root))
     setattr(cache, "read_only", read_only)
     setattr(cache, "activation_performed", False)
@@ -320,6 +339,7 @@ def _register_core_tools(
     def handle_list_documents(
         type: str | None = None,
         status: str | None = None,
+        concept: str | None = None,
         offset: int = 0,
         limit: int = 100,
         workspace_id: str | None = None,
@@ -330,6 +350,7 @@ def _register_core_tools(
             tool_impl.list_documents,
             type=type,
             status=status,
+            concept=concept,
             offset=offset,
             limit=limit,
             workspace_id=workspace_id,
@@ -367,6 +388,7 @@ def _register_core_tools(
             "health",
             cache,
             tool_impl.health,
+            use_live_cache=True,
             workspace_id=workspace_id,
         )
 
@@ -852,12 +874,18 @@ def _invoke_boundary(
     try:
         if spec.mode is ToolMode.WRITE:
             assert cache is not None
-            return tool_fn(
-                cache,
-                portfolio_index=portfolio_index,
-                read_only=read_only,
-                **kwargs,
-            )
+            # A filesystem watcher may not have delivered recent events yet;
+            # writes must see (and leave behind) a fully rechecked workspace.
+            cache.mark_dirty()
+            try:
+                return tool_fn(
+                    cache,
+                    portfolio_index=portfolio_index,
+                    read_only=read_only,
+                    **kwargs,
+                )
+            finally:
+                cache.mark_dirty()
 
         if spec.mode is ToolMode.PORTFOLIO:
             if portfolio_index is None:
@@ -874,18 +902,31 @@ def _invoke_boundary(
         else:
             assert cache is not None
             workspace_id = kwargs.get("workspace_id")
+            pool = getattr(cache, "workspace_pool", None)
             if _is_cross_workspace_read(spec.name, cache, workspace_id):
-                return _tool_error_result(
-                    "Cross-workspace reads are not supported for this tool. "
-                    "Start a separate `ontos serve` in the target workspace.",
-                    code="E_CROSS_WORKSPACE_NOT_SUPPORTED",
+                if pool is None or spec.name not in CROSS_WORKSPACE_READ_TOOL_NAMES:
+                    return _tool_error_result(
+                        "Cross-workspace reads are not supported for this tool. "
+                        "Start a separate `ontos serve` in the target workspace.",
+                        code="E_CROSS_WORKSPACE_NOT_SUPPORTED",
+                    )
+                root = tool_impl.resolve_portfolio_workspace(cache.portfolio_index, workspace_id)
+                target = pool.get(str(workspace_id), root)
+                tool_input = (
+                    target.get_fresh_view() if spec.ensure_fresh else target.current_view()
                 )
-            tool_input: Any = cache.current_view()
-            if spec.ensure_fresh:
-                tool_input = cache.get_fresh_view()
-            if spec.use_live_cache:
-                tool_input = cache
-            payload = tool_fn(tool_input, **kwargs)
+                pool.touch(str(workspace_id))
+                # The view belongs to the target workspace; its tool needs no
+                # further scope check.
+                kwargs["workspace_id"] = None
+                payload = tool_fn(tool_input, **kwargs)
+            else:
+                tool_input = cache.current_view()
+                if spec.ensure_fresh:
+                    tool_input = cache.get_fresh_view()
+                if spec.use_live_cache:
+                    tool_input = cache
+                payload = tool_fn(tool_input, **kwargs)
 
         validated = validate_success_payload(spec.name, payload)
         if (
@@ -1001,7 +1042,7 @@ def _render_instructions(
         "Use `workspace_overview` for project orientation. "
         "Use `context_map` for the full markdown narrative. "
         "Use `get_document` to read one document. "
-        "Use `list_documents` to browse by type/status. "
+        "Use `list_documents` to browse by type/status/concept. "
         "Use `query` for dependency lookups. "
         "Use `export_graph` for structured graph export. "
         "Use `health` to check server status and index freshness."
@@ -1076,17 +1117,22 @@ def _git_commit_provider(workspace_root: Path) -> Callable[[], Optional[str]]:
     return provider
 
 
-def _build_cache(workspace_root: Path) -> SnapshotCache:
+def _build_cache(workspace_root: Path, *, follow_freshness_mode: bool = True) -> SnapshotCache:
+    """Build a warm cache; pooled caches pass ``follow_freshness_mode=False``
+    to use fingerprint checks instead of starting a watcher per workspace."""
     config = load_project_config(
         config_path=workspace_root / ".ontos.toml",
         repo_root=workspace_root,
     )
+    parse_cache = MemoryParseCache()
     snapshot = create_snapshot(
         root=workspace_root,
         include_content=True,
         filters=None,
         git_commit_provider=_git_commit_provider(workspace_root),
         scope=None,
+        parse_cache=parse_cache,
+        lazy_content=True,
     )
     return SnapshotCache(
         workspace_root,
@@ -1094,6 +1140,29 @@ def _build_cache(workspace_root: Path) -> SnapshotCache:
         snapshot,
         git_commit_provider=_git_commit_provider(workspace_root),
         started_at=datetime.now(timezone.utc),
+        parse_cache=parse_cache,
+        watch=config.mcp.freshness_mode if follow_freshness_mode else None,
+        poll_interval=config.mcp.poll_interval_ms / 1000,
+        lazy_content=True,
+    )
+
+
+def _build_pooled_cache(workspace_root: Path) -> SnapshotCache:
+    return _build_cache(workspace_root, follow_freshness_mode=False)
+
+
+def _build_workspace_pool(cache: SnapshotCache) -> WorkspaceCachePool:
+    from ontos.mcp.portfolio_config import PortfolioConfig, load_portfolio_config
+
+    try:
+        config = load_portfolio_config()
+    except (FileNotFoundError, ValueError):
+        config = PortfolioConfig()
+    return WorkspaceCachePool(
+        _build_pooled_cache,
+        primary=cache,
+        max_workspaces=config.workspace_cache_size,
+        max_bytes=config.workspace_cache_max_mb * 1024 * 1024,
     )
 
 
@@ -1138,14 +1207,30 @@ def _build_portfolio_index(*, read_only: bool = False) -> PortfolioIndexLike:
     index = PortfolioIndex(DEFAULT_PORTFOLIO_DB_PATH, read_only=read_only)
     index.open()
     if not read_only:
-        index.rebuild_all(
+        summary = index.rebuild_all(
             scan_roots=scan_roots,
             exclude=list(config.exclude),
             registry_path=registry_path,
+            workers=config.workers,
+            progress=_report_portfolio_progress,
+        )
+        print(
+            "[ontos-mcp] portfolio index: "
+            f"{len(summary['rebuilt'])} rebuilt, {len(summary['skipped'])} unchanged, "
+            f"{len(summary['removed'])} removed",
+            file=sys.stderr,
         )
     return index
 
 
+def _report_portfolio_progress(progress: Any) -> None:
+    if progress.outcome == "rebuilt":
+        print(
+            f"[ontos-mcp] indexed {progress.slug} ({progress.completed}/{progress.total})",
+            file=sys.stderr,
+        )
+
+
 def _workspace_slug(workspace_root: Path) -> str:
     return slugify(workspace_root.name)
 
@@ -7,23 +7,23 @@ from datetime import datetime, timezone
 import json
 from pathlib import Path
 import sqlite3
-from typing import Any, Dict, Optional
+from typing import Any, Callable, Dict, Optional, Sequence, Tuple
 
 import ontos
 from ontos.commands.export_data import _snapshot_to_json
 from ontos.commands.map import CompactMode, GenerateMapOptions, generate_context_map
 from ontos.core.config import required_version_incompatibility
-from ontos.core.content_hash import compute_content_hash
 from ontos.core.errors import OntosUserError
 from ontos.core.ontology import TYPE_DEFINITIONS
 from ontos.core.snapshot import DocumentSnapshot
-from ontos.core.types import DocumentData, ValidationError, ValidationResult
+from ontos.core.types import DATACLASS_SLOTS, DocumentData, ValidationError, ValidationResult
 from ontos.core.warning_groups import (
     group_warning_records,
     groups_to_payload,
     select_warning_records,
 )
 from ontos.io.concepts import load_known_concepts
+from ontos.io.files import DocumentChangedError, document_content_hash, read_document_content
 from ontos.io.scan_scope import resolve_scan_scope
 from ontos.io.snapshot import create_snapshot
 from ontos.mcp._types import PortfolioIndexLike
@@ -36,7 +36,7 @@ TYPE_RANKS = {
 TYPE_RANKS["unknown"] = max(TYPE_RANKS.values(), default=0) + 1
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, **DATACLASS_SLOTS)
 class CanonicalDocumentRow:
     id: str
     type: str
@@ -51,6 +51,14 @@ class CanonicalSnapshotView:
     by_type: dict[str, int]
     list_rows: list[CanonicalDocumentRow]
     path_lookup: dict[str, str]
+    # Secondary indexes, built once per snapshot revision. Each row list
+    # keeps ``list_rows`` order, so a filtered page is a slice.
+    rows_by_type: dict[str, list[CanonicalDocumentRow]]
+    rows_by_status: dict[str, list[CanonicalDocumentRow]]
+    rows_by_type_status: dict[tuple[str, str], list[CanonicalDocumentRow]]
+    rows_by_concept: dict[str, list[CanonicalDocumentRow]]
+    # Document IDs by descending in-degree, then ID.
+    degree_ranked_ids: list[str]
 def build_canonical_snapshot_view(
     snapshot: DocumentSnapshot,
     workspace_root: Path,
@@ -63,6 +71,10 @@ def build_canonical_snapshot_view(
     by_type: dict[str, int] = {name: 0 for name in TYPE_DEFINITIONS}
     path_lookup: dict[str, str] = {}
     list_rows: list[CanonicalDocumentRow] = []
+    rows_by_type: dict[str, list[CanonicalDocumentRow]] = {}
+    rows_by_status: dict[str, list[CanonicalDocumentRow]] = {}
+    rows_by_type_status: dict[tuple[str, str], list[CanonicalDocumentRow]] = {}
+    rows_by_concept: dict[str, list[CanonicalDocumentRow]] = {}
 
     sorted_docs = sorted(
         snapshot.documents.values(),
@@ -75,16 +87,21 @@ def build_canonical_snapshot_view(
         by_type[doc_type] = by_type.get(doc_type, 0) + 1
 
         rel_path = _workspace_relative_path(doc.filepath, workspace_root)
-        list_rows.append(
-            CanonicalDocumentRow(
-                id=doc.id,
-                type=doc_type,
-                status=doc_status,
-                path=rel_path,
-            )
+        row = CanonicalDocumentRow(
+            id=doc.id,
+            type=doc_type,
+            status=doc_status,
+            path=rel_path,
         )
+        list_rows.append(row)
         path_lookup[rel_path] = doc.id
+        rows_by_type.setdefault(doc_type, []).append(row)
+        rows_by_status.setdefault(doc_status, []).append(row)
+        rows_by_type_status.setdefault((doc_type, doc_status), []).append(row)
+        for concept in dict.fromkeys(doc.tags):
+            rows_by_concept.setdefault(concept, []).append(row)
 
+    reverse_edges = snapshot.graph.reverse_edges
     total_count = len(list_rows)
     if sum(by_type.values()) != total_count:
         raise RuntimeError("Canonical by_type counts do not sum to total_count")
@@ -95,16 +112,28 @@ def build_canonical_snapshot_view(
         by_type=by_type,
         list_rows=list_rows,
         path_lookup=path_lookup,
+        rows_by_type=rows_by_type,
+        rows_by_status=rows_by_status,
+        rows_by_type_status=rows_by_type_status,
+        rows_by_concept=rows_by_concept,
+        degree_ranked_ids=sorted(
+            snapshot.documents,
+            key=lambda doc_id: (-len(reverse_edges.get(doc_id, ())), doc_id),
+        ),
     )
 
 
 def workspace_overview(cache: Any, *, workspace_id: Optional[str] = None) -> dict[str, Any]:
     """Return structured orientation data for the current workspace."""
     _enforce_workspace_scope(cache, workspace_id)
-    key_documents = sorted(
-        cache.snapshot.documents.values(),
-        key=lambda doc: (-len(cache.snapshot.graph.reverse_edges.get(doc.id, [])), doc.id),
-    )[:3]
+    return _memoized(cache, ("workspace_overview",), lambda: _workspace_overview_payload(cache))
+
+
+def _workspace_overview_payload(cache: Any) -> dict[str, Any]:
+    key_documents = [
+        cache.snapshot.documents[doc_id]
+        for doc_id in cache.canonical_view.degree_ranked_ids[:3]
+    ]
 
     warnings = _normalize_warnings(
         cache.snapshot.validation_result,
@@ -187,10 +216,7 @@ def activate(
         view.snapshot.validation_result,
         view.snapshot.warnings,
     )
-    loaded_ids = [doc.id for doc in sorted(
-        view.snapshot.documents.values(),
-        key=lambda doc: (-len(view.snapshot.graph.reverse_edges.get(doc.id, [])), doc.id),
-    )[:5]]
+    loaded_ids = view.canonical_view.degree_ranked_ids[:5]
     # Status derives from the full record list; the budget below only
     # shapes what is inlined in the response. (#134) Info records are
     # excluded from the status formula by construction.
@@ -274,7 +300,11 @@ def context_map(
             f"Invalid compact mode '{compact}'. Expected one of basic, rich, tiered, or full.",
             code="E_INVALID_COMPACT",
         )
+    mode = compact_modes[compact_key]
+    return _memoized(cache, ("context_map", compact_key), lambda: _context_map_payload(cache, mode))
 
+
+def _context_map_payload(cache: Any, compact: CompactMode) -> dict[str, Any]:
     config_dict = {
         "project_root": str(cache.workspace_root),
         "project_name": cache.workspace_root.name,
@@ -292,7 +322,7 @@ def context_map(
         cache.snapshot.documents,
         config_dict,
         GenerateMapOptions(
-            compact=compact_modes[compact_key],
+            compact=compact,
             max_dependency_depth=cache.config.validation.max_dependency_depth,
         ),
         known_concepts=load_known_concepts(cache.workspace_root),
@@ -329,7 +359,8 @@ def get_document(
     if doc is None:
         raise OntosUserError("Document not found.", code="E_DOCUMENT_NOT_FOUND")
 
-    content_hash = compute_content_hash(doc.content) if doc.content else None
+    content = _document_content(doc)
+    content_hash = document_content_hash(doc)
     payload = {
         "id": doc.id,
         "type": doc.type.value,
@@ -337,20 +368,36 @@ def get_document(
         "frontmatter": doc.frontmatter,
         "metadata": {
             "content_hash": content_hash,
-            "word_count": len(doc.content.split()),
+            "word_count": len(content.split()),
             "depended_by": sorted(cache.snapshot.graph.reverse_edges.get(doc.id, [])),
         },
     }
     if include_content:
-        payload["content"] = doc.content
+        payload["content"] = content
     return payload
 
 
+def _document_content(doc: DocumentData) -> str:
+    """Read a (possibly lazily held) body, mapping a concurrent edit to a user error."""
+    try:
+        return read_document_content(doc)
+    except DocumentChangedError as exc:
+        raise _document_changed(exc) from exc
+
+
+def _document_changed(exc: DocumentChangedError) -> OntosUserError:
+    return OntosUserError(
+        f"{exc.path} changed after the snapshot was built; retry the request.",
+        code="E_DOCUMENT_CHANGED",
+    )
+
+
 def list_documents(
     cache: Any,
     *,
     type: Optional[str] = None,
     status: Optional[str] = None,
+    concept: Optional[str] = None,
     offset: int = 0,
     limit: int = 100,
     workspace_id: Optional[str] = None,
@@ -362,20 +409,42 @@ def list_documents(
     if limit <= 0:
         raise OntosUserError("limit must be > 0.", code="E_INVALID_LIMIT")
 
-    rows = [
-        row for row in cache.canonical_view.list_rows
-        if (type is None or row.type == type)
-        and (status is None or row.status == status)
-    ]
+    rows = _filtered_rows(cache.canonical_view, type=type, status=status, concept=concept)
     total_count = len(rows)
     page = rows[offset:offset + limit]
     return {
         "total_count": total_count,
         "offset": offset,
-        "documents": [row.__dict__ for row in page],
+        "documents": [
+            {"id": row.id, "type": row.type, "status": row.status, "path": row.path}
+            for row in page
+        ],
     }
 
 
+def _filtered_rows(
+    view: CanonicalSnapshotView,
+    *,
+    type: Optional[str],
+    status: Optional[str],
+    concept: Optional[str],
+) -> Sequence[CanonicalDocumentRow]:
+    """Pick the narrowest precomputed index for a ``list_documents`` filter."""
+    if concept is not None:
+        return [
+            row for row in view.rows_by_concept.get(concept, ())
+            if (type is None or row.type == type)
+            and (status is None or row.status == status)
+        ]
+    if type is not None and status is not None:
+        return view.rows_by_type_status.get((type, status), ())
+    if type is not None:
+        return view.rows_by_type.get(type, ())
+    if status is not None:
+        return view.rows_by_status.get(status, ())
+    return view.list_rows
+
+
 def export_graph(
     cache: Any,
     *,
@@ -385,9 +454,6 @@ def export_graph(
 ) -> dict[str, Any]:
     """Return or persist a canonical export payload."""
     _enforce_workspace_scope(cache, workspace_id)
-    raw_payload = _snapshot_to_json(cache.snapshot, filters=None, deterministic=False)
-    ordered_payload = _ordered_export_payload(raw_payload, cache.snapshot)
-
     if export_to_file:
         if getattr(cache, "read_only", False):
             raise OntosUserError(
@@ -396,6 +462,7 @@ def export_graph(
                 code="E_READ_ONLY",
             )
         resolved_path, rel_path = _resolve_workspace_path(cache.workspace_root, export_to_file)
+        ordered_payload = _export_payload(cache)
         resolved_path.parent.mkdir(parents=True, exist_ok=True)
         resolved_path.write_text(json.dumps(ordered_payload, indent=2), encoding="utf-8")
         return {
@@ -405,27 +472,64 @@ def export_graph(
         }
 
     if summary_only:
-        node_ids = ordered_payload["graph"]["nodes"]
-        nodes = [
-            {
-                "id": doc_id,
-                "type": cache.snapshot.documents[doc_id].type.value,
-                "status": cache.snapshot.documents[doc_id].status.value,
-            }
-            for doc_id in node_ids
-        ]
-        return {
-            "summary": ordered_payload["summary"],
-            "graph": {
-                "nodes": nodes,
-                "edges": ordered_payload["graph"]["edges"],
-            },
-        }
+        # Only the summary is memoized: the full payload carries every
+        # document body, which lazy snapshots deliberately keep on disk.
+        return _memoized(cache, ("export_graph", "summary"), lambda: _export_summary_payload(cache))
 
+    ordered_payload = _export_payload(cache)
     ordered_payload["validation"] = _validation_payload(cache.snapshot.validation_result)
     return ordered_payload
 
 
+def _export_payload(cache: Any) -> dict[str, Any]:
+    try:
+        raw_payload = _snapshot_to_json(cache.snapshot, filters=None, deterministic=False)
+    except DocumentChangedError as exc:
+        raise _document_changed(exc) from exc
+    return _ordered_export_payload(raw_payload, cache.snapshot)
+
+
+def _export_summary_payload(cache: Any) -> dict[str, Any]:
+    """Build the summary-only export from canonical rows and graph edges.
+
+    Matches the summary and graph sections of the full export without
+    serializing, reading or hashing any document body.
+    """
+    rows = sorted(cache.canonical_view.list_rows, key=lambda row: row.id)
+    by_type: dict[str, int] = {}
+    by_status: dict[str, int] = {}
+    for row in rows:
+        by_type[row.type] = by_type.get(row.type, 0) + 1
+        by_status[row.status] = by_status.get(row.status, 0) + 1
+
+    included_ids = {row.id for row in rows}
+    graph_edges = cache.snapshot.graph.edges
+    edges = [
+        {"from": row.id, "to": dep_id, "type": "depends_on"}
+        for row in rows
+        for dep_id in sorted(graph_edges.get(row.id, ()))
+        if dep_id in included_ids
+    ]
+
+    summary: dict[str, Any] = {
+        "total_documents": len(rows),
+        "by_type": dict(sorted(by_type.items())),
+        "by_status": dict(sorted(by_status.items())),
+    }
+    if cache.snapshot.warnings:
+        summary["warnings"] = list(cache.snapshot.warnings)
+    return {
+        "summary": summary,
+        "graph": {
+            "nodes": [
+                {"id": row.id, "type": row.type, "status": row.status}
+                for row in rows
+            ],
+            "edges": edges,
+        },
+    }
+
+
 def query(cache: Any, *, entity_id: str, workspace_id: Optional[str] = None) -> dict[str, Any]:
     """Return structured graph details for one document."""
     _enforce_workspace_scope(cache, workspace_id)
@@ -440,7 +544,7 @@ def query(cache: Any, *, entity_id: str, workspace_id: Optional[str] = None) ->
         "depends_on": list(doc.depends_on),
         "depended_by": sorted(cache.snapshot.graph.reverse_edges.get(doc.id, [])),
         "depth": cache.depths.get(doc.id, 0),
-        "content_hash": compute_content_hash(doc.content) if doc.content else None,
+        "content_hash": document_content_hash(doc),
     }
 
 
@@ -448,7 +552,7 @@ def health(cache: Any, *, workspace_id: Optional[str] = None) -> dict[str, Any]:
     """Return server/cache health state."""
     _enforce_workspace_scope(cache, workspace_id)
     uptime = max(0, int((datetime.now(timezone.utc) - cache.started_at).total_seconds()))
-    return {
+    payload = {
         "server_uptime": uptime,
         "workspace": cache.workspace_root.name,
         "workspace_path": str(cache.workspace_root),
@@ -458,6 +562,10 @@ def health(cache: Any, *, workspace_id: Optional[str] = None) -> dict[str, Any]:
         "snapshot_revision": cache.snapshot_revision,
         "freshness_mode": cache.freshness_mode,
     }
+    pool = getattr(cache, "workspace_pool", None)
+    if pool is not None:
+        payload["workspace_cache"] = pool.stats()
+    return payload
 
 
 def refresh(cache: Any, *, workspace_id: Optional[str] = None) -> dict[str, Any]:
@@ -596,38 +704,54 @@ def get_context_bundle(
             code="E_MISSING_WORKSPACE",
         )
     else:
-        _validate_workspace_id(portfolio_index, workspace_id)
-        projects = portfolio_index.get_projects()
-        project = next((item for item in projects if item["slug"] == workspace_id), None)
-        if project is None:
-            raise OntosUserError(
-                f"Unknown workspace '{workspace_id}'.",
-                code="E_UNKNOWN_WORKSPACE",
-            )
-        if project["status"] == "undocumented":
-            raise OntosUserError(
-                f"Workspace '{workspace_id}' is undocumented. "
-                "Run `ontos init` in that project directory first.",
-                code="E_UNDOCUMENTED_WORKSPACE",
-            )
         slug = workspace_id
-        workspace_root = Path(project["path"]).resolve()
-        snapshot = create_snapshot(
-            root=workspace_root,
-            include_content=True,
-            filters=None,
-            git_commit_provider=None,
-            scope=None,
+        workspace_root = resolve_portfolio_workspace(portfolio_index, workspace_id)
+        pool = getattr(cache, "workspace_pool", None)
+        if pool is not None:
+            snapshot = pool.get(slug, workspace_root).get_fresh_snapshot()
+            pool.touch(slug)
+        else:
+            snapshot = create_snapshot(
+                root=workspace_root,
+                include_content=True,
+                filters=None,
+                git_commit_provider=None,
+                scope=None,
+            )
+
+    try:
+        return build_context_bundle(
+            snapshot,
+            workspace_root,
+            slug,
+            token_budget=effective_budget,
+            max_logs=portfolio_config.bundle_max_logs,
+            log_window_days=portfolio_config.bundle_log_window_days,
         )
+    except DocumentChangedError as exc:
+        raise _document_changed(exc) from exc
 
-    return build_context_bundle(
-        snapshot,
-        workspace_root,
-        slug,
-        token_budget=effective_budget,
-        max_logs=portfolio_config.bundle_max_logs,
-        log_window_days=portfolio_config.bundle_log_window_days,
-    )
+
+def resolve_portfolio_workspace(
+    portfolio_index: PortfolioIndexLike,
+    workspace_id: str,
+) -> Path:
+    """Return the root of an indexed, documented portfolio workspace."""
+    _validate_workspace_id(portfolio_index, workspace_id)
+    projects = portfolio_index.get_projects()
+    project = next((item for item in projects if item["slug"] == workspace_id), None)
+    if project is None:
+        raise OntosUserError(
+            f"Unknown workspace '{workspace_id}'.",
+            code="E_UNKNOWN_WORKSPACE",
+        )
+    if project["status"] == "undocumented":
+        raise OntosUserError(
+            f"Workspace '{workspace_id}' is undocumented. "
+            "Run `ontos init` in that project directory first.",
+            code="E_UNDOCUMENTED_WORKSPACE",
+        )
+    return Path(project["path"]).resolve()
 
 
 def _humanize_id(doc_id: str) -> str:
@@ -663,6 +787,18 @@ def _validate_workspace_id(
     _shared(portfolio_index, workspace_id)
 
 
+def _memoized(cache: Any, key: Tuple[Any, ...], compute: Callable[[], Any]) -> Any:
+    """Serve ``key`` from the snapshot revision's derived-payload memo.
+
+    Views and caches built by :mod:`ontos.mcp.cache` carry one; other
+    callers (ad-hoc snapshots in tests and scripts) just compute.
+    """
+    derived = getattr(cache, "derived", None)
+    if derived is None:
+        return compute()
+    return derived.get(key, compute)
+
+
 def _enforce_workspace_scope(cache: Any, workspace_id: Optional[str]) -> None:
     if workspace_id is None:
         return
@@ -0,0 +1,194 @@
+"""Background filesystem watchers for the MCP snapshot cache.
+
+The default freshness check re-scans the workspace and stats every tracked
+input on each tool call. The watchers here move that work off the request
+path: they record what changed in a :class:`ChangeTracker`, and the cache only
+rechecks the recorded paths (or falls back to its full check when the change
+cannot be attributed to individual files).
+
+``EventWatcher`` uses ``watchdog`` (inotify / FSEvents / ReadDirectoryChangesW)
+when it is installed and the platform accepts the watch. ``PollingWatcher`` is
+the fallback for network filesystems, containers without inotify, or missing
+``watchdog``: it runs the cache's own fingerprint check on a timer in a daemon
+thread.
+"""
+
+from __future__ import annotations
+
+import logging
+import threading
+from pathlib import Path
+from typing import Callable, Set, Tuple
+
+try:
+    from watchdog.events import FileSystemEventHandler
+    from watchdog.observers import Observer
+except ImportError:  # pragma: no cover - depends on environment packaging
+    FileSystemEventHandler = object  # type: ignore[assignment,misc]
+    Observer = None  # type: ignore[assignment]
+
+
+logger = logging.getLogger(__name__)
+
+FRESHNESS_FINGERPRINT = "file-mtime-fingerprint"
+FRESHNESS_EVENTS = "filesystem-events"
+FRESHNESS_POLL = "filesystem-poll"
+
+# Config value ([mcp] freshness_mode) -> requested watcher.
+CONFIG_FRESHNESS_MODES = ("fingerprint", "watch", "poll")
+
+# Directories whose churn never affects a snapshot.
+_IGNORED_PARTS = frozenset({".git", "__pycache__", "node_modules"})
+
+
+class ChangeTracker:
+    """Thread-safe set of paths changed since the last drain.
+
+    ``full`` means a change could not be attributed to specific files
+    (directory move, event overflow, poll hit, our own writes) and the next
+    check must consult the whole workspace.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._paths: Set[str] = set()
+        # Anything may have changed between the initial snapshot and the
+        # watcher coming up, so the first check is a full one.
+        self._full = True
+
+    @property
+    def pending(self) -> bool:
+        return self._full or bool(self._paths)
+
+    def add(self, path: str) -> None:
+        with self._lock:
+            self._paths.add(path)
+
+    def mark_all(self) -> None:
+        with self._lock:
+            self._full = True
+
+    def drain(self) -> Tuple[bool, Set[str]]:
+        """Return and reset ``(full, paths)``."""
+        with self._lock:
+            full, paths = self._full, self._paths
+            self._full = False
+            self._paths = set()
+        return full, paths
+
+
+class _EventHandler(FileSystemEventHandler):  # type: ignore[misc]
+    def __init__(self, tracker: ChangeTracker) -> None:
+        super().__init__()
+        self._tracker = tracker
+
+    def on_any_event(self, event) -> None:  # pragma: no cover - timing dependent
+        if getattr(event, "event_type", None) in {"opened", "closed_no_write"}:
+            return
+        paths = [event.src_path, getattr(event, "dest_path", "") or ""]
+        paths = [str(path) for path in paths if path]
+        if all(_is_ignored(path) for path in paths):
+            return
+        if event.is_directory and event.event_type != "modified":
+            # Created/moved/deleted directories may carry documents with them
+            # without per-file events.
+            self._tracker.mark_all()
+            return
+        if event.is_directory:
+            return
+        for path in paths:
+            self._tracker.add(path)
+
+
+class EventWatcher:
+    """Native filesystem notifications via ``watchdog``."""
+
+    mode = FRESHNESS_EVENTS
+
+    def __init__(self, root: Path, tracker: ChangeTracker) -> None:
+        if Observer is None:
+            raise RuntimeError("watchdog is not installed")
+        self._observer = Observer()
+        self._observer.daemon = True
+        self._observer.schedule(_EventHandler(tracker), str(root), recursive=True)
+
+    def start(self) -> None:
+        self._observer.start()
+
+    def stop(self) -> None:
+        self._observer.stop()
+        self._observer.join(timeout=5)
+
+
+class PollingWatcher:
+    """Run ``probe`` every ``interval`` seconds; a hit marks everything dirty."""
+
+    mode = FRESHNESS_POLL
+
+    def __init__(
+        self,
+        tracker: ChangeTracker,
+        probe: Callable[[], bool],
+        interval: float,
+    ) -> None:
+        self._tracker = tracker
+        self._probe = probe
+        self._interval = interval
+        self._stop = threading.Event()
+        self._thread = threading.Thread(
+            target=self._run, name="ontos-freshness-poll", daemon=True
+        )
+
+    def start(self) -> None:
+        self._thread.start()
+
+    def stop(self) -> None:
+        self._stop.set()
+        if self._thread.is_alive():
+            self._thread.join(timeout=5)
+
+    def _run(self) -> None:
+        while not self._stop.wait(self._interval):
+            if self._tracker.pending:
+                continue
+            try:
+                if self._probe():
+                    self._tracker.mark_all()
+            except Exception:
+                # A failed probe must not kill the thread; let the request
+                # path do the full check instead.
+                logger.exception("Freshness poll failed")
+                self._tracker.mark_all()
+
+
+def start_watcher(
+    root: Path,
+    requested: str,
+    tracker: ChangeTracker,
+    probe: Callable[[], bool],
+    interval: float,
+) -> "EventWatcher | PollingWatcher":
+    """Start the watcher for a ``watch``/``poll`` config value.
+
+    ``watch`` prefers native events and falls back to polling when
+    ``watchdog`` is missing or the platform refuses the watch (for example an
+    exhausted inotify watch limit).
+    """
+    if requested == "watch":
+        try:
+            watcher = EventWatcher(root, tracker)
+            watcher.start()
+            return watcher
+        except Exception as exc:
+            logger.warning(
+                "Filesystem events unavailable (%s); falling back to polling.",
+                exc,
+            )
+    watcher = PollingWatcher(tracker, probe, interval)
+    watcher.start()
+    return watcher
+
+
+def _is_ignored(path: str) -> bool:
+    return bool(_IGNORED_PARTS.intersection(Path(path).parts))
+
@@ -0,0 +1,156 @@
+"""Bounded LRU of per-workspace snapshot caches for portfolio read tools.
+
+A portfolio server keeps one warm :class:`~ontos.mcp.cache.SnapshotCache` for
+the workspace it was started in. Reads that name another workspace
+(``get_context_bundle``, and the read tools that accept ``workspace_id``) are
+served from a :class:`WorkspaceCachePool`: the first request builds that
+workspace's cache, later requests reuse it behind the cache's own fingerprint
+freshness check, so a hot workspace costs a stat pass instead of a full
+snapshot.
+
+The pool is bounded both by workspace count and by an estimated memory
+ceiling. The estimate counts document bodies plus a fixed per-document
+allowance for the parsed records, graph and views; it is a budget, not a
+measurement. The least recently used workspace is evicted first, but the
+workspace being served is always kept, even if it alone exceeds the ceiling.
+"""
+
+from __future__ import annotations
+
+from collections import OrderedDict
+from dataclasses import dataclass
+from pathlib import Path
+import threading
+from typing import Any, Callable, Dict, Optional
+
+from ontos.mcp.cache import SnapshotCache
+from ontos.mcp.portfolio_config import (
+    DEFAULT_WORKSPACE_CACHE_MAX_MB,
+    DEFAULT_WORKSPACE_CACHE_SIZE,
+)
+
+__all__ = [
+    "WorkspaceCachePool",
+    "estimate_cache_bytes",
+]
+
+# Rough cost of one document beyond its body: DocumentData, frontmatter dict,
+# graph adjacency, canonical-view rows and path lookups.
+_PER_DOCUMENT_OVERHEAD_BYTES = 2048
+
+
+@dataclass
+class _Entry:
+    root: Path
+    cache: SnapshotCache
+    estimated_bytes: int
+    revision: int
+
+
+class WorkspaceCachePool:
+    """LRU of ``SnapshotCache`` instances keyed by portfolio slug."""
+
+    def __init__(
+        self,
+        factory: Callable[[Path], SnapshotCache],
+        *,
+        primary: Optional[SnapshotCache] = None,
+        max_workspaces: int = DEFAULT_WORKSPACE_CACHE_SIZE,
+        max_bytes: int = DEFAULT_WORKSPACE_CACHE_MAX_MB * 1024 * 1024,
+    ) -> None:
+        self._factory = factory
+        self._primary = primary
+        self.max_workspaces = max(1, max_workspaces)
+        self.max_bytes = max(0, max_bytes)
+        self._entries: "OrderedDict[str, _Entry]" = OrderedDict()
+        # Held across builds: concurrent misses for one workspace must not
+        # build it twice, and builds are rare next to hits.
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def get(self, slug: str, root: Path) -> SnapshotCache:
+        """Return a warm cache for ``slug`` at ``root``, building it on a miss.
+
+        The server's own workspace is answered by its primary cache and never
+        enters the LRU.
+        """
+        root = Path(root).expanduser().resolve(strict=False)
+        primary = self._primary
+        if primary is not None and primary.workspace_root == root:
+            return primary
+
+        with self._lock:
+            entry = self._entries.get(slug)
+            if entry is not None and entry.root != root:
+                # The slug now names another checkout; drop the stale cache.
+                self._discard(slug)
+                entry = None
+            if entry is not None:
+                self.hits += 1
+                self._entries.move_to_end(slug)
+                return entry.cache
+
+            self.misses += 1
+            cache = self._factory(root)
+            self._entries[slug] = _Entry(
+                root=root,
+                cache=cache,
+                estimated_bytes=estimate_cache_bytes(cache),
+                revision=cache.snapshot_revision,
+            )
+            self._evict(keep=slug)
+            return cache
+
+    def touch(self, slug: str) -> None:
+        """Re-measure ``slug`` after a rebuild and re-apply the ceiling."""
+        with self._lock:
+            entry = self._entries.get(slug)
+            if entry is None or entry.cache.snapshot_revision == entry.revision:
+                return
+            entry.estimated_bytes = estimate_cache_bytes(entry.cache)
+            entry.revision = entry.cache.snapshot_revision
+            self._evict(keep=slug)
+
+    def stats(self) -> Dict[str, Any]:
+        """Occupancy and hit/miss/eviction counters for ``health``."""
+        with self._lock:
+            return {
+                "capacity": self.max_workspaces,
+                "max_bytes": self.max_bytes,
+                "resident": list(self._entries),
+                "estimated_bytes": self._resident_bytes(),
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+            }
+
+    def close(self) -> None:
+        """Close every pooled cache (the primary cache is not owned)."""
+        with self._lock:
+            for slug in list(self._entries):
+                self._discard(slug)
+
+    def _evict(self, *, keep: str) -> None:
+        while len(self._entries) > 1 and (
+            len(self._entries) > self.max_workspaces
+            or self._resident_bytes() > self.max_bytes
+        ):
+            victim = next(slug for slug in self._entries if slug != keep)
+            self._discard(victim)
+            self.evictions += 1
+
+    def _discard(self, slug: str) -> None:
+        entry = self._entries.pop(slug)
+        entry.cache.close()
+
+    def _resident_bytes(self) -> int:
+        return sum(entry.estimated_bytes for entry in self._entries.values())
+
+
+def estimate_cache_bytes(cache: SnapshotCache) -> int:
+    """Approximate resident size of one cached workspace snapshot."""
+    documents = cache.snapshot.documents
+    body_bytes = sum(len(doc.content or "") for doc in documents.values())
+    return body_bytes + len(documents) * _PER_DOCUMENT_OVERHEAD_BYTES
@@ -12,7 +12,7 @@ a single markdown file:
 Cross-cutting behavior (addendum v1.2):
 
 * **A1 single-lock discipline.** All three tools wrap the entire mutation
-  (``buffer_write`` + ``commit`` + ``rebuild_workspace``) inside
+  (``buffer_write`` + ``commit`` + portfolio refresh) inside
   ``workspace_lock()``. The inner ``SessionContext`` is constructed with
   ``owns_lock=False`` so it does not re-acquire the flock.
 * **A2 slugifier binding.** Workspace identity slugs use
@@ -22,11 +22,14 @@ Cross-cutting behavior (addendum v1.2):
   ``ctx.commit()`` raises, the target path is first rolled back via
   ``ontos.core.git.rollback_path`` (which does ``git checkout --`` for
   tracked paths and unlinks untracked partial writes), *then* the
-  portfolio index is rebuilt so the DB re-converges with the reverted
+  portfolio index is refreshed so the DB re-converges with the reverted
   filesystem. Previously this path did rebuild-only, which left the DB
   pointing at file content that had been partially clobbered. Rollback
   and rebuild failures are both recorded via ``ctx.error(...)`` but
   never mask the original commit exception.
+* **Portfolio refresh.** Only the touched path is re-indexed, through
+  ``PortfolioIndex.schedule_upsert`` on the index's background writer;
+  the tool returns before search converges.
 * **read_only enforcement.** Every write tool checks the server-level
   ``read_only`` flag and returns a structured
   ``WriteToolErrorEnvelope`` when mutations are disallowed. This closes
@@ -193,12 +196,22 @@ def _rebuild_safely(
     portfolio_index: Any,
     slug: str,
     workspace_root: Path,
+    paths: List[Path],
 ) -> None:
-    """Best-effort rebuild. Logs and swallows failures."""
+    """Best-effort index refresh for ``paths``. Logs and swallows failures.
+
+    An index with ``schedule_upsert`` re-indexes just ``paths`` on its
+    background writer, so the tool returns before search converges. Any
+    other index is rebuilt synchronously.
+    """
     if portfolio_index is None:
         return
     try:
-        portfolio_index.rebuild_workspace(slug, workspace_root)
+        schedule_upsert = getattr(portfolio_index, "schedule_upsert", None)
+        if schedule_upsert is not None:
+            schedule_upsert(slug, workspace_root, paths)
+        else:
+            portfolio_index.rebuild_workspace(slug, workspace_root)
     except Exception:
         traceback.print_exc(file=sys.stderr)
 
@@ -216,8 +229,8 @@ def _commit_with_a3_rollback_and_rebuild(
       1. Roll back the ``target_path`` — ``git checkout --`` for tracked
          paths, ``unlink`` for untracked partial writes. Scoped rollback
          avoids clobbering unrelated dirty state in the worktree.
-      2. Call ``rebuild_workspace(slug, root)`` so the portfolio DB
-         re-converges with the reverted filesystem.
+      2. Re-index ``target_path`` (see ``_rebuild_safely``) so the
+         portfolio DB re-converges with the reverted filesystem.
       3. Re-raise the original commit exception.
 
     Rollback and rebuild failures are both recorded via ``ctx.error(...)``
@@ -234,7 +247,7 @@ def _commit_with_a3_rollback_and_rebuild(
         reason = rollback_path(workspace_root, target_path)
         if reason is not None:
             ctx.error(f"Post-commit rollback failed: {reason}")
-        _rebuild_safely(portfolio_index, slug, workspace_root)
+        _rebuild_safely(portfolio_index, slug, workspace_root, [target_path])
         raise
 
 
@@ -473,7 +486,7 @@ def _scaffold_document_impl(
     _commit_with_a3_rollback_and_rebuild(
         ctx, portfolio_index, plan.slug, plan.workspace_root, resolved
     )
-    _rebuild_safely(portfolio_index, plan.slug, plan.workspace_root)
+    _rebuild_safely(portfolio_index, plan.slug, plan.workspace_root, [resolved])
 
     return {
         "success": True,
@@ -556,7 +569,7 @@ def _log_session_impl(
     _commit_with_a3_rollback_and_rebuild(
         ctx, portfolio_index, plan.slug, plan.workspace_root, target
     )
-    _rebuild_safely(portfolio_index, plan.slug, plan.workspace_root)
+    _rebuild_safely(portfolio_index, plan.slug, plan.workspace_root, [target])
 
     return {
         "success": True,
@@ -679,7 +692,7 @@ def _promote_document_impl(
     _commit_with_a3_rollback_and_rebuild(
         ctx, portfolio_index, plan.slug, plan.workspace_root, target
     )
-    _rebuild_safely(portfolio_index, plan.slug, plan.workspace_root)
+    _rebuild_safely(portfolio_index, plan.slug, plan.workspace_root, [target])
 
     return {
         "success": True,
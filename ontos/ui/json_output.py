@@ -12,6 +12,8 @@ from enum import Enum, IntEnum
 from pathlib import Path
 from typing import Any, Dict, List, Mapping, Optional
 
+from ontos.core.profiling import profile_report
+
 
 COMMAND_ENVELOPE_SCHEMA_VERSION = "4.0"
 
@@ -329,24 +331,28 @@ def _emit_command_envelope(
         result_status=normalized_result,
     )
 
-    emit_json(
-        {
-            "schema_version": schema_version,
-            "command": command,
-            "status": execution_status,
-            "exit_code": exit_code,
-            "message": message,
-            "result": {
-                "status": normalized_result,
-                "kind": normalized_kind,
-                "exit_category": normalized_exit_category,
-                "diagnostics": diagnostics,
-            },
-            "data": serialized_data,
-            "warnings": warnings or [],
-            "error": error,
-        }
-    )
+    envelope: Dict[str, Any] = {
+        "schema_version": schema_version,
+        "command": command,
+        "status": execution_status,
+        "exit_code": exit_code,
+        "message": message,
+        "result": {
+            "status": normalized_result,
+            "kind": normalized_kind,
+            "exit_category": normalized_exit_category,
+            "diagnostics": diagnostics,
+        },
+        "data": serialized_data,
+        "warnings": warnings or [],
+        "error": error,
+    }
+    # Present only under ``--profile`` / ONTOS_PROFILE; spans recorded up to
+    # the moment the envelope is emitted.
+    profile = profile_report()
+    if profile is not None:
+        envelope["profile"] = profile
+    emit_json(envelope)
 
 
 def _has_structured_diagnostics(data: Optional[Any]) -> bool:
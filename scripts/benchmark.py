@@ -0,0 +1,722 @@
+#!/usr/bin/env python3
+"""Reproducible performance benchmarks for Ontos hot paths.
+
+Four subcommands::
+
+    python scripts/benchmark.py generate --docs 10000 --out /tmp/corpus-10k
+    python scripts/benchmark.py run --sizes 1000,10000 --output results.json
+    python scripts/benchmark.py compare results.json baseline.json
+    python scripts/benchmark.py memory --sizes 10000
+
+``generate`` writes a deterministic synthetic workspace (same size and seed,
+same bytes) with layered ``depends_on`` fan-out, log ``impacts``, atom
+``describes``, concept tags, variable body sizes, wikilinks, markdown links
+and a small rate of broken references.
+
+``run`` generates (or reuses) one corpus per size and times each benchmark
+``--repeat`` times from a cold start: ``scan_documents``, ``load_documents``,
+``build_graph``, ``validate_all``, ``generate_context_map``,
+``run_link_diagnostics``, ``scan_body_references`` (every body against
+the full known-id set), ``build_context_bundle`` and the portfolio
+workspace rebuild.  Results are JSON (``ontos.benchmark/v1``).
+
+``compare`` exits 1 when any benchmark's median is slower than the baseline
+by more than ``--tolerance`` (a ratio) *and* ``--min-delta-ms``, so timer
+noise on tiny measurements does not fail a release.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import platform
+import random
+import shutil
+import statistics
+import sys
+import tempfile
+import time
+import tracemalloc
+from datetime import date, datetime, timedelta, timezone
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
+
+REPO_ROOT = Path(__file__).resolve().parents[1]
+if str(REPO_ROOT) not in sys.path:
+    sys.path.insert(0, str(REPO_ROOT))
+
+import ontos  # noqa: E402
+
+
+RESULTS_SCHEMA = "ontos.benchmark/v1"
+MEMORY_SCHEMA = "ontos.benchmark-memory/v1"
+CORPUS_MARKER = ".ontos-benchmark-corpus.json"
+DEFAULT_SIZES = (1_000, 10_000, 100_000)
+DEFAULT_SEED = 20_240_101
+
+BENCHMARKS = (
+    "scan_documents",
+    "load_documents",
+    "build_graph",
+    "validate_all",
+    "generate_context_map",
+    "run_link_diagnostics",
+    "scan_body_references",
+    "build_context_bundle",
+    "portfolio_rebuild",
+)
+
+# Share of each layer; the remainder are atoms.
+_LAYER_SHARES = (("kernel", 0.005), ("strategy", 0.02), ("product", 0.08), ("log", 0.15))
+_CONCEPTS = tuple(
+    f"concept-{name}"
+    for name in (
+        "auth", "billing", "search", "storage", "sync", "ui", "api", "metrics",
+        "cache", "queue", "export", "import", "audit", "roles", "alerts", "docs",
+    )
+)
+_WORDS = (
+    "system", "document", "graph", "change", "review", "service", "request",
+    "payload", "context", "module", "release", "schema", "index", "token",
+    "owner", "policy", "budget", "latency", "cluster", "migration", "layer",
+    "contract", "signal", "adapter", "gateway", "ledger", "snapshot", "worker",
+)
+_BROKEN_REF_RATE = 0.02
+
+
+class BenchmarkError(RuntimeError):
+    """Raised for unusable corpora or result files."""
+
+
+# ----------------------------------------------------------------------
+# Corpus generation
+# ----------------------------------------------------------------------
+
+
+def generate_corpus(root: Path, doc_count: int, seed: int = DEFAULT_SEED) -> Dict[str, Any]:
+    """Write a synthetic Ontos workspace with ``doc_count`` documents.
+
+    Reuses ``root`` when its marker records the same size and seed.
+
+    Returns:
+        Corpus metadata (documents, bytes, seed).
+    """
+    if doc_count < 10:
+        raise BenchmarkError("corpus needs at least 10 documents")
+    marker = root / CORPUS_MARKER
+    if marker.is_file():
+        try:
+            existing = json.loads(marker.read_text(encoding="utf-8"))
+        except ValueError:
+            existing = {}
+        if existing.get("documents") == doc_count and existing.get("seed") == seed:
+            return existing
+    if root.exists():
+        shutil.rmtree(root)
+
+    rng = random.Random(seed)
+    layers = _plan_layers(doc_count)
+    (root / "docs").mkdir(parents=True)
+    (root / "src").mkdir()
+    (root / ".ontos.toml").write_text(
+        '[ontos]\nversion = "4.0"\n\n[scanning]\nskip_patterns = ["_template.md", "archive/*"]\n',
+        encoding="utf-8",
+    )
+
+    all_ids = [doc_id for ids in layers.values() for doc_id in ids]
+    upstream = {
+        "kernel": [],
+        "strategy": layers["kernel"],
+        "product": layers["strategy"],
+        "atom": layers["product"] + layers["atom"][: max(1, len(layers["atom"]) // 10)],
+        "log": layers["atom"],
+    }
+    total_bytes = 0
+    start_day = date(2024, 1, 1)
+    for doc_type, ids in layers.items():
+        for index, doc_id in enumerate(ids):
+            frontmatter: Dict[str, Any] = {
+                "id": doc_id,
+                "type": doc_type,
+                "status": "active" if rng.random() > 0.05 else "draft",
+            }
+            parents = upstream[doc_type]
+            if parents:
+                fan_out = min(len(parents), rng.choice((1, 1, 2, 2, 3, 4)))
+                depends = rng.sample(parents, fan_out)
+                if doc_type == "atom":
+                    # Atoms may only depend on earlier atoms to stay acyclic.
+                    depends = [ref for ref in depends if ref < doc_id or not ref.startswith("atom_")]
+                frontmatter["depends_on"] = depends + _broken(rng, "missing_dep")
+            if doc_type == "log":
+                day = start_day + timedelta(days=index % 700)
+                frontmatter["date"] = day.isoformat()
+                frontmatter["event_type"] = rng.choice(("feature", "fix", "refactor", "chore"))
+                frontmatter["branch"] = f"feature/{index % 97}"
+                frontmatter["source"] = "benchmark"
+                frontmatter["impacts"] = rng.sample(layers["atom"], rng.randint(1, 4)) + _broken(
+                    rng, "missing_impact"
+                )
+            if doc_type == "atom" and rng.random() < 0.2:
+                frontmatter["describes"] = [f"src/module_{index % 50}.py"]
+                frontmatter["describes_verified"] = (start_day + timedelta(days=index % 300)).isoformat()
+            if rng.random() < 0.6:
+                frontmatter["concepts"] = rng.sample(_CONCEPTS, rng.randint(1, 3))
+            if rng.random() < 0.5:
+                frontmatter["title"] = f"{doc_type.title()} {index}"
+
+            body = _body(rng, doc_id, all_ids)
+            relative = _doc_path(doc_type, doc_id, index, start_day)
+            path = root / relative
+            path.parent.mkdir(parents=True, exist_ok=True)
+            text = _render(frontmatter) + body
+            path.write_text(text, encoding="utf-8")
+            total_bytes += len(text.encode("utf-8"))
+
+    for module in range(50):
+        (root / "src" / f"module_{module}.py").write_text(f"VALUE = {module}\n", encoding="utf-8")
+
+    metadata = {"documents": doc_count, "seed": seed, "bytes": total_bytes}
+    marker.write_text(json.dumps(metadata, sort_keys=True), encoding="utf-8")
+    return metadata
+
+
+def _plan_layers(doc_count: int) -> Dict[str, List[str]]:
+    layers: Dict[str, List[str]] = {}
+    assigned = 0
+    for doc_type, share in _LAYER_SHARES:
+        count = max(1, int(doc_count * share))
+        layers[doc_type] = [f"{doc_type}_{index:06d}" for index in range(count)]
+        assigned += count
+    layers["atom"] = [f"atom_{index:06d}" for index in range(doc_count - assigned)]
+    # Write parents before children; dict order is the generation order.
+    return {name: layers[name] for name in ("kernel", "strategy", "product", "atom", "log")}
+
+
+def _broken(rng: random.Random, prefix: str) -> List[str]:
+    if rng.random() < _BROKEN_REF_RATE:
+        return [f"{prefix}_{rng.randint(0, 10**6)}"]
+    return []
+
+
+def _body(rng: random.Random, doc_id: str, all_ids: Sequence[str]) -> str:
+    # Log-normal body sizes: most documents are short, a few are long.
+    word_count = int(min(4_000, max(30, rng.lognormvariate(5.3, 0.8))))
+    words = [rng.choice(_WORDS) for _ in range(word_count)]
+    for _ in range(rng.randint(0, 4)):
+        target = rng.choice(all_ids)
+        words.insert(rng.randrange(len(words)), f"[[{target}]]")
+    if rng.random() < 0.3:
+        target = rng.choice(all_ids)
+        words.insert(rng.randrange(len(words)), f"see `{target}`")
+    if rng.random() < _BROKEN_REF_RATE * 5:
+        words.insert(rng.randrange(len(words)), f"[[missing_wikilink_{rng.randint(0, 10**6)}]]")
+    if rng.random() < 0.1:
+        words.append("[guide](../README.md)")
+    lines = []
+    for start in range(0, len(words), 80):
+        lines.append(" ".join(words[start:start + 80]))
+    return f"# {doc_id}\n\n" + "\n\n".join(lines) + "\n"
+
+
+def _doc_path(doc_type: str, doc_id: str, index: int, start_day: date) -> str:
+    if doc_type == "log":
+        day = start_day + timedelta(days=index % 700)
+        return f"docs/logs/{day.isoformat()}_{doc_id}.md"
+    return f"docs/{doc_type}/group_{index % 32:02d}/{doc_id}.md"
+
+
+def _render(frontmatter: Dict[str, Any]) -> str:
+    lines = ["---"]
+    for key, value in frontmatter.items():
+        if isinstance(value, list):
+            lines.append(f"{key}: [{', '.join(str(item) for item in value)}]")
+        else:
+            lines.append(f"{key}: {value}")
+    lines.append("---")
+    return "\n".join(lines) + "\n"
+
+
+# ----------------------------------------------------------------------
+# Benchmarks
+# ----------------------------------------------------------------------
+
+
+class _Workspace:
+    """Lazily computed inputs shared by the benchmarks of one corpus."""
+
+    def __init__(self, root: Path, work_dir: Path):
+        from ontos.io.config import load_project_config
+
+        self.root = root
+        self.work_dir = work_dir
+        self.config = load_project_config(config_path=root / ".ontos.toml", repo_root=root)
+        self._paths: Optional[List[Path]] = None
+        self._docs: Optional[Dict[str, Any]] = None
+        self._snapshot: Any = None
+
+    @property
+    def paths(self) -> List[Path]:
+        if self._paths is None:
+            from ontos.io.files import scan_documents
+
+            self._paths = scan_documents(
+                [self.root / "docs"], skip_patterns=list(self.config.scanning.skip_patterns)
+            )
+        return self._paths
+
+    @property
+    def docs(self) -> Dict[str, Any]:
+        if self._docs is None:
+            from ontos.io.files import load_documents
+            from ontos.io.yaml import parse_frontmatter_content
+
+            self._docs = load_documents(self.paths, parse_frontmatter_content).documents
+        return self._docs
+
+    @property
+    def snapshot(self) -> Any:
+        if self._snapshot is None:
+            from ontos.io.snapshot import create_snapshot
+
+            self._snapshot = create_snapshot(self.root, include_content=True)
+        return self._snapshot
+
+    def validation_config(self) -> Dict[str, Any]:
+        return {
+            "allowed_orphan_types": self.config.validation.allowed_orphan_types,
+            "allowed_orphan_paths": self.config.validation.allowed_orphan_paths,
+            "project_root": str(self.root),
+        }
+
+
+def _bench_scan_documents(ws: _Workspace) -> Callable[[], Any]:
+    from ontos.io.files import scan_documents
+
+    patterns = list(ws.config.scanning.skip_patterns)
+    return lambda: scan_documents([ws.root / "docs"], skip_patterns=patterns)
+
+
+def _bench_load_documents(ws: _Workspace) -> Callable[[], Any]:
+    from ontos.io.files import load_documents
+    from ontos.io.yaml import parse_frontmatter_content
+
+    paths = ws.paths
+    return lambda: load_documents(paths, parse_frontmatter_content)
+
+
+def _bench_build_graph(ws: _Workspace) -> Callable[[], Any]:
+    from ontos.core.graph import build_graph
+
+    docs = ws.docs
+    return lambda: build_graph(docs, workspace_root=ws.root)
+
+
+def _bench_validate_all(ws: _Workspace) -> Callable[[], Any]:
+    from ontos.core.validation import ValidationOrchestrator
+
+    docs = ws.docs
+    config = ws.validation_config()
+    return lambda: ValidationOrchestrator(docs, config, workspace_root=ws.root).validate_all()
+
+
+def _bench_generate_context_map(ws: _Workspace) -> Callable[[], Any]:
+    from ontos.commands.map import GenerateMapOptions, generate_context_map
+
+    docs = ws.docs
+    config = dict(ws.validation_config(), project_name=ws.root.name, scope="docs")
+    options = GenerateMapOptions(output_path=ws.work_dir / "Ontos_Context_Map.md")
+    return lambda: generate_context_map(docs, config, options)
+
+
+def _bench_run_link_diagnostics(ws: _Workspace) -> Callable[[], Any]:
+    from ontos.core.link_diagnostics import run_link_diagnostics
+    from ontos.io.scan_scope import ScanScope
+
+    paths = ws.paths
+    return lambda: run_link_diagnostics(
+        repo_root=ws.root,
+        config=ws.config,
+        doc_paths=paths,
+        scope=ScanScope.DOCS,
+    )
+
+
+def _bench_scan_body_references(ws: _Workspace) -> Callable[[], Any]:
+    from ontos.core.body_refs import scan_body_references
+
+    # Every body against the full id set: 10k known ids at the 10k size.
+    docs = ws.docs
+    known_ids = frozenset(docs)
+    bodies = [(doc.filepath, doc.content) for doc in docs.values()]
+
+    def run() -> None:
+        for path, body in bodies:
+            scan_body_references(path, body, known_ids=known_ids, include_skipped=False)
+
+    return run
+
+
+def _bench_build_context_bundle(ws: _Workspace) -> Callable[[], Any]:
+    from ontos.mcp.bundler import build_context_bundle
+
+    snapshot = ws.snapshot
+    return lambda: build_context_bundle(snapshot, ws.root, "benchmark")
+
+
+def _bench_portfolio_rebuild(ws: _Workspace) -> Callable[[], Any]:
+    from ontos.mcp.portfolio import PortfolioIndex
+
+    counter = iter(range(10**9))
+
+    def run() -> None:
+        # A fresh database per run keeps every rebuild cold.
+        index = PortfolioIndex(ws.work_dir / f"portfolio-{next(counter)}.db")
+        index.rebuild_workspace("benchmark", ws.root)
+        index.close()
+
+    return run
+
+
+_BENCHMARK_FACTORIES: Dict[str, Callable[[_Workspace], Callable[[], Any]]] = {
+    "scan_documents": _bench_scan_documents,
+    "load_documents": _bench_load_documents,
+    "build_graph": _bench_build_graph,
+    "validate_all": _bench_validate_all,
+    "generate_context_map": _bench_generate_context_map,
+    "run_link_diagnostics": _bench_run_link_diagnostics,
+    "scan_body_references": _bench_scan_body_references,
+    "build_context_bundle": _bench_build_context_bundle,
+    "portfolio_rebuild": _bench_portfolio_rebuild,
+}
+
+
+def time_callable(func: Callable[[], Any], repeat: int) -> Dict[str, Any]:
+    """Run ``func`` ``repeat`` times and summarize wall-clock milliseconds."""
+    runs: List[float] = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        runs.append(round((time.perf_counter() - start) * 1000.0, 3))
+    return {
+        "runs_ms": runs,
+        "min_ms": min(runs),
+        "median_ms": round(statistics.median(runs), 3),
+        "mean_ms": round(statistics.fmean(runs), 3),
+    }
+
+
+def run_benchmarks(
+    sizes: Sequence[int],
+    *,
+    repeat: int = 3,
+    seed: int = DEFAULT_SEED,
+    corpus_dir: Optional[Path] = None,
+    selected: Optional[Sequence[str]] = None,
+    progress: Optional[Callable[[str], None]] = None,
+) -> Dict[str, Any]:
+    """Generate corpora and time every selected benchmark per size."""
+    names = list(selected or BENCHMARKS)
+    unknown = sorted(set(names) - set(BENCHMARKS))
+    if unknown:
+        raise BenchmarkError(f"unknown benchmark(s): {', '.join(unknown)}")
+    if repeat < 1:
+        raise BenchmarkError("--repeat must be >= 1")
+
+    results: Dict[str, Any] = {}
+    corpora: Dict[str, Any] = {}
+    with tempfile.TemporaryDirectory(prefix="ontos-bench-") as scratch:
+        scratch_dir = Path(scratch)
+        base = corpus_dir or scratch_dir / "corpora"
+        for size in sizes:
+            root = base / f"corpus-{size}"
+            if progress:
+                progress(f"generating {size} documents in {root}")
+            corpora[str(size)] = generate_corpus(root, size, seed)
+            work_dir = scratch_dir / f"work-{size}"
+            work_dir.mkdir()
+            workspace = _Workspace(root, work_dir)
+            per_size: Dict[str, Any] = {}
+            for name in names:
+                func = _BENCHMARK_FACTORIES[name](workspace)
+                per_size[name] = time_callable(func, repeat)
+                if progress:
+                    progress(f"{size:>7} {name:<22} median {per_size[name]['median_ms']:.1f} ms")
+            results[str(size)] = per_size
+
+    return {
+        "schema": RESULTS_SCHEMA,
+        "ontos_version": ontos.__version__,
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "created_at": datetime.now(timezone.utc).isoformat(),
+        "repeat": repeat,
+        "seed": seed,
+        "corpora": corpora,
+        "results": results,
+    }
+
+
+def measure_memory(
+    sizes: Sequence[int],
+    *,
+    seed: int = DEFAULT_SEED,
+    corpus_dir: Optional[Path] = None,
+    lazy_content: bool = False,
+    progress: Optional[Callable[[str], None]] = None,
+) -> Dict[str, Any]:
+    """Measure resident bytes per document of a snapshot and an MCP cache.
+
+    ``snapshot_bytes`` is what ``create_snapshot(include_content=True)``
+    keeps alive; ``cache_bytes`` adds the ``SnapshotCache`` state built on
+    top of it (fingerprints, path index, depths, canonical view and the
+    in-memory parse cache). Both are traced Python allocations.
+    ``lazy_content`` measures the snapshot the MCP server builds, with
+    bodies left on disk.
+    """
+    from ontos.io.parse_cache import MemoryParseCache
+    from ontos.io.snapshot import create_snapshot
+    from ontos.mcp.cache import SnapshotCache
+
+    results: Dict[str, Any] = {}
+    with tempfile.TemporaryDirectory(prefix="ontos-bench-") as scratch:
+        base = corpus_dir or Path(scratch) / "corpora"
+        for size in sizes:
+            root = base / f"corpus-{size}"
+            if progress:
+                progress(f"generating {size} documents in {root}")
+            generate_corpus(root, size, seed)
+            workspace = _Workspace(root, Path(scratch))
+
+            tracemalloc.start()
+            try:
+                parse_cache = MemoryParseCache()
+                snapshot = create_snapshot(
+                    root,
+                    include_content=True,
+                    parse_cache=parse_cache,
+                    lazy_content=lazy_content,
+                )
+                snapshot_bytes = tracemalloc.get_traced_memory()[0]
+                cache = SnapshotCache(
+                    root,
+                    workspace.config,
+                    snapshot,
+                    parse_cache=parse_cache,
+                    lazy_content=lazy_content,
+                )
+                cache_bytes = tracemalloc.get_traced_memory()[0]
+                cache.close()
+            finally:
+                tracemalloc.stop()
+            doc_count = max(1, len(snapshot.documents))
+            results[str(size)] = {
+                "documents": len(snapshot.documents),
+                "snapshot_bytes": snapshot_bytes,
+                "snapshot_bytes_per_doc": snapshot_bytes // doc_count,
+                "cache_bytes": cache_bytes,
+                "cache_bytes_per_doc": cache_bytes // doc_count,
+            }
+            if progress:
+                progress(
+                    f"{size:>7} snapshot {results[str(size)]['snapshot_bytes_per_doc']} B/doc, "
+                    f"cache {results[str(size)]['cache_bytes_per_doc']} B/doc"
+                )
+            del snapshot, cache, parse_cache
+
+    return {
+        "schema": MEMORY_SCHEMA,
+        "ontos_version": ontos.__version__,
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "created_at": datetime.now(timezone.utc).isoformat(),
+        "seed": seed,
+        "lazy_content": lazy_content,
+        "results": results,
+    }
+
+
+# ----------------------------------------------------------------------
+# Baseline comparison
+# ----------------------------------------------------------------------
+
+
+def load_results(path: Path) -> Dict[str, Any]:
+    try:
+        payload = json.loads(path.read_text(encoding="utf-8"))
+    except (OSError, ValueError) as exc:
+        raise BenchmarkError(f"cannot read benchmark results {path}: {exc}") from exc
+    if not isinstance(payload, dict) or payload.get("schema") != RESULTS_SCHEMA:
+        raise BenchmarkError(f"{path} is not an {RESULTS_SCHEMA} results file")
+    return payload
+
+
+def compare_results(
+    current: Dict[str, Any],
+    baseline: Dict[str, Any],
+    *,
+    tolerance: float = 0.25,
+    min_delta_ms: float = 5.0,
+) -> List[Dict[str, Any]]:
+    """Return one row per benchmark present in both files.
+
+    A row is a regression when the current median exceeds the baseline median
+    by more than ``tolerance`` (ratio) and by more than ``min_delta_ms``.
+    """
+    rows: List[Dict[str, Any]] = []
+    for size, benchmarks in sorted(current.get("results", {}).items(), key=lambda item: int(item[0])):
+        baseline_benchmarks = baseline.get("results", {}).get(size, {})
+        for name, stats in benchmarks.items():
+            reference = baseline_benchmarks.get(name)
+            if reference is None:
+                continue
+            now = float(stats["median_ms"])
+            before = float(reference["median_ms"])
+            ratio = now / before if before > 0 else float("inf") if now > 0 else 1.0
+            rows.append(
+                {
+                    "size": int(size),
+                    "benchmark": name,
+                    "baseline_ms": before,
+                    "current_ms": now,
+                    "ratio": round(ratio, 3),
+                    "regression": ratio > 1.0 + tolerance and now - before > min_delta_ms,
+                }
+            )
+    return rows
+
+
+def _format_rows(rows: Sequence[Dict[str, Any]]) -> str:
+    lines = [f"{'size':>7}  {'benchmark':<22} {'baseline':>10} {'current':>10} {'ratio':>7}"]
+    for row in rows:
+        flag = "  REGRESSION" if row["regression"] else ""
+        lines.append(
+            f"{row['size']:>7}  {row['benchmark']:<22} {row['baseline_ms']:>8.1f}ms "
+            f"{row['current_ms']:>8.1f}ms {row['ratio']:>7.2f}{flag}"
+        )
+    return "\n".join(lines)
+
+
+# ----------------------------------------------------------------------
+# CLI
+# ----------------------------------------------------------------------
+
+
+def _parse_sizes(raw: str) -> Tuple[int, ...]:
+    try:
+        sizes = tuple(int(part.replace("_", "")) for part in raw.split(",") if part.strip())
+    except ValueError as exc:
+        raise argparse.ArgumentTypeError(f"invalid size list: {raw!r}") from exc
+    if not sizes:
+        raise argparse.ArgumentTypeError("at least one size is required")
+    return sizes
+
+
+def _build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    generate = subparsers.add_parser("generate", help="write one synthetic corpus")
+    generate.add_argument("--docs", type=int, required=True)
+    generate.add_argument("--out", type=Path, required=True)
+    generate.add_argument("--seed", type=int, default=DEFAULT_SEED)
+
+    run = subparsers.add_parser("run", help="time the hot paths and emit JSON results")
+    run.add_argument("--sizes", type=_parse_sizes, default=DEFAULT_SIZES)
+    run.add_argument("--repeat", type=int, default=3)
+    run.add_argument("--seed", type=int, default=DEFAULT_SEED)
+    run.add_argument("--corpus-dir", type=Path, help="keep and reuse generated corpora here")
+    run.add_argument("--only", action="append", choices=BENCHMARKS, help="run only these benchmarks")
+    run.add_argument("--output", type=Path, help="write results JSON here (default: stdout)")
+    run.add_argument("--baseline", type=Path, help="compare against this results file")
+    run.add_argument("--tolerance", type=float, default=0.25)
+    run.add_argument("--min-delta-ms", type=float, default=5.0)
+
+    memory = subparsers.add_parser("memory", help="measure snapshot and MCP cache bytes per document")
+    memory.add_argument("--sizes", type=_parse_sizes, default=DEFAULT_SIZES[:2])
+    memory.add_argument("--seed", type=int, default=DEFAULT_SEED)
+    memory.add_argument("--corpus-dir", type=Path, help="keep and reuse generated corpora here")
+    memory.add_argument("--output", type=Path, help="write results JSON here (default: stdout)")
+    memory.add_argument(
+        "--lazy-content",
+        action="store_true",
+        help="measure snapshots that keep document bodies on disk, as the MCP server does",
+    )
+
+    compare = subparsers.add_parser("compare", help="compare results against a baseline")
+    compare.add_argument("current", type=Path)
+    compare.add_argument("baseline", type=Path)
+    compare.add_argument("--tolerance", type=float, default=0.25)
+    compare.add_argument("--min-delta-ms", type=float, default=5.0)
+    return parser
+
+
+def _report_comparison(rows: Sequence[Dict[str, Any]]) -> int:
+    print(_format_rows(rows), file=sys.stderr)
+    regressions = [row for row in rows if row["regression"]]
+    if regressions:
+        print(f"{len(regressions)} benchmark(s) regressed.", file=sys.stderr)
+        return 1
+    return 0
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    args = _build_parser().parse_args(argv)
+    try:
+        if args.command == "generate":
+            metadata = generate_corpus(args.out, args.docs, args.seed)
+            print(json.dumps(metadata, sort_keys=True))
+            return 0
+        if args.command == "run":
+            payload = run_benchmarks(
+                args.sizes,
+                repeat=args.repeat,
+                seed=args.seed,
+                corpus_dir=args.corpus_dir,
+                selected=args.only,
+                progress=lambda message: print(message, file=sys.stderr),
+            )
+            text = json.dumps(payload, indent=2, sort_keys=True)
+            if args.output:
+                args.output.write_text(text + "\n", encoding="utf-8")
+            else:
+                print(text)
+            if args.baseline:
+                rows = compare_results(
+                    payload,
+                    load_results(args.baseline),
+                    tolerance=args.tolerance,
+                    min_delta_ms=args.min_delta_ms,
+                )
+                return _report_comparison(rows)
+            return 0
+        if args.command == "memory":
+            payload = measure_memory(
+                args.sizes,
+                seed=args.seed,
+                corpus_dir=args.corpus_dir,
+                lazy_content=args.lazy_content,
+                progress=lambda message: print(message, file=sys.stderr),
+            )
+            text = json.dumps(payload, indent=2, sort_keys=True)
+            if args.output:
+                args.output.write_text(text + "\n", encoding="utf-8")
+            else:
+                print(text)
+            return 0
+        if args.command == "compare":
+            rows = compare_results(
+                load_results(args.current),
+                load_results(args.baseline),
+                tolerance=args.tolerance,
+                min_delta_ms=args.min_delta_ms,
+            )
+            return _report_comparison(rows)
+    except BenchmarkError as exc:
+        print(f"benchmark: {exc}", file=sys.stderr)
+        return 2
+    return 2  # pragma: no cover - argparse rejects unknown commands
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -82,6 +82,81 @@ class TestExportDataCommand:
         assert data["documents"][0]["type"] == "kernel"
 
 
+class TestExportDataStreaming:
+    """Tests for the NDJSON export format."""
+
+    @staticmethod
+    def _project(tmp_path):
+        (tmp_path / ".ontos.toml").write_text("[ontos]\nversion = '3.2'\n")
+        docs = tmp_path / "docs"
+        docs.mkdir()
+        (docs / "k.md").write_text("---\nid: k1\ntype: kernel\nstatus: active\n---\nKernel body.\n")
+        (docs / "a.md").write_text(
+            "---\nid: a1\ntype: atom\nstatus: draft\ndepends_on: [k1]\n---\nAtom body.\n"
+        )
+
+    def _export(self, tmp_path, *extra):
+        result = subprocess.run(
+            [sys.executable, "-m", "ontos", "export", "data", "--deterministic", *extra],
+            capture_output=True,
+            text=True,
+            cwd=str(tmp_path)
+        )
+        assert result.returncode == 0, result.stderr
+        return result.stdout
+
+    def test_ndjson_records_match_json_export(self, tmp_path):
+        """Documents, then edges, then a trailer with the JSON summary."""
+        self._project(tmp_path)
+        data = json.loads(self._export(tmp_path))
+        stream = self._export(tmp_path, "--format", "ndjson")
+        records = [json.loads(line) for line in stream.splitlines()]
+
+        assert [record["record"] for record in records] == ["document", "document", "edge", "trailer"]
+        assert [{k: v for k, v in r.items() if k != "record"} for r in records[:2]] == data["documents"]
+        assert {k: v for k, v in records[2].items() if k != "record"} == data["graph"]["edges"][0]
+        trailer = records[3]
+        assert trailer["schema_version"] == "ontos-export-ndjson-v1"
+        assert trailer["summary"] == data["summary"]
+        assert trailer["provenance"] == data["provenance"]
+        assert stream == self._export(tmp_path, "--format", "ndjson")
+
+    def test_content_hash_only_keeps_hashes(self, tmp_path):
+        """--content-hash-only drops bodies but keeps their hashes."""
+        self._project(tmp_path)
+        full = json.loads(self._export(tmp_path))["documents"]
+        hashed = json.loads(self._export(tmp_path, "--content-hash-only"))["documents"]
+
+        assert [doc["content_hash"] for doc in hashed] == [doc["content_hash"] for doc in full]
+        assert all(doc["content_hash"] for doc in hashed)
+        assert all(doc["content"] is None for doc in hashed)
+
+    def test_closed_stdout_pipe_exits_cleanly(self, tmp_path):
+        """A consumer that stops reading early (| head -1) is not an error."""
+        self._project(tmp_path)
+        body = "body text " * 400
+        for i in range(200):
+            (tmp_path / "docs" / f"bulk{i}.md").write_text(
+                f"---\nid: bulk{i}\ntype: atom\nstatus: active\n---\n{body}\n"
+            )
+
+        proc = subprocess.Popen(
+            [sys.executable, "-m", "ontos", "export", "data", "--format", "ndjson"],
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE,
+            cwd=str(tmp_path)
+        )
+        first = proc.stdout.readline()
+        proc.stdout.close()
+        stderr = proc.stderr.read()
+        proc.wait(timeout=120)
+
+        assert json.loads(first)["record"] == "document"
+        assert proc.returncode == 0, stderr
+        assert b"Broken pipe" not in stderr
+        assert b"Exception ignored" not in stderr
+
+
 class TestExportClaudeCommand:
     """Tests for ontos export claude command."""
 
@@ -380,6 +380,53 @@ def test_check_links_task_uses_shared_link_diagnostics(tmp_path, monkeypatch):
     assert observed["include_external_scope_resolution"] is True
 
 
+def test_read_only_tasks_share_one_corpus_load(tmp_path, monkeypatch):
+    import functools
+
+    import ontos.commands.maintain as maintain_module
+
+    _init_project(tmp_path)
+    docs = tmp_path / "docs"
+    (docs / "a.md").write_text("---\nid: a\ntype: atom\nstatus: active\n---\n", encoding="utf-8")
+    (docs / "b.md").write_text(
+        "---\nid: b\ntype: atom\nstatus: active\ndepends_on: [a]\n---\n", encoding="utf-8"
+    )
+    ctx = _build_context(tmp_path, quiet=True)
+
+    scans = []
+    parsed = []
+    original_scan = maintain_module._scan_docs
+    original_parse = maintain_module.parse_frontmatter_content
+
+    def counting_scan(scan_ctx):
+        scans.append(1)
+        return original_scan(scan_ctx)
+
+    @functools.wraps(original_parse)
+    def counting_parse(content):
+        parsed.append(content)
+        return original_parse(content)
+
+    monkeypatch.setattr(maintain_module, "_scan_docs", counting_scan)
+    monkeypatch.setattr(maintain_module, "parse_frontmatter_content", counting_parse)
+
+    assert _task_curation_stats(ctx).metrics["total"] == 2
+    assert _task_check_links(ctx).metrics["broken_links"] == 0
+    assert (len(scans), len(parsed)) == (1, 2)
+
+    (docs / "b.md").write_text(
+        "---\nid: b\ntype: atom\nstatus: active\ndepends_on: [gone]\n---\n", encoding="utf-8"
+    )
+    ctx.corpus.invalidate([docs / "b.md"])
+    assert _task_check_links(ctx).metrics["broken_links"] == 1
+    assert (len(scans), len(parsed)) == (1, 3)
+
+    (docs / "c.md").write_text("---\nid: c\ntype: atom\nstatus: active\n---\n", encoding="utf-8")
+    ctx.corpus.invalidate([docs / "c.md"])
+    assert _task_curation_stats(ctx).metrics["total"] == 3
+    assert (len(scans), len(parsed)) == (2, 4)
+
+
 def test_check_links_task_reports_broken_body_references(tmp_path):
     _init_project(tmp_path)
     (tmp_path / "docs" / "a.md").write_text(
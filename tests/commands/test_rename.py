@@ -1035,3 +1035,44 @@ def test_build_rename_plan_equivalence_cli_vs_injected_docs(tmp_path: Path):
 
     # Warnings list parity.
     assert list(cli_plan.warnings) == list(injected_plan.warnings)
+
+
+def test_rename_plan_opens_only_referencing_files(tmp_path: Path, monkeypatch):
+    import ontos.commands.rename as rename_module
+    from ontos.io.config import load_project_config
+    from ontos.io.files import load_documents
+    from ontos.io.scan_scope import ScanScope
+    from ontos.io.yaml import parse_frontmatter_content
+
+    _init_repo(tmp_path)
+    docs_dir = tmp_path / "docs"
+    _write_doc(docs_dir / "target.md", "old_id")
+    _write_doc(docs_dir / "linker.md", "linker", body="See [[old_id]].")
+    _write_doc(docs_dir / "dependent.md", "dependent", depends_on="[old_id]")
+    for index in range(5):
+        _write_doc(docs_dir / f"other_{index}.md", f"other_{index}", body="Unrelated body.")
+
+    docs = load_documents(sorted(docs_dir.glob("*.md")), parse_frontmatter_content).documents
+    opened = []
+    original = rename_module._read_decoded_content
+
+    def recording_read(path):
+        opened.append(path.name)
+        return original(path)
+
+    monkeypatch.setattr(rename_module, "_read_decoded_content", recording_read)
+    plan, error = rename_module.build_rename_plan(
+        repo_root=tmp_path,
+        config=load_project_config(repo_root=tmp_path),
+        scope=ScanScope.DOCS,
+        docs=docs,
+        old_id="old_id",
+        new_id="new_id",
+        mode="dry-run",
+        check_git=False,
+    )
+
+    assert error is None
+    assert sorted(item.path.name for item in plan.files) == ["dependent.md", "linker.md", "target.md"]
+    assert sorted(opened) == ["dependent.md", "linker.md", "target.md"]
+    assert plan.summary.files_scanned == len(docs)
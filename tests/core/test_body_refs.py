@@ -1,13 +1,19 @@
 """Tests for zone-aware body reference scanning."""
 
+import random
+
 import pytest
 from pathlib import Path
 from typing import Optional
 
 from ontos.core.body_refs import (
+    KnownIdMatcher,
     MatchType,
     ZoneType,
+    _iter_known_id_candidates,
     _looks_like_doc_id,
+    _order_known_ids,
+    known_id_matcher,
     scan_body_references,
 )
 
@@ -416,3 +422,21 @@ class TestKnownIdsBypassFilters:
         )
         ids = {m.normalized_id for m in scan.matches}
         assert "README.md" in ids
+
+
+def test_known_id_matcher_matches_per_id_scan():
+    ids = {"a", "ab", "a.b", "b-c", "abc_1", "x", "a a", "a, b", ""}
+    matcher = KnownIdMatcher(ids)
+    alphabet = ["a", "b", "c", "x", "1", "_", ".", "-", " ", ",", "(", ")", "[", "]", "`", ":", "!", "\n", "'"]
+    rng = random.Random(135)
+    texts = ["", "a", "a a a", "see ab. and (a.b), [b-c]!", "xa ab_ abc_1: a, b, b"]
+    texts.extend("".join(rng.choice(alphabet) for _ in range(rng.randint(1, 40))) for _ in range(2000))
+    ordered = _order_known_ids(ids)
+    for text in texts:
+        assert matcher.iter_candidates(text) == list(_iter_known_id_candidates(text, ordered)), text
+
+
+def test_known_id_matcher_is_shared_per_id_set():
+    first = known_id_matcher({"alpha", "beta"})
+    assert known_id_matcher(frozenset({"beta", "alpha"})) is first
+    assert known_id_matcher({"alpha"}) is not first
@@ -102,6 +102,18 @@ class TestValidateTypes:
         _validate_types({"workflow": {"log_retention_count": 50}})
         _validate_types({"hooks": {"pre_push": True, "pre_commit": False}})
 
+    def test_validate_types_rejects_negative_scanning_workers(self):
+        with pytest.raises(ConfigError, match=r"scanning\.workers must be >= 0"):
+            _validate_types({"scanning": {"workers": -1}})
+        assert dict_to_config({"scanning": {"workers": 0}}).scanning.workers == 0
+
+    def test_validate_types_rejects_unknown_mcp_freshness_mode(self):
+        with pytest.raises(ConfigError, match=r"mcp\.freshness_mode must be"):
+            _validate_types({"mcp": {"freshness_mode": "inotify"}})
+        with pytest.raises(ConfigError, match=r"mcp\.poll_interval_ms must be >= 50"):
+            _validate_types({"mcp": {"poll_interval_ms": 0}})
+        assert dict_to_config({"mcp": {"freshness_mode": "watch"}}).mcp.freshness_mode == "watch"
+
     def test_legacy_numeric_bounds_are_clamped_without_mutating_input(self):
         data = {
             "validation": {"max_dependency_depth": -4},
@@ -9,6 +9,7 @@ from ontos.core.graph import (
     GraphNode,
     build_graph,
     calculate_depths,
+    calculate_depths_incremental,
     detect_cycles,
     detect_orphans,
 )
@@ -667,6 +668,45 @@ class TestCalculateDepths:
         assert depths["parent"] == 2
 
 
+
+class TestCalculateDepthsIncremental:
+    @staticmethod
+    def _graph(edges):
+        graph = DependencyGraph()
+        for node, deps in edges.items():
+            graph.add_node(node, "atom", "", list(deps))
+        return graph
+
+    def test_matches_full_pass_after_edge_changes(self):
+        before = {
+            "a": [], "b": ["a"], "c": ["b"], "d": ["c"], "e": [], "f": ["e"],
+        }
+        previous = calculate_depths(self._graph(before))
+        after = dict(before, b=[], e=["d"], g=["f"])
+        graph = self._graph(after)
+
+        depths = calculate_depths_incremental(graph, previous, {"b", "e", "g"})
+
+        assert depths == calculate_depths(graph)
+        assert list(depths) == list(graph.nodes)
+
+    def test_new_cycle_in_changed_region(self):
+        before = {"leaf": [], "a": ["leaf"], "b": ["a"], "top": ["b"]}
+        previous = calculate_depths(self._graph(before))
+        graph = self._graph(dict(before, a=["leaf", "b"]))
+
+        depths = calculate_depths_incremental(graph, previous, {"a"})
+
+        assert depths == calculate_depths(graph)
+        assert depths["a"] == depths["b"] == 1
+        assert depths["top"] == 2
+
+    def test_unreported_new_node_falls_back_to_full_pass(self):
+        previous = calculate_depths(self._graph({"a": []}))
+        graph = self._graph({"a": [], "b": ["a"]})
+
+        assert calculate_depths_incremental(graph, previous, set()) == {"a": 0, "b": 1}
+
 class TestExternalDependencyAllowlist:
     """(#134) Resolved-on-disk deps matching allowed_external_dependency_paths
     are reported as EXTERNAL_FILE_DEPENDENCY at info severity; non-matching
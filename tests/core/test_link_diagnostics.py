@@ -584,3 +584,82 @@ def test_to_data_payload_includes_file_dependencies(tmp_path: Path):
     assert items["apps/real.py"]["allowlisted"] is True
     assert items["tools/other.py"]["allowlisted"] is False
     assert items["tools/other.py"]["field"] == "depends_on"
+
+
+def test_parallel_body_scan_matches_serial_output(tmp_path: Path):
+    _init_project(tmp_path)
+    (tmp_path / "docs" / "notes.txt").write_text("plain file\n", encoding="utf-8")
+    for index in range(70):
+        _write_doc(
+            tmp_path / "docs" / f"doc_{index:02d}.md",
+            f"doc_{index:02d}",
+            body=(
+                f"See [[doc_{(index + 1) % 70:02d}]] and [[missing_{index % 7}]].\n"
+                f"Also [next](doc_{(index + 2) % 70:02d}.md), [notes](notes.txt) "
+                f"and [gone](gone_{index % 3}.md).\n"
+            ),
+        )
+    config = load_project_config(config_path=tmp_path / ".ontos.toml", repo_root=tmp_path)
+    paths = collect_scoped_documents(tmp_path, config, ScanScope.DOCS)
+    load_result = load_documents(paths, parse_frontmatter_content)
+
+    def payload(workers: int):
+        result = run_link_diagnostics(
+            repo_root=tmp_path,
+            config=config,
+            doc_paths=paths,
+            scope=ScanScope.DOCS,
+            load_result=load_result,
+            workers=workers,
+        )
+        data = result.to_data_payload()
+        data.pop("timings_ms")
+        return data
+
+    serial = payload(1)
+    assert serial["summary"]["broken_body"] == 140
+    assert len(serial["file_dependencies"]) == 70
+    assert payload(2) == serial
+
+
+def test_body_scan_cache_skips_unchanged_bodies_and_reclassifies(tmp_path: Path, monkeypatch):
+    from ontos.core import link_diagnostics
+    from ontos.io.body_scan_cache import BodyScanCache
+
+    _init_project(tmp_path)
+    _write_doc(tmp_path / "docs" / "a.md", "a", body="See [[b]] and [[later]].")
+    _write_doc(tmp_path / "docs" / "b.md", "b", body="Back to [[a]].")
+
+    config = load_project_config(config_path=tmp_path / ".ontos.toml", repo_root=tmp_path)
+
+    def run():
+        paths = collect_scoped_documents(tmp_path, config, ScanScope.DOCS)
+        result = run_link_diagnostics(
+            repo_root=tmp_path,
+            config=config,
+            doc_paths=paths,
+            scope=ScanScope.DOCS,
+            body_scan_cache=BodyScanCache.for_workspace(tmp_path),
+        )
+        data = result.to_data_payload()
+        data.pop("timings_ms")
+        return data
+
+    first = run()
+    assert [item["value"] for item in first["broken_references"]] == ["later"]
+
+    real_scan = link_diagnostics.scan_body_references
+    calls = []
+
+    def counted_scan(*args, **kwargs):
+        calls.append(kwargs.get("path"))
+        return real_scan(*args, **kwargs)
+
+    monkeypatch.setattr(link_diagnostics, "scan_body_references", counted_scan)
+    assert run() == first
+    assert calls == []
+
+    # A new document fixes the broken reference without touching a.md.
+    _write_doc(tmp_path / "docs" / "later.md", "later", depends_on="[a]")
+    assert run()["broken_references"] == []
+    assert calls == [tmp_path / "docs" / "later.md"]
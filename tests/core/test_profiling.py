@@ -0,0 +1,67 @@
+"""Span accounting behind ``ontos --profile``."""
+
+import time
+
+import pytest
+
+from ontos.core import profiling
+from ontos.core.profiling import profile_report, profiled, span, start_profiling, stop_profiling
+
+
+@pytest.fixture(autouse=True)
+def _no_leaked_recorder():
+    yield
+    stop_profiling()
+
+
+def _by_name(report):
+    return {entry["name"]: entry for entry in report["spans"]}
+
+
+def test_spans_are_noops_without_a_recorder():
+    assert span("scan") is span("parse")
+    with span("scan"):
+        pass
+    assert profile_report() is None
+
+
+def test_nested_spans_split_self_time():
+    @profiled("graph")
+    def graph():
+        time.sleep(0.01)
+
+    start_profiling()
+    with span("validate"):
+        graph()
+        graph()
+        time.sleep(0.01)
+    spans = _by_name(stop_profiling().report())
+
+    assert spans["graph"]["calls"] == 2
+    assert spans["validate"]["calls"] == 1
+    assert spans["validate"]["total_ms"] >= spans["graph"]["total_ms"] + 9
+    assert spans["validate"]["self_ms"] == pytest.approx(
+        spans["validate"]["total_ms"] - spans["graph"]["total_ms"], abs=0.01
+    )
+    assert profiling._recorder is None
+
+
+def test_reentrant_span_is_timed_once():
+    start_profiling()
+    with span("render"):
+        with span("write"):
+            with span("render"):
+                time.sleep(0.01)
+    spans = _by_name(stop_profiling().report())
+
+    assert spans["render"]["calls"] == 2
+    assert spans["render"]["total_ms"] <= spans["write"]["total_ms"] + 1
+    assert spans["render"]["total_ms"] >= spans["write"]["total_ms"]
+    assert spans["write"]["self_ms"] < 1
+    assert spans["render"]["self_ms"] >= 9
+
+
+def test_environment_switch():
+    assert profiling.profiling_requested({"ONTOS_PROFILE": "1"})
+    assert not profiling.profiling_requested({"ONTOS_PROFILE": "off"})
+    assert not profiling.profiling_requested({})
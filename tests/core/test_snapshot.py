@@ -4,6 +4,7 @@ import pytest
 from pathlib import Path
 from ontos.core.snapshot import SnapshotFilters, DocumentSnapshot
 from ontos.core.types import ValidationErrorType
+from ontos.io.parse_cache import MemoryParseCache
 from ontos.io.snapshot import create_snapshot
 
 
@@ -223,6 +224,111 @@ status: active
         assert "unknown" in concept_warnings[0].message
 
 
+    def test_create_snapshot_from_previous_matches_full_rebuild(self, tmp_path):
+        (tmp_path / ".ontos.toml").write_text(
+            "[ontos]\nversion = '3.2'\n\n[validation]\nmax_dependency_depth = 1\n",
+            encoding="utf-8",
+        )
+        docs = tmp_path / "docs"
+        docs.mkdir()
+
+        def write(name, body):
+            (docs / name).write_text(body, encoding="utf-8")
+
+        write("kernel.md", "---\nid: kernel\ntype: kernel\nstatus: active\n---\n")
+        write("strategy.md", "---\nid: strategy\ntype: strategy\nstatus: active\ndepends_on: [kernel]\n---\n")
+        write("product.md", "---\nid: product\ntype: product\nstatus: active\ndepends_on: [strategy, kernal]\nimpacts: [ghost]\n---\n")
+        write("atom.md", "---\nid: atom\ntype: atom\nstatus: active\ndepends_on: [product]\n---\n")
+
+        edits = [
+            lambda: write("atom.md", "---\nid: atom\ntype: atom\nstatus: active\ndepends_on: [product]\n---\nNew body\n"),
+            lambda: write("ghost.md", "---\nid: ghost\ntype: atom\nstatus: draft\n---\n"),
+            lambda: write("kernel.md", "---\nid: kernel\ntype: kernel\nstatus: active\ndepends_on: [atom]\n---\n"),
+            lambda: write("kernel.md", "---\nid: kernel\ntype: kernel\nstatus: active\naliases: [kernal]\n---\n"),
+            lambda: (docs / "strategy.md").unlink(),
+        ]
+
+        def comparable(snapshot):
+            result = snapshot.validation_result
+            return (
+                snapshot.documents,
+                list(snapshot.documents),
+                snapshot.graph.edges,
+                snapshot.graph.reverse_edges,
+                result.errors,
+                result.warnings,
+                result.infos,
+                snapshot.analysis.depths,
+            )
+
+        parse_cache = MemoryParseCache()
+        snapshot = create_snapshot(tmp_path, parse_cache=parse_cache)
+        for edit in edits:
+            edit()
+            snapshot = create_snapshot(
+                tmp_path, parse_cache=parse_cache, previous=snapshot
+            )
+            assert snapshot.analysis.incremental
+            assert comparable(snapshot) == comparable(create_snapshot(tmp_path))
+
+    def test_create_snapshot_resolves_graph_once(self, tmp_path, monkeypatch):
+        import ontos.core.validation as validation_module
+        from ontos.core.graph import build_graph
+
+        (tmp_path / ".ontos.toml").write_text("[ontos]\nversion = '3.2'\n", encoding="utf-8")
+        docs = tmp_path / "docs"
+        docs.mkdir()
+        (docs / "kernel.md").write_text("---\nid: kernel\ntype: kernel\nstatus: active\n---\n")
+        (docs / "atom.md").write_text(
+            "---\nid: atom\ntype: atom\nstatus: active\ndepends_on: [kernel, docs/kernel.md, ghost]\n---\n"
+        )
+
+        resolvers = []
+
+        class CountingResolver(validation_module.DependencyResolver):
+            def __init__(self, *args, **kwargs):
+                resolvers.append(self)
+                super().__init__(*args, **kwargs)
+
+        monkeypatch.setattr(validation_module, "DependencyResolver", CountingResolver)
+        snapshot = create_snapshot(tmp_path)
+
+        assert len(resolvers) == 1
+        assert snapshot.graph is snapshot.analysis.graph
+        expected, _ = build_graph(snapshot.documents, workspace_root=tmp_path)
+        assert snapshot.graph.edges == expected.edges
+        assert snapshot.graph.reverse_edges == expected.reverse_edges
+        assert snapshot.analysis.depths == {"kernel": 0, "atom": 1}
+
+    def test_analyze_accepts_prebuilt_graph(self, tmp_path):
+        from ontos.core.graph import build_graph
+        from ontos.core.validation import ValidationOrchestrator
+
+        (tmp_path / ".ontos.toml").write_text("[ontos]\nversion = '3.2'\n", encoding="utf-8")
+        docs = tmp_path / "docs"
+        docs.mkdir()
+        (docs / "kernel.md").write_text("---\nid: kernel\ntype: kernel\nstatus: active\n---\n")
+        (docs / "atom.md").write_text(
+            "---\nid: atom\ntype: atom\nstatus: active\ndepends_on: [kernel, kernal]\n---\n"
+        )
+        documents = create_snapshot(tmp_path).documents
+
+        plain = ValidationOrchestrator(documents, workspace_root=tmp_path).analyze()
+        prebuilt = build_graph(documents, workspace_root=tmp_path)
+        reused = ValidationOrchestrator(documents, workspace_root=tmp_path).analyze(
+            prebuilt_graph=prebuilt
+        )
+
+        assert reused.graph is prebuilt[0]
+        assert reused.link_findings == plain.link_findings
+        assert (reused.cycles, reused.orphans, reused.depths) == (
+            plain.cycles,
+            plain.orphans,
+            plain.depths,
+        )
+        assert reused.result.errors == plain.result.errors
+        assert reused.result.warnings == plain.result.warnings
+
 class TestSnapshotProperties:
     """Tests for DocumentSnapshot properties."""
 
@@ -0,0 +1,45 @@
+"""Content-addressed memo of link-check body scan results."""
+
+import json
+
+import ontos
+from ontos.io.body_scan_cache import BODY_SCAN_CACHE_FILENAME, BodyScanCache
+from ontos.io.parse_cache import CACHE_RELATIVE_DIR
+
+
+RECORD = [3, 5, 9, "normal_text", "bare_id_token", "beta", "beta"]
+
+
+def test_memo_round_trips_by_signature_and_body(tmp_path):
+    cache = BodyScanCache.for_workspace(tmp_path)
+    assert cache.lookup("sig", "See [[beta]].") is None
+    cache.store("sig", "See [[beta]].", [RECORD])
+    cache.store("sig", "No refs.", [])
+    assert cache.save() is True
+
+    reloaded = BodyScanCache.for_workspace(tmp_path)
+    assert reloaded.lookup("sig", "See [[beta]].") == [RECORD]
+    assert reloaded.lookup("sig", "No refs.") == []
+    assert reloaded.lookup("other", "See [[beta]].") is None
+    assert reloaded.lookup("sig", "See [[gamma]].") is None
+    assert reloaded.stats["hits"] == 2
+    assert reloaded.stats["misses"] == 2
+
+
+def test_save_prunes_unused_entries_and_ignores_foreign_versions(tmp_path):
+    first = BodyScanCache.for_workspace(tmp_path)
+    first.store("sig", "kept", [])
+    first.store("sig", "dropped", [])
+    first.save()
+
+    second = BodyScanCache.for_workspace(tmp_path)
+    assert second.lookup("sig", "kept") == []
+    assert second.save() is True
+    assert BodyScanCache.for_workspace(tmp_path).lookup("sig", "dropped") is None
+
+    cache_file = tmp_path / CACHE_RELATIVE_DIR / BODY_SCAN_CACHE_FILENAME
+    payload = json.loads(cache_file.read_text(encoding="utf-8"))
+    assert payload["ontos_version"] == ontos.__version__
+    payload["ontos_version"] = "0.0.0"
+    cache_file.write_text(json.dumps(payload), encoding="utf-8")
+    assert BodyScanCache.for_workspace(tmp_path).lookup("sig", "kept") is None
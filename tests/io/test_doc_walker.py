@@ -0,0 +1,120 @@
+"""Parity tests for the scandir-based markdown walker behind scan_documents."""
+
+import os
+from fnmatch import fnmatch
+from pathlib import Path
+
+import pytest
+
+from ontos.io import doc_walker
+from ontos.io.files import scan_documents
+
+
+def _rglob_scan(dirs, skip_patterns, workspace_root=None, exclude_transient=False):
+    """The pre-walker implementation, kept verbatim as the reference."""
+    results = set()
+    workspace_resolved = workspace_root.resolve() if workspace_root is not None else None
+    for dir_path in dirs:
+        if not dir_path.exists():
+            continue
+        for md_file in dir_path.rglob("*.md"):
+            name = md_file.name
+            if exclude_transient and (
+                name.startswith(".") or name.startswith("#") or name.endswith("~")
+            ):
+                continue
+            path_str = str(md_file)
+            if any(fnmatch(path_str, p) or md_file.match(p) for p in skip_patterns):
+                continue
+            resolved = md_file.resolve()
+            if workspace_resolved is not None and not resolved.is_relative_to(workspace_resolved):
+                continue
+            results.add(resolved)
+    return sorted(results)
+
+
+def _touch(path: Path) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text("# x\n", encoding="utf-8")
+
+
+@pytest.fixture
+def tree(tmp_path):
+    root = tmp_path / "repo"
+    for rel in [
+        "docs/a.md",
+        "docs/_template.md",
+        "docs/notes.txt",
+        "docs/.hidden.md",
+        "docs/#draft.md",
+        "docs/backup.md~",
+        "docs/archive/old.md",
+        "docs/archive/deeper/older.md",
+        "docs/node_modules/pkg/readme.md",
+        "docs/node_modules/top.md",
+        "docs/vendor/lib/guide.md",
+        "docs/vendor/lib/nested/more.md",
+        "docs/sub/UPPER.MD",
+        "docs/sub/plain.md",
+        ".git/info.md",
+    ]:
+        _touch(root / rel)
+    (root / "docs" / "dir.md").mkdir()
+    outside = tmp_path / "outside"
+    _touch(outside / "external.md")
+    try:
+        (root / "docs" / "linked").symlink_to(outside, target_is_directory=True)
+        (root / "docs" / "link.md").symlink_to(outside / "external.md")
+    except (OSError, NotImplementedError):
+        pass
+    return root
+
+
+@pytest.mark.parametrize(
+    "skip_patterns",
+    [
+        [],
+        ["_template.md", "archive/*", ".git/*", "node_modules/*", "__pycache__/*"],
+        ["*/vendor/*", "*/node_modules/*"],
+        ["*vendor*.md", "sub/*.md"],
+        ["**/archive/**", "*.MD"],
+        ["docs/sub/plain.md", "[ab].md"],
+    ],
+)
+@pytest.mark.parametrize("exclude_transient", [False, True])
+def test_walker_matches_rglob_scanner(tree, skip_patterns, exclude_transient):
+    dirs = [tree / "docs", tree / "missing", tree]
+
+    expected = _rglob_scan(dirs, skip_patterns, tree, exclude_transient)
+    actual = scan_documents(
+        dirs,
+        skip_patterns=skip_patterns,
+        workspace_root=tree,
+        exclude_transient=exclude_transient,
+    )
+
+    assert actual == expected
+
+
+def test_relative_root_matches_rglob_scanner(tree, monkeypatch):
+    monkeypatch.chdir(tree)
+    for patterns in (["docs/archive/*"], ["*/vendor/*"]):
+        assert scan_documents([Path(".")], skip_patterns=patterns) == _rglob_scan(
+            [Path(".")], patterns
+        )
+
+
+def test_subtree_patterns_prune_directories(tree, monkeypatch):
+    visited = []
+    real_scandir = os.scandir
+
+    def recording_scandir(path):
+        visited.append(os.path.basename(path))
+        return real_scandir(path)
+
+    monkeypatch.setattr(doc_walker.os, "scandir", recording_scandir)
+    scan_documents([tree / "docs"], skip_patterns=["*/vendor/*", "*/node_modules/*"])
+
+    assert "vendor" not in visited
+    assert "node_modules" not in visited
+    assert "archive" in visited
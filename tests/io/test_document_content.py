@@ -0,0 +1,56 @@
+"""Lazy document bodies: byte-range refs recorded at load time."""
+
+import pytest
+
+from ontos.core.content_hash import compute_content_hash
+from ontos.io import files as files_module
+from ontos.io.files import (
+    DocumentChangedError,
+    document_content_hash,
+    document_content_length,
+    load_documents,
+    read_document_content,
+)
+from ontos.io.yaml import parse_frontmatter_content
+
+
+def _load(path):
+    result = load_documents([path], parse_frontmatter_content)
+    return next(iter(result.documents.values()))
+
+
+def test_stripped_body_is_read_back_from_its_byte_range(tmp_path):
+    path = tmp_path / "note.md"
+    path.write_text("---\nid: note\ntype: atom\nstatus: active\n---\nCafé body.\n", encoding="utf-8")
+    doc = _load(path)
+    body = doc.content
+    assert doc.content_ref.content_hash == compute_content_hash(body)
+
+    doc.content = ""
+    assert document_content_hash(doc) == compute_content_hash(body)
+    assert document_content_length(doc) == len(body) < doc.content_ref.length
+    assert read_document_content(doc) == body
+
+
+def test_edit_after_load_is_reported_not_served(tmp_path):
+    path = tmp_path / "note.md"
+    path.write_text("---\nid: note\ntype: atom\nstatus: active\n---\nOriginal body.\n", encoding="utf-8")
+    doc = _load(path)
+    doc.content = ""
+
+    path.write_text("---\nid: note\ntype: atom\nstatus: active\n---\nEdited body!!\n", encoding="utf-8")
+    with pytest.raises(DocumentChangedError):
+        read_document_content(doc)
+    path.unlink()
+    with pytest.raises(DocumentChangedError):
+        read_document_content(doc)
+
+
+def test_content_hash_is_recorded_at_load_time(tmp_path, monkeypatch):
+    path = tmp_path / "note.md"
+    path.write_text("---\nid: note\ntype: atom\nstatus: active\n---\nBody.\n", encoding="utf-8")
+    doc = _load(path)
+    expected = compute_content_hash(doc.content)
+
+    monkeypatch.setattr(files_module, "compute_content_hash", None)
+    assert document_content_hash(doc) == expected
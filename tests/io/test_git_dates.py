@@ -0,0 +1,83 @@
+"""Bulk git last-commit dates used by staleness checks."""
+
+import os
+import shutil
+import subprocess
+from pathlib import Path
+
+import pytest
+
+from ontos.io import git_dates
+from ontos.io.git import get_file_mtime
+from ontos.io.git_dates import GIT_DATES_CACHE_FILENAME, git_date_provider, load_git_date_index
+
+
+pytestmark = pytest.mark.skipif(shutil.which("git") is None, reason="git not installed")
+
+
+def _git(root: Path, *args: str, date: str = "") -> None:
+    env = dict(os.environ)
+    env.update(
+        GIT_AUTHOR_NAME="t",
+        GIT_AUTHOR_EMAIL="t@example.com",
+        GIT_COMMITTER_NAME="t",
+        GIT_COMMITTER_EMAIL="t@example.com",
+    )
+    if date:
+        env.update(GIT_AUTHOR_DATE=date, GIT_COMMITTER_DATE=date)
+    subprocess.run(["git", "-C", str(root), *args], check=True, capture_output=True, env=env)
+
+
+def _commit(root: Path, files: dict, date: str) -> None:
+    for rel, text in files.items():
+        path = root / rel
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(text, encoding="utf-8")
+    _git(root, "add", "-A")
+    _git(root, "commit", "-q", "-m", f"at {date}", date=date)
+
+
+@pytest.fixture
+def repo(tmp_path):
+    root = tmp_path / "repo"
+    root.mkdir()
+    _git(root, "init", "-q")
+    _commit(root, {"docs/a.md": "a1", "docs/b.md": "b1", "docs/sp ace.md": "s"}, "2024-01-01T10:00:00+00:00")
+    _commit(root, {"docs/a.md": "a2"}, "2024-03-01T10:00:00+02:00")
+    _git(root, "mv", "docs/b.md", "docs/renamed.md")
+    _commit(root, {"src/x.py": "x"}, "2024-05-01T10:00:00+00:00")
+    (root / "docs/untracked.md").write_text("u", encoding="utf-8")
+    return root
+
+
+def test_index_matches_per_file_git_log(repo, monkeypatch):
+    monkeypatch.chdir(repo)
+    index = load_git_date_index(repo)
+
+    for rel in ["docs/a.md", "docs/renamed.md", "docs/sp ace.md", "src/x.py", "docs/untracked.md"]:
+        assert index(Path(rel)) == get_file_mtime(Path(rel)), rel
+        assert index(repo / rel) == get_file_mtime(Path(rel)), rel
+    assert index(Path("docs/untracked.md")) is None
+    assert index(repo.parent / "elsewhere.md") is None
+
+
+def test_unchanged_head_reuses_disk_cache(repo, monkeypatch):
+    load_git_date_index(repo)
+    assert (repo / ".ontos" / "cache" / GIT_DATES_CACHE_FILENAME).exists()
+
+    def no_walk(*args, **kwargs):
+        raise AssertionError("history walked despite a warm cache")
+
+    monkeypatch.setattr(git_dates, "_tree_paths", no_walk)
+    monkeypatch.setattr(git_dates, "_last_commit_dates", no_walk)
+    index = load_git_date_index(repo)
+    assert index(repo / "docs/a.md").isoformat() == "2024-03-01T10:00:00+02:00"
+
+    monkeypatch.undo()
+    _commit(repo, {"docs/a.md": "a3"}, "2024-06-01T10:00:00+00:00")
+    index = load_git_date_index(repo)
+    assert index(repo / "docs/a.md").isoformat() == "2024-06-01T10:00:00+00:00"
+
+
+def test_provider_falls_back_outside_a_repository(tmp_path):
+    assert git_date_provider(tmp_path) is get_file_mtime
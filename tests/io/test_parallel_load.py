@@ -0,0 +1,86 @@
+"""Parity tests for the process-pool backend of load_documents."""
+
+from dataclasses import asdict
+from pathlib import Path
+
+import pytest
+
+from ontos.io import files as files_module
+from ontos.io.files import load_documents, resolve_worker_count
+from ontos.io.parse_cache import DocumentParseCache
+from ontos.io.yaml import parse_frontmatter_content
+
+
+def _corpus(root: Path) -> list:
+    docs = root / "docs"
+    docs.mkdir()
+    paths = []
+    for index in range(40):
+        path = docs / f"doc_{index:02d}.md"
+        path.write_text(
+            f"---\nid: doc_{index % 30}\ntype: {'atom' if index % 7 else 'nonsense'}\n"
+            f"status: active\ndepends_on: [doc_{(index + 1) % 30}]\n---\nBody {index}\n",
+            encoding="utf-8",
+        )
+        paths.append(path)
+    (docs / "broken.md").write_text("---\nid: [unterminated\n---\n", encoding="utf-8")
+    (docs / "_template.md").write_text("---\ntype: atom\n---\n", encoding="utf-8")
+    paths += [docs / "broken.md", docs / "_template.md", docs / "missing.md"]
+    return paths
+
+
+def _render(result):
+    return (
+        [(doc_id, asdict(doc)) for doc_id, doc in result.documents.items()],
+        [vars(issue) for issue in result.issues],
+        result.duplicate_ids,
+    )
+
+
+@pytest.fixture
+def parallel_threshold(monkeypatch):
+    monkeypatch.setattr(files_module, "_PARALLEL_MIN_PATHS", 0)
+
+
+def test_parallel_load_is_identical_to_serial(tmp_path, parallel_threshold):
+    paths = _corpus(tmp_path)
+    serial = load_documents(paths, parse_frontmatter_content)
+    parallel = load_documents(list(reversed(paths)), parse_frontmatter_content, workers=2)
+
+    assert _render(parallel) == _render(serial)
+    assert serial.duplicate_ids
+    assert {issue.code for issue in serial.issues} >= {
+        "duplicate_id",
+        "invalid_enum",
+        "parse_error",
+        "io_error",
+    }
+
+
+def test_parallel_load_populates_parse_cache(tmp_path, parallel_threshold):
+    paths = _corpus(tmp_path)
+    cache = DocumentParseCache.for_workspace(tmp_path)
+    first = load_documents(paths, parse_frontmatter_content, parse_cache=cache, workers=2)
+    cache.save()
+
+    warm = DocumentParseCache.for_workspace(tmp_path)
+    second = load_documents(paths, parse_frontmatter_content, parse_cache=warm, workers=2)
+    assert _render(second) == _render(first)
+    # Freshly written files are racily clean, so they are verified by hash.
+    assert warm.stats["hash_hits"] + warm.stats["hits"] == len(paths) - 2
+
+
+def test_unpicklable_parser_falls_back_to_serial(tmp_path, parallel_threshold):
+    paths = _corpus(tmp_path)
+    parser = lambda content: parse_frontmatter_content(content)  # noqa: E731
+
+    assert _render(load_documents(paths, parser, workers=2)) == _render(
+        load_documents(paths, parse_frontmatter_content)
+    )
+
+
+def test_resolve_worker_count():
+    assert resolve_worker_count(None) == 1
+    assert resolve_worker_count(-3) == 1
+    assert resolve_worker_count(4) == 4
+    assert resolve_worker_count(0) >= 1
@@ -0,0 +1,186 @@
+"""Tests for the persistent on-disk parse cache used by load_documents."""
+
+import json
+import os
+from dataclasses import asdict
+from pathlib import Path
+
+import pytest
+
+import ontos
+from ontos.io import files as files_module
+from ontos.io.files import load_documents
+from ontos.io.parse_cache import DocumentParseCache, write_cache_file
+from ontos.io.yaml import parse_frontmatter_content
+
+
+def _write(path: Path, text: str, *, age_seconds: int = 60) -> Path:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(text, encoding="utf-8")
+    # Age the file past the racy window so stat-only hits are trusted.
+    stamp = path.stat().st_mtime - age_seconds
+    os.utime(path, (stamp, stamp))
+    return path
+
+
+def _corpus(root: Path) -> list:
+    return [
+        _write(
+            root / "docs" / "a.md",
+            "---\nid: a\ntype: atom\nstatus: active\ndate: 2024-01-02\n"
+            "tags: [x, y]\nextra: {1: one}\n---\nBody A\n",
+        ),
+        _write(
+            root / "docs" / "b.md",
+            "---\nid: b\ntype: bogus\nstatus: draft\ndepends_on: [a]\n---\nBody B\n",
+        ),
+        _write(root / "docs" / "README.md", "# Readme\n"),
+        _write(root / "docs" / "dup.md", "---\nid: a\ntype: atom\n---\n"),
+    ]
+
+
+def _load(paths, cache=None):
+    return load_documents(paths, parse_frontmatter_content, parse_cache=cache)
+
+
+def _snapshot(result):
+    return (
+        {doc_id: asdict(doc) for doc_id, doc in result.documents.items()},
+        [vars(issue) for issue in result.issues],
+        result.duplicate_ids,
+    )
+
+
+def test_cached_load_matches_uncached_and_skips_reads(tmp_path, monkeypatch):
+    paths = _corpus(tmp_path)
+    expected = _snapshot(_load(paths))
+
+    cache = DocumentParseCache.for_workspace(tmp_path)
+    assert _snapshot(_load(paths, cache)) == expected
+    assert cache.save() is True
+    assert (tmp_path / ".ontos" / "cache" / ".gitignore").exists()
+
+    def fail_parse(*args, **kwargs):
+        raise AssertionError("unchanged file was re-parsed")
+
+    monkeypatch.setattr(files_module, "_parse_document_bytes", fail_parse)
+    monkeypatch.setattr(Path, "read_bytes", lambda self: pytest.fail(f"read {self}"))
+
+    warm = DocumentParseCache.for_workspace(tmp_path)
+    assert _snapshot(_load(paths, warm)) == expected
+    assert warm.stats["hits"] == len(paths)
+    assert warm.save() is False
+
+
+def test_cached_documents_share_interned_ids(tmp_path):
+    paths = _corpus(tmp_path)
+    cache = DocumentParseCache.for_workspace(tmp_path)
+    _load(paths, cache)
+    cache.save()
+
+    for loaded in (_load(paths), _load(paths, DocumentParseCache.for_workspace(tmp_path))):
+        doc_a, doc_b = loaded.documents["a"], loaded.documents["b"]
+        assert doc_b.depends_on[0] is doc_a.id
+        assert next(key for key in doc_a.frontmatter if key == "status") is next(
+            key for key in doc_b.frontmatter if key == "status"
+        )
+
+
+def test_changed_file_is_reparsed(tmp_path):
+    paths = _corpus(tmp_path)
+    cache = DocumentParseCache.for_workspace(tmp_path)
+    _load(paths, cache)
+    cache.save()
+
+    _write(tmp_path / "docs" / "b.md", "---\nid: b\ntype: atom\nstatus: active\n---\nNew\n")
+
+    warm = DocumentParseCache.for_workspace(tmp_path)
+    result = _load(paths, warm)
+    assert result.documents["b"].content == "New\n"
+    assert not [issue for issue in result.issues if issue.code == "invalid_enum"]
+    assert warm.stats["misses"] == 1
+
+
+def test_touched_file_with_same_bytes_is_a_hash_hit(tmp_path, monkeypatch):
+    paths = _corpus(tmp_path)
+    cache = DocumentParseCache.for_workspace(tmp_path)
+    _load(paths, cache)
+    cache.save()
+
+    stamp = paths[0].stat().st_mtime - 30
+    os.utime(paths[0], (stamp, stamp))
+    monkeypatch.setattr(
+        files_module,
+        "_parse_document_bytes",
+        lambda *args: pytest.fail("hash-identical file was re-parsed"),
+    )
+
+    warm = DocumentParseCache.for_workspace(tmp_path)
+    _load(paths, warm)
+    assert warm.stats["hash_hits"] == 1
+    assert warm.save() is True  # refreshed fingerprint is persisted
+
+
+def test_version_stamp_mismatch_discards_cache(tmp_path, monkeypatch):
+    paths = _corpus(tmp_path)
+    cache = DocumentParseCache.for_workspace(tmp_path)
+    _load(paths, cache)
+    cache.save()
+
+    monkeypatch.setattr(ontos, "__version__", "999.0.0")
+    stale = DocumentParseCache.for_workspace(tmp_path)
+    _load(paths, stale)
+    assert stale.stats["hits"] == 0
+    assert stale.stats["misses"] == len(paths)
+
+
+def test_corrupt_cache_file_is_ignored(tmp_path):
+    paths = _corpus(tmp_path)
+    cache_file = tmp_path / ".ontos" / "cache" / "documents.json"
+    cache_file.parent.mkdir(parents=True)
+    cache_file.write_text("{not json", encoding="utf-8")
+
+    cache = DocumentParseCache.for_workspace(tmp_path)
+    assert _snapshot(_load(paths, cache)) == _snapshot(_load(paths))
+    assert cache.save() is True
+    assert json.loads(cache_file.read_text(encoding="utf-8"))["ontos_version"] == ontos.__version__
+
+
+def test_recently_modified_file_is_verified_by_hash(tmp_path):
+    path = _write(tmp_path / "docs" / "fresh.md", "---\nid: fresh\n---\nv1\n", age_seconds=0)
+    cache = DocumentParseCache.for_workspace(tmp_path)
+    _load([path], cache)
+    cache.save()
+
+    # Same size, same mtime, different bytes: only the hash can tell.
+    stat_before = path.stat()
+    path.write_text("---\nid: fresh\n---\nv2\n", encoding="utf-8")
+    os.utime(path, ns=(stat_before.st_atime_ns, stat_before.st_mtime_ns))
+
+    warm = DocumentParseCache.for_workspace(tmp_path)
+    assert _load([path], warm).documents["fresh"].content == "v2\n"
+
+
+@pytest.mark.skipif(not hasattr(os, "symlink"), reason="symlinks unavailable")
+def test_symlinked_ontos_dir_creates_nothing_outside_workspace(tmp_path):
+    workspace = tmp_path / "ws"
+    outside = tmp_path / "outside"
+    workspace.mkdir()
+    outside.mkdir()
+    (workspace / ".ontos").symlink_to(outside, target_is_directory=True)
+    cache_file = workspace / ".ontos" / "cache" / "documents.json"
+
+    assert write_cache_file(cache_file, {"entries": {}}, workspace_root=workspace) is False
+    assert list(outside.iterdir()) == []
+
+    # An existing cache/ reached through the symlink is refused as well.
+    (outside / "cache").mkdir()
+    assert write_cache_file(cache_file, {"entries": {}}, workspace_root=workspace) is False
+    assert list((outside / "cache").iterdir()) == []
+
+
+def test_cache_dir_is_created_inside_workspace(tmp_path):
+    cache_file = tmp_path / ".ontos" / "cache" / "documents.json"
+
+    assert write_cache_file(cache_file, {"entries": {}}, workspace_root=tmp_path) is True
+    assert json.loads(cache_file.read_text(encoding="utf-8")) == {"entries": {}}
@@ -0,0 +1,53 @@
+"""Persisted token index used to narrow rename planning."""
+
+import os
+from pathlib import Path
+
+from ontos.io.parse_cache import CACHE_RELATIVE_DIR
+from ontos.io.reference_index import (
+    REFERENCE_INDEX_FILENAME,
+    load_reference_index,
+    reference_tokens,
+)
+
+
+def _age(path: Path) -> None:
+    # Step outside the racy window so stat fingerprints are trusted.
+    stat_result = path.stat()
+    old = stat_result.st_mtime_ns - 10_000_000_000
+    os.utime(path, ns=(old, old))
+
+
+def test_reference_tokens_keep_ids_inside_longer_runs():
+    tokens = reference_tokens("See [x](old_id.md), `old_id`, [[old_id|Alias]] and old_id_v2.\n")
+    assert "old_id.md" in tokens
+    assert "old_id" in tokens
+    assert "old_id_v2." in tokens
+    assert "[[" not in "".join(tokens)
+
+
+def test_candidates_are_a_superset_and_refresh_by_content(tmp_path):
+    docs = tmp_path / "docs"
+    docs.mkdir()
+    a = docs / "a.md"
+    b = docs / "b.md"
+    c = docs / "c.md"
+    a.write_text("---\nid: a\n---\nSee [target](target.md).\n", encoding="utf-8")
+    b.write_text("---\nid: b\ndepends_on: [target]\n---\n", encoding="utf-8")
+    c.write_text("---\nid: c\n---\nNothing here.\n", encoding="utf-8")
+    for path in (a, b, c):
+        _age(path)
+
+    index = load_reference_index(tmp_path, [a, b, c])
+    assert index.candidates("target") == {a, b}
+    assert index.rescanned == 3
+    assert (tmp_path / CACHE_RELATIVE_DIR / REFERENCE_INDEX_FILENAME).exists()
+
+    index = load_reference_index(tmp_path, [a, b, c])
+    assert (index.reused, index.rescanned) == (3, 0)
+
+    c.write_text("---\nid: c\n---\nNow mentions target.\n", encoding="utf-8")
+    _age(c)
+    index = load_reference_index(tmp_path, [a, b, c])
+    assert (index.reused, index.rescanned) == (2, 1)
+    assert index.candidates("target") == {a, b, c}
@@ -106,6 +106,42 @@ def test_build_context_bundle_greedy_packing_excludes_over_budget_docs(tmp_path)
     assert payload["excluded_count"] >= 1
 
 
+def test_build_context_bundle_reads_only_packed_bodies_from_a_lazy_snapshot(tmp_path, monkeypatch):
+    import ontos.mcp.bundler as bundler_module
+
+    root = create_workspace(tmp_path)
+    write_file(
+        root / "docs/heavy.md",
+        f"""
+        ---
+        id: heavy_doc
+        type: reference
+        status: active
+        depends_on: [kernel_doc]
+        ---
+        {"café " * 2000}
+        """,
+    )
+    eager = create_snapshot(root=root, include_content=True, filters=None, git_commit_provider=None, scope=None)
+    lazy = create_snapshot(root=root, lazy_content=True)
+    expected = build_context_bundle(eager, root, "workspace", token_budget=1024)
+
+    read_ids = []
+    real_read = bundler_module.read_document_content
+
+    def recording_read(doc):
+        read_ids.append(doc.id)
+        return real_read(doc)
+
+    monkeypatch.setattr(bundler_module, "read_document_content", recording_read)
+    # An edit to a document the budget drops must not fail the bundle.
+    write_file(root / "docs/heavy.md", "edited after the snapshot\n")
+
+    assert build_context_bundle(lazy, root, "workspace", token_budget=1024) == expected
+    assert "heavy_doc" not in read_ids
+    assert sorted(read_ids) == sorted(item["id"] for item in expected["included_documents"])
+
+
 def test_build_context_bundle_empty_workspace(tmp_path):
     root = create_empty_workspace(tmp_path)
     snapshot = create_snapshot(root=root, include_content=True, filters=None, git_commit_provider=None, scope=None)
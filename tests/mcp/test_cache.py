@@ -3,7 +3,12 @@ from concurrent.futures import ThreadPoolExecutor
 import pytest
 
 from ontos.core.types import ValidationErrorType
+from ontos.io import files as files_module
+from ontos.io.config import load_project_config
+from ontos.io.parse_cache import MemoryParseCache
+from ontos.io.snapshot import create_snapshot
 from ontos.mcp import tools
+from ontos.mcp.cache import SnapshotCache
 from tests.mcp_helpers import build_cache, create_workspace, write_file
 
 
@@ -222,6 +227,102 @@ def test_cache_refreshes_when_concept_vocabulary_appears_or_changes(tmp_path):
     assert tools.context_map(cache, compact="full")["validation"]["warnings"] == []
 
 
+
+def test_cache_rebuild_reparses_only_changed_documents(tmp_path, monkeypatch):
+    root = create_workspace(tmp_path)
+    cache = build_cache(root)
+
+    parsed = []
+    original_parse = files_module._parse_document_bytes
+
+    def counting_parse(path, raw_bytes, parser):
+        parsed.append(path.name)
+        return original_parse(path, raw_bytes, parser)
+
+    monkeypatch.setattr(files_module, "_parse_document_bytes", counting_parse)
+    atom = root / "docs/atom.md"
+    atom.write_text(
+        atom.read_text(encoding="utf-8").replace("Atom body", "Atom edited"),
+        encoding="utf-8",
+    )
+    cache.get_fresh_snapshot()
+
+    assert parsed == ["atom.md"]
+    assert cache.snapshot.analysis.incremental
+    assert "Atom edited" in cache.snapshot.documents["atom_doc"].content
+
+
+def test_derived_payloads_are_memoized_per_revision(tmp_path, monkeypatch):
+    root = create_workspace(tmp_path)
+    cache = build_cache(root)
+
+    calls = []
+    original_generate = tools.generate_context_map
+
+    def counting_generate(*args, **kwargs):
+        calls.append(kwargs)
+        return original_generate(*args, **kwargs)
+
+    monkeypatch.setattr(tools, "generate_context_map", counting_generate)
+    first = tools.context_map(cache.get_fresh_view(), compact="tiered")
+    assert tools.context_map(cache.get_fresh_view(), compact="tiered") is first
+    tools.context_map(cache.get_fresh_view(), compact="basic")
+    overview = tools.workspace_overview(cache.current_view())
+    assert tools.workspace_overview(cache.current_view()) is overview
+    summary = tools.export_graph(cache.current_view())
+    assert tools.export_graph(cache.current_view()) is summary
+    assert len(calls) == 2
+
+    atom = root / "docs/atom.md"
+    atom.write_text(
+        atom.read_text(encoding="utf-8").replace("Atom body", "Atom edited"),
+        encoding="utf-8",
+    )
+    rebuilt = tools.context_map(cache.get_fresh_view(), compact="tiered")
+    assert cache.snapshot_revision == 2
+    assert rebuilt is not first
+    assert len(calls) == 3
+    assert len(cache.derived) == 1
+
+
+def test_incremental_rebuilds_match_full_rebuilds(tmp_path):
+    root = create_workspace(tmp_path)
+    config = load_project_config(config_path=root / ".ontos.toml", repo_root=root)
+    parse_cache = MemoryParseCache()
+    snapshot = create_snapshot(root, parse_cache=parse_cache)
+    cache = SnapshotCache(
+        root,
+        config,
+        snapshot,
+        parse_cache=parse_cache,
+        verify_incremental=True,
+    )
+
+    edits = [
+        ("docs/added.md", "---\nid: added_doc\ntype: atom\nstatus: active\ndepends_on: [kernel_dco]\n---\n"),
+        ("docs/kernel.md", "---\nid: kernel_doc\ntype: kernel\nstatus: active\ndepends_on: [added_doc]\n---\nKernel body.\n"),
+        ("docs/added.md", "---\nid: added_doc\ntype: atom\nstatus: active\n---\n"),
+    ]
+    for rel_path, text in edits:
+        write_file(root / rel_path, text)
+        cache.get_fresh_snapshot()
+        assert cache.snapshot.analysis.incremental
+    (root / "docs/added.md").unlink()
+    cache.get_fresh_snapshot()
+
+    assert cache.snapshot_revision == 5
+    assert cache.incremental_mismatches == 0
+
+
+def test_force_refresh_rebuilds_from_scratch(tmp_path):
+    root = create_workspace(tmp_path)
+    cache = build_cache(root)
+
+    cache.force_refresh()
+
+    assert cache.snapshot_revision == 2
+    assert not cache.snapshot.analysis.incremental
+
 def _curation_warning_count(cache) -> int:
     return sum(
         warning.error_type == ValidationErrorType.CURATION
@@ -1,8 +1,14 @@
+from datetime import datetime, timezone
+
 import pytest
 
 from ontos.commands.map import CompactMode, GenerateMapOptions, generate_context_map
 from ontos.core.types import ValidationErrorType
+from ontos.io.config import load_project_config
+from ontos.io.parse_cache import MemoryParseCache
+from ontos.io.snapshot import create_snapshot
 from ontos.mcp import tools
+from ontos.mcp.cache import SnapshotCache
 
 from tests.mcp_helpers import (
     build_cache,
@@ -96,3 +102,35 @@ def test_context_map_honors_snapshot_dependency_depth(
 
     assert len(snapshot_depth) == expected_depth_warnings
     assert len(map_depth) == expected_depth_warnings
+
+
+def test_context_map_lazy_snapshot_renders_log_body_summaries(tmp_path):
+    root = create_workspace(tmp_path)
+    write_file(
+        root / "docs/logs/2026-01-02_flux.md",
+        """
+        ---
+        id: log_flux
+        type: log
+        status: active
+        date: 2026-01-02
+        ---
+        Fixed the flux capacitor wiring today.
+        """,
+    )
+    parse_cache = MemoryParseCache()
+    lazy = SnapshotCache(
+        root,
+        load_project_config(config_path=root / ".ontos.toml", repo_root=root),
+        create_snapshot(root=root, parse_cache=parse_cache, lazy_content=True),
+        started_at=datetime.now(timezone.utc),
+        parse_cache=parse_cache,
+        lazy_content=True,
+    )
+    assert lazy.snapshot.documents["log_flux"].content == ""
+
+    eager_markdown = tools.context_map(build_cache(root), compact="full")["markdown"]
+    lazy_markdown = tools.context_map(lazy, compact="full")["markdown"]
+
+    assert "Fixed the flux capacitor wiring today." in eager_markdown
+    assert lazy_markdown == eager_markdown
@@ -2,7 +2,7 @@ import json
 
 from ontos.mcp import tools
 
-from tests.mcp_helpers import build_cache, create_workspace
+from tests.mcp_helpers import build_cache, create_workspace, write_file
 
 
 def test_export_graph_summary_and_full_payloads(tmp_path):
@@ -36,3 +36,35 @@ def test_export_graph_file_write_takes_precedence(tmp_path):
     }
     written = json.loads(export_path.read_text(encoding="utf-8"))
     assert written["schema_version"] == "ontos-export-v1"
+
+
+def test_export_graph_summary_matches_full_export_without_reading_bodies(tmp_path, monkeypatch):
+    root = create_workspace(tmp_path)
+    write_file(
+        root / "docs/dangling.md",
+        """
+        ---
+        id: dangling_doc
+        type: atom
+        status: draft
+        depends_on: [kernel_doc, missing_doc]
+        ---
+        Dangling body.
+        """,
+    )
+    cache = build_cache(root)
+    full = tools.export_graph(cache, summary_only=False)
+
+    def no_body_reads(*_args, **_kwargs):
+        raise AssertionError("summary export must not touch document bodies")
+
+    monkeypatch.setattr(tools, "_snapshot_to_json", no_body_reads)
+    monkeypatch.setattr(tools, "read_document_content", no_body_reads)
+    summary = tools.export_graph(cache, summary_only=True)
+
+    assert summary["summary"] == full["summary"]
+    assert summary["graph"]["edges"] == full["graph"]["edges"]
+    assert [node["id"] for node in summary["graph"]["nodes"]] == full["graph"]["nodes"]
+    assert {
+        node["id"]: (node["type"], node["status"]) for node in summary["graph"]["nodes"]
+    } == {doc["id"]: (doc["type"], doc["status"]) for doc in full["documents"]}
@@ -0,0 +1,148 @@
+"""Watcher-backed freshness modes for the MCP snapshot cache."""
+
+import time
+
+import pytest
+
+from ontos.io.config import load_project_config
+from ontos.io.snapshot import create_snapshot
+from ontos.mcp import tools
+from ontos.mcp import watcher as watcher_module
+from ontos.mcp.cache import SnapshotCache
+from tests.mcp_helpers import create_workspace, write_file
+
+
+def _watched_cache(root, mode, *, poll_interval=3600.0):
+    config = load_project_config(config_path=root / ".ontos.toml", repo_root=root)
+    return SnapshotCache(
+        root,
+        config,
+        create_snapshot(root),
+        watch=mode,
+        poll_interval=poll_interval,
+    )
+
+
+def _wait_until(predicate, timeout=10.0):
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if predicate():
+            return True
+        time.sleep(0.02)
+    return False
+
+
+def test_idle_fresh_view_does_not_scan_workspace(tmp_path, monkeypatch):
+    root = create_workspace(tmp_path)
+    cache = _watched_cache(root, "poll")
+    try:
+        cache.get_fresh_view()  # drains the initial full check
+
+        monkeypatch.setattr(
+            cache,
+            "_is_stale",
+            lambda _state: pytest.fail("idle check consulted the workspace"),
+        )
+        for _ in range(3):
+            cache.get_fresh_view()
+        assert cache.snapshot_revision == 1
+    finally:
+        cache.close()
+
+
+def test_dirty_paths_are_rechecked_without_full_scan(tmp_path, monkeypatch):
+    root = create_workspace(tmp_path)
+    cache = _watched_cache(root, "poll")
+    try:
+        cache.get_fresh_view()
+        monkeypatch.setattr(
+            cache,
+            "_scan_canonical_document_keys",
+            lambda: pytest.fail("tracked edit triggered a full rescan"),
+        )
+
+        atom = root / "docs/atom.md"
+        atom.write_text(
+            atom.read_text(encoding="utf-8").replace("Atom body", "Atom watched"),
+            encoding="utf-8",
+        )
+        cache._changes.add(str(root / "src/untracked.txt"))
+        cache.get_fresh_view()
+        assert cache.snapshot_revision == 1
+
+        cache._changes.add(str(atom))
+        snapshot = cache.get_fresh_snapshot()
+        assert cache.snapshot_revision == 2
+        assert "Atom watched" in snapshot.documents["atom_doc"].content
+    finally:
+        cache.close()
+
+
+def test_poll_mode_picks_up_new_documents_and_reports_mode(tmp_path):
+    root = create_workspace(tmp_path)
+    cache = _watched_cache(root, "poll", poll_interval=0.05)
+    try:
+        cache.get_fresh_view()
+        assert tools.health(cache)["freshness_mode"] == "filesystem-poll"
+
+        write_file(root / "docs/polled.md", """
+        ---
+        id: polled_doc
+        type: atom
+        status: active
+        ---
+        Polled.
+        """)
+        assert _wait_until(lambda: cache._changes.pending)
+        assert "polled_doc" in cache.get_fresh_snapshot().documents
+    finally:
+        cache.close()
+
+
+def test_watch_mode_falls_back_to_polling_without_watchdog(tmp_path, monkeypatch):
+    monkeypatch.setattr(watcher_module, "Observer", None)
+    root = create_workspace(tmp_path)
+    cache = _watched_cache(root, "watch")
+    try:
+        assert cache.freshness_mode == "filesystem-poll"
+    finally:
+        cache.close()
+
+
+def test_watch_mode_uses_filesystem_events(tmp_path):
+    pytest.importorskip("watchdog")
+    root = create_workspace(tmp_path)
+    cache = _watched_cache(root, "watch")
+    try:
+        if cache.freshness_mode != "filesystem-events":
+            pytest.skip("platform refused a filesystem watch")
+        cache.get_fresh_view()
+
+        write_file(root / "docs/evented.md", """
+        ---
+        id: evented_doc
+        type: atom
+        status: active
+        ---
+        Evented.
+        """)
+        assert _wait_until(lambda: cache._changes.pending)
+        assert "evented_doc" in cache.get_fresh_snapshot().documents
+    finally:
+        cache.close()
+
+
+def test_mark_dirty_forces_full_check(tmp_path):
+    root = create_workspace(tmp_path)
+    cache = _watched_cache(root, "poll")
+    try:
+        cache.get_fresh_view()
+        (root / "docs/atom.md").unlink()
+        cache.get_fresh_view()
+        assert cache.snapshot_revision == 1  # no event delivered yet
+
+        cache.mark_dirty()
+        assert "atom_doc" not in cache.get_fresh_snapshot().documents
+        assert cache.snapshot_revision == 2
+    finally:
+        cache.close()
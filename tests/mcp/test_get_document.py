@@ -1,7 +1,13 @@
+from datetime import datetime, timezone
+
 import pytest
 
 from ontos.core.errors import OntosUserError
+from ontos.io.config import load_project_config
+from ontos.io.parse_cache import MemoryParseCache
+from ontos.io.snapshot import create_snapshot
 from ontos.mcp import tools
+from ontos.mcp.cache import SnapshotCache
 
 from tests.mcp_helpers import build_cache, create_workspace, invoke_tool
 
@@ -40,3 +46,43 @@ def test_get_document_metadata_only_omits_content_through_wrapper(tmp_path):
 
     assert result.isError is False
     assert "content" not in result.structuredContent
+
+
+def _lazy_cache(root):
+    parse_cache = MemoryParseCache()
+    snapshot = create_snapshot(root=root, parse_cache=parse_cache, lazy_content=True)
+    return SnapshotCache(
+        root,
+        load_project_config(config_path=root / ".ontos.toml", repo_root=root),
+        snapshot,
+        started_at=datetime.now(timezone.utc),
+        parse_cache=parse_cache,
+        lazy_content=True,
+    )
+
+
+def test_lazy_snapshot_serves_bodies_from_disk(tmp_path):
+    root = create_workspace(tmp_path)
+    eager = tools.get_document(build_cache(root), document_id="atom_doc")
+    cache = _lazy_cache(root)
+
+    assert all(doc.content == "" for doc in cache.snapshot.documents.values())
+    assert tools.get_document(cache, document_id="atom_doc") == eager
+    assert tools.query(cache, entity_id="atom_doc")["content_hash"] == eager["metadata"]["content_hash"]
+
+
+def test_lazy_body_edited_after_snapshot_is_a_retryable_error(tmp_path):
+    root = create_workspace(tmp_path)
+    cache = _lazy_cache(root)
+    doc = cache.snapshot.documents["atom_doc"]
+    doc.filepath.write_text(
+        doc.filepath.read_text(encoding="utf-8").replace("Atom body", "Atom body, edited"),
+        encoding="utf-8",
+    )
+
+    with pytest.raises(OntosUserError) as excinfo:
+        tools.get_document(cache, document_id="atom_doc")
+    assert excinfo.value.code == "E_DOCUMENT_CHANGED"
+
+    cache.get_fresh_snapshot()
+    assert "edited" in tools.get_document(cache, document_id="atom_doc")["content"]
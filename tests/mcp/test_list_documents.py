@@ -1,6 +1,6 @@
 from ontos.mcp import tools
 
-from tests.mcp_helpers import build_cache, create_workspace
+from tests.mcp_helpers import build_cache, create_workspace, write_file
 
 
 def test_list_documents_filters_sort_and_pagination(tmp_path):
@@ -28,3 +28,43 @@ def test_list_documents_includes_extended_types(tmp_path):
 
     assert "_template" not in ids
     assert {"reference_doc", "concept_doc", "unknown_doc"} <= ids
+
+
+def test_list_documents_filters_match_a_full_scan(tmp_path):
+    root = create_workspace(tmp_path)
+    write_file(
+        root / "docs/tagged.md",
+        """
+        ---
+        id: tagged_doc
+        type: atom
+        status: draft
+        concepts: [caching, graph]
+        ---
+        Tagged body.
+        """,
+    )
+    cache = build_cache(root)
+    rows = cache.canonical_view.list_rows
+    tags = {doc.id: set(doc.tags) for doc in cache.snapshot.documents.values()}
+
+    for type_, status, concept in [
+        ("atom", None, None),
+        (None, "draft", None),
+        ("atom", "active", None),
+        (None, None, "caching"),
+        ("atom", "draft", "graph"),
+        ("kernel", None, "graph"),
+        ("missing", None, None),
+    ]:
+        expected = [
+            row.id for row in rows
+            if (type_ is None or row.type == type_)
+            and (status is None or row.status == status)
+            and (concept is None or concept in tags[row.id])
+        ]
+        payload = tools.list_documents(cache, type=type_, status=status, concept=concept, limit=500)
+        assert [doc["id"] for doc in payload["documents"]] == expected
+        assert payload["total_count"] == len(expected)
+
+    assert tools.list_documents(cache, concept="caching")["documents"][0]["id"] == "tagged_doc"
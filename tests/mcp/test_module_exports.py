@@ -7,7 +7,7 @@ import ontos.mcp.scanner as scanner_module
 
 
 def test_portfolio_module_all_exports_public_surface():
-    assert sorted(portfolio_module.__all__) == ["PortfolioIndex"]
+    assert sorted(portfolio_module.__all__) == ["PortfolioIndex", "RebuildProgress"]
     assert "_sanitize_fts_query" not in portfolio_module.__all__
 
 
@@ -38,6 +38,9 @@ def test_portfolio_config_module_all_exports_public_surface():
             "DEFAULT_BUNDLE_LOG_WINDOW_DAYS",
             "DEFAULT_BUNDLE_MAX_LOGS",
             "DEFAULT_BUNDLE_TOKEN_BUDGET",
+            "DEFAULT_PORTFOLIO_WORKERS",
+            "DEFAULT_WORKSPACE_CACHE_MAX_MB",
+            "DEFAULT_WORKSPACE_CACHE_SIZE",
             "PortfolioConfig",
             "PORTFOLIO_CONFIG_PATH",
             "ensure_portfolio_config",
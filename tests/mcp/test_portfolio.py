@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+from concurrent.futures import Future
 from contextlib import closing
 import sqlite3
 from pathlib import Path
@@ -566,6 +567,363 @@ def test_rebuild_all_discovers_projects_and_handles_slug_collisions(tmp_path):
     assert all(project["doc_count"] == 1 for project in projects)
 
 
+def _document_rowids(db_path: Path, slug: str) -> dict[str, int]:
+    with closing(sqlite3.connect(db_path)) as conn:
+        return dict(
+            conn.execute(
+                "SELECT id, rowid FROM documents WHERE workspace = ?",
+                (slug,),
+            ).fetchall()
+        )
+
+
+def test_rebuild_workspace_rewrites_only_changed_documents(tmp_path):
+    workspace_root = create_workspace(tmp_path)
+    db_path = tmp_path / "portfolio.db"
+    index = PortfolioIndex(db_path)
+    index.rebuild_workspace("workspace", workspace_root)
+    before = _document_rowids(db_path, "workspace")
+
+    write_file(
+        workspace_root / "docs/atom.md",
+        """
+        ---
+        id: atom_doc
+        type: atom
+        status: active
+        depends_on: [product_doc]
+        ---
+        Atom body rewritten incrementally.
+        """,
+    )
+    (workspace_root / "docs/log.md").unlink()
+    index.rebuild_workspace("workspace", workspace_root)
+    after = _document_rowids(db_path, "workspace")
+
+    assert "log_doc" not in after
+    assert after["atom_doc"] != before["atom_doc"]
+    unchanged = set(before) - {"atom_doc", "log_doc"}
+    assert {doc_id: after[doc_id] for doc_id in unchanged} == {
+        doc_id: before[doc_id] for doc_id in unchanged
+    }
+    search = index.search_fts("incrementally", workspace="workspace", offset=0, limit=10)
+    assert [row["doc_id"] for row in search["results"]] == ["atom_doc"]
+    assert index.get_projects()[0]["doc_count"] == len(after)
+
+
+def test_rebuild_all_skips_unchanged_workspaces_and_drops_vanished_ones(tmp_path, monkeypatch):
+    scan_root = tmp_path / "Dev"
+    scan_root.mkdir()
+    alpha = _make_custom_workspace(
+        scan_root, workspace_name="alpha", docs={"a.md": _doc_content("doc_a", "Alpha body")}
+    )
+    beta = _make_custom_workspace(
+        scan_root, workspace_name="beta", docs={"b.md": _doc_content("doc_b", "Beta body")}
+    )
+    (alpha / ".git").mkdir()
+    (beta / ".git").mkdir()
+
+    index = PortfolioIndex(tmp_path / "portfolio.db")
+    first = index.rebuild_all([scan_root], exclude=[], registry_path=None)
+    assert first == {"rebuilt": ["alpha", "beta"], "skipped": [], "removed": []}
+
+    second = index.rebuild_all([scan_root], exclude=[], registry_path=None)
+    assert second == {"rebuilt": [], "skipped": ["alpha", "beta"], "removed": []}
+
+    write_file(alpha / "docs/a.md", _doc_content("doc_a", "Alpha edited"))
+    third = index.rebuild_all([scan_root], exclude=["beta"], registry_path=None)
+    assert third == {"rebuilt": ["alpha"], "skipped": [], "removed": ["beta"]}
+    assert [project["slug"] for project in index.get_projects()] == ["alpha"]
+    assert index.search_fts("Beta", workspace=None, offset=0, limit=10)["total_hits"] == 0
+    assert index.search_fts("edited", workspace=None, offset=0, limit=10)["total_hits"] == 1
+
+
+def test_rebuild_all_builds_one_snapshot_per_changed_workspace(tmp_path, monkeypatch):
+    import ontos.mcp.portfolio as portfolio_module
+
+    scan_root = tmp_path / "Dev"
+    scan_root.mkdir()
+    for name in ("alpha", "beta"):
+        workspace = _make_custom_workspace(
+            scan_root,
+            workspace_name=name,
+            docs={f"{name}.md": _doc_content(f"{name}_doc", f"{name} body")},
+        )
+        (workspace / ".git").mkdir()
+
+    built = []
+    real_create_snapshot = portfolio_module.create_snapshot
+
+    def counting_create_snapshot(root, *args, **kwargs):
+        built.append(Path(root).name)
+        return real_create_snapshot(root, *args, **kwargs)
+
+    monkeypatch.setattr(portfolio_module, "create_snapshot", counting_create_snapshot)
+    monkeypatch.setattr("ontos.io.snapshot.create_snapshot", counting_create_snapshot)
+    monkeypatch.setattr("ontos.mcp.scanner.create_snapshot", counting_create_snapshot, raising=False)
+
+    index = PortfolioIndex(tmp_path / "portfolio.db")
+    index.rebuild_all([scan_root], exclude=[], registry_path=None)
+    assert sorted(built) == ["alpha", "beta"]
+
+    built.clear()
+    write_file(scan_root / "beta" / "docs/beta.md", _doc_content("beta_doc", "beta edited"))
+    index.rebuild_all([scan_root], exclude=[], registry_path=None)
+    assert built == ["beta"]
+
+
+def test_rebuild_workspace_repairs_fts_drift_with_full_rewrite(tmp_path):
+    workspace_root = create_workspace(tmp_path)
+    db_path = tmp_path / "portfolio.db"
+    index = PortfolioIndex(db_path)
+    index.rebuild_workspace("workspace", workspace_root)
+    with closing(sqlite3.connect(db_path)) as conn:
+        conn.execute("DELETE FROM fts_content WHERE rowid = (SELECT MIN(rowid) FROM fts_content)")
+        conn.commit()
+
+    index.rebuild_workspace("workspace", workspace_root)
+
+    with closing(sqlite3.connect(db_path)) as conn:
+        docs_count, fts_count = index._fts_parity_counts(conn, "workspace")
+    assert docs_count == fts_count == 8
+
+
+def _index_state(index: PortfolioIndex, slug: str) -> dict:
+    with closing(sqlite3.connect(index.db_path)) as conn:
+        edges = conn.execute(
+            "SELECT from_id, to_id FROM edges WHERE from_workspace = ? ORDER BY from_id, to_id",
+            (slug,),
+        ).fetchall()
+        fingerprint = conn.execute(
+            "SELECT fingerprint FROM scan_state WHERE workspace = ?",
+            (slug,),
+        ).fetchone()[0]
+    return {
+        "documents": index.get_workspace_documents(slug),
+        "edges": edges,
+        "fingerprint": fingerprint,
+        "doc_count": index.get_projects()[0]["doc_count"],
+        "search": index.search_fts("incrementally", workspace=slug, offset=0, limit=10)["results"],
+    }
+
+
+def test_upsert_documents_touches_only_given_paths_and_matches_full_resync(tmp_path):
+    workspace_root = create_workspace(tmp_path)
+    index = PortfolioIndex(tmp_path / "portfolio.db")
+    index.rebuild_workspace("workspace", workspace_root)
+    before = _document_rowids(index.db_path, "workspace")
+
+    write_file(
+        workspace_root / "docs/atom.md",
+        """
+        ---
+        id: atom_doc
+        type: atom
+        status: active
+        depends_on: [kernel_doc]
+        ---
+        Atom body upserted incrementally.
+        """,
+    )
+    write_file(workspace_root / "docs/fresh.md", _doc_content("fresh_doc", "Fresh incrementally."))
+    (workspace_root / "docs/log.md").unlink()
+    touched = [workspace_root / "docs/atom.md", Path("docs/fresh.md"), workspace_root / "docs/log.md"]
+
+    assert index.upsert_documents("workspace", workspace_root, touched) == "upserted"
+
+    after = _document_rowids(index.db_path, "workspace")
+    unchanged = set(before) - {"atom_doc", "log_doc"}
+    assert {doc_id: after[doc_id] for doc_id in unchanged} == {
+        doc_id: before[doc_id] for doc_id in unchanged
+    }
+    assert index.is_workspace_stale("workspace") is False
+
+    full = PortfolioIndex(tmp_path / "full.db")
+    full.rebuild_workspace("workspace", workspace_root)
+    assert _index_state(index, "workspace") == _index_state(full, "workspace")
+
+
+def test_upsert_documents_leaves_untouched_drift_stale_and_falls_back_when_unsound(tmp_path):
+    workspace_root = create_workspace(tmp_path)
+    index = PortfolioIndex(tmp_path / "portfolio.db")
+    index.rebuild_workspace("workspace", workspace_root)
+
+    # Another file changed behind the index's back; it stays visibly stale.
+    write_file(workspace_root / "docs/atom.md", _doc_content("atom_doc", "Atom incrementally."))
+    write_file(workspace_root / "docs/kernel.md", _doc_content("kernel_doc", "Kernel incrementally."))
+    assert index.upsert_documents("workspace", workspace_root, [workspace_root / "docs/atom.md"]) == "upserted"
+    assert index.is_workspace_stale("workspace") is True
+
+    # The new file claims an ID an untouched file already holds.
+    write_file(workspace_root / "docs/copy.md", _doc_content("kernel_doc", "Duplicate."))
+    assert index.upsert_documents("workspace", workspace_root, [workspace_root / "docs/copy.md"]) == "rebuilt"
+    assert index.is_workspace_stale("workspace") is False
+
+    # A config edit can renormalize every document.
+    config = workspace_root / ".ontos.toml"
+    config.write_text(config.read_text(encoding="utf-8") + "\n# edited\n", encoding="utf-8")
+    assert index.upsert_documents("workspace", workspace_root, [workspace_root / "docs/atom.md"]) == "rebuilt"
+
+    full = PortfolioIndex(tmp_path / "full.db")
+    full.rebuild_workspace("workspace", workspace_root)
+    assert _index_state(index, "workspace") == _index_state(full, "workspace")
+
+
+def test_schedule_upsert_converges_in_the_background(tmp_path):
+    workspace_root = create_workspace(tmp_path)
+    index = PortfolioIndex(tmp_path / "portfolio.db")
+    index.rebuild_workspace("workspace", workspace_root)
+    assert index.wait_for_writes(timeout=0) is True
+
+    write_file(workspace_root / "docs/fresh.md", _doc_content("fresh_doc", "Queued incrementally."))
+    index.schedule_upsert("workspace", workspace_root, [workspace_root / "docs/fresh.md"])
+
+    assert index.wait_for_writes(timeout=30) is True
+    search = index.search_fts("queued", workspace="workspace", offset=0, limit=10)
+    assert [row["doc_id"] for row in search["results"]] == ["fresh_doc"]
+    assert index.is_workspace_stale("workspace") is False
+
+
+def test_rebuild_all_with_worker_pool_matches_serial_and_reports_progress(tmp_path):
+    scan_root = tmp_path / "Dev"
+    scan_root.mkdir()
+    for name in ("alpha", "beta", "gamma"):
+        workspace = _make_custom_workspace(
+            scan_root,
+            workspace_name=name,
+            docs={f"{name}.md": _doc_content(f"{name}_doc", f"{name} body")},
+        )
+        (workspace / ".git").mkdir()
+
+    serial = PortfolioIndex(tmp_path / "serial.db")
+    serial.rebuild_all([scan_root], exclude=[], registry_path=None)
+
+    events = []
+    pooled = PortfolioIndex(tmp_path / "pooled.db")
+    summary = pooled.rebuild_all(
+        [scan_root], exclude=[], registry_path=None, workers=2, progress=events.append
+    )
+
+    assert summary["rebuilt"] == ["alpha", "beta", "gamma"]
+    assert sorted(event.slug for event in events) == ["alpha", "beta", "gamma"]
+    assert [event.completed for event in events] == [1, 2, 3]
+    assert {event.total for event in events} == {3}
+    assert {event.outcome for event in events} == {"rebuilt"}
+    for slug in ("alpha", "beta", "gamma"):
+        assert [
+            {key: row[key] for key in ("id", "path", "content_hash", "concepts")}
+            for row in pooled.get_workspace_documents(slug)
+        ] == [
+            {key: row[key] for key in ("id", "path", "content_hash", "concepts")}
+            for row in serial.get_workspace_documents(slug)
+        ]
+
+    events.clear()
+    again = pooled.rebuild_all(
+        [scan_root], exclude=[], registry_path=None, workers=2, progress=events.append
+    )
+    assert again["skipped"] == ["alpha", "beta", "gamma"]
+    assert {event.outcome for event in events} == {"skipped"}
+
+
+
+class _InlinePool:
+    """Stands in for ProcessPoolExecutor; runs each job when submitted."""
+
+    instances: list["_InlinePool"] = []
+
+    def __init__(self, max_workers, *, fail=None):
+        self.fail = fail or {}
+        self.shutdowns = []
+        _InlinePool.instances.append(self)
+
+    def submit(self, fn, slug, root, previous):
+        future = Future()
+        if slug in self.fail:
+            future.set_exception(self.fail[slug])
+        else:
+            future.set_result(fn(slug, root, previous))
+        return future
+
+    def shutdown(self, wait=True, *, cancel_futures=False):
+        self.shutdowns.append(cancel_futures)
+
+
+def _three_workspaces(tmp_path: Path) -> Path:
+    scan_root = tmp_path / "Dev"
+    scan_root.mkdir()
+    for name in ("alpha", "beta", "gamma"):
+        workspace = _make_custom_workspace(
+            scan_root,
+            workspace_name=name,
+            docs={f"{name}.md": _doc_content(f"{name}_doc", f"{name} body")},
+        )
+        (workspace / ".git").mkdir()
+    return scan_root
+
+
+def _use_inline_pool(monkeypatch, fail=None):
+    import ontos.mcp.portfolio as portfolio_module
+
+    _InlinePool.instances.clear()
+    serial = []
+    real_prepare = portfolio_module._prepare_workspace
+
+    def counting_prepare(slug, root, previous):
+        serial.append(slug)
+        return real_prepare(slug, root, previous)
+
+    monkeypatch.setattr(
+        portfolio_module,
+        "ProcessPoolExecutor",
+        lambda max_workers: _InlinePool(max_workers, fail=fail),
+    )
+    monkeypatch.setattr(portfolio_module, "_prepare_workspace", counting_prepare)
+    return serial
+
+
+def test_rebuild_all_propagates_a_workspace_error_without_serial_rerun(tmp_path, monkeypatch):
+    scan_root = _three_workspaces(tmp_path)
+    serial = _use_inline_pool(monkeypatch, fail={"beta": PermissionError("beta unreadable")})
+
+    index = PortfolioIndex(tmp_path / "portfolio.db")
+    with pytest.raises(PermissionError, match="beta unreadable"):
+        index.rebuild_all([scan_root], exclude=[], registry_path=None, workers=2)
+
+    # Submitted jobs ran "in the pool"; nothing was re-prepared in-process.
+    assert sorted(serial) == ["alpha", "gamma"]
+    assert _InlinePool.instances[0].shutdowns == [True]
+
+
+def test_rebuild_all_finishes_serially_when_the_pool_breaks(tmp_path, monkeypatch):
+    from concurrent.futures.process import BrokenProcessPool
+
+    scan_root = _three_workspaces(tmp_path)
+    serial = _use_inline_pool(monkeypatch, fail={"alpha": BrokenProcessPool("worker died")})
+
+    index = PortfolioIndex(tmp_path / "portfolio.db")
+    summary = index.rebuild_all([scan_root], exclude=[], registry_path=None, workers=2)
+
+    assert summary["rebuilt"] == ["alpha", "beta", "gamma"]
+    assert serial.count("alpha") == 1
+    assert [project["slug"] for project in index.get_projects()] == ["alpha", "beta", "gamma"]
+
+
+def test_rebuild_all_shuts_the_pool_down_when_a_write_fails(tmp_path, monkeypatch):
+    scan_root = _three_workspaces(tmp_path)
+    _use_inline_pool(monkeypatch)
+
+    def failing_write(self, conn, slug, prepared, *, project):
+        raise sqlite3.OperationalError("disk I/O error")
+
+    monkeypatch.setattr(PortfolioIndex, "_write_workspace", failing_write)
+    index = PortfolioIndex(tmp_path / "portfolio.db")
+    with pytest.raises(sqlite3.OperationalError):
+        index.rebuild_all([scan_root], exclude=[], registry_path=None, workers=2)
+
+    assert _InlinePool.instances[0].shutdowns == [True]
+
+
 def _make_custom_workspace(tmp_path: Path, *, workspace_name: str, docs: dict[str, str]) -> Path:
     root = tmp_path / workspace_name
     root.mkdir(parents=True, exist_ok=True)
@@ -276,3 +276,36 @@ def test_ensure_portfolio_config_is_idempotent(tmp_path, monkeypatch):
     assert second == Path(config_path)
     assert config_path.exists()
     assert config_path.read_bytes() == original
+
+
+def test_load_portfolio_config_workers(tmp_path, monkeypatch, caplog):
+    config_path = tmp_path / ".config" / "ontos" / "portfolio.toml"
+    config_path.parent.mkdir(parents=True)
+    monkeypatch.setattr(portfolio_config_module, "PORTFOLIO_CONFIG_PATH", config_path)
+
+    config_path.write_text("[portfolio]\nworkers = 4\n", encoding="utf-8")
+    assert load_portfolio_config().workers == 4
+
+    config_path.write_text("[portfolio]\nworkers = -2\n", encoding="utf-8")
+    with caplog.at_level("WARNING"):
+        assert load_portfolio_config().workers == portfolio_config_module.DEFAULT_PORTFOLIO_WORKERS
+    assert "portfolio.workers" in caplog.text
+
+
+def test_load_portfolio_config_workspace_cache_limits(tmp_path, monkeypatch, caplog):
+    config_path = tmp_path / ".config" / "ontos" / "portfolio.toml"
+    config_path.parent.mkdir(parents=True)
+    monkeypatch.setattr(portfolio_config_module, "PORTFOLIO_CONFIG_PATH", config_path)
+
+    config_path.write_text(
+        "[portfolio]\nworkspace_cache_size = 2\nworkspace_cache_max_mb = 64\n",
+        encoding="utf-8",
+    )
+    cfg = load_portfolio_config()
+    assert (cfg.workspace_cache_size, cfg.workspace_cache_max_mb) == (2, 64)
+
+    config_path.write_text("[portfolio]\nworkspace_cache_size = 0\n", encoding="utf-8")
+    with caplog.at_level("WARNING"):
+        cfg = load_portfolio_config()
+    assert cfg.workspace_cache_size == portfolio_config_module.DEFAULT_WORKSPACE_CACHE_SIZE
+    assert "portfolio.workspace_cache_size" in caplog.text
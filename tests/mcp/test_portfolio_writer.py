@@ -0,0 +1,77 @@
+from __future__ import annotations
+
+from pathlib import Path
+import threading
+
+from ontos.mcp.portfolio_writer import PortfolioWriteQueue
+
+
+class BlockingApply:
+    """Records batches; the first one blocks until released."""
+
+    def __init__(self, *, fail_targeted: bool = False):
+        self.calls = []
+        self.started = threading.Event()
+        self.release = threading.Event()
+        self.fail_targeted = fail_targeted
+
+    def __call__(self, slug, root, paths):
+        self.calls.append((slug, root, None if paths is None else sorted(paths)))
+        self.started.set()
+        self.release.wait(timeout=30)
+        if self.fail_targeted and paths is not None:
+            raise RuntimeError("induced upsert failure")
+
+
+def test_pending_requests_for_a_workspace_coalesce_into_one_batch(tmp_path):
+    apply = BlockingApply()
+    queue = PortfolioWriteQueue(apply)
+    a, b, c = (tmp_path / name for name in ("a.md", "b.md", "c.md"))
+
+    queue.submit("alpha", tmp_path, [a])
+    assert apply.started.wait(timeout=30)
+    queue.submit("alpha", tmp_path, [b])
+    queue.submit("beta", tmp_path, [c])
+    queue.submit("alpha", tmp_path, [c, b])
+    assert queue.wait_idle(timeout=0) is False
+    assert queue.pending() == 3
+
+    apply.release.set()
+    assert queue.wait_idle(timeout=30) is True
+    root = tmp_path.resolve()
+    assert apply.calls == [
+        ("alpha", root, [a]),
+        ("alpha", root, [b, c]),
+        ("beta", root, [c]),
+    ]
+    assert (queue.submitted, queue.batches, queue.failures) == (4, 3, 0)
+    queue.close(timeout=30)
+
+
+def test_full_resync_absorbs_pending_paths(tmp_path):
+    apply = BlockingApply()
+    queue = PortfolioWriteQueue(apply)
+
+    queue.submit("alpha", tmp_path, [tmp_path / "a.md"])
+    assert apply.started.wait(timeout=30)
+    queue.submit("alpha", tmp_path, [tmp_path / "b.md"])
+    queue.submit("alpha", tmp_path)
+    queue.submit("alpha", tmp_path, [tmp_path / "c.md"])
+
+    apply.release.set()
+    queue.close(timeout=30)
+    assert [call[2] for call in apply.calls] == [[tmp_path / "a.md"], None]
+
+
+def test_failed_upsert_is_retried_as_full_resync(tmp_path, capsys):
+    apply = BlockingApply(fail_targeted=True)
+    apply.release.set()
+    queue = PortfolioWriteQueue(apply)
+
+    queue.submit("alpha", Path(tmp_path), [tmp_path / "a.md"])
+    assert queue.wait_idle(timeout=30) is True
+
+    assert [call[2] for call in apply.calls] == [[tmp_path / "a.md"], None]
+    assert queue.failures == 1
+    assert "induced upsert failure" in capsys.readouterr().err
+    queue.close(timeout=30)
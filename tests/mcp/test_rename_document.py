@@ -244,6 +244,7 @@ def test_rename_document_rebuild_uses_canonical_slug_under_basename_collision(tm
 
     assert result.isError is False, result.content[0].text
 
+    assert index.wait_for_writes(timeout=30)
     after_left_ids = {doc["id"] for doc in index.get_workspace_documents("workspace")}
     after_right_ids = {doc["id"] for doc in index.get_workspace_documents("workspace-2")}
 
@@ -518,6 +519,7 @@ def test_rename_document_without_workspace_id_targets_served_workspace_in_portfo
 
     assert result.isError is False, result.content[0].text
 
+    assert index.wait_for_writes(timeout=30)
     after_left_ids = {doc["id"] for doc in index.get_workspace_documents("workspace")}
     after_right_ids = {doc["id"] for doc in index.get_workspace_documents("workspace-2")}
     assert after_left_ids == before_left_ids
@@ -301,6 +301,32 @@ def test_load_registry_records_dict_fallback_skips_top_level_metadata(tmp_path):
     assert records[0].path == project_path
 
 
+def test_document_count_matches_snapshot_without_building_one(tmp_path, monkeypatch):
+    from ontos.io.snapshot import create_snapshot
+
+    root = _make_project(tmp_path / "counted", with_ontos=True, with_readme=True, doc_count=3)
+    docs = root / "docs"
+    (docs / "README.md").write_text("# Docs index\n", encoding="utf-8")
+    (docs / "guides").mkdir()
+    (docs / "guides" / "README.md").write_text(
+        "---\nid: guides_index\ntype: atom\n---\nGuides.\n", encoding="utf-8"
+    )
+    (docs / "entity_template.md").write_text("---\ntype: atom\n---\n", encoding="utf-8")
+    (docs / "plain.md").write_text("No frontmatter at all.\n", encoding="utf-8")
+    (docs / "archive").mkdir()
+    (docs / "archive" / "old.md").write_text("---\nid: old\n---\n", encoding="utf-8")
+
+    expected = len(create_snapshot(root, include_content=False).documents)
+
+    def no_snapshot(*args, **kwargs):
+        raise AssertionError("discovery built a snapshot")
+
+    monkeypatch.setattr("ontos.io.snapshot.create_snapshot", no_snapshot)
+    assert scanner_module._count_documents(root, True) == expected == 5
+    [entry] = discover_projects(scan_roots=[tmp_path], exclude=[], registry_path=None)
+    assert entry.doc_count == 5
+
+
 def _make_project(path: Path, *, with_ontos: bool, with_readme: bool, doc_count: int) -> Path:
     path.mkdir(parents=True)
     (path / ".git").mkdir()
@@ -0,0 +1,123 @@
+from __future__ import annotations
+
+import asyncio
+import shutil
+
+from ontos.mcp.workspace_cache import WorkspaceCachePool, estimate_cache_bytes
+from tests.mcp_helpers import build_cache, build_server, create_workspace, write_file
+
+
+class TwoWorkspaceIndex:
+    def __init__(self, primary, other):
+        self._projects = [
+            {"slug": "workspace", "path": str(primary), "status": "documented"},
+            {"slug": "other", "path": str(other), "status": "documented"},
+        ]
+
+    def get_projects(self):
+        return [dict(project, doc_count=8, last_scanned=None, tags=[], has_ontos=1) for project in self._projects]
+
+    def search_fts(self, query, workspace, offset, limit):
+        _ = (query, workspace, offset, limit)
+        return {"total_hits": 0, "results": []}
+
+
+def _workspaces(tmp_path, count):
+    roots = []
+    for index in range(count):
+        base = tmp_path / f"ws{index}"
+        roots.append(create_workspace(base))
+    return roots
+
+
+def test_pool_reuses_caches_and_evicts_least_recently_used(tmp_path):
+    roots = _workspaces(tmp_path, 3)
+    built = []
+
+    def factory(root):
+        built.append(root)
+        return build_cache(root)
+
+    pool = WorkspaceCachePool(factory, max_workspaces=2, max_bytes=1 << 30)
+    first = pool.get("a", roots[0])
+    assert pool.get("a", roots[0]) is first
+    pool.get("b", roots[1])
+    pool.get("a", roots[0])
+    pool.get("c", roots[2])
+
+    stats = pool.stats()
+    assert stats["resident"] == ["a", "c"]
+    assert (stats["hits"], stats["misses"], stats["evictions"]) == (2, 3, 1)
+    assert stats["estimated_bytes"] == sum(
+        estimate_cache_bytes(pool.get(slug, roots[i])) for slug, i in (("a", 0), ("c", 2))
+    )
+    assert len(built) == 3
+    pool.close()
+    assert pool.stats()["resident"] == []
+
+
+def test_pool_byte_ceiling_keeps_the_workspace_being_served(tmp_path):
+    roots = _workspaces(tmp_path, 2)
+    pool = WorkspaceCachePool(build_cache, max_workspaces=8, max_bytes=1)
+
+    pool.get("a", roots[0])
+    pool.get("b", roots[1])
+
+    stats = pool.stats()
+    assert stats["resident"] == ["b"]
+    assert stats["evictions"] == 1
+
+
+def test_pool_serves_primary_and_rebuilds_moved_slug(tmp_path):
+    roots = _workspaces(tmp_path, 2)
+    primary = build_cache(roots[0])
+    pool = WorkspaceCachePool(build_cache, primary=primary)
+
+    assert pool.get("workspace", roots[0]) is primary
+    assert pool.stats()["resident"] == []
+
+    before = pool.get("other", roots[1])
+    moved = tmp_path / "moved"
+    shutil.copytree(roots[1], moved)
+    after = pool.get("other", moved)
+    assert after is not before
+    assert after.workspace_root == moved.resolve()
+    assert pool.stats()["misses"] == 2
+
+
+def test_cross_workspace_reads_are_served_from_the_pool(tmp_path):
+    primary, other = _workspaces(tmp_path, 2)
+    write_file(
+        other / "docs/only_here.md",
+        """
+        ---
+        id: only_here_doc
+        type: atom
+        status: active
+        depends_on: [kernel_doc]
+        ---
+        Other workspace body.
+        """,
+    )
+    server = build_server(
+        primary,
+        portfolio_index=TwoWorkspaceIndex(primary, other),
+        workspace_pool=WorkspaceCachePool(build_cache),
+    )
+
+    result = asyncio.run(
+        server.call_tool("get_document", {"document_id": "only_here_doc", "workspace_id": "other"})
+    )
+    assert result.isError is False
+    assert "Other workspace body." in result.structuredContent["content"]
+
+    result = asyncio.run(server.call_tool("query", {"entity_id": "only_here_doc", "workspace_id": "other"}))
+    assert result.isError is False
+
+    missing = asyncio.run(server.call_tool("query", {"entity_id": "only_here_doc"}))
+    assert missing.isError is True
+
+    health = asyncio.run(server.call_tool("health", {})).structuredContent
+    assert health["workspace_cache"]["resident"] == ["other"]
+    assert health["workspace_cache"]["misses"] == 1
+    assert health["workspace_cache"]["hits"] == 1
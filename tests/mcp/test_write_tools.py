@@ -18,6 +18,7 @@ from __future__ import annotations
 
 import asyncio
 import subprocess
+import threading
 import time
 from multiprocessing import Event, Process, Queue
 from pathlib import Path
@@ -189,6 +190,7 @@ def test_scaffold_document_rebuild_uses_canonical_slug_under_basename_collision(
     assert result.isError is False, result.content[0].text
     assert (right_root / "docs" / "second_only.md").exists()
 
+    assert index.wait_for_writes(timeout=30)
     after_left_ids = {doc["id"] for doc in index.get_workspace_documents("workspace")}
     after_right_ids = {doc["id"] for doc in index.get_workspace_documents("workspace-2")}
 
@@ -199,6 +201,32 @@ def test_scaffold_document_rebuild_uses_canonical_slug_under_basename_collision(
     assert index.is_workspace_stale("workspace-2") is False
 
 
+def test_scaffold_document_returns_before_the_index_upsert_lands(tmp_path, monkeypatch):
+    _left_root, right_root, index = _build_same_basename_portfolio(tmp_path)
+    release = threading.Event()
+    upserts = []
+    real_upsert = index.upsert_documents
+
+    def gated_upsert(slug, workspace_root, paths):
+        release.wait(timeout=30)
+        upserts.append((slug, sorted(path.name for path in paths)))
+        return real_upsert(slug, workspace_root, paths)
+
+    monkeypatch.setattr(index, "upsert_documents", gated_upsert)
+    server = build_server(right_root, portfolio_index=index)
+    result = _call(server, "scaffold_document", {"path": "docs/queued.md", "content": ""})
+
+    assert result.isError is False, result.content[0].text
+    assert index.wait_for_writes(timeout=0) is False
+    assert "queued" not in {doc["id"] for doc in index.get_workspace_documents("workspace-2")}
+
+    release.set()
+    assert index.wait_for_writes(timeout=30) is True
+    assert upserts == [("workspace-2", ["queued.md"])]
+    assert "queued" in {doc["id"] for doc in index.get_workspace_documents("workspace-2")}
+    assert index.is_workspace_stale("workspace-2") is False
+
+
 # ---------------------------------------------------------------------------
 # log_session
 # ---------------------------------------------------------------------------
@@ -509,6 +537,7 @@ def test_write_tool_without_workspace_id_targets_served_workspace_in_portfolio_m
     assert result.isError is False, result.content[0].text
     assert (right_root / "docs" / "current_workspace_only.md").exists()
 
+    assert index.wait_for_writes(timeout=30)
     after_left_ids = {doc["id"] for doc in index.get_workspace_documents("workspace")}
     after_right_ids = {doc["id"] for doc in index.get_workspace_documents("workspace-2")}
     captured = capsys.readouterr()
@@ -15,6 +15,7 @@ from typing import Any
 REPO_ROOT = Path(__file__).resolve().parents[1]
 
 from ontos.io.config import load_project_config
+from ontos.io.parse_cache import MemoryParseCache
 from ontos.io.snapshot import create_snapshot
 from ontos.mcp.cache import SnapshotCache
 
@@ -173,18 +174,21 @@ def create_empty_workspace(tmp_path: Path) -> Path:
 
 def build_cache(root: Path) -> SnapshotCache:
     config = load_project_config(config_path=root / ".ontos.toml", repo_root=root)
+    parse_cache = MemoryParseCache()
     snapshot = create_snapshot(
         root=root,
         include_content=True,
         filters=None,
         git_commit_provider=None,
         scope=None,
+        parse_cache=parse_cache,
     )
     return SnapshotCache(
         root,
         config,
         snapshot,
         started_at=datetime.now(timezone.utc),
+        parse_cache=parse_cache,
     )
 
 
@@ -0,0 +1,94 @@
+"""Tests for the synthetic-corpus benchmark harness."""
+
+from __future__ import annotations
+
+import json
+
+from scripts.benchmark import (
+    BENCHMARKS,
+    MEMORY_SCHEMA,
+    RESULTS_SCHEMA,
+    compare_results,
+    generate_corpus,
+    main,
+    measure_memory,
+    run_benchmarks,
+)
+
+
+def _digest(root):
+    return {
+        path.relative_to(root).as_posix(): path.read_bytes()
+        for path in sorted(root.rglob("*.md"))
+    }
+
+
+def test_generate_corpus_is_deterministic_and_loadable(tmp_path):
+    from ontos.core.validation import ValidationOrchestrator
+    from ontos.io.files import load_documents, scan_documents
+    from ontos.io.yaml import parse_frontmatter_content
+
+    first = generate_corpus(tmp_path / "a", 60, seed=7)
+    generate_corpus(tmp_path / "b", 60, seed=7)
+
+    assert first["documents"] == 60
+    assert _digest(tmp_path / "a") == _digest(tmp_path / "b")
+
+    paths = scan_documents([tmp_path / "a" / "docs"])
+    result = load_documents(paths, parse_frontmatter_content)
+    assert len(result.documents) == 60
+    types = {doc.type.value for doc in result.documents.values()}
+    assert {"kernel", "strategy", "product", "atom", "log"} <= types
+    assert any(doc.depends_on for doc in result.documents.values())
+    assert any(doc.impacts for doc in result.documents.values())
+    ValidationOrchestrator(result.documents).validate_all()
+
+
+def test_run_emits_every_benchmark(tmp_path):
+    payload = run_benchmarks([40], repeat=1, corpus_dir=tmp_path)
+
+    assert payload["schema"] == RESULTS_SCHEMA
+    assert set(payload["results"]["40"]) == set(BENCHMARKS)
+    for stats in payload["results"]["40"].values():
+        assert len(stats["runs_ms"]) == 1
+        assert stats["median_ms"] >= 0
+
+
+def test_memory_reports_bytes_per_document(tmp_path):
+    payload = measure_memory([30], corpus_dir=tmp_path)
+
+    assert payload["schema"] == MEMORY_SCHEMA
+    stats = payload["results"]["30"]
+    assert stats["documents"] == 30
+    assert 0 < stats["snapshot_bytes"] <= stats["cache_bytes"]
+    assert stats["cache_bytes_per_doc"] == stats["cache_bytes"] // 30
+
+
+def test_compare_flags_only_material_regressions(tmp_path):
+    def results(**medians):
+        return {
+            "schema": RESULTS_SCHEMA,
+            "results": {"1000": {name: {"median_ms": ms} for name, ms in medians.items()}},
+        }
+
+    baseline = results(build_graph=100.0, scan_documents=1.0, validate_all=100.0)
+    current = results(build_graph=140.0, scan_documents=3.0, validate_all=110.0)
+
+    rows = {row["benchmark"]: row for row in compare_results(current, baseline)}
+    assert rows["build_graph"]["regression"]
+    assert not rows["scan_documents"]["regression"]  # below --min-delta-ms
+    assert not rows["validate_all"]["regression"]
+
+    (tmp_path / "current.json").write_text(json.dumps(current), encoding="utf-8")
+    (tmp_path / "baseline.json").write_text(json.dumps(baseline), encoding="utf-8")
+    assert main(["compare", str(tmp_path / "current.json"), str(tmp_path / "baseline.json")]) == 1
+    assert main(["compare", str(tmp_path / "baseline.json"), str(tmp_path / "baseline.json")]) == 0
+    assert main(["compare", str(tmp_path / "missing.json"), str(tmp_path / "baseline.json")]) == 2
+
+
+def test_memory_lazy_content_keeps_bodies_on_disk(tmp_path):
+    eager = measure_memory([30], corpus_dir=tmp_path)["results"]["30"]
+    payload = measure_memory([30], corpus_dir=tmp_path, lazy_content=True)
+
+    assert payload["lazy_content"] is True
+    assert payload["results"]["30"]["snapshot_bytes"] < eager["snapshot_bytes"]
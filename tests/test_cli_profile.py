@@ -0,0 +1,63 @@
+"""``--profile`` / ``ONTOS_PROFILE`` across CLI commands."""
+
+from __future__ import annotations
+
+import json
+import os
+import pstats
+import subprocess
+import sys
+from pathlib import Path
+
+
+REPO_ROOT = Path(__file__).resolve().parents[1]
+
+
+def _run(root: Path, *args: str, **env_overrides: str) -> subprocess.CompletedProcess[str]:
+    env = dict(os.environ)
+    env.pop("ONTOS_PROFILE", None)
+    env["PYTHONPATH"] = str(REPO_ROOT)
+    env.update(env_overrides)
+    return subprocess.run(
+        [sys.executable, "-m", "ontos", *args],
+        cwd=root,
+        text=True,
+        capture_output=True,
+        env=env,
+    )
+
+
+def _project(tmp_path: Path) -> Path:
+    (tmp_path / ".ontos.toml").write_text('[ontos]\nversion = "4.0"\n', encoding="utf-8")
+    docs = tmp_path / "docs"
+    docs.mkdir()
+    (docs / "kernel.md").write_text("---\nid: kernel\ntype: kernel\nstatus: active\n---\n# K\n")
+    (docs / "atom.md").write_text(
+        "---\nid: atom\ntype: atom\nstatus: active\ndepends_on: [kernel]\n---\n# A\n"
+    )
+    return tmp_path
+
+
+def test_json_envelope_reports_spans(tmp_path):
+    root = _project(tmp_path)
+    result = _run(root, "--json", "--profile", "map")
+
+    envelope = json.loads(result.stdout)
+    names = [entry["name"] for entry in envelope["profile"]["spans"]]
+    for phase in ("config", "scan", "read", "parse", "graph", "validate", "render", "write"):
+        assert phase in names
+    assert "Profile" not in result.stderr
+
+    plain = _run(root, "--json", "map")
+    assert "profile" not in json.loads(plain.stdout)
+
+
+def test_env_var_prints_table_and_dumps_cprofile(tmp_path):
+    root = _project(tmp_path)
+    stats_file = tmp_path / "map.pstats"
+    result = _run(root, "map", ONTOS_PROFILE="1", ONTOS_PROFILE_OUTPUT=str(stats_file))
+
+    assert result.returncode == 0, result.stderr
+    assert "Profile (wall" in result.stderr
+    assert "validate" in result.stderr
+    pstats.Stats(str(stats_file))